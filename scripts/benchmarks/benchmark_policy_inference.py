@@ -0,0 +1,144 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the CPU inference of an exported policy.
+
+The policy is loaded from an ONNX file with ONNX Runtime or from a TorchScript file with PyTorch, depending
+on the extension of the file. For each batch size, the policy is run on random observations and the latency
+percentiles and the throughput are reported. The script does not launch the simulator.
+
+Policies are exported by the ``play.py`` scripts of the RSL-RL workflow, or with the functions
+:func:`isaaclab_rl.rsl_rl.export_policy_as_onnx` and :func:`isaaclab_rl.rsl_rl.export_policy_as_jit`.
+An ONNX policy only accepts multiple observations if it was exported with a dynamic batch dimension.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_policy_inference.py --policy /path/to/exported/policy.onnx \
+        --batch_sizes 1 64 1024
+
+"""
+
+import argparse
+import numpy as np
+import os
+import time
+import torch
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the CPU inference of an exported policy.")
+parser.add_argument("--policy", type=str, required=True, help="Path to the exported policy (.onnx or .pt file).")
+parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1, 16, 256, 4096], help="Batch sizes to benchmark.")
+parser.add_argument("--num_iterations", type=int, default=1000, help="Number of measured inferences per batch size.")
+parser.add_argument("--num_warmup", type=int, default=50, help="Number of inferences before the measurement.")
+parser.add_argument("--num_threads", type=int, default=None, help="Number of CPU threads. Defaults to the runtime's.")
+parser.add_argument(
+    "--obs_dim", type=int, default=None, help="Dimension of the observations. Only needed if it cannot be inferred."
+)
+# parse the arguments
+args_cli = parser.parse_args()
+
+
+class OnnxPolicy:
+    """Policy loaded from an ONNX file and run with ONNX Runtime on the CPU."""
+
+    def __init__(self, path: str):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        if args_cli.num_threads is not None:
+            options.intra_op_num_threads = args_cli.num_threads
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.inputs = self.session.get_inputs()
+
+    def supports_batch_size(self, batch_size: int) -> bool:
+        # note: the batch dimension of the observations is fixed if it is an integer
+        obs_batch_size = self.inputs[0].shape[0]
+        return not isinstance(obs_batch_size, int) or obs_batch_size == batch_size
+
+    def create_inputs(self, batch_size: int) -> dict[str, np.ndarray]:
+        feeds = {}
+        for index, node in enumerate(self.inputs):
+            # the batch dimension is the first one for the observations and the second one for the hidden states
+            batch_dim = 0 if index == 0 else 1
+            shape = [batch_size if dim == batch_dim else size for dim, size in enumerate(node.shape)]
+            if not all(isinstance(size, int) for size in shape):
+                raise ValueError(f"Cannot infer the shape of the input '{node.name}': {node.shape}.")
+            feeds[node.name] = np.random.randn(*shape).astype(np.float32)
+        return feeds
+
+    def __call__(self, inputs: dict[str, np.ndarray]):
+        return self.session.run(None, inputs)
+
+
+class JitPolicy:
+    """Policy loaded from a TorchScript file and run with PyTorch on the CPU."""
+
+    def __init__(self, path: str):
+        if args_cli.num_threads is not None:
+            torch.set_num_threads(args_cli.num_threads)
+        self.module = torch.jit.load(path, map_location="cpu")
+        self.module.eval()
+        # the memory of recurrent policies is stored in the module for a single environment
+        self.is_recurrent = hasattr(self.module, "hidden_state")
+        # infer the dimension of the observations from the first layer
+        self.obs_dim = args_cli.obs_dim
+        if self.obs_dim is None:
+            # note: scripted sequential modules do not support indexing
+            first_layer = self.module.rnn if self.is_recurrent else getattr(self.module.actor, "0")
+            self.obs_dim = first_layer.input_size if self.is_recurrent else first_layer.in_features
+
+    def supports_batch_size(self, batch_size: int) -> bool:
+        return not self.is_recurrent or batch_size == 1
+
+    def create_inputs(self, batch_size: int) -> torch.Tensor:
+        return torch.randn(batch_size, self.obs_dim)
+
+    def __call__(self, inputs: torch.Tensor):
+        with torch.inference_mode():
+            return self.module(inputs)
+
+
+def benchmark(policy: OnnxPolicy | JitPolicy, batch_size: int) -> np.ndarray:
+    """Returns the latencies of the inferences (in ms)."""
+    inputs = policy.create_inputs(batch_size)
+    # warm-up
+    for _ in range(args_cli.num_warmup):
+        policy(inputs)
+    # measure
+    latencies = np.empty(args_cli.num_iterations)
+    for i in range(args_cli.num_iterations):
+        start_time = time.perf_counter()
+        policy(inputs)
+        latencies[i] = time.perf_counter() - start_time
+    return latencies * 1000.0
+
+
+def main():
+    """Benchmark the inference of the policy for the different batch sizes."""
+    extension = os.path.splitext(args_cli.policy)[1]
+    if extension == ".onnx":
+        policy = OnnxPolicy(args_cli.policy)
+    elif extension in (".pt", ".jit"):
+        policy = JitPolicy(args_cli.policy)
+    else:
+        raise ValueError(f"Unsupported policy file: '{args_cli.policy}'. Expected an '.onnx' or '.pt' file.")
+
+    print(f"Policy: {args_cli.policy}")
+    print(f"{'batch size':>10} | {'p50 (ms)':>9} | {'p90 (ms)':>9} | {'p99 (ms)':>9} | {'throughput (obs/s)':>18}")
+    print("-" * 68)
+    for batch_size in args_cli.batch_sizes:
+        if not policy.supports_batch_size(batch_size):
+            print(f"{batch_size:>10} | skipped: the policy does not support this batch size")
+            continue
+        latencies = benchmark(policy, batch_size)
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        throughput = batch_size / latencies.mean() * 1000.0
+        print(f"{batch_size:>10} | {p50:>9.3f} | {p90:>9.3f} | {p99:>9.3f} | {throughput:>18.0f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
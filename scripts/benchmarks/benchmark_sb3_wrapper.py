@@ -0,0 +1,165 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the per-step overhead of the Stable-Baselines3 wrapper.
+
+The wrapper is run on top of a stand-in environment that returns pre-computed observations, rewards and
+dones. Thus, the measured time only contains the conversion of the step outputs by the wrapper and the
+access to the infos done by Stable-Baselines3 during rollouts, and not the simulation of the environment.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_sb3_wrapper.py --headless --num_envs 256 4096 16384
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the per-step overhead of the Stable-Baselines3 wrapper.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[256, 4096, 16384], help="Numbers of environments to benchmark."
+)
+parser.add_argument("--num_steps", type=int, default=200, help="Number of steps to run for each setting.")
+parser.add_argument("--obs_dim", type=int, default=48, help="Dimension of the observations.")
+parser.add_argument("--action_dim", type=int, default=12, help="Dimension of the actions.")
+parser.add_argument(
+    "--reset_ratio", type=float, default=0.005, help="Ratio of the environments that are reset at each step."
+)
+parser.add_argument(
+    "--packed_transfer",
+    action="store_true",
+    default=False,
+    help="Move the step outputs to the host with a single copy through a staging buffer.",
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import numpy as np
+import time
+import torch
+
+from isaaclab.envs import DirectRLEnv
+
+from isaaclab_rl.sb3 import Sb3VecEnvWrapper
+
+
+class BenchmarkEnv(DirectRLEnv):
+    """Stand-in environment that cycles through pre-computed step outputs.
+
+    The environment is not initialized through :class:`DirectRLEnv`, i.e. it does not create a simulation.
+    It only provides the attributes that are used by the wrapper.
+    """
+
+    def __init__(self, num_envs: int, device: str, num_buffers: int = 8):
+        self._num_envs = num_envs
+        self._device = device
+        self.render_mode = None
+        self.single_observation_space = gym.spaces.Dict(
+            {"policy": gym.spaces.Box(-np.inf, np.inf, shape=(args_cli.obs_dim,))}
+        )
+        self.single_action_space = gym.spaces.Box(-1.0, 1.0, shape=(args_cli.action_dim,))
+        # pre-compute the step outputs
+        self._step_outputs = []
+        for _ in range(num_buffers):
+            obs = torch.randn(num_envs, args_cli.obs_dim, device=device)
+            rew = torch.randn(num_envs, device=device)
+            dones = torch.rand(num_envs, device=device) < args_cli.reset_ratio
+            truncated = dones & (torch.rand(num_envs, device=device) < 0.5)
+            terminated = dones & ~truncated
+            extras = {"log": {"Episode_Reward/dummy": torch.rand(1).item()}, "time_outs": truncated}
+            self._step_outputs.append(({"policy": obs}, rew, terminated, truncated, extras))
+        self._step_count = 0
+
+    @property
+    def num_envs(self) -> int:
+        return self._num_envs
+
+    @property
+    def device(self) -> str:
+        return self._device
+
+    def reset(self, seed=None, options=None):
+        obs_dict, *_, extras = self._step_outputs[0]
+        return {"policy": obs_dict["policy"].clone()}, extras
+
+    def step(self, action):
+        self._step_count += 1
+        obs_dict, rew, terminated, truncated, extras = self._step_outputs[self._step_count % len(self._step_outputs)]
+        # note: the wrapper modifies the observation dictionary in place
+        return {"policy": obs_dict["policy"]}, rew, terminated, truncated, extras
+
+    def close(self):
+        pass
+
+
+def consume_infos(infos, dones: np.ndarray):
+    """Access the infos in the same way as Stable-Baselines3 does when collecting rollouts."""
+    # episode information buffer (see :meth:`BaseAlgorithm._update_info_buffer`)
+    for info in infos:
+        info.get("episode")
+        info.get("is_success")
+    # bootstrapping on time-outs (see :meth:`OnPolicyAlgorithm.collect_rollouts`)
+    for idx, done in enumerate(dones):
+        if done and infos[idx].get("terminal_observation") is not None and infos[idx].get("TimeLimit.truncated"):
+            np.asarray(infos[idx]["terminal_observation"]).sum()
+
+
+def benchmark(num_envs: int, fast_variant: bool, lazy_infos: bool) -> float:
+    """Returns the average time per step of the wrapper (in ms)."""
+    env = Sb3VecEnvWrapper(
+        BenchmarkEnv(num_envs, args_cli.device),
+        fast_variant=fast_variant,
+        lazy_infos=lazy_infos,
+        packed_transfer=args_cli.packed_transfer,
+    )
+    env.reset()
+    actions = torch.zeros(num_envs, args_cli.action_dim, device=args_cli.device)
+    # warm-up
+    for _ in range(5):
+        _, _, dones, infos = env.step(actions)
+        consume_infos(infos, dones)
+    # measure
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        _, _, dones, infos = env.step(actions)
+        consume_infos(infos, dones)
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1000.0
+
+
+def main():
+    """Benchmark the wrapper variants for the different numbers of environments."""
+    print(f"{'num_envs':>10} | {'variant':>8} | {'list infos (ms)':>16} | {'lazy infos (ms)':>16} | {'speed-up':>8}")
+    print("-" * 70)
+    for num_envs in args_cli.num_envs:
+        for fast_variant in (True, False):
+            list_time = benchmark(num_envs, fast_variant, lazy_infos=False)
+            lazy_time = benchmark(num_envs, fast_variant, lazy_infos=True)
+            variant = "fast" if fast_variant else "full"
+            print(
+                f"{num_envs:>10} | {variant:>8} | {list_time:>16.3f} | {lazy_time:>16.3f} |"
+                f" {list_time / lazy_time:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
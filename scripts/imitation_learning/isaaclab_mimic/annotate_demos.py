@@ -34,6 +34,12 @@ parser.add_argument(
     default=False,
     help="Enable Pinocchio.",
 )
+parser.add_argument(
+    "--lazy_load",
+    action="store_true",
+    default=False,
+    help="Read the episodes from the dataset file on access instead of loading them into memory at once.",
+)
 parser.add_argument(
     "--annotate_subtask_start_signals",
     action="store_true",
@@ -292,7 +298,7 @@ def main():
             for episode_index, episode_name in enumerate(dataset_file_handler.get_episode_names()):
                 processed_episode_count += 1
                 print(f"\nAnnotating episode #{episode_index} ({episode_name})")
-                episode = dataset_file_handler.load_episode(episode_name, env.device)
+                episode = dataset_file_handler.load_episode(episode_name, env.device, lazy=args_cli.lazy_load)
 
                 is_episode_annotated_successfully = False
                 if args_cli.auto:
@@ -351,7 +357,7 @@ def replay_episode(
     """
     global current_action_index, skip_episode, is_paused
     # read initial state and actions from the loaded episode
-    initial_state = episode.data["initial_state"]
+    initial_state = episode.get_initial_state()
     actions = episode.data["actions"]
     env.sim.reset()
     env.recorder_manager.reset()
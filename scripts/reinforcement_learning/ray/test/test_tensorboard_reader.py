@@ -0,0 +1,97 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the incremental tensorboard reader of the Ray tuner."""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("ray")
+
+from torch.utils.tensorboard import SummaryWriter
+
+from tensorboard.compat.proto import event_pb2, summary_pb2
+from tensorboard.summary.writer.record_writer import RecordWriter
+
+from scripts.reinforcement_learning.ray.util import TensorboardScalarReader, load_tensorboard_logs
+
+
+def _serialize_scalar(tag: str, value: float, step: int) -> bytes:
+    """Serialize a scalar event."""
+    summary = summary_pb2.Summary(value=[summary_pb2.Summary.Value(tag=tag, simple_value=value)])
+    return event_pb2.Event(wall_time=time.time(), step=step, summary=summary).SerializeToString()
+
+
+def _write_scalars(path: str, num_steps: int, start_step: int = 0):
+    """Append the scalars of the given steps to an event file."""
+    with open(path, "ab") as f:
+        writer = RecordWriter(f)
+        for step in range(start_step, start_step + num_steps):
+            writer.write(_serialize_scalar("Loss/value", 0.5 * step, step))
+            writer.write(_serialize_scalar("Episode Reward/mean", float(step), step))
+        writer.flush()
+
+
+def test_read_latest_scalars(tmp_path):
+    """Test that the reader returns the same scalars as the event accumulator."""
+    writer = SummaryWriter(str(tmp_path / "summaries"))
+    for step in range(10):
+        writer.add_scalar("Loss/value", 0.5 * step, step)
+        writer.add_scalar("Episode Reward/mean", float(step), step)
+    writer.add_text("info", "text summaries are ignored")
+    writer.flush()
+
+    reader = TensorboardScalarReader(str(tmp_path))
+    scalars = reader.read()
+    assert scalars == {"Loss/value": 4.5, "Episode_Reward/mean": 9.0}
+    assert scalars == load_tensorboard_logs(str(tmp_path))
+
+    # new records are read on the next call
+    writer.add_scalar("Loss/value", -1.0, 10)
+    writer.close()
+    assert reader.read() == {"Loss/value": -1.0, "Episode_Reward/mean": 9.0}
+
+
+def test_incomplete_record(tmp_path):
+    """Test that a record that is still being written is read once it is complete."""
+    path = os.path.join(tmp_path, "events.out.tfevents.0")
+    _write_scalars(path, num_steps=1)
+    with open(path, "rb") as f:
+        data = f.read()
+    # truncate the file in the middle of the second record
+    with open(path, "wb") as f:
+        f.write(data[:-10])
+
+    reader = TensorboardScalarReader(str(tmp_path))
+    assert reader.read() == {"Loss/value": 0.0}
+    with open(path, "ab") as f:
+        f.write(data[-10:])
+    assert reader.read() == {"Loss/value": 0.0, "Episode_Reward/mean": 0.0}
+    # an empty directory has no scalars
+    assert TensorboardScalarReader(os.path.join(tmp_path, "missing")).read() == {}
+
+
+def test_incremental_polling(tmp_path):
+    """Test that the time of a poll does not grow with the size of the event file."""
+    path = os.path.join(tmp_path, "events.out.tfevents.0")
+    _write_scalars(path, num_steps=50000)
+
+    reader = TensorboardScalarReader(str(tmp_path))
+    start_time = time.perf_counter()
+    assert reader.read() == {"Loss/value": 0.5 * 49999, "Episode_Reward/mean": 49999.0}
+    initial_read_time = time.perf_counter() - start_time
+
+    # poll the file while it grows
+    poll_times = []
+    for i in range(5):
+        _write_scalars(path, num_steps=10, start_step=50000 + 10 * i)
+        start_time = time.perf_counter()
+        scalars = reader.read()
+        poll_times.append(time.perf_counter() - start_time)
+        assert scalars == {"Loss/value": 0.5 * (50009 + 10 * i), "Episode_Reward/mean": float(50009 + 10 * i)}
+    # the polls only decode the new records
+    assert max(poll_times) < 0.1 * initial_read_time
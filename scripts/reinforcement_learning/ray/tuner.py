@@ -110,6 +110,8 @@ class IsaacLabTuneTrainable(tune.Trainable):
             self.experiment_name = experiment["experiment_name"]
             self.isaac_logdir = experiment["logdir"]
             self.tensorboard_logdir = self.isaac_logdir + "/" + self.experiment_name
+            # read the new records of the logs on every poll instead of reloading the whole event files
+            self.tensorboard_reader = util.TensorboardScalarReader(self.tensorboard_logdir)
             self.done = False
 
         if self.proc is None:
@@ -119,10 +121,10 @@ class IsaacLabTuneTrainable(tune.Trainable):
             self.data["done"] = True
             print(f"[INFO]: Process finished with {proc_status}, returning...")
         else:  # wait until the logs are ready or fresh
-            data = util.load_tensorboard_logs(self.tensorboard_logdir)
+            data = self.tensorboard_reader.read()
 
-            while data is None:
-                data = util.load_tensorboard_logs(self.tensorboard_logdir)
+            while not data:
+                data = self.tensorboard_reader.read()
                 proc_status = self.proc.poll()
                 if proc_status is not None:
                     break
@@ -134,7 +136,7 @@ class IsaacLabTuneTrainable(tune.Trainable):
                 unresponsiveness_start_time = time()
                 while util._dicts_equal(data_, self_data_):
                     self.time_since_last_proc_response = time() - unresponsiveness_start_time
-                    data = util.load_tensorboard_logs(self.tensorboard_logdir)
+                    data = self.tensorboard_reader.read()
                     data_ = {k: v for k, v in data.items() if k != "done"}
                     proc_status = self.proc.poll()
                     if proc_status is not None:
@@ -6,6 +6,7 @@ import argparse
 import os
 import re
 import select
+import struct
 import subprocess
 import sys
 import threading
@@ -17,15 +18,21 @@ from time import time
 from typing import Any
 
 import ray
+from google.protobuf.message import DecodeError
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from tensorboard.backend.event_processing.directory_watcher import DirectoryDeletedError
 from tensorboard.backend.event_processing.event_accumulator import EventAccumulator
+from tensorboard.compat.proto import event_pb2
 
 
 def load_tensorboard_logs(directory: str) -> dict:
     """From a tensorboard directory, get the latest scalar values. If the logs can't be
     found, check the summaries sublevel.
 
+    .. note::
+        The event files are parsed from the start on every call. To poll the logs of a running training,
+        use a :class:`TensorboardScalarReader`, which only reads the new records.
+
     Args:
         directory: The directory of the tensorboard logging.
 
@@ -33,12 +40,6 @@ def load_tensorboard_logs(directory: str) -> dict:
         The latest available scalar values.
     """
 
-    # replace any non-alnum/underscore/dot with "_", then collapse runs of "_"
-    def replace_invalid_chars(t):
-        t2 = re.sub(r"[^0-9A-Za-z_./]", "_", t)
-        t2 = re.sub(r"_+", "_", t2)
-        return t2.strip("_")
-
     # Initialize the event accumulator with a size guidance for only the latest entry
     def get_latest_scalars(path: str) -> dict:
         event_acc = EventAccumulator(path, size_guidance={"scalars": 1})
@@ -46,7 +47,7 @@ def load_tensorboard_logs(directory: str) -> dict:
             event_acc.Reload()
             if event_acc.Tags()["scalars"]:
                 return {
-                    replace_invalid_chars(tag): event_acc.Scalars(tag)[-1].value
+                    _replace_invalid_chars(tag): event_acc.Scalars(tag)[-1].value
                     for tag in event_acc.Tags()["scalars"]
                     if event_acc.Scalars(tag)
                 }
@@ -57,6 +58,91 @@ def load_tensorboard_logs(directory: str) -> dict:
     return scalars or get_latest_scalars(os.path.join(directory, "summaries"))
 
 
+class TensorboardScalarReader:
+    """Incremental reader of the latest scalar values in a tensorboard directory.
+
+    :func:`load_tensorboard_logs` parses the event files from the start on every call, so polling the logs
+    of a running training becomes slower as the event files grow. This reader instead remembers the offset
+    up to which each event file was read and, on every call to :meth:`read`, only decodes the records that
+    were appended since the previous call. The latest value of each scalar is kept in memory.
+
+    Like :func:`load_tensorboard_logs`, the reader looks for the event files in the directory and in its
+    summaries sublevel. A record that is still being written is read on the next call.
+    """
+
+    _HEADER_SIZE = 12
+    """Size (in bytes) of the header of a record: the length of the data and its checksum."""
+
+    _FOOTER_SIZE = 4
+    """Size (in bytes) of the footer of a record: the checksum of the data."""
+
+    def __init__(self, directory: str):
+        """Initialize the reader.
+
+        Args:
+            directory: The directory of the tensorboard logging.
+        """
+        self.directory = directory
+        # offsets up to which the event files were read
+        self._offsets: dict[str, int] = {}
+        # latest values of the scalars
+        self._scalars: dict[str, float] = {}
+
+    def read(self) -> dict[str, float]:
+        """Read the new records of the event files and get the latest scalar values.
+
+        Returns:
+            The latest available scalar values. Empty if no scalar was logged yet.
+        """
+        for path in self._list_event_files():
+            self._read_event_file(path)
+        return dict(self._scalars)
+
+    def _list_event_files(self) -> list[str]:
+        """List the event files in the order in which they were created."""
+        paths = []
+        for directory in (self.directory, os.path.join(self.directory, "summaries")):
+            try:
+                with os.scandir(directory) as it:
+                    # note: the names of the event files start with their creation time
+                    names = sorted(entry.name for entry in it if "tfevents" in entry.name and entry.is_file())
+            except OSError:
+                continue
+            paths.extend(os.path.join(directory, name) for name in names)
+        return paths
+
+    def _read_event_file(self, path: str):
+        """Decode the records appended to an event file since the last read."""
+        offset = self._offsets.get(path, 0)
+        try:
+            with open(path, "rb") as f:
+                # the file was replaced by a smaller one
+                if os.fstat(f.fileno()).st_size < offset:
+                    offset = 0
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return
+        # parse the complete records
+        # note: the records are not checked against their checksums for speed
+        pos = 0
+        while pos + self._HEADER_SIZE <= len(data):
+            length = struct.unpack_from("<Q", data, pos)[0]
+            end = pos + self._HEADER_SIZE + length + self._FOOTER_SIZE
+            if end > len(data):
+                break
+            try:
+                event = event_pb2.Event.FromString(data[pos + self._HEADER_SIZE : end - self._FOOTER_SIZE])
+            except DecodeError:
+                event = None
+            if event is not None:
+                for value in event.summary.value:
+                    if value.WhichOneof("value") == "simple_value":
+                        self._scalars[_replace_invalid_chars(value.tag)] = value.simple_value
+            pos = end
+        self._offsets[path] = offset + pos
+
+
 def get_invocation_command_from_cfg(
     cfg: dict,
     python_cmd: str = "/workspace/isaaclab/isaaclab.sh -p",
@@ -483,6 +569,13 @@ def populate_isaac_ray_cfg_args(cfg: dict = {}) -> dict:
     return cfg
 
 
+def _replace_invalid_chars(tag: str) -> str:
+    """Replace any non-alnum/underscore/dot with "_", then collapse runs of "_"."""
+    tag = re.sub(r"[^0-9A-Za-z_./]", "_", tag)
+    tag = re.sub(r"_+", "_", tag)
+    return tag.strip("_")
+
+
 def _dicts_equal(d1: dict, d2: dict, tol=1e-9) -> bool:
     """Check if two dicts are equal; helps ensure only new logs are returned."""
     if d1.keys() != d2.keys():
@@ -37,6 +37,12 @@ parser.add_argument(
     default=False,
     help="Use a slower SB3 wrapper but keep all the extra training info.",
 )
+parser.add_argument(
+    "--lazy_infos",
+    action="store_true",
+    default=False,
+    help="Only create the info dictionaries of the SB3 wrapper for the environments that are accessed.",
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
@@ -174,7 +180,7 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
         env = gym.wrappers.RecordVideo(env, **video_kwargs)
 
     # wrap around environment for stable baselines
-    env = Sb3VecEnvWrapper(env, fast_variant=not args_cli.keep_all_info)
+    env = Sb3VecEnvWrapper(env, fast_variant=not args_cli.keep_all_info, lazy_infos=args_cli.lazy_infos)
 
     norm_keys = {"normalize_input", "normalize_value", "clip_obs"}
     norm_args = {}
@@ -3,45 +3,183 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""
+Script to merge a set of HDF5 datasets and to index sharded datasets.
+
+The episodes of the input files are copied into the output file as HDF5 objects, i.e. without decoding and
+re-encoding their data. The input files are scanned in a process pool. Next to the output file, a sidecar index
+is written that maps each episode of the output to its file, its sample offset in the logical dataset, its number
+of samples and its success flag. With ``--index_only``, no data is copied and the index refers to the episodes in
+the input files, so that the shards can be opened as one logical dataset without scanning them.
+
+required arguments:
+    --input_files        A list of paths to HDF5 files to merge.
+
+optional arguments:
+    --output_file        File path to merged output. (default: merged_dataset.hdf5)
+    --num_workers        Number of processes used to scan the input files. (default: 1)
+    --index_only         Only write the index of the input files without merging them. (default: False)
+"""
+
 import argparse
 import h5py
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+INDEX_FILE_SUFFIX = ".index.json"
+"""Suffix of the sidecar index file, appended to the output file path without its extension."""
+
+
+def parse_args():
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
+    parser.add_argument(
+        "--input_files",
+        type=str,
+        nargs="+",
+        default=[],
+        help="A list of paths to HDF5 files to merge.",
+    )
+    parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
+    parser.add_argument("--num_workers", type=int, default=1, help="Number of processes used to scan the input files.")
+    parser.add_argument(
+        "--index_only",
+        action="store_true",
+        default=False,
+        help="Only write the index of the input files without merging them into the output file.",
+    )
+    return parser.parse_args()
+
+
+def get_index_file_path(dataset_file_path: str) -> str:
+    """Get the path of the sidecar index file of a dataset file.
+
+    Args:
+        dataset_file_path: Path to the dataset file.
+
+    Returns:
+        Path to the sidecar index file.
+    """
+    return os.path.splitext(dataset_file_path)[0] + INDEX_FILE_SUFFIX
 
-parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
-parser.add_argument(
-    "--input_files",
-    type=str,
-    nargs="+",
-    default=[],
-    help="A list of paths to HDF5 files to merge.",
-)
-parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
 
-args_cli = parser.parse_args()
+def scan_dataset_file(file_path: str) -> dict:
+    """Read the metadata of the episodes in a dataset file.
 
+    Args:
+        file_path: Path to the dataset file.
 
-def merge_datasets():
-    for filepath in args_cli.input_files:
+    Returns:
+        A dictionary with the environment arguments of the file and the name, number of samples and success flag
+        of each of its episodes.
+    """
+    with h5py.File(file_path, "r") as input:
+        data_group = input["data"]
+        episodes = []
+        for episode_name, episode_group in data_group.items():
+            success = episode_group.attrs.get("success")
+            episodes.append({
+                "name": episode_name,
+                "num_samples": int(episode_group.attrs.get("num_samples", 0)),
+                "success": bool(success) if success is not None else None,
+            })
+        return {"env_args": data_group.attrs.get("env_args"), "episodes": episodes}
+
+
+def merge_datasets(
+    input_files: list[str], output_file: str, num_workers: int = 1, index_only: bool = False
+) -> list[dict]:
+    """Merge the episodes of the input files into the output file and write the sidecar index.
+
+    Args:
+        input_files: Paths to the dataset files to merge.
+        output_file: Path to the merged dataset file. If ``index_only`` is True, this is only used to
+            determine the path of the index file.
+        num_workers: Number of processes used to scan the input files. Defaults to 1.
+        index_only: Whether to only write the index of the input files. Defaults to False.
+
+    Returns:
+        The entries of the index, in the order of the episodes in the logical dataset.
+
+    Raises:
+        FileNotFoundError: If one of the input files does not exist.
+    """
+    for filepath in input_files:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"The dataset file {filepath} does not exist.")
 
-    with h5py.File(args_cli.output_file, "w") as output:
-        episode_idx = 0
-        copy_attributes = True
+    # scan the input files in parallel
+    # note: the output file is written by this process only, since HDF5 does not support concurrent writers
+    if num_workers > 1 and len(input_files) > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            scans = list(executor.map(scan_dataset_file, input_files))
+    else:
+        scans = [scan_dataset_file(filepath) for filepath in input_files]
+
+    # build the index of the logical dataset
+    index = []
+    file_entries = []
+    offset = 0
+    for filepath, scan in zip(input_files, scans):
+        entries = []
+        for episode in scan["episodes"]:
+            entries.append({
+                "name": episode["name"] if index_only else f"demo_{len(index) + len(entries)}",
+                "file": os.path.abspath(filepath if index_only else output_file),
+                "source_file": os.path.abspath(filepath),
+                "source_name": episode["name"],
+                "offset": offset,
+                "num_samples": episode["num_samples"],
+                "success": episode["success"],
+            })
+            offset += episode["num_samples"]
+        index += entries
+        file_entries.append(entries)
+    env_args = next((scan["env_args"] for scan in scans if scan["env_args"] is not None), None)
+
+    if not index_only:
+        with h5py.File(output_file, "w") as output:
+            data_group = output.create_group("data")
+            # copy the episodes as HDF5 objects, without decoding their data
+            for filepath, entries in zip(input_files, file_entries):
+                with h5py.File(filepath, "r") as input:
+                    for entry in entries:
+                        input.copy(f"data/{entry['source_name']}", data_group, entry["name"])
+            if env_args is not None:
+                data_group.attrs["env_args"] = env_args
+            data_group.attrs["total"] = offset
+
+    with open(get_index_file_path(output_file), "w") as f:
+        json.dump({"env_args": json.loads(env_args) if env_args is not None else None, "episodes": index}, f, indent=2)
+
+    return index
+
+
+def load_index(dataset_file_path: str) -> dict:
+    """Load the sidecar index of a dataset file.
 
-        for filepath in args_cli.input_files:
+    Args:
+        dataset_file_path: Path to the dataset file, or to the index file itself.
 
-            with h5py.File(filepath, "r") as input:
-                for episode, data in input["data"].items():
-                    input.copy(f"data/{episode}", output, f"data/demo_{episode_idx}")
-                    episode_idx += 1
+    Returns:
+        A dictionary with the environment arguments and the index entries of the episodes.
+    """
+    if not dataset_file_path.endswith(INDEX_FILE_SUFFIX):
+        dataset_file_path = get_index_file_path(dataset_file_path)
+    with open(dataset_file_path) as f:
+        return json.load(f)
 
-                if copy_attributes:
-                    output["data"].attrs["env_args"] = input["data"].attrs["env_args"]
-                    copy_attributes = False
 
-    print(f"Merged dataset saved to {args_cli.output_file}")
+def main():
+    """Main function to merge the datasets."""
+    args_cli = parse_args()
+    index = merge_datasets(args_cli.input_files, args_cli.output_file, args_cli.num_workers, args_cli.index_only)
+    if args_cli.index_only:
+        print(f"Indexed {len(index)} episodes in {get_index_file_path(args_cli.output_file)}")
+    else:
+        print(f"Merged dataset saved to {args_cli.output_file}")
 
 
 if __name__ == "__main__":
-    merge_datasets()
+    main()
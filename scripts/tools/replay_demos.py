@@ -32,6 +32,12 @@ parser.add_argument(
         " --num_envs is 1."
     ),
 )
+parser.add_argument(
+    "--lazy_load",
+    action="store_true",
+    default=False,
+    help="Read the episodes from the dataset file on access instead of loading them into memory at once.",
+)
 parser.add_argument(
     "--enable_pinocchio",
     action="store_true",
@@ -197,7 +203,7 @@ def main():
                             replayed_episode_count += 1
                             print(f"{replayed_episode_count :4}: Loading #{next_episode_index} episode to env_{env_id}")
                             episode_data = dataset_file_handler.load_episode(
-                                episode_names[next_episode_index], env.device
+                                episode_names[next_episode_index], env.device, lazy=args_cli.lazy_load
                             )
                             env_episode_data_map[env_id] = episode_data
                             # Set initial state for the new episode
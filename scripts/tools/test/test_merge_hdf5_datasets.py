@@ -0,0 +1,92 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the HDF5 dataset merge script."""
+
+import h5py
+import json
+import numpy as np
+import os
+import tempfile
+
+import pytest
+
+from scripts.tools.merge_hdf5_datasets import get_index_file_path, load_index, merge_datasets
+
+
+@pytest.fixture
+def temp_dataset_files():
+    """Create temporary shard files with test data."""
+    temp_dir = tempfile.TemporaryDirectory()
+    file_paths = []
+    for file_id in range(3):
+        file_path = os.path.join(temp_dir.name, f"shard_{file_id}.hdf5")
+        with h5py.File(file_path, "w") as h5f:
+            data_group = h5f.create_group("data")
+            data_group.attrs["env_args"] = json.dumps({"env_name": "test_env", "type": 2})
+            for demo_id in range(file_id + 1):
+                demo_group = data_group.create_group(f"demo_{demo_id}")
+                num_samples = 2 + demo_id
+                demo_group.attrs["num_samples"] = num_samples
+                demo_group.attrs["success"] = demo_id % 2 == 0
+                demo_group.create_dataset(
+                    "actions", data=np.full((num_samples, 3), file_id, dtype=np.float32), compression="gzip"
+                )
+                demo_group.create_dataset("obs/policy", data=np.random.rand(num_samples, 4), compression="gzip")
+        file_paths.append(file_path)
+    yield temp_dir.name, file_paths
+    # Cleanup
+    temp_dir.cleanup()
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_merge_datasets(temp_dataset_files, num_workers):
+    """Test merging the shard files into a single file."""
+    temp_dir, file_paths = temp_dataset_files
+    output_file = os.path.join(temp_dir, "merged.hdf5")
+    index = merge_datasets(file_paths, output_file, num_workers=num_workers)
+
+    # check the index
+    assert len(index) == 6
+    assert [entry["name"] for entry in index] == [f"demo_{i}" for i in range(6)]
+    assert [entry["num_samples"] for entry in index] == [2, 2, 3, 2, 3, 4]
+    assert [entry["offset"] for entry in index] == [0, 2, 4, 7, 9, 12]
+    assert [entry["success"] for entry in index] == [True, True, False, True, False, True]
+    assert load_index(output_file)["episodes"] == index
+    assert load_index(output_file)["env_args"]["env_name"] == "test_env"
+
+    # check the merged data against the source data
+    with h5py.File(output_file, "r") as output:
+        assert output["data"].attrs["total"] == 16
+        assert json.loads(output["data"].attrs["env_args"])["env_name"] == "test_env"
+        for entry in index:
+            with h5py.File(entry["source_file"], "r") as input:
+                source_group = input["data"][entry["source_name"]]
+                merged_group = output["data"][entry["name"]]
+                np.testing.assert_array_equal(merged_group["actions"][()], source_group["actions"][()])
+                np.testing.assert_array_equal(merged_group["obs/policy"][()], source_group["obs/policy"][()])
+                # the data is copied without re-encoding
+                assert merged_group["actions"].compression == "gzip"
+
+
+def test_index_only(temp_dataset_files):
+    """Test indexing the shard files without merging them."""
+    temp_dir, file_paths = temp_dataset_files
+    output_file = os.path.join(temp_dir, "sharded.hdf5")
+    index = merge_datasets(file_paths, output_file, index_only=True)
+
+    assert not os.path.exists(output_file)
+    assert os.path.exists(get_index_file_path(output_file))
+    assert len(index) == 6
+    for entry in index:
+        with h5py.File(entry["file"], "r") as input:
+            assert input["data"][entry["name"]].attrs["num_samples"] == entry["num_samples"]
+
+
+def test_missing_input_file(temp_dataset_files):
+    """Test that missing input files are reported."""
+    temp_dir, file_paths = temp_dataset_files
+    with pytest.raises(FileNotFoundError):
+        merge_datasets(file_paths + [os.path.join(temp_dir, "missing.hdf5")], os.path.join(temp_dir, "merged.hdf5"))
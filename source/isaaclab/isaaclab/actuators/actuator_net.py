@@ -111,6 +111,11 @@ class ActuatorNetMLP(DCMotor):
     and velocities which are used to provide input to the neural network. The model is loaded
     as a TorchScript.
 
+    The history is stored in a ring buffer, i.e. the newest entry overwrites the oldest one in place
+    instead of shifting the complete history at every step. The network input is then gathered from
+    the ring buffer with a single indexing operation, using the indices precomputed for each position
+    of the ring.
+
     Note:
         Only the desired joint positions are used as inputs to the network.
 
@@ -126,12 +131,31 @@ class ActuatorNetMLP(DCMotor):
         file_bytes = read_file(self.cfg.network_file)
         self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
 
-        # create buffers for MLP history
+        # create ring buffer for MLP history
+        # note: the position errors are stored in the first half and the velocities in the second half of the
+        #   last dimension, such that the network input of all the joints is gathered from a single tensor
         history_length = max(self.cfg.input_idx) + 1
-        self._joint_pos_error_history = torch.zeros(
-            self._num_envs, history_length, self.num_joints, device=self._device
-        )
-        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
+        self._history_length = history_length
+        self._history = torch.zeros(self._num_envs, self.num_joints, 2 * history_length, device=self._device)
+        self._history_pointer = 0
+
+        # precompute the indices of the network inputs in the ring buffer for every position of the ring
+        input_idx = torch.tensor(list(self.cfg.input_idx), dtype=torch.long, device=self._device)
+        if self.cfg.input_order == "pos_vel":
+            input_offsets = [0, history_length]
+            input_scales = [self.cfg.pos_scale, self.cfg.vel_scale]
+        elif self.cfg.input_order == "vel_pos":
+            input_offsets = [history_length, 0]
+            input_scales = [self.cfg.vel_scale, self.cfg.pos_scale]
+        else:
+            raise ValueError(
+                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
+            )
+        # shape: (history_length, 2 * len(input_idx))
+        ring_positions = torch.arange(history_length, device=self._device).unsqueeze(1)
+        slots = torch.remainder(ring_positions - input_idx.unsqueeze(0), history_length)
+        self._input_indices = torch.cat([slots + input_offsets[0], slots + input_offsets[1]], dim=1)
+        self._input_scales = torch.tensor(input_scales, device=self._device).repeat_interleave(len(input_idx))
 
     """
     Operations.
@@ -139,38 +163,24 @@ class ActuatorNetMLP(DCMotor):
 
     def reset(self, env_ids: Sequence[int]):
         # reset the history for the specified environments
-        self._joint_pos_error_history[env_ids] = 0.0
-        self._joint_vel_history[env_ids] = 0.0
+        self._history[env_ids] = 0.0
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
-        # move history queue by 1 and update top of history
+        # move the ring pointer by 1 and overwrite the oldest entry of the history
+        self._history_pointer = (self._history_pointer + 1) % self._history_length
         # -- positions
-        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
-        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
+        torch.sub(control_action.joint_positions, joint_pos, out=self._history[:, :, self._history_pointer])
         # -- velocity
-        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
-        self._joint_vel_history[:, 0] = joint_vel
+        self._history[:, :, self._history_length + self._history_pointer] = joint_vel
         # save current joint vel for dc-motor clipping
         self._joint_vel[:] = joint_vel
 
         # compute network inputs
-        # -- positions
-        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
-        # -- velocity
-        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
-        # -- scale and concatenate inputs
-        if self.cfg.input_order == "pos_vel":
-            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
-        elif self.cfg.input_order == "vel_pos":
-            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
-        else:
-            raise ValueError(
-                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
-            )
+        # -- gather the history entries of the inputs in the configured order and scale them
+        network_input = self._history[:, :, self._input_indices[self._history_pointer]]
+        network_input = network_input.view(self._num_envs * self.num_joints, -1).mul_(self._input_scales)
 
         # run network inference
         with torch.inference_mode():
@@ -122,7 +122,7 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         self.termination_manager = TerminationManager(self.cfg.terminations, self)
         print("[INFO] Termination Manager: ", self.termination_manager)
         # -- reward manager
-        self.reward_manager = RewardManager(self.cfg.rewards, self)
+        self.reward_manager = RewardManager(self.cfg.rewards, self, compile_terms=self.cfg.compile_rewards)
         print("[INFO] Reward Manager: ", self.reward_manager)
         # -- curriculum manager
         self.curriculum_manager = CurriculumManager(self.cfg.curriculum, self)
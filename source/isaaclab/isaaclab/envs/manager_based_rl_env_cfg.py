@@ -61,6 +61,13 @@ class ManagerBasedRLEnvCfg(ManagerBasedEnvCfg):
     Please refer to the :class:`isaaclab.managers.RewardManager` class for more details.
     """
 
+    compile_rewards: bool = False
+    """Whether to compile the reward computation with :func:`torch.compile`. Defaults to False.
+
+    This is only beneficial if all the reward terms are pure tensor functions of the environment state.
+    Please refer to the :class:`isaaclab.managers.RewardManager` class for more details.
+    """
+
     terminations: object = MISSING
     """Termination settings.
 
@@ -240,6 +240,36 @@ class ObservationGroupCfg:
     ObservationGroupCfg.history_length is set.
     """
 
+    fuse_history: bool = False
+    """Whether to store the history of all observation terms in the group in a single shared buffer.
+    Defaults to False, in which case each term has its own history buffer.
+
+    If True, the terms write their values into their column slice of a single group-level ring buffer of shape
+    (num_envs, history_length, group_dim). This avoids the per-term history bookkeeping and the concatenation
+    of the term histories, and the group observation is returned as a view into the ring buffer. The view is
+    only valid until the next update of the history, so it must be cloned if it needs to be kept around.
+
+    Note that the flattened history is ordered time-major, i.e. the values of all the terms at the oldest step
+    come first, followed by the values of all the terms at the next step, and so on. This differs from the
+    default layout, where the complete history of each term is stored contiguously.
+
+    This requires :attr:`history_length` to be set, :attr:`concatenate_terms` to be True, the terms to be
+    concatenated along the last dimension, and all the terms to return tensors of shape (num_envs, obs_term_dim).
+    The :attr:`concatenate_dim` must be -1, or 0 if :attr:`flatten_history_dim` is True.
+    """
+
+    static_layout: bool = False
+    """Whether to write the observation terms into a preallocated output buffer of the group. Defaults to False,
+    in which case the observation terms are concatenated into a new tensor at every computation.
+
+    If True, the observation manager allocates a single contiguous output tensor for the group at initialization
+    and each term writes its processed values directly into its slice of it. The copy into the output buffer
+    replaces the clone of the term's value, which is then only performed when the term has modifiers. The same
+    output tensor is returned at every computation, so it must be cloned if it needs to be kept around.
+
+    This setting only has an effect if :attr:`concatenate_terms` is True and :attr:`fuse_history` is False.
+    """
+
 
 ##
 # Event manager
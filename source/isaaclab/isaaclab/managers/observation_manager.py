@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import numpy as np
 import torch
@@ -51,6 +52,8 @@ class ObservationManager(ManagerBase):
     per :class:`ObservationTermCfg` (See the :attr:`ObservationTermCfg.history_length` and
     :attr:`ObservationTermCfg.flatten_history_dim`). History can also be controlled via :class:`ObservationGroupCfg`
     where group configuration overwrites per term configuration if set. History follows an oldest to newest ordering.
+    Groups can optionally store the history of all their terms in a single shared buffer (See the
+    :attr:`ObservationGroupCfg.fuse_history`), in which case the flattened history is ordered time-major.
 
     The observation manager can be used to compute observations for all the groups or for a specific group. The
     observations are computed by calling the registered functions for each term in the group. The functions are
@@ -110,6 +113,26 @@ class ObservationManager(ManagerBase):
             else:
                 self._group_obs_dim[group_name] = group_term_dims
 
+        # allocate the output buffers of the groups with static layout
+        # note: each term is assigned a view into the output buffer along the concatenation dimension
+        self._group_obs_out_buffer: dict[str, torch.Tensor] = dict()
+        self._group_obs_term_out_buffer: dict[str, list[torch.Tensor]] = dict()
+        for group_name in self._group_obs_static_layout:
+            concatenate_dim = self._group_obs_concatenate_dim[group_name]
+            out_buffer = torch.zeros(
+                (self._env.num_envs, *self._group_obs_dim[group_name]),
+                dtype=self._group_obs_static_layout[group_name],
+                device=self._env.device,
+            )
+            term_out_buffers = list()
+            offset = 0
+            for term_dims in self._group_obs_term_dim[group_name]:
+                term_size = int((self._env.num_envs, *term_dims)[concatenate_dim])
+                term_out_buffers.append(out_buffer.narrow(concatenate_dim, offset, term_size))
+                offset += term_size
+            self._group_obs_out_buffer[group_name] = out_buffer
+            self._group_obs_term_out_buffer[group_name] = term_out_buffers
+
         # Stores the latest observations.
         self._obs_buffer: dict[str, torch.Tensor | dict[str, torch.Tensor]] | None = None
 
@@ -166,9 +189,19 @@ class ObservationManager(ManagerBase):
                     terms.append((group_name + "-" + name, term[env_idx].cpu().tolist()))
                 continue
 
-            idx = 0
             # add info for each term
             data = obs_buffer[group_name]
+            if group_name in self._group_obs_fused_history_buffer:
+                # fused history is ordered time-major, so the terms are strided over the history
+                history = data[env_idx].reshape(self._group_obs_fused_history_buffer[group_name].max_length, -1)
+                for name, term_slice in zip(
+                    self._group_obs_term_names[group_name],
+                    self._group_obs_fused_history_slices[group_name],
+                ):
+                    terms.append((group_name + "-" + name, history[:, term_slice].flatten().cpu().tolist()))
+                continue
+
+            idx = 0
             for name, shape in zip(
                 self._group_obs_term_names[group_name],
                 self._group_obs_term_dim[group_name],
@@ -302,6 +335,9 @@ class ObservationManager(ManagerBase):
             for term_name in self._group_obs_term_names[group_name]:
                 if term_name in self._group_obs_term_history_buffer[group_name]:
                     self._group_obs_term_history_buffer[group_name][term_name].reset(batch_ids=env_ids)
+            # reset fused history of the group
+            if group_name in self._group_obs_fused_history_buffer:
+                self._group_obs_fused_history_buffer[group_name].reset(batch_ids=env_ids)
         # call all modifiers that are classes
         for mod in self._group_obs_class_instances:
             mod.reset(env_ids=env_ids)
@@ -383,11 +419,26 @@ class ObservationManager(ManagerBase):
         group_obs = dict.fromkeys(group_term_names, None)
         # read attributes for each term
         obs_terms = zip(group_term_names, self._group_obs_term_cfgs[group_name])
+        # read fused history of the group (if any)
+        fused_history = group_name in self._group_obs_fused_history_buffer
+        if fused_history:
+            term_slices = self._group_obs_fused_history_slices[group_name]
+            fused_obs = self._group_obs_fused_history_data[group_name]
+        # read output buffers of the terms for static layout (if any)
+        term_out_buffers = self._group_obs_term_out_buffer.get(group_name)
 
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
-        for term_name, term_cfg in obs_terms:
+        for term_idx, (term_name, term_cfg) in enumerate(obs_terms):
+            # resolve the output buffer of the term (only for static layout)
+            term_out = term_out_buffers[term_idx] if term_out_buffers is not None else None
             # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            # note: the term's value is copied so that the in-place operations do not modify the source data.
+            #   For static layout, the copy into the output buffer replaces the clone.
+            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params)
+            if term_out is not None and term_cfg.history_length == 0:
+                obs = term_out.copy_(obs)
+            else:
+                obs = obs.clone()
             # apply post-processing
             if term_cfg.modifiers is not None:
                 for modifier in term_cfg.modifiers:
@@ -396,12 +447,18 @@ class ObservationManager(ManagerBase):
                 obs = term_cfg.noise.func(obs, term_cfg.noise)
             elif isinstance(term_cfg.noise, noise.NoiseModelCfg) and term_cfg.noise.func is not None:
                 obs = term_cfg.noise.func(obs)
+            # write back the output of out-of-place operations into the output buffer
+            if term_out is not None and term_cfg.history_length == 0 and obs is not term_out:
+                obs = term_out.copy_(obs)
             if term_cfg.clip:
                 obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
             if term_cfg.scale is not None:
                 obs = obs.mul_(term_cfg.scale)
+            # Write the term into its slice of the group's fused history entry
+            if fused_history:
+                fused_obs[:, term_slices[term_idx]] = obs
             # Update the history buffer if observation term has history enabled
-            if term_cfg.history_length > 0:
+            elif term_cfg.history_length > 0:
                 circular_buffer = self._group_obs_term_history_buffer[group_name][term_name]
                 if update_history:
                     circular_buffer.append(obs)
@@ -412,16 +469,46 @@ class ObservationManager(ManagerBase):
                         max_len=circular_buffer.max_length,
                         batch_size=circular_buffer.batch_size,
                         device=circular_buffer.device,
+                        mirrored=circular_buffer.is_mirrored,
                     )
                     circular_buffer.append(obs)
 
+                # note: the history buffer returns a view into its storage. When the terms are concatenated,
+                #   the concatenation copies the data. Otherwise, we clone to not hand out aliased memory.
+                history = circular_buffer.buffer
                 if term_cfg.flatten_history_dim:
-                    group_obs[term_name] = circular_buffer.buffer.reshape(self._env.num_envs, -1)
+                    history = history.reshape(self._env.num_envs, -1)
+                if not self._group_obs_concatenate[group_name]:
+                    history = history.clone()
+                if term_out is not None:
+                    term_out.copy_(history)
                 else:
-                    group_obs[term_name] = circular_buffer.buffer
-            else:
+                    group_obs[term_name] = history
+            elif term_out is None:
                 group_obs[term_name] = obs
 
+        # update the fused history and return a view into it
+        if fused_history:
+            circular_buffer = self._group_obs_fused_history_buffer[group_name]
+            if update_history:
+                circular_buffer.append(fused_obs)
+            elif circular_buffer._buffer is None:
+                # this guards history buffer from corruption by external calls before simulation start
+                circular_buffer = CircularBuffer(
+                    max_len=circular_buffer.max_length,
+                    batch_size=circular_buffer.batch_size,
+                    device=circular_buffer.device,
+                    mirrored=True,
+                )
+                circular_buffer.append(fused_obs)
+            # note: the history of all terms is a single contiguous window of the buffer
+            if self._group_obs_fused_history_flatten[group_name]:
+                return circular_buffer.buffer.reshape(self._env.num_envs, -1)
+            return circular_buffer.buffer
+
+        # terms were written directly into the output buffer
+        if term_out_buffers is not None:
+            return self._group_obs_out_buffer[group_name]
         # concatenate all observations in the group together
         if self._group_obs_concatenate[group_name]:
             # set the concatenate dimension, account for the batch dimension if positive dimension is given
@@ -468,6 +555,13 @@ class ObservationManager(ManagerBase):
         self._group_obs_concatenate_dim: dict[str, int] = dict()
 
         self._group_obs_term_history_buffer: dict[str, dict] = dict()
+        # create buffers for groups that share a single history buffer for all terms
+        self._group_obs_fused_history_buffer: dict[str, CircularBuffer] = dict()
+        self._group_obs_fused_history_data: dict[str, torch.Tensor] = dict()
+        self._group_obs_fused_history_slices: dict[str, list[slice]] = dict()
+        self._group_obs_fused_history_flatten: dict[str, bool] = dict()
+        # create a map from the groups with static layout to the data type of their output buffer
+        self._group_obs_static_layout: dict[str, torch.dtype] = dict()
         # create a list to store classes instances, e.g., for modifiers and noise models
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
         self._group_obs_class_instances: list[modifiers.ModifierBase | noise.NoiseModel] = list()
@@ -507,6 +601,11 @@ class ObservationManager(ManagerBase):
             self._group_obs_concatenate_dim[group_name] = (
                 group_cfg.concatenate_dim + 1 if group_cfg.concatenate_dim >= 0 else group_cfg.concatenate_dim
             )
+            # check that the group can use a fused history buffer
+            self._check_fused_history_cfg(group_name, group_cfg)
+            # shapes and data types of the term outputs (without history)
+            group_entry_obs_dims: list[tuple[int, ...]] = list()
+            group_entry_obs_dtypes: list[torch.dtype] = list()
             # check if config is dict already
             if isinstance(group_cfg, dict):
                 group_cfg_items = group_cfg.items()
@@ -521,6 +620,8 @@ class ObservationManager(ManagerBase):
                     "history_length",
                     "flatten_history_dim",
                     "concatenate_dim",
+                    "fuse_history",
+                    "static_layout",
                 ]:
                     continue
                 # check for non config
@@ -546,7 +647,10 @@ class ObservationManager(ManagerBase):
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
 
                 # call function the first time to fill up dimensions
-                obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape)
+                obs = term_cfg.func(self._env, **term_cfg.params)
+                obs_dims = tuple(obs.shape)
+                group_entry_obs_dims.append(obs_dims)
+                group_entry_obs_dtypes.append(obs.dtype)
 
                 # if scale is set, check if single float or tuple
                 if term_cfg.scale is not None:
@@ -627,9 +731,14 @@ class ObservationManager(ManagerBase):
 
                 # create history buffers and calculate history term dimensions
                 if term_cfg.history_length > 0:
-                    group_entry_history_buffer[term_name] = CircularBuffer(
-                        max_len=term_cfg.history_length, batch_size=self._env.num_envs, device=self._env.device
-                    )
+                    # note: for fused history, a single buffer is created for the whole group below
+                    if not group_cfg.fuse_history:
+                        group_entry_history_buffer[term_name] = CircularBuffer(
+                            max_len=term_cfg.history_length,
+                            batch_size=self._env.num_envs,
+                            device=self._env.device,
+                            mirrored=True,
+                        )
                     old_dims = list(obs_dims)
                     old_dims.insert(1, term_cfg.history_length)
                     obs_dims = tuple(old_dims)
@@ -645,3 +754,69 @@ class ObservationManager(ManagerBase):
                     term_cfg.func.reset()
             # add history buffers for each group
             self._group_obs_term_history_buffer[group_name] = group_entry_history_buffer
+            # create the static output buffer and the fused history buffer of the group
+            self._prepare_group_buffers(group_name, group_cfg, group_entry_obs_dims, group_entry_obs_dtypes)
+
+    def _check_fused_history_cfg(self, group_name: str, group_cfg: ObservationGroupCfg):
+        """Checks that the group can use a fused history buffer, if it is enabled."""
+        if not group_cfg.fuse_history:
+            return
+        if group_cfg.history_length is None or group_cfg.history_length <= 0:
+            raise ValueError(
+                f"Observation group '{group_name}' has 'fuse_history' enabled but no group-level"
+                f" 'history_length'. Received: {group_cfg.history_length}."
+            )
+        # note: for terms of shape (num_envs, obs_term_dim), the first dimension (after the batch dimension) is also
+        #   the last one, unless the history dimension is kept
+        last_dims = (-1, 0) if group_cfg.flatten_history_dim else (-1,)
+        if not group_cfg.concatenate_terms or group_cfg.concatenate_dim not in last_dims:
+            raise ValueError(
+                f"Observation group '{group_name}' has 'fuse_history' enabled but its terms are not"
+                " concatenated along the last dimension. Please set 'concatenate_terms' to True and"
+                " 'concatenate_dim' to -1 (or 0 if 'flatten_history_dim' is True)."
+                f" Received: {group_cfg.concatenate_dim}."
+            )
+
+    def _prepare_group_buffers(
+        self,
+        group_name: str,
+        group_cfg: ObservationGroupCfg,
+        obs_dims: list[tuple[int, ...]],
+        obs_dtypes: list[torch.dtype],
+    ):
+        """Prepares the static output layout and the fused history buffer of a group.
+
+        Args:
+            group_name: The name of the group.
+            group_cfg: The configuration of the group.
+            obs_dims: The shapes of the term outputs (without history).
+            obs_dtypes: The data types of the term outputs.
+        """
+        # resolve the data type of the output buffer for static layout
+        if group_cfg.static_layout and group_cfg.concatenate_terms and not group_cfg.fuse_history and obs_dtypes:
+            self._group_obs_static_layout[group_name] = functools.reduce(torch.promote_types, obs_dtypes)
+        if not group_cfg.fuse_history:
+            return
+        # compute the terms' slices in the fused history entry
+        fused_slices: list[slice] = list()
+        fused_dim = 0
+        for term_name, term_obs_dims in zip(self._group_obs_term_names[group_name], obs_dims):
+            if len(term_obs_dims) != 2:
+                raise ValueError(
+                    f"Observation term '{term_name}' in group '{group_name}' has shape {term_obs_dims[1:]}, but"
+                    " groups with 'fuse_history' enabled only support terms of shape (num_envs, obs_term_dim)."
+                )
+            fused_slices.append(slice(fused_dim, fused_dim + term_obs_dims[1]))
+            fused_dim += term_obs_dims[1]
+        # create the fused history buffer of the group
+        self._group_obs_fused_history_buffer[group_name] = CircularBuffer(
+            max_len=group_cfg.history_length,
+            batch_size=self._env.num_envs,
+            device=self._env.device,
+            mirrored=True,
+        )
+        self._group_obs_fused_history_data[group_name] = torch.zeros(
+            (self._env.num_envs, fused_dim), device=self._env.device
+        )
+        self._group_obs_fused_history_slices[group_name] = fused_slices
+        self._group_obs_fused_history_flatten[group_name] = group_cfg.flatten_history_dim
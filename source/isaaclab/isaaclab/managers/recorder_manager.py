@@ -14,7 +14,7 @@ from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from isaaclab.utils import configclass
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import EpisodeData, EpisodeDataBuffer, HDF5DatasetFileHandler
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import RecorderTermCfg
@@ -38,6 +38,13 @@ class RecorderManagerBaseCfg:
 
     dataset_file_handler_class_type: type = HDF5DatasetFileHandler
 
+    dataset_file_handler_kwargs: dict = dict()
+    """Keyword arguments passed to the dataset file handler on construction. Defaults to an empty dictionary.
+
+    For the :class:`~isaaclab.utils.datasets.HDF5DatasetFileHandler`, this can be used to select the compression
+    filter and to write the episodes in a background thread, e.g. ``{"compression": "lzf", "async_write": True}``.
+    """
+
     dataset_export_dir_path: str = "/tmp/isaaclab/logs"
     """The directory path where the recorded datasets are exported."""
 
@@ -50,6 +57,18 @@ class RecorderManagerBaseCfg:
     export_in_record_pre_reset: bool = True
     """Whether to export episodes in the record_pre_reset call."""
 
+    episode_buffer_length: int | None = None
+    """The number of entries to preallocate per recorded key and environment. Defaults to None,
+    in which case the episodes are stored as lists of tensors in :class:`~isaaclab.utils.datasets.EpisodeData`.
+
+    If set, the episodes of all the environments are stored in a :class:`~isaaclab.utils.datasets.EpisodeDataBuffer`,
+    which holds each recorded key in a preallocated tensor of shape (num_envs, episode_buffer_length, ...).
+    Recording a key then costs a single scatter for all the environments instead of a copy per environment.
+    The value must be at least the number of times a key is recorded within an episode, e.g. the maximum
+    episode length in steps for keys recorded at every step, multiplied by the decimation for keys recorded
+    at every physics step.
+    """
+
 
 class RecorderTerm(ManagerTermBase):
     """Base class for recorder terms.
@@ -145,6 +164,7 @@ class RecorderManager(ManagerBase):
         """
         self._term_names: list[str] = list()
         self._terms: dict[str, RecorderTerm] = dict()
+        self._episode_buffer: EpisodeDataBuffer | None = None
 
         # Do nothing if cfg is None or an empty dict
         if not cfg:
@@ -161,21 +181,29 @@ class RecorderManager(ManagerBase):
 
         # create episode data buffer indexed by environment id
         self._episodes: dict[int, EpisodeData] = dict()
-        for env_id in range(env.num_envs):
-            self._episodes[env_id] = EpisodeData()
+        if cfg.episode_buffer_length is not None:
+            # store the episodes of all environments in preallocated tensors
+            # note: the success values are stored separately since they are set per episode
+            self._episode_buffer = EpisodeDataBuffer(env.num_envs, cfg.episode_buffer_length, env.device)
+            self._episode_success: dict[int, bool] = dict()
+        else:
+            for env_id in range(env.num_envs):
+                self._episodes[env_id] = EpisodeData()
 
         env_name = getattr(env.cfg, "env_name", None)
 
         self._dataset_file_handler = None
         if cfg.dataset_export_mode != DatasetExportMode.EXPORT_NONE:
-            self._dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._dataset_file_handler = cfg.dataset_file_handler_class_type(**cfg.dataset_file_handler_kwargs)
             self._dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, cfg.dataset_filename), env_name=env_name
             )
 
         self._failed_episode_dataset_file_handler = None
         if cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_FAILED_IN_SEPARATE_FILES:
-            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type(
+                **cfg.dataset_file_handler_kwargs
+            )
             self._failed_episode_dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, f"{cfg.dataset_filename}_failed"), env_name=env_name
             )
@@ -280,8 +308,13 @@ class RecorderManager(ManagerBase):
         for term in self._terms.values():
             term.reset(env_ids=env_ids)
 
-        for env_id in env_ids:
-            self._episodes[env_id] = EpisodeData()
+        if self._episode_buffer is not None:
+            self._episode_buffer.reset(env_ids)
+            for env_id in env_ids:
+                self._episode_success.pop(env_id, None)
+        else:
+            for env_id in env_ids:
+                self._episodes[env_id] = EpisodeData()
 
         # nothing to log here
         return {}
@@ -295,6 +328,10 @@ class RecorderManager(ManagerBase):
         Returns:
             The episode data for the given environment id.
         """
+        if self._episode_buffer is not None:
+            episode = self._episode_buffer.get_episode(env_id)
+            episode.success = self._episode_success.get(env_id)
+            return episode
         return self._episodes.get(env_id, EpisodeData())
 
     def add_to_episodes(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
@@ -315,6 +352,11 @@ class RecorderManager(ManagerBase):
         # resolve environment ids
         if key is None:
             return
+        # write the values of all environments at once into the preallocated buffer
+        # note: the buffer resolves the environment ids and nested values itself
+        if self._episode_buffer is not None:
+            self._episode_buffer.add(key, value, env_ids)
+            return
         if env_ids is None:
             env_ids = list(range(self._env.num_envs))
         if isinstance(env_ids, torch.Tensor):
@@ -348,6 +390,10 @@ class RecorderManager(ManagerBase):
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
+        if self._episode_buffer is not None:
+            for env_id, success in zip(env_ids, success_values.view(-1).tolist()):
+                self._episode_success[env_id] = success
+            return
         for value_index, env_id in enumerate(env_ids):
             self._episodes[env_id].success = success_values[value_index].item()
 
@@ -461,7 +507,16 @@ class RecorderManager(ManagerBase):
         # Export episode data through dataset exporter
         need_to_flush = False
 
-        if any(env_id in self._episodes and not self._episodes[env_id].is_empty() for env_id in env_ids):
+        # slice the episodes out of the preallocated buffer
+        if self._episode_buffer is not None:
+            episodes = {env_id: self.get_episode(env_id) for env_id in env_ids}
+            self._episode_buffer.reset(env_ids)
+            for env_id in env_ids:
+                self._episode_success.pop(env_id, None)
+        else:
+            episodes = self._episodes
+
+        if any(env_id in episodes and not episodes[env_id].is_empty() for env_id in env_ids):
             ep_meta = self.get_ep_meta()
             if self._dataset_file_handler is not None:
                 self._dataset_file_handler.add_env_args(ep_meta)
@@ -469,10 +524,10 @@ class RecorderManager(ManagerBase):
                 self._failed_episode_dataset_file_handler.add_env_args(ep_meta)
 
         for env_id in env_ids:
-            if env_id in self._episodes and not self._episodes[env_id].is_empty():
-                self._episodes[env_id].pre_export()
+            if env_id in episodes and not episodes[env_id].is_empty():
+                episodes[env_id].pre_export()
 
-                episode_succeeded = self._episodes[env_id].success
+                episode_succeeded = episodes[env_id].success
                 target_dataset_file_handler = None
                 if (self.cfg.dataset_export_mode == DatasetExportMode.EXPORT_ALL) or (
                     self.cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_ONLY and episode_succeeded
@@ -484,7 +539,7 @@ class RecorderManager(ManagerBase):
                     else:
                         target_dataset_file_handler = self._failed_episode_dataset_file_handler
                 if target_dataset_file_handler is not None:
-                    target_dataset_file_handler.write_episode(self._episodes[env_id])
+                    target_dataset_file_handler.write_episode(episodes[env_id])
                     need_to_flush = True
                 # Update episode count
                 if episode_succeeded:
@@ -494,7 +549,8 @@ class RecorderManager(ManagerBase):
                 else:
                     self._exported_failed_episode_count[env_id] = self._exported_failed_episode_count.get(env_id, 0) + 1
             # Reset the episode buffer for the given environment after export
-            self._episodes[env_id] = EpisodeData()
+            if self._episode_buffer is None:
+                self._episodes[env_id] = EpisodeData()
 
         if need_to_flush:
             if self._dataset_file_handler is not None:
@@ -517,10 +573,12 @@ class RecorderManager(ManagerBase):
             # skip non-term settings
             if term_name in [
                 "dataset_file_handler_class_type",
+                "dataset_file_handler_kwargs",
                 "dataset_filename",
                 "dataset_export_dir_path",
                 "dataset_export_mode",
                 "export_in_record_pre_reset",
+                "episode_buffer_length",
             ]:
                 continue
             # check if term config is None
@@ -35,17 +35,28 @@ class RewardManager(ManagerBase):
         of the environment. This is done to ensure that the computed reward terms are balanced with
         respect to the chosen time-step interval in the environment.
 
+    The raw values of the reward terms are stacked into a single (num_envs, num_terms) buffer. The weighted
+    sum over the terms is then computed with a single matrix-vector product against the vector of term weights,
+    and the episodic sums of all the terms are updated at once. This keeps the number of kernel launches
+    independent of the number of terms, except for the evaluation of the terms themselves.
+
+    Optionally, the computation can be compiled with :func:`torch.compile`. This is only beneficial if all the
+    reward terms are pure tensor functions of the environment state. Otherwise, the compiled region breaks at
+    the terms that cannot be traced, which may be slower than the eager computation.
+
     """
 
     _env: ManagerBasedRLEnv
     """The environment instance."""
 
-    def __init__(self, cfg: object, env: ManagerBasedRLEnv):
+    def __init__(self, cfg: object, env: ManagerBasedRLEnv, compile_terms: bool = False):
         """Initialize the reward manager.
 
         Args:
             cfg: The configuration object or dictionary (``dict[str, RewardTermCfg]``).
             env: The environment instance.
+            compile_terms: Whether to compile the evaluation of the terms and their weighted sum with
+                :func:`torch.compile`. Defaults to False.
         """
         # create buffers to parse and store terms
         self._term_names: list[str] = list()
@@ -55,15 +66,26 @@ class RewardManager(ManagerBase):
         # call the base class constructor (this will parse the terms config)
         super().__init__(cfg, env)
         # prepare extra info to store individual reward term information
-        self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        # note: the columns correspond to the terms in the order of :attr:`active_terms`
+        self._episode_sums = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
 
+        # Buffer which stores the raw value of each term for each environment
+        self._term_values = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
         # Buffer which stores the current step reward for each term for each environment
         self._step_reward = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
 
+        # Buffers which store the weights of the terms, and the weights scaled by the time-step interval
+        # note: these are updated at the next computation whenever the weights or the time-step interval change
+        self._term_weights = torch.zeros(len(self._term_names), dtype=torch.float, device=self.device)
+        self._term_weights_dt = torch.zeros(len(self._term_names), dtype=torch.float, device=self.device)
+        self._term_weights_key: tuple[tuple[float, ...], float] | None = None
+
+        # compile the computation of the reward (if enabled)
+        if compile_terms:
+            self._compute_terms = torch.compile(self._compute_terms)
+
     def __str__(self) -> str:
         """Returns: A string representation for reward manager."""
         msg = f"<RewardManager> contains {len(self._term_names)} active terms.\n"
@@ -112,13 +134,12 @@ class RewardManager(ManagerBase):
             env_ids = slice(None)
         # store information
         extras = {}
-        for key in self._episode_sums.keys():
-            # store information
-            # r_1 + r_2 + ... + r_n
-            episodic_sum_avg = torch.mean(self._episode_sums[key][env_ids])
-            extras["Episode_Reward/" + key] = episodic_sum_avg / self._env.max_episode_length_s
-            # reset episodic sum
-            self._episode_sums[key][env_ids] = 0.0
+        # r_1 + r_2 + ... + r_n
+        episodic_sum_avg = torch.mean(self._episode_sums[env_ids], dim=0) / self._env.max_episode_length_s
+        for term_idx, term_name in enumerate(self._term_names):
+            extras["Episode_Reward/" + term_name] = episodic_sum_avg[term_idx]
+        # reset episodic sum
+        self._episode_sums[env_ids] = 0.0
         # reset all the reward terms
         for term_cfg in self._class_term_cfgs:
             term_cfg.func.reset(env_ids=env_ids)
@@ -137,25 +158,41 @@ class RewardManager(ManagerBase):
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
+        # update the weights of the terms
+        # note: the weights can be modified through the term configurations, e.g. by a curriculum
+        weights = tuple(float(term_cfg.weight) for term_cfg in self._term_cfgs)
+        if self._term_weights_key != (weights, dt):
+            self._term_weights_key = (weights, dt)
+            self._term_weights[:] = torch.tensor(weights, dtype=torch.float)
+            self._term_weights_dt[:] = torch.tensor([weight * dt for weight in weights], dtype=torch.float)
+            # clear the values of the terms that are skipped
+            for term_idx, weight in enumerate(weights):
+                if weight == 0.0:
+                    self._term_values[:, term_idx] = 0.0
+        # compute the reward
+        self._compute_terms(dt)
+
+        return self._reward_buf
+
+    def _compute_terms(self, dt: float):
+        """Evaluates the reward terms and reduces them into the reward buffers.
+
+        Args:
+            dt: The time-step interval of the environment.
+        """
         # iterate over all the reward terms
-        for term_idx, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
+        for term_idx, term_cfg in enumerate(self._term_cfgs):
             # skip if weight is zero (kind of a micro-optimization)
             if term_cfg.weight == 0.0:
-                self._step_reward[:, term_idx] = 0.0
                 continue
             # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
-
-            # Update current reward for this step.
-            self._step_reward[:, term_idx] = value / dt
-
-        return self._reward_buf
+            self._term_values[:, term_idx] = term_cfg.func(self._env, **term_cfg.params)
+        # Update current reward for this step.
+        torch.mul(self._term_values, self._term_weights, out=self._step_reward)
+        # update total reward
+        torch.mv(self._term_values, self._term_weights_dt, out=self._reward_buf)
+        # update episodic sum
+        self._episode_sums.add_(self._step_reward, alpha=dt)
 
     """
     Operations - Term settings.
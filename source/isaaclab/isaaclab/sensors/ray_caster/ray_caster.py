@@ -23,7 +23,7 @@ import isaaclab.utils.math as math_utils
 from isaaclab.markers import VisualizationMarkers
 from isaaclab.terrains.trimesh.utils import make_plane
 from isaaclab.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
+from isaaclab.utils.warp import RaycastContext, convert_to_warp_mesh
 
 from ..sensor_base import SensorBase
 from .ray_caster_data import RayCasterData
@@ -40,12 +40,12 @@ class RayCaster(SensorBase):
     a set of meshes with a given ray pattern.
 
     The meshes are parsed from the list of primitive paths provided in the configuration. These are then
-    converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
-    these warp meshes using the ray pattern provided in the configuration.
+    converted to warp meshes and stored in the `meshes` dictionary. The ray-caster then ray-casts against
+    these warp meshes using the ray pattern provided in the configuration, and returns the closest hit.
 
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    Meshes that move during the simulation, such as obstacles in each environment, are parsed from the
+    list of dynamic mesh primitive paths. The mesh of the first matching prim is instanced at the current
+    poses of all the matching prims, which are read at every update.
     """
 
     cfg: RayCasterCfg
@@ -73,6 +73,8 @@ class RayCaster(SensorBase):
         self._data = RayCasterData()
         # the warp meshes used for raycasting.
         self.meshes: dict[str, wp.Mesh] = {}
+        # the views of the prims of the dynamic meshes, used for reading their poses
+        self._dynamic_mesh_views: dict[str, XFormPrim] = {}
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -160,55 +162,82 @@ class RayCaster(SensorBase):
         self._initialize_rays_impl()
 
     def _initialize_warp_meshes(self):
-        # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
-
         # read prims to ray-cast
         for mesh_prim_path in self.cfg.mesh_prim_paths:
-            # check if the prim is a plane - handle PhysX plane as a special case
-            # if a plane exists then we need to create an infinite mesh that is a plane
-            mesh_prim = sim_utils.get_first_matching_child_prim(
-                mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane"
-            )
-            # if we did not find a plane then we need to read the mesh
-            if mesh_prim is None:
-                # obtain the mesh prim
-                mesh_prim = sim_utils.get_first_matching_child_prim(
-                    mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
+            self.meshes[mesh_prim_path] = self._create_warp_mesh(mesh_prim_path)
+
+        # read the dynamic prims to ray-cast
+        for mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+            view = XFormPrim(mesh_prim_path, reset_xform_properties=False)
+            if view.count != self._view.count:
+                raise RuntimeError(
+                    f"The dynamic mesh prim path '{mesh_prim_path}' matches {view.count} prims, but the ray-caster"
+                    f" has {self._view.count} sensors. Please provide one prim per sensor."
                 )
-                # check if valid
-                if mesh_prim is None or not mesh_prim.IsValid():
-                    raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
-                # cast into UsdGeomMesh
-                mesh_prim = UsdGeom.Mesh(mesh_prim)
-                # read the vertices and faces
-                points = np.asarray(mesh_prim.GetPointsAttr().Get())
-                transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
-                points = np.matmul(points, transform_matrix[:3, :3].T)
-                points += transform_matrix[:3, 3]
-                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
-                wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
-                # print info
-                omni.log.info(
-                    f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
-                )
-            else:
-                mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
-                wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-                # print info
-                omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
-            # add the warp mesh to the list
-            self.meshes[mesh_prim_path] = wp_mesh
+            # express the mesh of the first prim in the frame of the prim, so that it can be instanced at the
+            # poses of all the prims
+            pos_w, quat_w = view.get_world_poses([0])
+            self.meshes[mesh_prim_path] = self._create_warp_mesh(view.prim_paths[0], pos_w[0], quat_w[0])
+            self._dynamic_mesh_views[mesh_prim_path] = view
 
         # throw an error if no meshes are found
-        if all([mesh_prim_path not in self.meshes for mesh_prim_path in self.cfg.mesh_prim_paths]):
+        if len(self.meshes) == 0:
             raise RuntimeError(
                 f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
             )
 
+    def _create_warp_mesh(
+        self, mesh_prim_path: str, pos_w: torch.Tensor | None = None, quat_w: torch.Tensor | None = None
+    ) -> wp.Mesh:
+        """Creates the warp mesh of the first mesh prim under the given path.
+
+        Args:
+            mesh_prim_path: The prim path expression to read the mesh from.
+            pos_w: The position of the frame to express the mesh in. Defaults to None, in which case
+                the mesh is expressed in the world frame.
+            quat_w: The orientation (w, x, y, z) of the frame to express the mesh in. Defaults to None, in which
+                case the mesh is expressed in the world frame.
+
+        Returns:
+            The warp mesh.
+        """
+        # check if the prim is a plane - handle PhysX plane as a special case
+        # if a plane exists then we need to create an infinite mesh that is a plane
+        mesh_prim = sim_utils.get_first_matching_child_prim(mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane")
+        # if we did not find a plane then we need to read the mesh
+        if mesh_prim is None:
+            # obtain the mesh prim
+            mesh_prim = sim_utils.get_first_matching_child_prim(
+                mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
+            )
+            # check if valid
+            if mesh_prim is None or not mesh_prim.IsValid():
+                raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
+            # cast into UsdGeomMesh
+            mesh_prim = UsdGeom.Mesh(mesh_prim)
+            # read the vertices and faces
+            points = np.asarray(mesh_prim.GetPointsAttr().Get())
+            transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
+            points = np.matmul(points, transform_matrix[:3, :3].T)
+            points += transform_matrix[:3, 3]
+            # express the vertices in the given frame
+            if pos_w is not None and quat_w is not None:
+                points = torch.tensor(points, dtype=torch.float32, device=pos_w.device)
+                points = math_utils.quat_apply_inverse(quat_w.expand(len(points), 4), points - pos_w)
+                points = points.cpu().numpy()
+            indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
+            wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
+            # print info
+            omni.log.info(
+                f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
+            )
+        else:
+            mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
+            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+            # print info
+            omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
+        return wp_mesh
+
     def _initialize_rays_impl(self):
         # compute ray stars and directions
         self.ray_starts, self.ray_directions = self.cfg.pattern_cfg.func(self.cfg.pattern_cfg, self._device)
@@ -228,6 +257,10 @@ class RayCaster(SensorBase):
         self._data.pos_w = torch.zeros(self._view.count, 3, device=self._device)
         self._data.quat_w = torch.zeros(self._view.count, 4, device=self._device)
         self._data.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        # create the ray-casting buffers, which write the hits into the data buffer
+        self._raycast_context = self._create_raycast_context(
+            max_dist=self.cfg.max_distance, ray_hits=self._data.ray_hits_w
+        )
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
@@ -292,17 +325,52 @@ class RayCaster(SensorBase):
             raise RuntimeError(f"Unsupported ray_alignment type: {self.cfg.ray_alignment}.")
 
         # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+        # note: the hits are written into the data buffer by the ray-casting context
+        self._raycast_meshes(ray_starts_w, ray_directions_w, env_ids)
 
         # apply vertical drift to ray starting position in ray caster frame
         self._data.ray_hits_w[env_ids, :, 2] += self.ray_cast_drift[env_ids, 2].unsqueeze(-1)
 
+    def _create_raycast_context(self, **kwargs) -> RaycastContext:
+        """Creates the ray-casting buffers for the meshes of the sensor.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to :class:`~isaaclab.utils.warp.RaycastContext`.
+
+        Returns:
+            The ray-casting context.
+        """
+        return RaycastContext(
+            list(self.meshes.values()),
+            num_envs=self._view.count,
+            num_rays=self.num_rays,
+            instanced_meshes=[mesh_prim_path in self._dynamic_mesh_views for mesh_prim_path in self.meshes],
+            **kwargs,
+        )
+
+    def _raycast_meshes(self, ray_starts_w: torch.Tensor, ray_directions_w: torch.Tensor, env_ids: Sequence[int]):
+        """Ray-casts against the meshes of the sensor and writes the closest hits into the ray-casting buffers.
+
+        The dynamic meshes are instanced at the current poses of their prims in the given environments.
+
+        Args:
+            ray_starts_w: The ray starting positions in the world frame. Shape is (len(env_ids), num_rays, 3).
+            ray_directions_w: The ray directions in the world frame. Shape is (len(env_ids), num_rays, 3).
+            env_ids: The sensor ids of the rays.
+        """
+        # read the poses of the dynamic meshes
+        mesh_transforms = None
+        if len(self._dynamic_mesh_views) > 0:
+            mesh_transforms = []
+            for mesh_prim_path in self.meshes:
+                view = self._dynamic_mesh_views.get(mesh_prim_path)
+                if view is None:
+                    mesh_transforms.append(None)
+                else:
+                    pos_w, quat_w = view.get_world_poses(env_ids)
+                    mesh_transforms.append(torch.cat([pos_w, quat_w], dim=-1))
+        self._raycast_context.raycast(ray_starts_w, ray_directions_w, env_ids, mesh_transforms=mesh_transforms)
+
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
         # note: parent only deals with callbacks. not their visibility
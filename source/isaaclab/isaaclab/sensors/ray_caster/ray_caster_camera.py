@@ -15,7 +15,6 @@ from isaacsim.core.prims import XFormPrim
 
 import isaaclab.utils.math as math_utils
 from isaaclab.sensors.camera import CameraData
-from isaaclab.utils.warp import raycast_mesh
 
 from .ray_caster import RayCaster
 
@@ -39,9 +38,8 @@ class RayCasterCamera(RayCaster):
     - ``"distance_to_image_plane"``: An image containing distances of 3D points from camera plane along camera's z-axis.
     - ``"normals"``: An image containing the local surface normal vectors at each pixel.
 
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    Like the :class:`RayCaster`, the camera ray-casts against multiple static meshes and against dynamic meshes
+    instanced at the poses of their prims.
     """
 
     cfg: RayCasterCameraCfg
@@ -247,6 +245,18 @@ class RayCasterCamera(RayCaster):
         self.num_rays = self.ray_directions.shape[1]
         # create buffer to store ray hits
         self.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        # create the ray-casting buffers, which write the hits into the buffer above
+        # note: we set max distance to 1e6 during the ray-casting. This is because we clip the distance
+        # to the image plane and distance to the camera to the maximum distance afterwards in-order to
+        # match the USD camera behavior.
+        self._raycast_context = self._create_raycast_context(
+            max_dist=1e6,
+            return_distance=any(
+                [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
+            ),
+            return_normal="normals" in self.cfg.data_types,
+            ray_hits=self.ray_hits_w,
+        )
         # set offsets
         quat_w = math_utils.convert_camera_frame_orientation_convention(
             torch.tensor([self.cfg.offset.rot], device=self._device), origin=self.cfg.offset.convention, target="world"
@@ -271,22 +281,13 @@ class RayCasterCamera(RayCaster):
         ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
 
         # ray cast and store the hits
-        # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
-        # to the image plane and distance to the camera to the maximum distance afterwards in-order to
-        # match the USD camera behavior.
-
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-            max_dist=1e6,
-            return_distance=any(
-                [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
-            ),
-            return_normal="normals" in self.cfg.data_types,
-        )
+        self._raycast_meshes(ray_starts_w, ray_directions_w, env_ids)
+        ray_depth = self._raycast_context.ray_distance
+        ray_normal = self._raycast_context.ray_normal
+        if ray_depth is not None:
+            ray_depth = ray_depth[env_ids]
+        if ray_normal is not None:
+            ray_normal = ray_normal[env_ids]
         # update output buffers
         if "distance_to_image_plane" in self.cfg.data_types:
             # note: data is in camera frame so we only take the first component (z-axis of camera frame)
@@ -34,11 +34,18 @@ class RayCasterCfg(SensorBaseCfg):
     class_type: type = RayCaster
 
     mesh_prim_paths: list[str] = MISSING
-    """The list of mesh primitive paths to ray cast against.
+    """The list of static mesh primitive paths to ray cast against.
 
-    Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+    The meshes are read once in the world frame. The closest hit over all the meshes is returned.
+    """
+
+    dynamic_mesh_prim_paths: list[str] = list()
+    """The list of dynamic mesh primitive path expressions to ray cast against. Defaults to an empty list.
+
+    Each expression must match one prim per sensor, for example ``{ENV_REGEX_NS}/Obstacle`` for an obstacle in each
+    environment, and the i-th matching prim is seen by the i-th sensor only. The mesh under the first matching prim
+    is instanced at the world poses of all the matching prims, which are read at every update of the sensor. All
+    the matching prims are thus expected to have the same mesh.
     """
 
     offset: OffsetCfg = OffsetCfg()
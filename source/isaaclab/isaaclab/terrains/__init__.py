@@ -21,6 +21,7 @@ There are two main components in this package:
 """
 from .height_field import *  # noqa: F401, F403
 from .sub_terrain_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg
+from .terrain_cache import TerrainCache
 from .terrain_generator import TerrainGenerator
 from .terrain_generator_cfg import TerrainGeneratorCfg
 from .terrain_importer import TerrainImporter
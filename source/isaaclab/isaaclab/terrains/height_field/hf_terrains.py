@@ -255,29 +255,46 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     obs_x_range = np.arange(0, width_pixels, 4)
     obs_y_range = np.arange(0, length_pixels, 4)
 
+    # sample the obstacles
+    # note: all the samples are drawn in a single call. The samples of each obstacle are consecutive and in the
+    #   order (height, width, length, x, y), which matches drawing them one after the other for each obstacle.
+    if cfg.obstacle_height_mode == "choice":
+        obs_height_range = np.array([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
+    elif cfg.obstacle_height_mode == "fixed":
+        obs_height_range = None
+    else:
+        raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
+    sample_ranges = [obs_width_range, obs_length_range, obs_x_range, obs_y_range]
+    if obs_height_range is not None:
+        sample_ranges.insert(0, obs_height_range)
+    num_samples = [len(sample_range) for sample_range in sample_ranges]
+    sample_ids = np.random.randint(0, num_samples, size=(cfg.num_obstacles, len(sample_ranges)))
+    samples = [sample_range[sample_ids[:, i]] for i, sample_range in enumerate(sample_ranges)]
+    heights = samples.pop(0) if obs_height_range is not None else np.full(cfg.num_obstacles, obs_height)
+    widths, lengths, x_starts, y_starts = samples
+    # clip start position to the terrain
+    x_starts = np.where(x_starts + widths > width_pixels, width_pixels - widths, x_starts)
+    y_starts = np.where(y_starts + lengths > length_pixels, length_pixels - lengths, y_starts)
+
+    # rasterize the obstacles
+    # note: the obstacles overwrite the previously placed ones. Thus, each pixel takes the height of the last
+    #   obstacle covering it, which is found with a scatter-max over the obstacle indices.
+    obstacle_ids = np.zeros(width_pixels * length_pixels, dtype=np.int64)
+    if cfg.num_obstacles > 0:
+        dx = np.arange(widths.max())[None, :, None]
+        dy = np.arange(lengths.max())[None, None, :]
+        mask = (dx < widths[:, None, None]) & (dy < lengths[:, None, None])
+        # discard the pixels outside the terrain
+        pixel_x = x_starts[:, None, None] + dx
+        pixel_y = y_starts[:, None, None] + dy
+        mask &= (pixel_x >= 0) & (pixel_y >= 0) & (pixel_x < width_pixels) & (pixel_y < length_pixels)
+        pixel_ids = np.broadcast_to(pixel_x * length_pixels + pixel_y, mask.shape)[mask]
+        pixel_obstacle_ids = np.broadcast_to(np.arange(1, cfg.num_obstacles + 1)[:, None, None], mask.shape)[mask]
+        np.maximum.at(obstacle_ids, pixel_ids, pixel_obstacle_ids)
     # create a terrain with a flat platform at the center
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    # generate the obstacles
-    for _ in range(cfg.num_obstacles):
-        # sample size
-        if cfg.obstacle_height_mode == "choice":
-            height = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
-        elif cfg.obstacle_height_mode == "fixed":
-            height = obs_height
-        else:
-            raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
-        width = int(np.random.choice(obs_width_range))
-        length = int(np.random.choice(obs_length_range))
-        # sample position
-        x_start = int(np.random.choice(obs_x_range))
-        y_start = int(np.random.choice(obs_y_range))
-        # clip start position to the terrain
-        if x_start + width > width_pixels:
-            x_start = width_pixels - width
-        if y_start + length > length_pixels:
-            y_start = length_pixels - length
-        # add to terrain
-        hf_raw[x_start : x_start + width, y_start : y_start + length] = height
+    hf_raw = np.zeros(width_pixels * length_pixels)
+    hf_raw[obstacle_ids > 0] = heights[obstacle_ids[obstacle_ids > 0] - 1]
+    hf_raw = hf_raw.reshape(width_pixels, length_pixels)
     # clip the terrain to the platform
     x1 = (width_pixels - platform_width) // 2
     x2 = (width_pixels + platform_width) // 2
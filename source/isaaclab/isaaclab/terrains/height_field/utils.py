@@ -90,6 +90,9 @@ def convert_height_field_to_mesh(
     avoid having long vertical surfaces in the mesh. The correction is done by moving the vertices of the
     vertical surfaces to minimum of the two neighboring vertices.
 
+    The conversion is vectorized over the grid and only reads the height-field array, i.e. the input array
+    is neither copied nor modified.
+
     The correction is done in the following way:
     If :math:`\\frac{y_2 - y_1}{x_2 - x_1} > threshold`, then move A to A' (i.e., set :math:`x_1' = x_2`).
     This is repeated along all directions.
@@ -118,56 +121,48 @@ def convert_height_field_to_mesh(
     """
     # read height field
     num_rows, num_cols = height_field.shape
-    # create a mesh grid of the height field
-    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
-    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
-    yy, xx = np.meshgrid(y, x)
-    # copy height field to avoid modifying the original array
-    hf = height_field.copy()
+    # integer grid coordinates of the vertices along the x and y axis
+    # note: the height field is only read, so it is not copied
+    xx = np.arange(num_rows, dtype=np.int32)[:, None]
+    yy = np.arange(num_cols, dtype=np.int32)[None, :]
 
     # correct vertical surfaces above the slope threshold
     if slope_threshold is not None:
         # scale slope threshold based on the horizontal and vertical scale
         slope_threshold *= horizontal_scale / vertical_scale
-        # allocate arrays to store the movement of the vertices
-        move_x = np.zeros((num_rows, num_cols))
-        move_y = np.zeros((num_rows, num_cols))
-        move_corners = np.zeros((num_rows, num_cols))
+        # allocate arrays to store the movement of the vertices (in number of cells)
+        move_x = np.zeros((num_rows, num_cols), dtype=np.int8)
+        move_y = np.zeros((num_rows, num_cols), dtype=np.int8)
+        move_corners = np.zeros((num_rows, num_cols), dtype=np.int8)
         # move vertices along the x-axis
-        move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
-        move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
+        move_x[: num_rows - 1, :] += height_field[1:num_rows, :] - height_field[: num_rows - 1, :] > slope_threshold
+        move_x[1:num_rows, :] -= height_field[: num_rows - 1, :] - height_field[1:num_rows, :] > slope_threshold
         # move vertices along the y-axis
-        move_y[:, : num_cols - 1] += hf[:, 1:num_cols] - hf[:, : num_cols - 1] > slope_threshold
-        move_y[:, 1:num_cols] -= hf[:, : num_cols - 1] - hf[:, 1:num_cols] > slope_threshold
+        move_y[:, : num_cols - 1] += height_field[:, 1:num_cols] - height_field[:, : num_cols - 1] > slope_threshold
+        move_y[:, 1:num_cols] -= height_field[:, : num_cols - 1] - height_field[:, 1:num_cols] > slope_threshold
         # move vertices along the corners
         move_corners[: num_rows - 1, : num_cols - 1] += (
-            hf[1:num_rows, 1:num_cols] - hf[: num_rows - 1, : num_cols - 1] > slope_threshold
+            height_field[1:num_rows, 1:num_cols] - height_field[: num_rows - 1, : num_cols - 1] > slope_threshold
         )
         move_corners[1:num_rows, 1:num_cols] -= (
-            hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
+            height_field[: num_rows - 1, : num_cols - 1] - height_field[1:num_rows, 1:num_cols] > slope_threshold
         )
-        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
-        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        xx = xx + move_x + move_corners * (move_x == 0)
+        yy = yy + move_y + move_corners * (move_y == 0)
 
     # create vertices for the mesh
-    vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
-    vertices[:, 0] = xx.flatten()
-    vertices[:, 1] = yy.flatten()
-    vertices[:, 2] = hf.flatten() * vertical_scale
+    vertices = np.empty((num_rows, num_cols, 3), dtype=np.float32)
+    np.multiply(xx, horizontal_scale, out=vertices[..., 0], casting="unsafe")
+    np.multiply(yy, horizontal_scale, out=vertices[..., 1], casting="unsafe")
+    np.multiply(height_field, vertical_scale, out=vertices[..., 2], casting="unsafe")
+    vertices = vertices.reshape(-1, 3)
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
+    # note: each cell of the grid is split into two triangles along its diagonal
+    ind0 = np.arange(num_rows - 1, dtype=np.uint32)[:, None] * num_cols + np.arange(num_cols - 1, dtype=np.uint32)
+    ind0 = ind0.reshape(-1, 1)
+    ind1 = ind0 + 1
+    ind2 = ind0 + num_cols
+    ind3 = ind2 + 1
+    triangles = np.concatenate([ind0, ind3, ind1, ind0, ind2, ind3], axis=1).reshape(-1, 3)
 
     return vertices, triangles
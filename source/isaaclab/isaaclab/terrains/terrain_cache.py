@@ -0,0 +1,229 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import contextlib
+import numpy as np
+import os
+import tempfile
+import time
+import zipfile
+from collections.abc import Iterable
+
+import omni.log
+
+
+class TerrainCache:
+    """Size-bounded cache of generated terrains stored as binary NumPy archives.
+
+    Each entry of the cache is a dictionary of arrays (for instance, the vertices and faces of a mesh)
+    that is stored in a single ``.npz`` file named after its key. The keys are expected to be hashes
+    of the configurations used to generate the entries, i.e. the cache is content-addressed.
+
+    The cache is bounded by its total size on disk. When an entry is added and the size of the cache
+    exceeds the limit, the least recently used entries are removed. The usage of an entry is tracked
+    through the modification time of its file, which is updated every time the entry is loaded. This
+    allows multiple processes to share the same cache directory. To avoid listing the cache directory
+    every time an entry is added, the cache keeps a running total of its size, which is only refreshed
+    from the disk when it exceeds the limit.
+
+    The cache keeps statistics about the number of hits, misses and evicted entries, which can be
+    used to check the effectiveness of the cache.
+
+    The entries are written to temporary files that are moved to their final location once complete.
+    A process that crashes in between leaves its temporary file behind. Such files are not counted in
+    the size of the cache, and are instead removed when a cache is created for the directory. Only the
+    files older than :attr:`STALE_TEMP_FILE_AGE` are removed, since newer files may still be written
+    by other processes sharing the cache directory.
+    """
+
+    STALE_TEMP_FILE_AGE: float = 3600.0
+    """The age (in seconds) after which a temporary file of the cache is considered stale. Defaults to 3600.0."""
+
+    def __init__(self, cache_dir: str, max_size_mb: float | None = None, compress: bool = False):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: The directory where the cache entries are stored.
+            max_size_mb: The maximum size of the cache on disk (in MB). Defaults to None,
+                in which case the size of the cache is not bounded.
+            compress: Whether to compress the cache entries. Defaults to False. Compression
+                reduces the size of the entries on disk at the cost of slower reads and writes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb
+        self.compress = compress
+        # statistics of the cache
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+        # running total of the size of the entries (in bytes). None until the cache directory is listed.
+        self._size_bytes: int | None = None
+        # remove the temporary files left by crashed processes
+        self._remove_stale_temp_files()
+
+    def __str__(self) -> str:
+        """Return a string representation of the cache statistics."""
+        msg = f"Terrain cache at '{self.cache_dir}':"
+        msg += f"\n\tHits: {self.num_hits}"
+        msg += f"\n\tMisses: {self.num_misses}"
+        msg += f"\n\tEvictions: {self.num_evictions}"
+        msg += f"\n\tSize: {self.size_mb:.2f} MB"
+        if self.max_size_mb is not None:
+            msg += f" (max: {self.max_size_mb:.2f} MB)"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of the loaded entries that were found in the cache. Zero if nothing was loaded yet."""
+        num_loads = self.num_hits + self.num_misses
+        return self.num_hits / num_loads if num_loads > 0 else 0.0
+
+    @property
+    def size_mb(self) -> float:
+        """The total size of the cache entries on disk (in MB)."""
+        return sum(size for _, _, size in self._list_entries()) / 2**20
+
+    """
+    Operations.
+    """
+
+    def load(self, key: str, names: Iterable[str] = ()) -> dict[str, np.ndarray] | None:
+        """Load an entry from the cache.
+
+        A corrupted entry, or an entry missing one of the expected arrays, is removed from the cache
+        and treated as a miss.
+
+        Args:
+            key: The key of the entry.
+            names: The names of the arrays that the entry must contain. Defaults to an empty tuple.
+
+        Returns:
+            The arrays of the entry. None if the entry is not in the cache.
+        """
+        filename = self._get_filename(key)
+        try:
+            with np.load(filename) as data:
+                entry = {name: data[name] for name in data.files}
+            for name in names:
+                if name not in entry:
+                    raise KeyError(f"Missing array '{name}' in terrain cache entry: {filename}")
+        except FileNotFoundError:
+            # note: an entry can be removed by another process between the check and the read
+            self.num_misses += 1
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            omni.log.warn(f"Removing invalid terrain cache entry: {filename}. Error: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(filename)
+            self.num_misses += 1
+            return None
+        # mark the entry as recently used
+        with contextlib.suppress(OSError):
+            os.utime(filename)
+        self.num_hits += 1
+        return entry
+
+    def save(self, key: str, **arrays: np.ndarray):
+        """Add an entry to the cache and evict the least recently used entries if the cache is full.
+
+        The entry is written to a temporary file first and then moved to its final location. Thus,
+        other processes never read partially written entries. The temporary file is removed if the
+        entry cannot be written.
+
+        Args:
+            key: The key of the entry.
+            **arrays: The arrays of the entry.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        filename = self._get_filename(key)
+        save_fn = np.savez_compressed if self.compress else np.savez
+        f = tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False)
+        try:
+            with f:
+                save_fn(f, **arrays)
+            os.replace(f.name, filename)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(f.name)
+            raise
+        # evict entries if the cache is full
+        if self.max_size_mb is None:
+            return
+        # note: replacing an existing entry over-estimates the size, which only triggers an earlier refresh
+        if self._size_bytes is not None:
+            self._size_bytes += os.path.getsize(filename)
+        if self._size_bytes is None or self._size_bytes > self.max_size_mb * 2**20:
+            self.evict(keep=key)
+
+    def evict(self, keep: str | None = None):
+        """Remove the least recently used entries until the cache fits in its maximum size.
+
+        Args:
+            keep: The key of an entry that must not be removed. Defaults to None.
+        """
+        if self.max_size_mb is None:
+            return
+        entries = self._list_entries()
+        size = sum(entry_size for _, _, entry_size in entries)
+        max_size = self.max_size_mb * 2**20
+        # remove the oldest entries first
+        for filename, _, entry_size in sorted(entries, key=lambda entry: entry[1]):
+            if size <= max_size:
+                break
+            if keep is not None and filename == self._get_filename(keep):
+                continue
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                continue
+            size -= entry_size
+            self.num_evictions += 1
+            omni.log.info(f"Evicted terrain cache entry: {filename}")
+        self._size_bytes = size
+
+    """
+    Internal helpers.
+    """
+
+    def _get_filename(self, key: str) -> str:
+        """The file storing the entry with the given key."""
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _remove_stale_temp_files(self):
+        """Remove the temporary files of the cache older than :attr:`STALE_TEMP_FILE_AGE`."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        min_mtime = time.time() - self.STALE_TEMP_FILE_AGE
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".tmp") or not entry.is_file():
+                    continue
+                # note: the file can be moved or removed by another process in the meantime
+                with contextlib.suppress(OSError):
+                    if entry.stat().st_mtime < min_mtime:
+                        os.remove(entry.path)
+                        omni.log.info(f"Removed stale terrain cache file: {entry.path}")
+
+    def _list_entries(self) -> list[tuple[str, float, int]]:
+        """The file name, modification time and size (in bytes) of the entries in the cache."""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".npz") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
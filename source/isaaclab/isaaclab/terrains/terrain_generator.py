@@ -5,26 +5,32 @@
 
 from __future__ import annotations
 
+import contextlib
+import multiprocessing
 import numpy as np
-import os
 import torch
 import trimesh
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 import omni.log
 
 from isaaclab.utils.dict import dict_to_md5_hash
-from isaaclab.utils.io import dump_yaml
 from isaaclab.utils.timer import Timer
 from isaaclab.utils.warp import convert_to_warp_mesh
 
+from .terrain_cache import TerrainCache
 from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .utils import color_meshes_by_height, find_flat_patches_batched
 
 if TYPE_CHECKING:
-    from .sub_terrain_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg
+    from .sub_terrain_cfg import SubTerrainBaseCfg
     from .terrain_generator_cfg import TerrainGeneratorCfg
 
+# arrays stored in the cache entries of the whole terrain and of the sub-terrains
+_CACHED_TERRAIN_ARRAYS = ("vertices", "faces", "num_vertices", "num_faces", "terrain_origins")
+_CACHED_SUB_TERRAIN_ARRAYS = ("vertices", "faces", "origin")
+
 
 class TerrainGenerator:
     r"""Terrain generator to handle different terrain generation functions.
@@ -71,7 +77,15 @@ class TerrainGenerator:
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. Besides the sub-terrains, the
+    whole terrain (including the flat patches) is cached based on the terrain generator configuration,
+    so that a previously generated terrain is loaded from a single file. The cache is managed by a
+    :class:`TerrainCache`, which is available as :attr:`cache`.
+
+    If the :attr:`~TerrainGeneratorCfg.num_workers` is greater than one, the sub-terrains are generated in
+    parallel by a pool of worker processes. Since every sub-terrain is generated with its own seed, which only
+    depends on the generator seed and the location of the sub-terrain in the grid, the generated terrain is the
+    same irrespective of the number of workers.
 
     .. attention::
 
@@ -97,6 +111,8 @@ class TerrainGenerator:
     For instance, the key "root_spawn" maps to a tensor containing the flat patches for spawning an asset.
     Similarly, the key "target_spawn" maps to a tensor containing the flat patches for setting targets.
     """
+    cache: TerrainCache | None
+    """The cache of the generated terrains. None if caching is disabled."""
 
     def __init__(self, cfg: TerrainGeneratorCfg, device: str = "cpu"):
         """Initialize the terrain generator.
@@ -141,6 +157,13 @@ class TerrainGenerator:
         # note: we create a new random number generator to avoid affecting the global state
         #  in the other places where random numbers are used.
         self.np_rng = np.random.default_rng(seed)
+        self._seed = int(seed)
+
+        # create the cache of the generated terrains
+        if self.cfg.use_cache:
+            self.cache = TerrainCache(self.cfg.cache_dir, self.cfg.cache_max_size_mb, self.cfg.cache_compression)
+        else:
+            self.cache = None
 
         # buffer for storing valid patches
         self.flat_patches = {}
@@ -148,30 +171,46 @@ class TerrainGenerator:
         self.terrain_meshes = list()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
 
-        # parse configuration and add sub-terrains
-        # create terrains based on curriculum or randomly
-        if self.cfg.curriculum:
-            with Timer("[INFO] Generating terrains based on curriculum took"):
-                self._generate_curriculum_terrains()
+        # load the terrain from the cache if it exists
+        terrain_hash = self._get_terrain_hash()
+        cached_terrain = None
+        if self.cache is not None:
+            cached_terrain = self.cache.load(terrain_hash, _CACHED_TERRAIN_ARRAYS)
+        if cached_terrain is not None:
+            with Timer("[INFO] Loading terrains from cache took"):
+                self._load_terrain(cached_terrain)
         else:
-            with Timer("[INFO] Generating terrains randomly took"):
-                self._generate_random_terrains()
-        # add a border around the terrains
-        self._add_terrain_border()
-        # combine all the sub-terrains into a single mesh
-        self.terrain_mesh = trimesh.util.concatenate(self.terrain_meshes)
-
-        # color the terrain mesh
-        if self.cfg.color_scheme == "height":
-            self.terrain_mesh = color_meshes_by_height(self.terrain_mesh)
-        elif self.cfg.color_scheme == "random":
-            self.terrain_mesh.visual.vertex_colors = self.np_rng.choice(
-                range(256), size=(len(self.terrain_mesh.vertices), 4)
-            )
-        elif self.cfg.color_scheme == "none":
-            pass
-        else:
-            raise ValueError(f"Invalid color scheme: {self.cfg.color_scheme}.")
+            # parse configuration and add sub-terrains
+            # create terrains based on curriculum or randomly
+            if self.cfg.curriculum:
+                with Timer("[INFO] Generating terrains based on curriculum took"):
+                    self._generate_curriculum_terrains()
+            else:
+                with Timer("[INFO] Generating terrains randomly took"):
+                    self._generate_random_terrains()
+            # add a border around the terrains
+            self._add_terrain_border()
+            # combine all the sub-terrains into a single mesh
+            self.terrain_mesh = trimesh.util.concatenate(self.terrain_meshes)
+
+            # color the terrain mesh
+            if self.cfg.color_scheme == "height":
+                self.terrain_mesh = color_meshes_by_height(self.terrain_mesh)
+            elif self.cfg.color_scheme == "random":
+                self.terrain_mesh.visual.vertex_colors = self.np_rng.choice(
+                    range(256), size=(len(self.terrain_mesh.vertices), 4)
+                )
+            elif self.cfg.color_scheme == "none":
+                pass
+            else:
+                raise ValueError(f"Invalid color scheme: {self.cfg.color_scheme}.")
+
+            # save the terrain to the cache
+            if self.cache is not None:
+                self._save_terrain(terrain_hash)
+        # log the cache statistics
+        if self.cache is not None:
+            omni.log.info(str(self.cache))
 
         # offset the entire terrain and origins so that it is centered
         # -- terrain mesh
@@ -199,6 +238,7 @@ class TerrainGenerator:
         msg += f"\n\tUse cache: {self.cfg.use_cache}"
         if self.cfg.use_cache:
             msg += f"\n\tCache directory: {self.cfg.cache_dir}"
+            msg += f"\n\tCache hits / misses: {self.cache.num_hits} / {self.cache.num_misses}"
 
         return msg
 
@@ -215,6 +255,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        sub_terrains = list()
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -222,10 +263,10 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            # add to the sub-terrains to generate
+            sub_terrains.append((int(sub_row), int(sub_col), difficulty, sub_terrains_cfgs[sub_index]))
+        # generate the terrains and add them to sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -244,6 +285,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = list()
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -255,15 +297,207 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
-                # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
-                # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                # add to the sub-terrains to generate
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        # generate the terrains and add them to sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     """
     Internal helper functions.
     """
 
+    def _generate_sub_terrains(self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the input sub-terrains and add them to the list of sub-terrains.
+
+        If caching is enabled, the sub-terrains are loaded from the cache if they exist. The remaining
+        sub-terrains are generated and stored in the cache.
+
+        If :attr:`TerrainGeneratorCfg.num_workers` is greater than one, the sub-terrain meshes are generated
+        in a pool of worker processes. The generated meshes are added to the list of sub-terrains in the order
+        of the input list, so that the result does not depend on the number of workers.
+
+        Args:
+            sub_terrains: The row index, column index, difficulty and configuration of each sub-terrain.
+        """
+        # arguments of the sub-terrain mesh generation
+        args = [(difficulty, cfg, self._get_sub_terrain_seed(row, col)) for row, col, difficulty, cfg in sub_terrains]
+        # load the sub-terrain meshes from the cache
+        results = [None] * len(args)
+        if self.cache is not None:
+            for index, arg in enumerate(args):
+                cached_sub_terrain = self.cache.load(self._get_sub_terrain_hash(*arg), _CACHED_SUB_TERRAIN_ARRAYS)
+                if cached_sub_terrain is not None:
+                    mesh = trimesh.Trimesh(cached_sub_terrain["vertices"], cached_sub_terrain["faces"], process=False)
+                    results[index] = (mesh, cached_sub_terrain["origin"])
+        missing_indices = [index for index, result in enumerate(results) if result is None]
+        missing_args = [args[index] for index in missing_indices]
+        # generate the missing sub-terrain meshes
+        num_workers = min(self.cfg.num_workers, len(missing_args))
+        # note: the workers must be forked. Spawned workers re-import the simulator modules, which is
+        #   not possible outside of the simulation app.
+        if num_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            omni.log.warn(
+                "Generating the sub-terrains sequentially: worker processes require the 'fork' start method,"
+                " which is not available on this platform."
+            )
+            num_workers = 0
+        if num_workers > 1:
+            # note: only the arguments of each sub-terrain are sent to the workers, not the generator itself
+            with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                generated = list(executor.map(_generate_sub_terrain_mesh, *zip(*missing_args)))
+        else:
+            generated = [_generate_sub_terrain_mesh(*arg) for arg in missing_args]
+        for index, arg, (mesh, origin) in zip(missing_indices, missing_args, generated):
+            results[index] = (mesh, origin)
+            # save the sub-terrain to the cache
+            if self.cache is not None:
+                key = self._get_sub_terrain_hash(*arg)
+                self.cache.save(key, vertices=mesh.vertices, faces=mesh.faces, origin=origin)
+        # add the sub-terrains
+        for (row, col, _, cfg), (mesh, origin) in zip(sub_terrains, results):
+            self._add_sub_terrain(mesh, origin, row, col, cfg)
+        # sample the flat patches of all the sub-terrains
+        meshes = [mesh for mesh, _ in results]
+        self._sample_flat_patches([(row, col, mesh, cfg) for (row, col, _, cfg), mesh in zip(sub_terrains, meshes)])
+
+    def _sample_flat_patches(self, sub_terrains: list[tuple[int, int, trimesh.Trimesh, SubTerrainBaseCfg]]):
+        """Sample the flat patches of the input sub-terrains, if specified in their configuration.
+
+        The sub-terrain meshes are combined into a single mesh, on which the flat patches of all the sub-terrains
+        and all their flat patch sampling configurations are sampled in a single batch. The search of each
+        sub-terrain is restricted to its own region.
+
+        Args:
+            sub_terrains: The row index, column index, mesh and configuration of each sub-terrain. The meshes
+                must already be moved to their location in the terrain.
+        """
+        sub_terrains = [sub_terrain for sub_terrain in sub_terrains if sub_terrain[3].flat_patch_sampling is not None]
+        if len(sub_terrains) == 0:
+            return
+        omni.log.info(f"Sampling flat patches for {len(sub_terrains)} sub-terrains.")
+        # convert the sub-terrain meshes to a single warp mesh
+        mesh = trimesh.util.concatenate([sub_terrain_mesh for _, _, sub_terrain_mesh, _ in sub_terrains])
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        # collect the flat patch sampling configurations
+        patch_names, patch_locations, patch_cfgs, origins, search_bounds = [], [], [], [], []
+        for row, col, sub_terrain_mesh, sub_terrain_cfg in sub_terrains:
+            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+                patch_names.append(name)
+                patch_locations.append((row, col))
+                patch_cfgs.append(patch_cfg)
+                origins.append(self.terrain_origins[row, col])
+                search_bounds.append(sub_terrain_mesh.bounds[:, :2])
+        # sample the flat patches
+        flat_patches, acceptance_rate = find_flat_patches_batched(
+            wp_mesh, patch_cfgs, torch.tensor(np.array(origins)), torch.tensor(np.array(search_bounds))
+        )
+        # add the flat patches to the tensors
+        for name, (row, col), patch_cfg, patches in zip(patch_names, patch_locations, patch_cfgs, flat_patches):
+            # create the flat patches tensor (if not already created)
+            if name not in self.flat_patches:
+                self.flat_patches[name] = torch.zeros(
+                    (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
+                )
+            self.flat_patches[name][row, col] = patches
+        # log the acceptance rate of the sampling
+        for name in dict.fromkeys(patch_names):
+            rates = acceptance_rate[[index for index, patch_name in enumerate(patch_names) if patch_name == name]]
+            omni.log.info(
+                f"Flat patches '{name}' acceptance rate: mean {rates.mean().item():.3f}, min {rates.min().item():.3f}"
+            )
+
+    def _get_sub_terrain_seed(self, row: int, col: int) -> int:
+        """Compute the seed used to generate the sub-terrain at the given grid location.
+
+        The seed only depends on the seed of the terrain generator and the location of the sub-terrain.
+
+        Args:
+            row: The row index of the sub-terrain.
+            col: The column index of the sub-terrain.
+
+        Returns:
+            The seed of the sub-terrain.
+        """
+        return int(np.random.SeedSequence([self._seed, row, col]).generate_state(1)[0])
+
+    def _get_sub_terrain_hash(self, difficulty: float, cfg: SubTerrainBaseCfg, seed: int) -> str:
+        """Compute the key of a sub-terrain in the cache.
+
+        Args:
+            difficulty: The difficulty parameter.
+            cfg: The configuration of the sub-terrain.
+            seed: The seed used to generate the sub-terrain.
+
+        Returns:
+            The hash of the sub-terrain configuration.
+        """
+        # copy the configuration
+        cfg = cfg.copy()
+        # add other parameters to the sub-terrain configuration
+        cfg.difficulty = float(difficulty)
+        cfg.seed = seed
+        return dict_to_md5_hash(cfg.to_dict())
+
+    def _get_terrain_hash(self) -> str:
+        """Compute the key of the whole terrain in the cache.
+
+        The key is computed from the terrain generator configuration, excluding the parameters that do not
+        affect the generated terrain, and the seed used for the generation.
+
+        Returns:
+            The hash of the terrain generator configuration.
+        """
+        cfg_dict = self.cfg.to_dict()
+        for name in ("use_cache", "cache_dir", "cache_max_size_mb", "cache_compression", "num_workers"):
+            cfg_dict.pop(name, None)
+        cfg_dict["seed"] = self._seed
+        return dict_to_md5_hash(cfg_dict)
+
+    def _save_terrain(self, key: str):
+        """Save the generated terrain to the cache.
+
+        The terrain is saved before it is centered, so that loading it follows the same steps as the generation.
+
+        Args:
+            key: The key of the terrain in the cache.
+        """
+        arrays = {
+            "vertices": self.terrain_mesh.vertices,
+            "faces": self.terrain_mesh.faces,
+            "num_vertices": np.array([len(mesh.vertices) for mesh in self.terrain_meshes]),
+            "num_faces": np.array([len(mesh.faces) for mesh in self.terrain_meshes]),
+            "terrain_origins": self.terrain_origins,
+        }
+        if self.cfg.color_scheme != "none":
+            arrays["vertex_colors"] = self.terrain_mesh.visual.vertex_colors
+        for name, value in self.flat_patches.items():
+            arrays[f"flat_patches:{name}"] = value.cpu().numpy()
+        self.cache.save(key, **arrays)
+
+    def _load_terrain(self, cached_terrain: dict[str, np.ndarray]):
+        """Load the terrain from the arrays stored in the cache.
+
+        Args:
+            cached_terrain: The arrays of the cached terrain.
+        """
+        vertices, faces = cached_terrain["vertices"], cached_terrain["faces"]
+        # split the terrain mesh into the sub-terrain meshes
+        vertex_offsets = np.concatenate([[0], np.cumsum(cached_terrain["num_vertices"])])
+        face_offsets = np.concatenate([[0], np.cumsum(cached_terrain["num_faces"])])
+        for index in range(len(vertex_offsets) - 1):
+            mesh_vertices = vertices[vertex_offsets[index] : vertex_offsets[index + 1]]
+            mesh_faces = faces[face_offsets[index] : face_offsets[index + 1]] - vertex_offsets[index]
+            self.terrain_meshes.append(trimesh.Trimesh(mesh_vertices, mesh_faces, process=False))
+        # create the terrain mesh
+        self.terrain_mesh = trimesh.Trimesh(vertices, faces, process=False)
+        if "vertex_colors" in cached_terrain:
+            self.terrain_mesh.visual.vertex_colors = cached_terrain["vertex_colors"]
+        # read the origins and flat patches
+        self.terrain_origins = cached_terrain["terrain_origins"]
+        for name, value in cached_terrain.items():
+            if name.startswith("flat_patches:"):
+                self.flat_patches[name.split(":", 1)[1]] = torch.tensor(value, device=self.device)
+
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
         # border parameters
@@ -292,7 +526,8 @@ class TerrainGenerator:
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins. The flat patches are sampled afterwards for all the
+        sub-terrains at once in :meth:`_sample_flat_patches`.
 
         Args:
             mesh: The mesh of the sub-terrain.
@@ -300,31 +535,6 @@ class TerrainGenerator:
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
         """
-        # sample flat patches if specified
-        if sub_terrain_cfg.flat_patch_sampling is not None:
-            omni.log.info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
-            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
-                patch_cfg: FlatPatchSamplingCfg
-                # create the flat patches tensor (if not already created)
-                if name not in self.flat_patches:
-                    self.flat_patches[name] = torch.zeros(
-                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
-                    )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
-                )
-
         # transform the mesh to the correct position
         transform = np.eye(4)
         transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
@@ -334,61 +544,65 @@ class TerrainGenerator:
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
 
-    def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
-        """Generate a sub-terrain mesh based on the input difficulty parameter.
 
-        If caching is enabled, the sub-terrain is cached and loaded from the cache if it exists.
-        The cache is stored in the cache directory specified in the configuration.
+def _generate_sub_terrain_mesh(
+    difficulty: float, cfg: SubTerrainBaseCfg, seed: int | None = None
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh based on the input difficulty parameter.
 
-        .. Note:
-            This function centers the 2D center of the mesh and its specified origin such that the
-            2D center becomes :math:`(0, 0)` instead of :math:`(size[0] / 2, size[1] / 2).
+    If a seed is provided, the global random number generators of NumPy and PyTorch are seeded with it
+    while generating the sub-terrain, and their states are restored afterwards.
 
-        Args:
-            difficulty: The difficulty parameter.
-            cfg: The configuration of the sub-terrain.
+    .. Note:
+        This function centers the 2D center of the mesh and its specified origin such that the
+        2D center becomes :math:`(0, 0)` instead of :math:`(size[0] / 2, size[1] / 2).
 
-        Returns:
-            The sub-terrain mesh and origin.
-        """
-        # copy the configuration
-        cfg = cfg.copy()
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
-            # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
-            # return the generated mesh
-            return mesh, origin
-
-        # generate the terrain
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        seed: The seed used to generate the sub-terrain. Defaults to None, in which case the
+            current state of the global random number generators is used.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # copy the configuration
+    cfg = cfg.copy()
+    # add other parameters to the sub-terrain configuration
+    cfg.difficulty = float(difficulty)
+
+    # generate the terrain
+    # note: the terrain functions sample from the global random number generators of NumPy and PyTorch
+    with _seed_global_rngs(seed):
         meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+    # return the generated mesh
+    return mesh, origin
 
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_obj_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+
+@contextlib.contextmanager
+def _seed_global_rngs(seed: int | None):
+    """Context manager to seed the global random number generators of NumPy and PyTorch (on CPU).
+
+    The states of the random number generators are restored when exiting the context.
+
+    Args:
+        seed: The seed to use. If None, the random number generators are left untouched.
+    """
+    if seed is None:
+        yield
+        return
+    np_random_state = np.random.get_state()
+    np.random.seed(seed)
+    try:
+        with torch.random.fork_rng(devices=[]):
+            torch.manual_seed(seed)
+            yield
+    finally:
+        np.random.set_state(np_random_state)
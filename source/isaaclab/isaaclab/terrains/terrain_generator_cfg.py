@@ -123,7 +123,36 @@ class TerrainGeneratorCfg:
     If enabled, the generated terrains are stored in the cache directory. When generating terrains, the cache
     is checked to see if the terrain already exists. If it does, the terrain is loaded from the cache. Otherwise,
     the terrain is generated and stored in the cache. Caching can be used to speed up terrain generation.
+
+    Both the whole terrain and its sub-terrains are cached, each as a single binary file.
     """
 
     cache_dir: str = "/tmp/isaaclab/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/isaaclab/terrains"."""
+
+    cache_max_size_mb: float | None = 2048.0
+    """The maximum size of the terrain cache on disk (in MB). Defaults to 2048.0.
+
+    When the cache exceeds this size, the least recently used entries are removed. If None, the size
+    of the cache is not bounded.
+    """
+
+    cache_compression: bool = False
+    """Whether to compress the entries of the terrain cache. Defaults to False.
+
+    Compression reduces the size of the cache on disk at the cost of slower loading of the terrains.
+    """
+
+    num_workers: int = 0
+    """The number of worker processes used to generate the sub-terrains. Defaults to 0.
+
+    If greater than one, the sub-terrain meshes are generated in parallel by a pool of worker processes
+    and then merged in the main process. Otherwise, they are generated sequentially in the main process.
+    The generated terrain does not depend on the number of workers.
+
+    .. note::
+        The worker processes are forked from the main process, which runs the (multithreaded) simulator.
+        This is only safe because the sub-terrain functions are pure NumPy and trimesh operations: custom
+        sub-terrain functions must not use the simulator, CUDA or other threaded resources. On platforms
+        where forking is not available (e.g. Windows), the sub-terrains are generated sequentially.
+    """
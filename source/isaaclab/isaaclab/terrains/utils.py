@@ -9,10 +9,13 @@ from __future__ import annotations
 import numpy as np
 import torch
 import trimesh
+from collections.abc import Sequence
 
 import warp as wp
 
-from isaaclab.utils.warp import raycast_mesh
+from isaaclab.utils.warp import RaycastContext
+
+from .sub_terrain_cfg import FlatPatchSamplingCfg
 
 
 def color_meshes_by_height(meshes: list[trimesh.Trimesh], **kwargs) -> trimesh.Trimesh:
@@ -156,6 +159,8 @@ def find_flat_patches(
     3. Reject patches that are outside the z range or have a height difference that is too large.
     4. Keep sampling until all patches are valid.
 
+    This function is a wrapper around :func:`find_flat_patches_batched` for a single search space.
+
     Args:
         wp_mesh: The warp mesh to find patches in.
         num_patches: The desired number of patches to find.
@@ -172,93 +177,163 @@ def find_flat_patches(
     Returns:
         A tensor of shape (num_patches, 3) containing the flat patches. The patches are defined in the mesh frame.
 
+    Raises:
+        RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
+            are not suitable for finding valid patches and maximum number of iterations is reached.
+    """
+    # resolve the origin to a tensor
+    if isinstance(origin, np.ndarray):
+        origin = torch.from_numpy(origin)
+    origin = torch.as_tensor(origin, dtype=torch.float).view(1, 3)
+    # find the patches
+    patch_cfg = FlatPatchSamplingCfg(
+        num_patches=num_patches,
+        patch_radius=patch_radius,
+        x_range=x_range,
+        y_range=y_range,
+        z_range=z_range,
+        max_height_diff=max_height_diff,
+    )
+    flat_patches, _ = find_flat_patches_batched(wp_mesh, [patch_cfg], origin)
+    # return the flat patches (in the mesh frame)
+    return flat_patches[0]
+
+
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    patch_cfgs: Sequence[FlatPatchSamplingCfg],
+    origins: torch.Tensor,
+    search_bounds: torch.Tensor | None = None,
+    num_candidates: int = 8,
+    max_iterations: int = 10000,
+) -> tuple[list[torch.Tensor], torch.Tensor]:
+    """Finds flat patches for multiple search spaces in the input mesh at once.
+
+    This function performs the same rejection sampling as :func:`find_flat_patches`, but for a batch of search
+    spaces. For instance, the search spaces can be the different sub-terrains of a terrain, each with
+    multiple flat patch sampling configurations. The patches of all the search spaces are sampled and
+    ray-cast together, and several candidates are sampled for each patch in every iteration. Only the
+    patches without any valid candidate are sampled again in the next iteration.
+
+    The search space of each configuration is defined by its origin, its x, y and z ranges (relative to the origin)
+    and the search bounds. The x and y ranges are bounded by the search bounds, and the query points of a patch
+    outside the search bounds are considered invalid. This allows restricting the search of a sub-terrain to its
+    region when all the sub-terrains are combined into a single mesh.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        patch_cfgs: The flat patch sampling configuration of each search space.
+        origins: The origin of each search space in the mesh frame. Shape is (N, 3), where N is the
+            number of search spaces.
+        search_bounds: The lower and upper corners of the 2D region of each search space in the mesh frame.
+            Shape is (N, 2, 2). Defaults to None, in which case the bounding box of the mesh is used.
+        num_candidates: The number of candidates sampled for each patch in every iteration. Defaults to 8.
+        max_iterations: The maximum number of sampling iterations. Defaults to 10000.
+
+    Returns:
+        A tuple containing the flat patches and the acceptance rate of each search space.
+        The flat patches are a list of tensors of shape (num_patches, 3), one for each search space. The patches are
+        defined relative to the origin of their search space. The acceptance rate is a tensor of shape (N,) with the
+        ratio of the sampled candidates that were valid.
+
     Raises:
         RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
             are not suitable for finding valid patches and maximum number of iterations is reached.
     """
     # set device to warp mesh device
     device = wp.device_to_torch(wp_mesh.device)
+    num_queries = len(patch_cfgs)
+    origins = origins.to(device=device, dtype=torch.float).view(num_queries, 3)
 
-    # resolve inputs to consistent type
-    # -- patch radii
-    if isinstance(patch_radius, float):
-        patch_radius = [patch_radius]
-    # -- origin
-    if isinstance(origin, np.ndarray):
-        origin = torch.from_numpy(origin).to(torch.float).to(device)
-    elif isinstance(origin, torch.Tensor):
-        origin = origin.to(device)
-    else:
-        origin = torch.tensor(origin, dtype=torch.float, device=device)
+    # resolve the search bounds
+    if search_bounds is None:
+        # note: the bounds of the mesh are computed once for all the search spaces
+        points = wp_mesh.points.numpy()
+        bounds = torch.from_numpy(np.stack([points[:, :2].min(axis=0), points[:, :2].max(axis=0)])).to(device)
+        search_bounds = bounds.expand(num_queries, 2, 2)
+    search_bounds = search_bounds.to(device=device, dtype=torch.float).view(num_queries, 2, 2)
 
     # create ranges for the x and y coordinates around the origin.
-    # The provided ranges are bounded by the mesh's bounding box.
-    x_range = (
-        max(x_range[0] + origin[0].item(), wp_mesh.points.numpy()[:, 0].min()),
-        min(x_range[1] + origin[0].item(), wp_mesh.points.numpy()[:, 0].max()),
-    )
-    y_range = (
-        max(y_range[0] + origin[1].item(), wp_mesh.points.numpy()[:, 1].min()),
-        min(y_range[1] + origin[1].item(), wp_mesh.points.numpy()[:, 1].max()),
-    )
-    z_range = (
-        z_range[0] + origin[2].item(),
-        z_range[1] + origin[2].item(),
-    )
+    # The provided ranges are bounded by the search bounds.
+    xy_ranges = torch.tensor([[cfg.x_range, cfg.y_range] for cfg in patch_cfgs], device=device).transpose(1, 2)
+    xy_ranges = xy_ranges + origins[:, None, :2]
+    xy_lower = torch.maximum(xy_ranges[:, 0], search_bounds[:, 0])
+    xy_upper = torch.minimum(xy_ranges[:, 1], search_bounds[:, 1])
+    z_ranges = torch.tensor([cfg.z_range for cfg in patch_cfgs], device=device) + origins[:, 2:]
+    max_height_diff = torch.tensor([cfg.max_height_diff for cfg in patch_cfgs], device=device)
 
     # create a circle of points around (0, 0) to query validity of the patches
     # the ring of points is uniformly distributed around the circle
+    # note: the radii are padded by repeating the last radius to have the same number for all search spaces
+    radii = [[cfg.patch_radius] if isinstance(cfg.patch_radius, float) else cfg.patch_radius for cfg in patch_cfgs]
+    num_radii = max(len(r) for r in radii)
+    radii = torch.tensor([r + [r[-1]] * (num_radii - len(r)) for r in radii], device=device)
     angle = torch.linspace(0, 2 * np.pi, 10, device=device)
-    query_x = []
-    query_y = []
-    for radius in patch_radius:
-        query_x.append(radius * torch.cos(angle))
-        query_y.append(radius * torch.sin(angle))
-    query_x = torch.cat(query_x).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    query_y = torch.cat(query_y).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    # dim: (num_radii * 10, 3)
-    query_points = torch.cat([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+    # dim: (N, num_radii * 10, 2)
+    query_points = torch.stack([radii[..., None] * torch.cos(angle), radii[..., None] * torch.sin(angle)], dim=-1)
+    query_points = query_points.view(num_queries, -1, 2)
 
     # create buffers
+    # -- the search space of each patch
+    num_patches = [cfg.num_patches for cfg in patch_cfgs]
+    query_ids = torch.arange(num_queries, device=device).repeat_interleave(torch.tensor(num_patches, device=device))
     # -- a buffer to store indices of points that are not valid
-    points_ids = torch.arange(num_patches, device=device)
+    points_ids = torch.arange(len(query_ids), device=device)
     # -- a buffer to store the flat patches locations
-    flat_patches = torch.zeros(num_patches, 3, device=device)
+    flat_patches = torch.zeros(len(query_ids), 3, device=device)
+    # -- statistics of the sampled candidates
+    num_sampled = torch.zeros(num_queries, device=device)
+    num_valid = torch.zeros(num_queries, device=device)
+    # -- the ray-casting buffers, with the rays of all the candidates of a patch in one environment
+    num_rays = num_candidates * query_points.shape[1]
+    raycast_context = RaycastContext(wp_mesh, num_envs=len(query_ids), num_rays=num_rays)
+    # -- the ray-cast direction is downwards
+    ray_directions = torch.zeros(len(query_ids), num_rays, 3, device=device)
+    ray_directions[..., 2] = -1.0
 
     # sample points and raycast to find the height.
     # 1. Reject points that are outside the z_range or have a height difference that is too large.
     # 2. Keep sampling until all points are valid.
     iter_count = 0
-    while len(points_ids) > 0 and iter_count < 10000:
-        # sample points in the 2D region around the origin
-        pos_x = torch.empty(len(points_ids), device=device).uniform_(*x_range)
-        pos_y = torch.empty(len(points_ids), device=device).uniform_(*y_range)
-        flat_patches[points_ids, :2] = torch.stack([pos_x, pos_y], dim=-1)
-
-        # define the query points to check validity of the patch
-        # dim: (num_patches, num_radii * 10, 3)
-        points = flat_patches[points_ids].unsqueeze(1) + query_points
-        points[..., 2] = 100.0
-        # ray-cast direction is downwards
-        dirs = torch.zeros_like(points)
-        dirs[..., 2] = -1.0
-
-        # ray-cast to find the height of the patches
-        ray_hits = raycast_mesh(points.view(-1, 3), dirs.view(-1, 3), wp_mesh)[0]
-        heights = ray_hits.view(points.shape)[..., 2]
-        # set the height of the patches
-        # note: for invalid patches, they would be overwritten in the next iteration
-        #   so it's safe to set the height to the last value
-        flat_patches[points_ids, 2] = heights[..., -1]
+    while len(points_ids) > 0 and iter_count < max_iterations:
+        ids = query_ids[points_ids]
+        # sample candidates in the 2D region of each search space
+        # dim: (num_invalid_patches, num_candidates, 2)
+        lower, upper = xy_lower[ids].unsqueeze(1), xy_upper[ids].unsqueeze(1)
+        candidates = lower + (upper - lower) * torch.rand(len(ids), num_candidates, 2, device=device)
+
+        # define the query points to check validity of the candidates
+        # dim: (num_invalid_patches, num_candidates, num_radii * 10, 2)
+        points = candidates.unsqueeze(2) + query_points[ids].unsqueeze(1)
+        ray_starts = torch.cat([points, torch.full_like(points[..., :1], 100.0)], dim=-1)
+
+        # ray-cast to find the height of the candidates
+        raycast_context.raycast(ray_starts, ray_directions[: len(ids)], env_ids=points_ids)
+        heights = raycast_context.ray_hits[points_ids].view(ray_starts.shape)[..., 2]
+        # the query points outside the search bounds are treated as misses
+        bounds = search_bounds[ids].view(-1, 1, 1, 2, 2)
+        outside = torch.any((points < bounds[..., 0, :]) | (points > bounds[..., 1, :]), dim=-1)
+        heights[outside] = float("inf")
 
         # check validity
+        z_lower, z_upper = z_ranges[ids, 0].view(-1, 1, 1), z_ranges[ids, 1].view(-1, 1, 1)
         # -- height is within the z range
-        not_valid = torch.any(torch.logical_or(heights < z_range[0], heights > z_range[1]), dim=1)
+        valid = torch.all((heights >= z_lower) & (heights <= z_upper), dim=-1)
         # -- height difference is within the max height difference
-        not_valid = torch.logical_or(not_valid, (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff)
-
-        # remove invalid patches indices
-        points_ids = points_ids[not_valid]
+        valid &= (heights.max(dim=-1)[0] - heights.min(dim=-1)[0]) <= max_height_diff[ids].unsqueeze(1)
+        # update the statistics
+        num_sampled.index_add_(0, ids, torch.full_like(ids, num_candidates, dtype=torch.float))
+        num_valid.index_add_(0, ids, valid.sum(dim=1).float())
+
+        # set the patches with a valid candidate to their first valid candidate
+        found = valid.any(dim=1)
+        found_ids = torch.nonzero(found).squeeze(-1)
+        first_valid = valid[found_ids].int().argmax(dim=1)
+        flat_patches[points_ids[found_ids], :2] = candidates[found_ids, first_valid]
+        flat_patches[points_ids[found_ids], 2] = heights[found_ids, first_valid, -1]
+
+        # remove valid patches indices
+        points_ids = points_ids[~found]
         # increment count
         iter_count += 1
 
@@ -268,8 +343,10 @@ def find_flat_patches(
             "Failed to find valid patches! Please check the input parameters."
             f"\n\tMaximum number of iterations reached: {iter_count}"
             f"\n\tNumber of invalid patches: {len(points_ids)}"
-            f"\n\tMaximum height difference: {max_height_diff}"
+            f"\n\tMaximum height difference: {max_height_diff[query_ids[points_ids]].unique().tolist()}"
         )
 
-    # return the flat patches (in the mesh frame)
-    return flat_patches - origin
+    # return the flat patches (relative to their origin) and the acceptance rate
+    flat_patches = flat_patches - origins[query_ids]
+    acceptance_rate = num_valid / num_sampled.clamp(min=1.0)
+    return list(torch.split(flat_patches, num_patches)), acceptance_rate
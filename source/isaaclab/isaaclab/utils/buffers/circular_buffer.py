@@ -17,15 +17,31 @@ class CircularBuffer:
 
     The shape of the appended data is expected to be (batch_size, ...), where the first dimension is the
     batch dimension. Correspondingly, the shape of the ring buffer is (max_len, batch_size, ...).
+
+    The buffer supports two storage layouts, selected through the ``mirrored`` argument:
+
+    * **Time-major** (default): The ring has the shape (max_len, batch_size, ...). Reading the complete history
+      through :attr:`buffer` clones, rolls and transposes the ring, and returns a new tensor that the caller owns.
+    * **Mirrored**: The ring has the shape (batch_size, 2 * max_len, ...) and every entry is written twice, at
+      the head position and ``max_len`` slots after it. The complete history in chronological order is then
+      always a contiguous window of the storage, and :attr:`buffer` returns a view into it without any copy.
+      Since the returned tensor aliases the storage, it is only valid until the next call to :meth:`append`
+      or :meth:`reset`. Clone it if it needs to be kept around.
+
+    The mirrored layout doubles the memory footprint and the cost of :meth:`append`, but makes reading the
+    history free. It is the preferred layout when the history is read at least once per append, which is the
+    case for observation histories.
     """
 
-    def __init__(self, max_len: int, batch_size: int, device: str):
+    def __init__(self, max_len: int, batch_size: int, device: str, mirrored: bool = False):
         """Initialize the circular buffer.
 
         Args:
             max_len: The maximum length of the circular buffer. The minimum allowed value is 1.
             batch_size: The batch dimension of the data.
             device: The device used for processing.
+            mirrored: Whether to use the mirrored (batch-major, double-length) storage layout. Defaults to False,
+                in which case the time-major layout is used.
 
         Raises:
             ValueError: If the buffer size is less than one.
@@ -35,8 +51,11 @@ class CircularBuffer:
         # set the parameters
         self._batch_size = batch_size
         self._device = device
+        self._mirrored = mirrored
         self._ALL_INDICES = torch.arange(batch_size, device=device)
 
+        # max length as an integer for indexing (avoids a device sync on every access)
+        self._max_length = max_len
         # max length tensor for comparisons
         self._max_len = torch.full((batch_size,), max_len, dtype=torch.int, device=device)
         # number of data pushes passed since the last call to :meth:`reset`
@@ -45,6 +64,8 @@ class CircularBuffer:
         self._pointer: int = -1
         # the actual buffer for data storage
         # note: this is initialized on the first call to :meth:`append`
+        #   for the time-major layout, the shape is (max_len, batch_size, ...)
+        #   for the mirrored layout, the shape is (batch_size, 2 * max_len, ...)
         self._buffer: torch.Tensor = None  # type: ignore
 
     """
@@ -64,7 +85,12 @@ class CircularBuffer:
     @property
     def max_length(self) -> int:
         """The maximum length of the ring buffer."""
-        return int(self._max_len[0].item())
+        return self._max_length
+
+    @property
+    def is_mirrored(self) -> bool:
+        """Whether the buffer uses the mirrored (batch-major, double-length) storage layout."""
+        return self._mirrored
 
     @property
     def current_length(self) -> torch.Tensor:
@@ -78,9 +104,17 @@ class CircularBuffer:
     @property
     def buffer(self) -> torch.Tensor:
         """Complete circular buffer with most recent entry at the end and oldest entry at the beginning.
+
+        For the mirrored layout, the returned tensor is a view into the storage and is only valid until the
+        next call to :meth:`append` or :meth:`reset`. Otherwise, a new tensor is returned.
+
         Returns:
             Complete circular buffer with most recent entry at the end and oldest entry at the beginning of dimension 1. The shape is [batch_size, max_length, data.shape[1:]].
         """
+        if self._mirrored:
+            # the window after the head holds the entries in chronological order
+            start = self._pointer + 1
+            return self._buffer[:, start : start + self.max_length]
         buf = self._buffer.clone()
         buf = torch.roll(buf, shifts=self.max_length - self._pointer - 1, dims=0)
         return torch.transpose(buf, dim0=0, dim1=1)
@@ -102,7 +136,10 @@ class CircularBuffer:
         self._num_pushes[batch_ids] = 0
         if self._buffer is not None:
             # set buffer at batch_id reset indices to 0.0 so that the buffer() getter returns the cleared circular buffer after reset.
-            self._buffer[:, batch_ids, :] = 0.0
+            if self._mirrored:
+                self._buffer[batch_ids] = 0.0
+            else:
+                self._buffer[:, batch_ids, :] = 0.0
 
     def append(self, data: torch.Tensor):
         """Append the data to the circular buffer.
@@ -123,15 +160,27 @@ class CircularBuffer:
         # at the first call, initialize the buffer size
         if self._buffer is None:
             self._pointer = -1
-            self._buffer = torch.empty((self.max_length, *data.shape), dtype=data.dtype, device=self._device)
+            if self._mirrored:
+                buffer_shape = (self.batch_size, 2 * self.max_length, *data.shape[1:])
+            else:
+                buffer_shape = (self.max_length, *data.shape)
+            self._buffer = torch.empty(buffer_shape, dtype=data.dtype, device=self._device)
         # move the head to the next slot
         self._pointer = (self._pointer + 1) % self.max_length
         # add the new data to the last layer
-        self._buffer[self._pointer] = data
+        if self._mirrored:
+            # write the entry to both halves so that the history is always a contiguous window
+            self._buffer[:, self._pointer] = data
+            self._buffer[:, self._pointer + self.max_length] = data
+        else:
+            self._buffer[self._pointer] = data
         # Check for batches with zero pushes and initialize all values in batch to first append
         is_first_push = self._num_pushes == 0
         if torch.any(is_first_push):
-            self._buffer[:, is_first_push] = data[is_first_push]
+            if self._mirrored:
+                self._buffer[is_first_push] = data[is_first_push].unsqueeze(1)
+            else:
+                self._buffer[:, is_first_push] = data[is_first_push]
         # increment number of number of pushes for all batches
         self._num_pushes += 1
 
@@ -164,4 +213,6 @@ class CircularBuffer:
         # the index in the circular buffer (pointer points to the last+1 index)
         index_in_buffer = torch.remainder(self._pointer - valid_keys, self.max_length)
         # return output
+        if self._mirrored:
+            return self._buffer[self._ALL_INDICES, index_in_buffer]
         return self._buffer[index_in_buffer, self._ALL_INDICES]
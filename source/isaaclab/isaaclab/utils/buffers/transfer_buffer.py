@@ -0,0 +1,186 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from typing import Any
+
+
+class TransferBuffer:
+    """Staging buffer that copies a collection of tensors to another device with a single transfer.
+
+    Moving many small tensors (for instance, the observations, rewards and dones of an environment step)
+    to another device with separate calls to :meth:`torch.Tensor.to` issues one copy and, for copies to the
+    host, one synchronization per tensor. This class instead packs all the tensors into a contiguous staging
+    buffer on their device, copies the staging buffer to the target device with a single non-blocking copy,
+    and synchronizes once. The transferred tensors are returned as views into the buffer on the target device.
+    When the target device is the CPU and the tensors are on a CUDA device, the host buffer is allocated in
+    pinned (page-locked) memory.
+
+    The data is given as a (possibly nested) dictionary of tensors. The returned dictionary has the same
+    structure. Entries that are not tensors are returned as they are. The layout of the staging buffers is
+    computed from the names, shapes and data types of the tensors, and the buffers are re-allocated whenever
+    the layout changes.
+
+    The buffer on the target device is cycled through :attr:`num_buffers` copies. Thus, the tensors returned by
+    a transfer are not overwritten by the next ``num_buffers - 1`` transfers. For instance, with the default
+    double-buffering, the outputs of an environment step remain valid while the next step is transferred.
+
+    .. caution::
+        The returned tensors (and NumPy arrays created from them) share memory with the buffer. They are
+        overwritten after :attr:`num_buffers` transfers and must be copied if they need to be kept longer.
+    """
+
+    _ALIGNMENT = 16
+    """Alignment (in bytes) of the tensors in the staging buffers."""
+
+    def __init__(self, device: str, num_buffers: int = 2):
+        """Initialize the transfer buffer.
+
+        Args:
+            device: The device to which the data is transferred.
+            num_buffers: The number of buffers on the target device that are cycled through. Defaults to 2.
+
+        Raises:
+            ValueError: If the number of buffers is smaller than 1.
+        """
+        if num_buffers < 1:
+            raise ValueError(f"The number of buffers should be at least 1. Received: {num_buffers}.")
+        self._device = torch.device(device)
+        self._num_buffers = num_buffers
+        # layout of the tensors in the staging buffers
+        self._layout: tuple | None = None
+        # staging buffer on the source device and views of the tensors into it
+        self._src_buffer: torch.Tensor | None = None
+        self._src_views: list[torch.Tensor] = []
+        # buffers on the target device and views of the tensors into them
+        self._dst_buffers: list[torch.Tensor] = []
+        self._dst_views: list[list[torch.Tensor]] = []
+        self._buffer_index = 0
+
+    def __str__(self) -> str:
+        """Returns a string representation of the transfer buffer."""
+        num_bytes = 0 if self._src_buffer is None else self._src_buffer.numel()
+        return (
+            f"TransferBuffer(device={self._device}, num_buffers={self._num_buffers},"
+            f" num_tensors={len(self._src_views)}, num_bytes={num_bytes})"
+        )
+
+    """
+    Properties.
+    """
+
+    @property
+    def device(self) -> torch.device:
+        """The device to which the data is transferred."""
+        return self._device
+
+    @property
+    def num_buffers(self) -> int:
+        """The number of buffers on the target device that are cycled through."""
+        return self._num_buffers
+
+    """
+    Operations.
+    """
+
+    def transfer(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Copy the tensors in the data to the target device.
+
+        All the tensors in the data are expected to be on the same device.
+
+        Args:
+            data: A (possibly nested) dictionary of tensors.
+
+        Returns:
+            A dictionary with the same structure as the input, in which the tensors are replaced with
+            views into the buffer on the target device.
+
+        Raises:
+            ValueError: If the tensors are not all on the same device.
+        """
+        tensors = []
+        self._flatten(data, tensors)
+        if len(tensors) == 0:
+            return data
+        # check that the layout is still valid
+        layout = tuple((tuple(tensor.shape), tensor.dtype, tensor.device) for tensor in tensors)
+        if layout != self._layout:
+            self._allocate(layout)
+        # pack the tensors into the staging buffer
+        for view, tensor in zip(self._src_views, tensors):
+            view.copy_(tensor)
+        # copy the staging buffer to the target device
+        dst_buffer = self._dst_buffers[self._buffer_index]
+        dst_views = self._dst_views[self._buffer_index]
+        self._buffer_index = (self._buffer_index + 1) % self._num_buffers
+        dst_buffer.copy_(self._src_buffer, non_blocking=True)
+        # wait for the copy to finish before the host reads the data
+        # note: copies between CUDA devices are ordered on the device streams and need no synchronization
+        if self._src_buffer.device.type == "cuda" and self._device.type == "cpu":
+            torch.cuda.current_stream(self._src_buffer.device).synchronize()
+        # replace the tensors with their views in the target buffer
+        return self._unflatten(data, iter(dst_views))
+
+    """
+    Internal helpers.
+    """
+
+    def _allocate(self, layout: tuple):
+        """Allocate the staging buffers for the given layout of tensors."""
+        src_devices = {device for _, _, device in layout}
+        if len(src_devices) > 1:
+            raise ValueError(f"The tensors to transfer should be on the same device. Received: {src_devices}.")
+        src_device = src_devices.pop()
+        # compute the offsets of the tensors in the buffers
+        offsets = []
+        num_bytes = 0
+        for shape, dtype, _ in layout:
+            offsets.append(num_bytes)
+            num_elements = torch.Size(shape).numel()
+            item_size = torch.empty((), dtype=dtype).element_size()
+            num_bytes += -(-num_elements * item_size // self._ALIGNMENT) * self._ALIGNMENT
+        # allocate the buffers
+        pin_memory = src_device.type == "cuda" and self._device.type == "cpu"
+        self._src_buffer = torch.empty(num_bytes, dtype=torch.uint8, device=src_device)
+        self._dst_buffers = [
+            torch.empty(num_bytes, dtype=torch.uint8, device=self._device, pin_memory=pin_memory)
+            for _ in range(self._num_buffers)
+        ]
+        # create the views of the tensors into the buffers
+        self._src_views = self._create_views(self._src_buffer, layout, offsets)
+        self._dst_views = [self._create_views(buffer, layout, offsets) for buffer in self._dst_buffers]
+        self._layout = layout
+        self._buffer_index = 0
+
+    @staticmethod
+    def _create_views(buffer: torch.Tensor, layout: tuple, offsets: list[int]) -> list[torch.Tensor]:
+        """Create views of the tensors with the given layout into a byte buffer."""
+        views = []
+        for (shape, dtype, _), offset in zip(layout, offsets):
+            num_bytes = torch.Size(shape).numel() * torch.empty((), dtype=dtype).element_size()
+            views.append(buffer[offset : offset + num_bytes].view(dtype).view(shape))
+        return views
+
+    def _flatten(self, data: dict[str, Any], tensors: list[torch.Tensor]):
+        """Collect the tensors in the (nested) dictionary in depth-first order."""
+        for value in data.values():
+            if isinstance(value, torch.Tensor):
+                tensors.append(value)
+            elif isinstance(value, dict):
+                self._flatten(value, tensors)
+
+    def _unflatten(self, data: dict[str, Any], views) -> dict[str, Any]:
+        """Replace the tensors in the (nested) dictionary with the given views in depth-first order."""
+        output = {}
+        for key, value in data.items():
+            if isinstance(value, torch.Tensor):
+                output[key] = next(views)
+            elif isinstance(value, dict):
+                output[key] = self._unflatten(value, views)
+            else:
+                output[key] = value
+        return output
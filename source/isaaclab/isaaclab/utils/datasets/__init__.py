@@ -14,4 +14,6 @@ Submodule for datasets classes and methods.
 
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
+from .episode_data_buffer import EpisodeDataBuffer
 from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+from .lazy_episode_data import HDF5ChunkCache, LazyEpisodeData, LazyHDF5Tensor
@@ -16,6 +16,9 @@ import torch
 class EpisodeData:
     """Class to store episode data."""
 
+    _LEAF_TYPES: tuple[type, ...] = (torch.Tensor,)
+    """The types of the leaves of the episode data that can be indexed per step."""
+
     def __init__(self) -> None:
         """Initializes episode data class."""
         self._data = dict()
@@ -157,7 +160,7 @@ class EpisodeData:
                     output_state[key] = get_state_helper(value, state_index)
                     if output_state[key] is None:
                         return None
-            elif isinstance(states, torch.Tensor):
+            elif isinstance(states, self._LEAF_TYPES):
                 if state_index >= len(states):
                     return None
                 output_state = states[state_index, None]
@@ -189,7 +192,7 @@ class EpisodeData:
                     output_joint_targets[key] = get_joint_target_helper(value, joint_target_index)
                     if output_joint_targets[key] is None:
                         return None
-            elif isinstance(joint_targets, torch.Tensor):
+            elif isinstance(joint_targets, self._LEAF_TYPES):
                 if joint_target_index >= len(joint_targets):
                     return None
                 output_joint_targets = joint_targets[joint_target_index]
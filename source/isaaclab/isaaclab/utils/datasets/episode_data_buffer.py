@@ -0,0 +1,183 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from .episode_data import EpisodeData
+
+
+class EpisodeDataBuffer:
+    """Class to store the episode data of a batch of environments in preallocated tensors.
+
+    Unlike :class:`EpisodeData`, which stores the data of a single episode as lists of tensors, this class
+    stores the data of all the environments together. Each key is stored in a tensor of shape
+    (num_envs, max_episode_length, ...) that is allocated at the first call to :meth:`add` for the key, together
+    with a per-environment write cursor. Adding data for a batch of environments is then a single scatter into
+    the tensor, independent of the number of environments. The episode of an environment is only sliced out of
+    the tensors when it is requested through :meth:`get_episode`, typically when the episode is exported.
+
+    The keys are recorded independently of each other, i.e. each key has its own write cursor. This allows
+    recording keys at different rates, for example the initial state once per episode and the actions at every
+    step.
+    """
+
+    def __init__(self, num_envs: int, max_episode_length: int, device: str):
+        """Initializes the episode data buffer.
+
+        Args:
+            num_envs: The number of environments.
+            max_episode_length: The maximum number of entries that can be recorded per key and environment.
+            device: The device used for storing the data.
+
+        Raises:
+            ValueError: If the maximum episode length is less than one.
+        """
+        if max_episode_length < 1:
+            raise ValueError(f"The maximum episode length should be greater than zero. Received: {max_episode_length}.")
+        self._num_envs = num_envs
+        self._max_episode_length = max_episode_length
+        self._device = device
+        self._ALL_INDICES = torch.arange(num_envs, dtype=torch.long, device=device)
+        # the recorded data and the number of recorded entries per key
+        # note: the key can contain nested keys separated by "/"
+        self._data: dict[str, torch.Tensor] = dict()
+        self._lengths: dict[str, torch.Tensor] = dict()
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def max_episode_length(self) -> int:
+        """The maximum number of entries that can be recorded per key and environment."""
+        return self._max_episode_length
+
+    @property
+    def device(self) -> str:
+        """The device used for storing the data."""
+        return self._device
+
+    @property
+    def keys(self) -> list[str]:
+        """The recorded keys. Nested keys are separated by "/"."""
+        return list(self._data.keys())
+
+    """
+    Operations.
+    """
+
+    def add(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Add the value to the episodes of the given environments.
+
+        The key can be nested by using the "/" character. For example: "obs/joint_pos".
+
+        Args:
+            key: The key name.
+            value: The corresponding value of tensor type or of dict type. The shape of a tensor is (len(env_ids), ...).
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        # check datatype
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                self.add(f"{key}/{sub_key}", sub_value, env_ids)
+            return
+
+        # resolve environment ids
+        env_ids = self._resolve_env_ids(env_ids)
+        # allocate the storage on the first call for the key
+        if key not in self._data:
+            self._data[key] = torch.zeros(
+                (self._num_envs, self._max_episode_length, *value.shape[1:]), dtype=value.dtype, device=self._device
+            )
+            self._lengths[key] = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
+        # write the value at the cursor of each environment
+        # note: entries beyond the maximum length overwrite the last entry. This is detected when the episode
+        #   is requested, so that the check does not require a synchronization at every call.
+        cursor = self._lengths[key][env_ids]
+        self._data[key][env_ids, cursor.clamp(max=self._max_episode_length - 1)] = value.to(self._device)
+        self._lengths[key][env_ids] = cursor + 1
+
+    def reset(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Clear the episodes of the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        env_ids = self._resolve_env_ids(env_ids)
+        for lengths in self._lengths.values():
+            lengths[env_ids] = 0
+
+    def is_empty(self, env_id: int) -> bool:
+        """Check if the episode of the given environment is empty.
+
+        Args:
+            env_id: The environment id.
+
+        Returns:
+            True if no data was recorded for the environment since its last reset.
+        """
+        if len(self._lengths) == 0:
+            return True
+        lengths = torch.stack([lengths[env_id] for lengths in self._lengths.values()])
+        return not bool(torch.any(lengths > 0))
+
+    def get_episode(self, env_id: int) -> EpisodeData:
+        """Get the episode of the given environment.
+
+        The recorded data is copied out of the buffer, so the returned episode remains valid after the
+        environment is reset. The leaves of the episode data are tensors of shape (num_entries, ...).
+
+        Args:
+            env_id: The environment id.
+
+        Returns:
+            The episode data of the environment.
+
+        Raises:
+            RuntimeError: If more entries were recorded for a key than the maximum episode length.
+        """
+        episode = EpisodeData()
+        episode.env_id = env_id
+        if len(self._lengths) == 0:
+            return episode
+        # read the lengths of all the keys at once
+        lengths = torch.stack([lengths[env_id] for lengths in self._lengths.values()]).tolist()
+        for (key, data), length in zip(self._data.items(), lengths):
+            # skip keys that were not recorded for the environment
+            if length == 0:
+                continue
+            if length > self._max_episode_length:
+                raise RuntimeError(
+                    f"The episode of environment {env_id} has {length} entries for the key '{key}', which exceeds"
+                    f" the maximum episode length of {self._max_episode_length}. Please increase the maximum"
+                    " episode length of the buffer."
+                )
+            # add the data to the nested dictionary
+            sub_keys = key.split("/")
+            current_dataset_pointer = episode.data
+            for sub_key in sub_keys[:-1]:
+                current_dataset_pointer = current_dataset_pointer.setdefault(sub_key, dict())
+            current_dataset_pointer[sub_keys[-1]] = data[env_id, :length].clone()
+        return episode
+
+    """
+    Helper functions.
+    """
+
+    def _resolve_env_ids(self, env_ids: Sequence[int] | torch.Tensor | None) -> torch.Tensor:
+        """Resolve the environment ids into a tensor on the buffer's device."""
+        if env_ids is None:
+            return self._ALL_INDICES
+        if isinstance(env_ids, torch.Tensor):
+            return env_ids.to(device=self._device, dtype=torch.long)
+        return torch.tensor(env_ids, dtype=torch.long, device=self._device)
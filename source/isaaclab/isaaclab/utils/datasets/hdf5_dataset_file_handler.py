@@ -12,22 +12,81 @@ import h5py
 import json
 import numpy as np
 import os
+import queue
+import threading
 import torch
 from collections.abc import Iterable
 
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
+from .lazy_episode_data import HDF5ChunkCache, LazyEpisodeData, LazyHDF5Tensor
 
 
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
-    """HDF5 dataset file handler for storing and loading episode data."""
+    """HDF5 dataset file handler for storing and loading episode data.
+
+    By default, the episodes are written synchronously, i.e. :meth:`write_episode` copies the episode data to
+    the host, compresses it and writes it to the file before returning. If ``async_write`` is enabled, the episode
+    data is only copied to the host in :meth:`write_episode` and handed to a background writer thread through a
+    bounded queue. The writer thread then compresses and writes the episodes in the order they were submitted, and
+    flushes the file when requested through :meth:`flush`. If the queue is full, :meth:`write_episode` blocks until
+    the writer thread catches up. Calling :meth:`close` waits for all the queued episodes to be written.
+
+    Episodes can be loaded lazily with :meth:`load_episode`, in which case their data is read from the file in
+    windows of consecutive steps on access. The decoded windows of all the lazily loaded episodes share a
+    least-recently-used cache of ``max_cached_chunks`` windows.
+    """
+
+    _FLUSH = object()
+    """Marker to request a flush of the file from the writer thread."""
 
-    def __init__(self):
-        """Initializes the HDF5 dataset file handler."""
+    def __init__(
+        self,
+        compression: str | None = "gzip",
+        compression_opts: int | None = None,
+        async_write: bool = False,
+        max_queue_size: int = 16,
+        max_cached_chunks: int = 128,
+    ):
+        """Initializes the HDF5 dataset file handler.
+
+        Args:
+            compression: The compression filter used for the datasets of the written episodes. Supported values are
+                ``"gzip"``, ``"lzf"`` and None (no compression). Defaults to ``"gzip"``.
+            compression_opts: The compression level for the ``"gzip"`` filter, in the range [0, 9]. Defaults to None,
+                in which case the default level of h5py is used.
+            async_write: Whether to write the episodes in a background thread. Defaults to False.
+            max_queue_size: The maximum number of episodes waiting to be written in the background thread.
+                Defaults to 16.
+            max_cached_chunks: The maximum number of decoded windows kept in memory for lazily loaded episodes.
+                Defaults to 128.
+
+        Raises:
+            ValueError: If the compression filter or its options are not supported.
+        """
         self._hdf5_file_stream = None
         self._hdf5_data_group = None
         self._demo_count = 0
         self._env_args = {}
+        # background writer
+        # note: the writer state is set before validating the arguments since the destructor closes the handler
+        self._async_write = async_write
+        self._write_queue: queue.Queue | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._writer_error: Exception | None = None
+        self._bytes_written = 0
+        # cache of decoded windows for lazily loaded episodes
+        self._chunk_cache: HDF5ChunkCache | None = None
+        # compression settings
+        if compression not in ("gzip", "lzf", None):
+            raise ValueError(f"Unsupported compression filter: '{compression}'. Expected 'gzip', 'lzf' or None.")
+        if compression_opts is not None and compression != "gzip":
+            raise ValueError(f"Compression options are only supported for the 'gzip' filter. Received: {compression}.")
+        self._compression = compression
+        self._compression_opts = compression_opts
+        if async_write:
+            self._write_queue = queue.Queue(maxsize=max_queue_size)
+        self._chunk_cache = HDF5ChunkCache(max_cached_chunks)
 
     def open(self, file_path: str, mode: str = "r"):
         """Open an existing dataset file."""
@@ -97,19 +156,49 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
 
     @property
     def demo_count(self) -> int:
-        """The number of demos collected so far."""
+        """The number of demos collected so far.
+
+        In asynchronous mode, this includes the demos that are still waiting to be written.
+        """
         return self._demo_count
 
+    @property
+    def queue_depth(self) -> int:
+        """The number of episodes and flush requests waiting for the background writer thread.
+
+        This is always zero if the episodes are written synchronously.
+        """
+        return self._write_queue.qsize() if self._write_queue is not None else 0
+
+    @property
+    def bytes_written(self) -> int:
+        """The number of bytes of episode data written to the file so far, before compression."""
+        return self._bytes_written
+
     """
     Operations.
     """
 
-    def load_episode(self, episode_name: str, device: str) -> EpisodeData | None:
-        """Load episode data from the file."""
+    def load_episode(
+        self, episode_name: str, device: str, lazy: bool = False, read_ahead: int = 64
+    ) -> EpisodeData | None:
+        """Load episode data from the file.
+
+        Args:
+            episode_name: The name of the episode.
+            device: The device of the loaded tensors.
+            lazy: Whether to read the episode data from the file on access. If True, a :class:`LazyEpisodeData`
+                is returned, which is only valid as long as the file is open. Defaults to False.
+            read_ahead: The number of consecutive steps read from the file at once for lazily loaded episodes.
+                Defaults to 64.
+
+        Returns:
+            The episode data, or None if the episode does not exist in the file.
+        """
         self._raise_if_not_initialized()
         if episode_name not in self._hdf5_data_group:
             return None
-        episode = EpisodeData()
+        episode = LazyEpisodeData() if lazy else EpisodeData()
         h5_episode_group = self._hdf5_data_group[episode_name]
 
         def load_dataset_helper(group):
@@ -118,6 +207,8 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
             for key in group:
                 if isinstance(group[key], h5py.Group):
                     data[key] = load_dataset_helper(group[key])
+                elif lazy:
+                    data[key] = LazyHDF5Tensor(group[key], device, read_ahead, self._chunk_cache)
                 else:
                     # Converting group[key] to numpy array greatly improves the performance
                     # when converting to torch tensor
@@ -139,27 +230,114 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     def write_episode(self, episode: EpisodeData):
         """Add an episode to the dataset.
 
+        In asynchronous mode, the episode data is copied to the host and queued for the writer thread. This call
+        blocks if the queue is full.
+
         Args:
             episode: The episode data to add.
+
+        Raises:
+            RuntimeError: If the writer thread failed to write a previous episode.
         """
         self._raise_if_not_initialized()
+        self._raise_if_writer_failed()
         if episode.is_empty():
             return
 
-        # create episode group based on demo count
-        h5_episode_group = self._hdf5_data_group.create_group(f"demo_{self._demo_count}")
+        # copy the episode data to the host
+        # note: in asynchronous mode, the data is always copied so that the caller can reuse the tensors
+        def to_numpy_helper(value):
+            """Helper method to convert recursive dict objects to numpy arrays."""
+            if isinstance(value, dict):
+                return {sub_key: to_numpy_helper(sub_value) for sub_key, sub_value in value.items()}
+            if self._async_write:
+                return value.detach().to("cpu", copy=True).numpy()
+            return value.cpu().numpy()
 
+        data = {key: to_numpy_helper(value) for key, value in episode.data.items()}
         # store number of steps taken
-        if "actions" in episode.data:
-            h5_episode_group.attrs["num_samples"] = len(episode.data["actions"])
+        num_samples = len(data["actions"]) if "actions" in data else 0
+
+        if self._async_write:
+            # start the writer thread on the first episode
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._run_writer, daemon=True)
+                self._writer_thread.start()
+            self._write_queue.put((self._demo_count, num_samples, episode.seed, episode.success, data))
+        else:
+            self._write_episode_data(self._demo_count, num_samples, episode.seed, episode.success, data)
+
+        # increment total demo counts
+        self._demo_count += 1
+
+    def flush(self):
+        """Flush the episode data to disk.
+
+        In asynchronous mode, the flush is queued for the writer thread and this call returns immediately.
+
+        Raises:
+            RuntimeError: If the writer thread failed to write a previous episode.
+        """
+        self._raise_if_not_initialized()
+        self._raise_if_writer_failed()
+
+        if self._writer_thread is not None:
+            self._write_queue.put(self._FLUSH)
         else:
-            h5_episode_group.attrs["num_samples"] = 0
+            self._hdf5_file_stream.flush()
 
-        if episode.seed is not None:
-            h5_episode_group.attrs["seed"] = episode.seed
+    def wait(self):
+        """Wait until the writer thread has processed all the queued episodes and flush requests.
 
-        if episode.success is not None:
-            h5_episode_group.attrs["success"] = episode.success
+        Raises:
+            RuntimeError: If the writer thread failed to write an episode.
+        """
+        if self._writer_thread is not None:
+            self._write_queue.join()
+        self._raise_if_writer_failed()
+
+    def close(self):
+        """Close the dataset file handler.
+
+        In asynchronous mode, this waits for all the queued episodes to be written before closing the file.
+
+        Raises:
+            RuntimeError: If the writer thread failed to write an episode.
+        """
+        # stop the writer thread after it has drained the queue
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        if self._hdf5_file_stream is not None:
+            self._hdf5_file_stream.close()
+            self._hdf5_file_stream = None
+        if self._chunk_cache is not None:
+            self._chunk_cache.clear()
+        # report the failure only once, since the destructor closes the file handler again
+        writer_error, self._writer_error = self._writer_error, None
+        if writer_error is not None:
+            raise RuntimeError("HDF5 dataset writer thread failed to write an episode.") from writer_error
+
+    """
+    Helper functions.
+    """
+
+    def _write_episode_data(
+        self, demo_index: int, num_samples: int, seed: int | None, success: bool | None, data: dict
+    ):
+        """Write the host data of an episode to the file."""
+        # create episode group based on demo count
+        h5_episode_group = self._hdf5_data_group.create_group(f"demo_{demo_index}")
+
+        # store number of steps taken
+        h5_episode_group.attrs["num_samples"] = num_samples
+
+        if seed is not None:
+            h5_episode_group.attrs["seed"] = seed
+
+        if success is not None:
+            h5_episode_group.attrs["success"] = success
 
         def create_dataset_helper(group, key, value):
             """Helper method to create dataset that contains recursive dict objects."""
@@ -168,30 +346,42 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
                 for sub_key, sub_value in value.items():
                     create_dataset_helper(key_group, sub_key, sub_value)
             else:
-                group.create_dataset(key, data=value.cpu().numpy(), compression="gzip")
+                group.create_dataset(
+                    key, data=value, compression=self._compression, compression_opts=self._compression_opts
+                )
+                self._bytes_written += value.nbytes
 
-        for key, value in episode.data.items():
+        for key, value in data.items():
             create_dataset_helper(h5_episode_group, key, value)
 
         # increment total step counts
-        self._hdf5_data_group.attrs["total"] += h5_episode_group.attrs["num_samples"]
-
-        # increment total demo counts
-        self._demo_count += 1
-
-    def flush(self):
-        """Flush the episode data to disk."""
-        self._raise_if_not_initialized()
-
-        self._hdf5_file_stream.flush()
-
-    def close(self):
-        """Close the dataset file handler."""
-        if self._hdf5_file_stream is not None:
-            self._hdf5_file_stream.close()
-            self._hdf5_file_stream = None
+        self._hdf5_data_group.attrs["total"] += num_samples
+
+    def _run_writer(self):
+        """Write the queued episodes to the file until the stop marker (None) is received."""
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                # skip the remaining items after a failure, so that the producer is never blocked
+                if self._writer_error is not None:
+                    continue
+                if item is self._FLUSH:
+                    self._hdf5_file_stream.flush()
+                else:
+                    self._write_episode_data(*item)
+            except Exception as e:
+                self._writer_error = e
+            finally:
+                self._write_queue.task_done()
 
     def _raise_if_not_initialized(self):
         """Raise an error if the dataset file handler is not initialized."""
         if self._hdf5_file_stream is None:
             raise RuntimeError("HDF5 dataset file stream is not initialized")
+
+    def _raise_if_writer_failed(self):
+        """Raise an error if the writer thread failed to write an episode."""
+        if self._writer_error is not None:
+            raise RuntimeError("HDF5 dataset writer thread failed to write an episode.") from self._writer_error
@@ -0,0 +1,219 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import torch
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+
+from .episode_data import EpisodeData
+
+
+class HDF5ChunkCache:
+    """Least-recently-used cache of decoded chunks of HDF5 datasets.
+
+    The chunks are stored as tensors on the device of the dataset that read them. When the cache is full, the
+    least recently used chunk is evicted, so that the memory used by the cache is bounded by the number of chunks
+    times the size of the largest chunk.
+    """
+
+    def __init__(self, max_num_chunks: int = 128):
+        """Initializes the chunk cache.
+
+        Args:
+            max_num_chunks: The maximum number of chunks kept in the cache. Defaults to 128.
+
+        Raises:
+            ValueError: If the maximum number of chunks is less than one.
+        """
+        if max_num_chunks < 1:
+            raise ValueError(
+                f"The maximum number of cached chunks should be greater than zero. Received: {max_num_chunks}."
+            )
+        self._max_num_chunks = max_num_chunks
+        self._chunks: OrderedDict[tuple, torch.Tensor] = OrderedDict()
+
+    def __len__(self) -> int:
+        """The number of chunks in the cache."""
+        return len(self._chunks)
+
+    @property
+    def max_num_chunks(self) -> int:
+        """The maximum number of chunks kept in the cache."""
+        return self._max_num_chunks
+
+    def get(self, key: tuple, loader: Callable[[], torch.Tensor]) -> torch.Tensor:
+        """Get a chunk from the cache, loading it on a miss.
+
+        Args:
+            key: The key identifying the chunk.
+            loader: The function that loads the chunk if it is not in the cache.
+
+        Returns:
+            The decoded chunk.
+        """
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        chunk = loader()
+        self._chunks[key] = chunk
+        if len(self._chunks) > self._max_num_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def clear(self):
+        """Remove all the chunks from the cache."""
+        self._chunks.clear()
+
+
+class LazyHDF5Tensor:
+    """Read-only tensor view of an HDF5 dataset that is loaded on access.
+
+    Indexing the first dimension with an integer reads the window of ``read_ahead`` consecutive entries that
+    contains the index, decodes it into a tensor on the target device and stores it in the chunk cache. Subsequent
+    accesses to the same window, for example when stepping through the actions of an episode, are then served from
+    the cache. Indexing with a slice reads the selected entries directly from the file, without caching them.
+    Any other index is applied to the fully materialized tensor.
+
+    The tensor is only valid as long as the file it was read from is open.
+    """
+
+    def __init__(self, dataset: h5py.Dataset, device: str, read_ahead: int, cache: HDF5ChunkCache):
+        """Initializes the lazy tensor.
+
+        Args:
+            dataset: The HDF5 dataset backing the tensor.
+            device: The device of the tensors returned on access.
+            read_ahead: The number of entries read from the file at once for integer indices.
+            cache: The cache storing the decoded windows.
+
+        Raises:
+            ValueError: If the read-ahead window is less than one.
+        """
+        if read_ahead < 1:
+            raise ValueError(f"The read-ahead window should be greater than zero. Received: {read_ahead}.")
+        self._dataset = dataset
+        self._device = device
+        self._read_ahead = read_ahead
+        self._cache = cache
+
+    def __len__(self) -> int:
+        """The number of entries along the first dimension."""
+        return self._dataset.shape[0]
+
+    def __iter__(self) -> Iterator[torch.Tensor]:
+        """Iterate over the entries along the first dimension."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, key) -> torch.Tensor:
+        """Read the entries selected by the key."""
+        first_key, other_keys = (key[0], key[1:]) if isinstance(key, tuple) and len(key) > 0 else (key, ())
+        if isinstance(first_key, (int, np.integer)):
+            value = self._read_entry(int(first_key))
+        elif isinstance(first_key, slice):
+            value = self._to_tensor(self._dataset[first_key])
+            other_keys = (slice(None),) + other_keys if other_keys else ()
+        else:
+            return self.materialize()[key]
+        return value[other_keys] if other_keys else value
+
+    """
+    Properties.
+    """
+
+    @property
+    def shape(self) -> torch.Size:
+        """The shape of the tensor."""
+        return torch.Size(self._dataset.shape)
+
+    @property
+    def device(self) -> str:
+        """The device of the tensors returned on access."""
+        return self._device
+
+    """
+    Operations.
+    """
+
+    def materialize(self) -> torch.Tensor:
+        """Read the complete dataset into a tensor."""
+        return self._to_tensor(self._dataset[()])
+
+    """
+    Helper functions.
+    """
+
+    def _read_entry(self, index: int) -> torch.Tensor:
+        """Read a single entry along the first dimension through the chunk cache."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(f"Index {index} is out of bounds for dataset '{self._dataset.name}' of length {length}.")
+        chunk_index, chunk_offset = divmod(index, self._read_ahead)
+        start = chunk_index * self._read_ahead
+
+        def load_chunk() -> torch.Tensor:
+            return self._to_tensor(self._dataset[start : start + self._read_ahead])
+
+        chunk = self._cache.get((self._dataset.name, self._read_ahead, self._device, chunk_index), load_chunk)
+        return chunk[chunk_offset]
+
+    def _to_tensor(self, array: np.ndarray) -> torch.Tensor:
+        """Convert an array read from the file into a tensor on the target device."""
+        return torch.as_tensor(np.asarray(array), device=self._device)
+
+
+class LazyEpisodeData(EpisodeData):
+    """Episode data whose leaves are read from an HDF5 file on access.
+
+    The leaves of the episode data are :class:`LazyHDF5Tensor` objects. This keeps the memory usage independent
+    of the episode length when stepping through the episode, e.g. with :meth:`get_next_action` and
+    :meth:`get_next_state`. The initial state is materialized when it is requested with :meth:`get_initial_state`.
+    Adding data to the episode is not supported.
+    """
+
+    _LEAF_TYPES = (torch.Tensor, LazyHDF5Tensor)
+
+    def add(self, key: str, value: torch.Tensor | dict):
+        """Adding data to a lazily loaded episode is not supported.
+
+        Raises:
+            RuntimeError: Always.
+        """
+        raise RuntimeError("Cannot add data to a lazily loaded episode. Use the materialized episode instead.")
+
+    def get_initial_state(self) -> torch.Tensor | dict | None:
+        """Get the initial state from the dataset."""
+        if "initial_state" not in self._data:
+            return None
+        return _materialize_helper(self._data["initial_state"])
+
+    def materialize(self) -> EpisodeData:
+        """Read the complete episode into an :class:`EpisodeData` object.
+
+        Returns:
+            The episode data with all the leaves loaded as tensors.
+        """
+        episode = EpisodeData()
+        episode.data = _materialize_helper(self._data)
+        episode.seed = self.seed
+        episode.success = self.success
+        episode.env_id = self.env_id
+        return episode
+
+
+def _materialize_helper(value: dict | LazyHDF5Tensor | torch.Tensor) -> dict | torch.Tensor:
+    """Helper method to materialize recursive dict objects."""
+    if isinstance(value, dict):
+        return {key: _materialize_helper(sub_value) for key, sub_value in value.items()}
+    if isinstance(value, LazyHDF5Tensor):
+        return value.materialize()
+    return value
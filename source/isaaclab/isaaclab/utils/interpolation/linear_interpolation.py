@@ -17,9 +17,16 @@ class LinearInterpolation:
     interpolating between the corresponding y values. For the query points that are outside the input points,
     the class does a zero-order-hold extrapolation based on the boundary values. This means that the class
     returns the value of the closest point in x.
+
+    The closest points are found with a binary search over the samples, so that the memory usage is independent
+    of the number of samples. If the samples are uniformly spaced, the closest points can instead be computed
+    directly from the grid spacing by setting ``uniform_grid`` to True.
+
+    The class also supports a batch of functions, each with its own samples. In this case, the last dimension of
+    the query points selects the function that is evaluated, e.g. the joint dimension of the joint positions.
     """
 
-    def __init__(self, x: torch.Tensor, y: torch.Tensor, device: str):
+    def __init__(self, x: torch.Tensor, y: torch.Tensor, device: str, uniform_grid: bool = False):
         """Initializes the linear interpolation.
 
         The scalar function maps from real values, x, to real values, y. The input to the class is a set of samples
@@ -30,56 +37,97 @@ class LinearInterpolation:
 
         Args:
             x: An vector of samples from the function's domain. The values should be sorted in ascending order.
-                Shape is (num_samples,)
-            y: The function's values associated to the input x. Shape is (num_samples,)
+                Shape is (num_samples,), or (num_functions, num_samples) for a batch of functions.
+            y: The function's values associated to the input x. Shape is the same as x.
             device: The device used for processing.
+            uniform_grid: Whether the samples in x are uniformly spaced. If True, the closest points are computed
+                from the grid spacing instead of searched for. Defaults to False.
 
         Raises:
             ValueError: If the input tensors are empty or have different sizes.
             ValueError: If the input tensor x is not sorted in ascending order.
+            ValueError: If ``uniform_grid`` is True and the input tensor x is not uniformly spaced.
         """
-        # make sure that input tensors are 1D of size (num_samples,)
-        self._x = x.view(-1).clone().to(device=device)
-        self._y = y.view(-1).clone().to(device=device)
+        # make sure that input tensors are of size (num_samples,) or (num_functions, num_samples)
+        self._batched = x.dim() == 2
+        if self._batched:
+            self._x = x.clone().to(device=device).contiguous()
+            self._y = y.clone().to(device=device).contiguous()
+        else:
+            self._x = x.view(-1).clone().to(device=device)
+            self._y = y.view(-1).clone().to(device=device)
 
         # make sure sizes are correct
         if self._x.numel() == 0:
             raise ValueError("Input tensor x is empty!")
         if self._x.numel() != self._y.numel():
             raise ValueError(f"Input tensors x and y have different sizes: {self._x.numel()} != {self._y.numel()}")
+        if self._x.shape != self._y.shape:
+            raise ValueError(f"Input tensors x and y have different shapes: {self._x.shape} != {self._y.shape}")
         # make sure that x is sorted
-        if torch.any(self._x[1:] < self._x[:-1]):
+        if torch.any(self._x[..., 1:] < self._x[..., :-1]):
             raise ValueError("Input tensor x is not sorted in ascending order!")
+        self._num_samples = self._x.shape[-1]
+
+        # precompute the grid parameters for uniformly spaced samples
+        self._uniform_grid = uniform_grid
+        if self._uniform_grid:
+            # the spacing of a single sample is irrelevant since all queries map to the same sample
+            spacing = (self._x[..., -1:] - self._x[..., :1]) / max(self._num_samples - 1, 1)
+            grid = self._x[..., :1] + spacing * torch.arange(self._num_samples, device=device)
+            if not torch.allclose(grid, self._x, rtol=1e-5, atol=1e-6):
+                raise ValueError("Input tensor x is not uniformly spaced!")
+            self._x_start = self._x[..., :1]
+            self._inv_spacing = torch.where(spacing > 0, 1.0 / spacing, torch.zeros_like(spacing))
 
     def compute(self, q: torch.Tensor) -> torch.Tensor:
         """Calculates a linearly interpolated values for the query points.
 
         Args:
-           q: The query points. It can have any arbitrary shape.
+           q: The query points. It can have any arbitrary shape. For a batch of functions, the last dimension
+               must be equal to the number of functions.
 
         Returns:
             The interpolated values at query points. It has the same shape as the input tensor.
         """
         # serialized q
-        q_1d = q.view(-1)
-        # Number of elements in the x that are strictly smaller than query points (use int32 instead of int64)
-        num_smaller_elements = torch.sum(self._x.unsqueeze(1) < q_1d.unsqueeze(0), dim=0, dtype=torch.int)
+        # note: for a batch of functions, the queries are arranged as (num_functions, num_queries)
+        if self._batched:
+            q_1d = q.reshape(-1, self._x.shape[0]).t().contiguous()
+        else:
+            q_1d = q.reshape(-1).contiguous()
+        # Number of elements in the x that are strictly smaller than query points
+        if self._uniform_grid:
+            num_smaller_elements = torch.ceil((q_1d - self._x_start) * self._inv_spacing).clamp_(0, self._num_samples)
+            num_smaller_elements = num_smaller_elements.long()
+        else:
+            num_smaller_elements = torch.searchsorted(self._x, q_1d)
 
         # The index pointing to the first element in x such that x[lower_bound_i] < q_i
         # If a point is smaller that all x elements, it will assign 0
         lower_bound = torch.clamp(num_smaller_elements - 1, min=0)
         # The index pointing to the first element in x such that x[upper_bound_i] >= q_i
         # If a point is greater than all x elements, it will assign the last elements' index
-        upper_bound = torch.clamp(num_smaller_elements, max=self._x.numel() - 1)
+        upper_bound = torch.clamp(num_smaller_elements, max=self._num_samples - 1)
+
+        # gather the samples around the query points
+        if self._batched:
+            x_lb, x_ub = self._x.gather(1, lower_bound), self._x.gather(1, upper_bound)
+            y_lb, y_ub = self._y.gather(1, lower_bound), self._y.gather(1, upper_bound)
+        else:
+            x_lb, x_ub = self._x[lower_bound], self._x[upper_bound]
+            y_lb, y_ub = self._y[lower_bound], self._y[upper_bound]
 
         # compute the weight as: (q_i - x_lb) / (x_ub - x_lb)
-        weight = (q_1d - self._x[lower_bound]) / (self._x[upper_bound] - self._x[lower_bound])
+        weight = (q_1d - x_lb) / (x_ub - x_lb)
         # If a point is out of bounds assign weight 0.0
-        weight[upper_bound == lower_bound] = 0.0
+        weight = torch.where(upper_bound == lower_bound, 0.0, weight)
 
         # Perform linear interpolation
-        fq = self._y[lower_bound] + weight * (self._y[upper_bound] - self._y[lower_bound])
+        fq = y_lb + weight * (y_ub - y_lb)
 
         # deserialized fq
-        fq = fq.view(q.shape)
+        if self._batched:
+            fq = fq.t()
+        fq = fq.reshape(q.shape)
         return fq
@@ -5,4 +5,4 @@
 
 """Sub-module containing operations based on warp."""
 
-from .ops import convert_to_warp_mesh, raycast_mesh
+from .ops import RaycastContext, convert_to_warp_mesh, raycast_mesh
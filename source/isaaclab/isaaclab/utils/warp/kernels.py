@@ -75,6 +75,229 @@ def raycast_mesh_kernel(
             ray_face_id[tid] = f
 
 
+@wp.kernel(enable_backward=False)
+def compute_mesh_instance_bounds_kernel(
+    mesh_lowers: wp.array(dtype=wp.vec3),
+    mesh_uppers: wp.array(dtype=wp.vec3),
+    instance_meshes: wp.array(dtype=wp.int32),
+    instance_transforms: wp.array(dtype=wp.transform),
+    instance_lowers: wp.array(dtype=wp.vec3),
+    instance_uppers: wp.array(dtype=wp.vec3),
+):
+    """Computes the world-frame axis-aligned bounding boxes of mesh instances.
+
+    The bounding box of an instance encloses the local bounding box of its mesh after it is transformed by
+    the instance transform.
+
+    Args:
+        mesh_lowers: The lower corners of the local bounding boxes of the meshes. Shape is (M,).
+        mesh_uppers: The upper corners of the local bounding boxes of the meshes. Shape is (M,).
+        instance_meshes: The index of the mesh of each instance. Shape is (K,).
+        instance_transforms: The transform from the mesh frame to the world frame of each instance. Shape is (K,).
+        instance_lowers: The output lower corners of the instance bounding boxes. Shape is (K,).
+        instance_uppers: The output upper corners of the instance bounding boxes. Shape is (K,).
+    """
+    # get the thread id
+    tid = wp.tid()
+
+    mesh_id = instance_meshes[tid]
+    xform = instance_transforms[tid]
+    # transform the center of the local box and project its half extents onto the world axes
+    half_extents = 0.5 * (mesh_uppers[mesh_id] - mesh_lowers[mesh_id])
+    center = wp.transform_point(xform, 0.5 * (mesh_uppers[mesh_id] + mesh_lowers[mesh_id]))
+    rot = wp.transform_get_rotation(xform)
+    extents = (
+        wp.abs(wp.quat_rotate(rot, wp.vec3(half_extents[0], 0.0, 0.0)))
+        + wp.abs(wp.quat_rotate(rot, wp.vec3(0.0, half_extents[1], 0.0)))
+        + wp.abs(wp.quat_rotate(rot, wp.vec3(0.0, 0.0, half_extents[2])))
+    )
+    instance_lowers[tid] = center - extents
+    instance_uppers[tid] = center + extents
+
+
+@wp.kernel(enable_backward=False)
+def raycast_mesh_env_kernel(
+    mesh: wp.uint64,
+    env_ids: wp.array(dtype=wp.int32),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    ray_normal: wp.array2d(dtype=wp.vec3),
+    ray_face_id: wp.array2d(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+):
+    """Performs ray-casting against a mesh for the rays of a subset of the environments.
+
+    Unlike :func:`raycast_mesh_kernel`, the rays are stored per environment and only the rows of the given
+    environments are processed. The outputs of missed rays are written as well (:obj:`float('inf')` and -1 for
+    the face ids), so that the output arrays do not need to be reset before the launch.
+
+    Args:
+        mesh: The input mesh.
+        env_ids: The environments to ray-cast for. Shape is (E,). The kernel is launched with shape (E, R).
+        ray_starts: The input ray start positions. Shape is (num_envs, R).
+        ray_directions: The input ray directions. Shape is (num_envs, R).
+        ray_hits: The output ray hit positions. Shape is (num_envs, R).
+        ray_distance: The output ray hit distances. Shape is (num_envs, R), if `return_distance` is True.
+            Otherwise, this array is not used.
+        ray_normal: The output ray hit normals. Shape is (num_envs, R), if `return_normal` is True.
+            Otherwise, this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (num_envs, R), if `return_face_id` is True.
+            Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+    """
+    # get the thread id
+    env_index, ray_id = wp.tid()
+    env_id = env_ids[env_index]
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # ray cast against the mesh and store the hit position
+    start = ray_starts[env_id, ray_id]
+    direction = ray_directions[env_id, ray_id]
+    hit_success = wp.mesh_query_ray(mesh, start, direction, max_dist, t, u, v, sign, n, f)
+    # store the hit data, or the miss values
+    if hit_success:
+        ray_hits[env_id, ray_id] = start + t * direction
+    else:
+        t = wp.inf
+        n = wp.vec3(wp.inf, wp.inf, wp.inf)
+        f = -1
+        ray_hits[env_id, ray_id] = n
+    if return_distance == 1:
+        ray_distance[env_id, ray_id] = t
+    if return_normal == 1:
+        ray_normal[env_id, ray_id] = n
+    if return_face_id == 1:
+        ray_face_id[env_id, ray_id] = f
+
+
+@wp.kernel(enable_backward=False)
+def raycast_multi_mesh_kernel(
+    bvh: wp.uint64,
+    meshes: wp.array(dtype=wp.uint64),
+    mesh_face_offsets: wp.array(dtype=wp.int32),
+    instance_meshes: wp.array(dtype=wp.int32),
+    instance_envs: wp.array(dtype=wp.int32),
+    instance_transforms: wp.array(dtype=wp.transform),
+    env_ids: wp.array(dtype=wp.int32),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    ray_normal: wp.array2d(dtype=wp.vec3),
+    ray_face_id: wp.array2d(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+):
+    """Performs ray-casting against a set of mesh instances and keeps the closest hit.
+
+    The mesh instances are stored in a bounding volume hierarchy (BVH) over their world-frame bounding boxes.
+    Each ray only tests the instances whose bounding box it crosses, which are found by traversing the BVH.
+    An instance either belongs to an environment, in which case it is only visible to the rays of that
+    environment, or it is shared by all the environments (environment index -1).
+
+    For each candidate instance, the ray is transformed into the frame of the instance's mesh and cast with
+    the closest hit found so far as the maximum distance. Since the transforms are rigid, the hit distance in
+    the mesh frame is the same as in the world frame.
+
+    As in :func:`raycast_mesh_env_kernel`, only the rays of the given environments are processed and the outputs
+    of missed rays are written as well. The face id of a hit is offset by the face offset of the hit mesh, so that
+    the face ids of the different meshes do not overlap.
+
+    Args:
+        bvh: The BVH over the bounding boxes of the mesh instances.
+        meshes: The ids of the warp meshes. Shape is (M,).
+        mesh_face_offsets: The offset of the face ids of each mesh, i.e. the number of faces of the previous
+            meshes. Shape is (M,).
+        instance_meshes: The index of the mesh of each instance. Shape is (K,).
+        instance_envs: The environment index of each instance, or -1 for instances shared by all the
+            environments. Shape is (K,).
+        instance_transforms: The transform from the mesh frame to the world frame of each instance. Shape is (K,).
+        env_ids: The environments to ray-cast for. Shape is (E,). The kernel is launched with shape (E, R).
+        ray_starts: The input ray start positions. Shape is (num_envs, R).
+        ray_directions: The input ray directions. Shape is (num_envs, R).
+        ray_hits: The output ray hit positions. Shape is (num_envs, R).
+        ray_distance: The output ray hit distances. Shape is (num_envs, R), if `return_distance` is True.
+            Otherwise, this array is not used.
+        ray_normal: The output ray hit normals in the world frame. Shape is (num_envs, R), if `return_normal`
+            is True. Otherwise, this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (num_envs, R), if `return_face_id` is True.
+            Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+    """
+    # get the thread id
+    env_index, ray_id = wp.tid()
+    env_id = env_ids[env_index]
+
+    start = ray_starts[env_id, ray_id]
+    direction = ray_directions[env_id, ray_id]
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit over all the instances
+    closest_dist = max_dist
+    closest_normal = wp.vec3()
+    closest_face = int(-1)
+    hit_success = bool(False)
+
+    # traverse the instances whose bounding box is crossed by the ray
+    query = wp.bvh_query_ray(bvh, start, direction)
+    instance_id = int(0)
+    while wp.bvh_query_next(query, instance_id):
+        instance_env = instance_envs[instance_id]
+        if instance_env >= 0 and instance_env != env_id:
+            continue
+        # ray cast in the frame of the instance's mesh
+        xform = instance_transforms[instance_id]
+        xform_inv = wp.transform_inverse(xform)
+        local_start = wp.transform_point(xform_inv, start)
+        local_direction = wp.transform_vector(xform_inv, direction)
+        mesh_index = instance_meshes[instance_id]
+        if wp.mesh_query_ray(meshes[mesh_index], local_start, local_direction, closest_dist, t, u, v, sign, n, f):
+            if t < closest_dist:
+                closest_dist = t
+                closest_normal = wp.transform_vector(xform, n)
+                closest_face = mesh_face_offsets[mesh_index] + f
+                hit_success = True
+
+    # store the hit data, or the miss values
+    if hit_success:
+        ray_hits[env_id, ray_id] = start + closest_dist * direction
+    else:
+        closest_dist = wp.inf
+        closest_normal = wp.vec3(wp.inf, wp.inf, wp.inf)
+        ray_hits[env_id, ray_id] = closest_normal
+    if return_distance == 1:
+        ray_distance[env_id, ray_id] = closest_dist
+    if return_normal == 1:
+        ray_normal[env_id, ray_id] = closest_normal
+    if return_face_id == 1:
+        ray_face_id[env_id, ray_id] = closest_face
+
+
 @wp.kernel(enable_backward=False)
 def reshape_tiled_image(
     tiled_image_buffer: Any,
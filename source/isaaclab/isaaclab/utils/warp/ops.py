@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import numpy as np
 import torch
+import weakref
+from collections.abc import Sequence
 
 import warp as wp
 
@@ -20,29 +22,44 @@ wp.init()
 
 from . import kernels
 
+_MESH_BOUNDS: weakref.WeakKeyDictionary[wp.Mesh, tuple[np.ndarray, np.ndarray]] = weakref.WeakKeyDictionary()
+"""The local bounding boxes of the meshes used for multi-mesh ray-casting, computed on their first use."""
+
 
 def raycast_mesh(
     ray_starts: torch.Tensor,
     ray_directions: torch.Tensor,
-    mesh: wp.Mesh,
+    mesh: wp.Mesh | Sequence[wp.Mesh],
     max_dist: float = 1e6,
     return_distance: bool = False,
     return_normal: bool = False,
     return_face_id: bool = False,
+    mesh_transforms: Sequence[torch.Tensor | None] | None = None,
 ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
-    """Performs ray-casting against a mesh.
+    """Performs ray-casting against a mesh or a set of meshes.
 
     Note that the `ray_starts` and `ray_directions`, and `ray_hits` should have compatible shapes
     and data types to ensure proper execution. Additionally, they all must be in the same frame.
 
+    If a list of meshes is provided, the closest hit over all the meshes is returned. Each mesh is either
+    defined in the world frame, or instanced once per environment with the given per-environment transforms,
+    for example to ray-cast against moving obstacles. In the latter case, the rays must be batched per
+    environment with shape (num_envs, num_rays, 3), and the rays of an environment only hit the instances of
+    that environment. All the instances are ray-cast in a single kernel launch, which traverses a bounding volume
+    hierarchy over the bounding boxes of the instances, so that each ray only tests the instances it may hit.
+
     Args:
-        ray_starts: The starting position of the rays. Shape (N, 3).
-        ray_directions: The ray directions for each ray. Shape (N, 3).
-        mesh: The warp mesh to ray-cast against.
+        ray_starts: The starting position of the rays. Shape (N, 3) or (num_envs, num_rays, 3).
+        ray_directions: The ray directions for each ray. Shape (N, 3) or (num_envs, num_rays, 3).
+        mesh: The warp mesh or the list of warp meshes to ray-cast against. A list of meshes must live on
+            the same device, and their geometry is assumed not to change after their first ray-cast.
         max_dist: The maximum distance to ray-cast. Defaults to 1e6.
         return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
         return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
         return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        mesh_transforms: The transforms of the meshes in a list of meshes. For each mesh, either None if the mesh
+            is defined in the world frame, or the pose of its instance in each environment as (x, y, z, qw, qx, qy, qz)
+            with shape (num_envs, 7). Defaults to None, in which case all the meshes are in the world frame.
 
     Returns:
         The ray hit position. Shape (N, 3).
@@ -55,8 +72,27 @@ def raycast_mesh(
             The returned tensor contains :obj:`float('inf')` for missed hits.
         The ray hit face id. Shape (N,).
             Will only return if :attr:`return_face_id` is True else returns None.
-            The returned tensor contains :obj:`int(-1)` for missed hits.
+            The returned tensor contains :obj:`int(-1)` for missed hits. For a list of meshes, the face ids of
+            each mesh are offset by the total number of faces of the previous meshes in the list, i.e. the
+            face ids index the faces of the meshes concatenated in order.
+
+    Raises:
+        ValueError: If the list of meshes is empty, its meshes are on different devices, or the mesh transforms
+            do not match the meshes and the rays.
     """
+    # ray-cast against a set of meshes
+    if not isinstance(mesh, wp.Mesh):
+        return _raycast_multi_mesh(
+            ray_starts,
+            ray_directions,
+            list(mesh),
+            mesh_transforms,
+            max_dist,
+            return_distance,
+            return_normal,
+            return_face_id,
+        )
+
     # extract device and shape information
     shape = ray_starts.shape
     device = ray_starts.device
@@ -127,6 +163,66 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def _raycast_multi_mesh(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    meshes: list[wp.Mesh],
+    mesh_transforms: Sequence[torch.Tensor | None] | None,
+    max_dist: float,
+    return_distance: bool,
+    return_normal: bool,
+    return_face_id: bool,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+    """Performs ray-casting against a set of meshes. See :func:`raycast_mesh` for the arguments."""
+    # check the transforms
+    if mesh_transforms is None:
+        mesh_transforms = [None] * len(meshes)
+    if len(mesh_transforms) != len(meshes):
+        raise ValueError(
+            f"The number of mesh transforms ({len(mesh_transforms)}) does not match the number of meshes"
+            f" ({len(meshes)})."
+        )
+    # extract device and shape information
+    shape = ray_starts.shape
+    device = ray_starts.device
+    num_envs = shape[0] if len(shape) == 3 else 1
+    for mesh_index, transforms in enumerate(mesh_transforms):
+        if transforms is not None and (len(shape) != 3 or transforms.reshape(-1, 7).shape[0] != num_envs):
+            raise ValueError(
+                f"The transforms of mesh {mesh_index} have shape {tuple(transforms.shape)}, which does not match"
+                f" the rays of shape {tuple(shape)}. Expected rays of shape (num_envs, num_rays, 3) and"
+                " transforms of shape (num_envs, 7)."
+            )
+
+    # ray-cast with a temporary context
+    context = RaycastContext(
+        meshes,
+        num_envs=num_envs,
+        num_rays=ray_starts[0].numel() // 3 if len(shape) == 3 else ray_starts.numel() // 3,
+        max_dist=max_dist,
+        return_distance=return_distance,
+        return_normal=return_normal,
+        return_face_id=return_face_id,
+        instanced_meshes=[transforms is not None for transforms in mesh_transforms],
+    )
+    context.raycast(ray_starts, ray_directions, mesh_transforms=mesh_transforms)
+
+    ray_distance = context.ray_distance.to(device).view(shape[:-1]) if return_distance else None
+    ray_normal = context.ray_normal.to(device).view(shape) if return_normal else None
+    ray_face_id = context.ray_face_id.to(device).view(shape[:-1]) if return_face_id else None
+    return context.ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
+
+
+def _get_mesh_bounds(mesh: wp.Mesh) -> tuple[np.ndarray, np.ndarray]:
+    """Get the lower and upper corners of the bounding box of a mesh in its frame, caching them on first use."""
+    bounds = _MESH_BOUNDS.get(mesh)
+    if bounds is None:
+        points = mesh.points.numpy()
+        bounds = (points.min(axis=0), points.max(axis=0))
+        _MESH_BOUNDS[mesh] = bounds
+    return bounds
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
@@ -143,3 +239,362 @@ def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -
         points=wp.array(points.astype(np.float32), dtype=wp.vec3, device=device),
         indices=wp.array(indices.astype(np.int32).flatten(), dtype=wp.int32, device=device),
     )
+
+
+class RaycastContext:
+    """Persistent buffers for ray-casting a fixed number of rays per environment against a set of meshes.
+
+    The function :func:`raycast_mesh` allocates its output tensors and maps all the tensors to warp arrays at
+    every call. For sensors that ray-cast the same rays at every step, this class instead keeps the input and
+    output buffers of shape (num_envs, num_rays, ...) on the device of the meshes, together with their warp
+    arrays. The output buffers can be provided by the caller, for example the data tensors of a sensor, so that
+    the hits are written into them in place. Only the rays of the requested environments are ray-cast, and their
+    outputs are overwritten, including the missed rays.
+
+    For a set of meshes, the instances of the meshes and their bounding volume hierarchy (BVH) are built once.
+    When the transforms of the instanced meshes are updated, the bounding boxes of the instances are recomputed
+    in place and the BVH is refit instead of being rebuilt.
+
+    The warp kernels are launched on the current torch stream of the device, so that no synchronization is
+    needed between the buffer updates in torch and the ray-casting in warp.
+    """
+
+    def __init__(
+        self,
+        meshes: wp.Mesh | Sequence[wp.Mesh],
+        num_envs: int,
+        num_rays: int,
+        max_dist: float = 1e6,
+        return_distance: bool = False,
+        return_normal: bool = False,
+        return_face_id: bool = False,
+        instanced_meshes: Sequence[bool] | None = None,
+        ray_hits: torch.Tensor | None = None,
+        ray_distance: torch.Tensor | None = None,
+        ray_normal: torch.Tensor | None = None,
+        ray_face_id: torch.Tensor | None = None,
+    ):
+        """Initializes the ray-casting buffers.
+
+        Args:
+            meshes: The warp mesh or the list of warp meshes to ray-cast against. The meshes must live on the same
+                device, and their geometry is assumed not to change.
+            num_envs: The number of environments.
+            num_rays: The number of rays per environment.
+            max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+            return_distance: Whether to compute the distance of the rays until they hit the meshes.
+                Defaults to False.
+            return_normal: Whether to compute the normal of the mesh faces the rays hit. Defaults to False.
+            return_face_id: Whether to compute the face id of the mesh faces the rays hit. Defaults to False.
+            instanced_meshes: Whether each mesh is instanced once per environment, with the transforms passed to
+                :meth:`raycast`, or defined in the world frame. Defaults to None, in which case all the meshes are
+                defined in the world frame.
+            ray_hits: The output buffer of the ray hit positions. Shape is (num_envs, num_rays, 3). Defaults to
+                None, in which case it is allocated.
+            ray_distance: The output buffer of the ray hit distances. Shape is (num_envs, num_rays). Only used if
+                :attr:`return_distance` is True. Defaults to None, in which case it is allocated.
+            ray_normal: The output buffer of the ray hit normals. Shape is (num_envs, num_rays, 3). Only used if
+                :attr:`return_normal` is True. Defaults to None, in which case it is allocated.
+            ray_face_id: The output buffer of the ray hit face ids. Shape is (num_envs, num_rays). Only used if
+                :attr:`return_face_id` is True. Defaults to None, in which case it is allocated.
+
+        Raises:
+            ValueError: If the list of meshes is empty or its meshes are on different devices, if the number of
+                instancing flags does not match the number of meshes, or if an output buffer does not have the
+                expected shape, data type or device, or is not contiguous.
+        """
+        # check the meshes
+        self._meshes = [meshes] if isinstance(meshes, wp.Mesh) else list(meshes)
+        if len(self._meshes) == 0:
+            raise ValueError("No meshes provided for ray-casting.")
+        if any(mesh.device != self._meshes[0].device for mesh in self._meshes):
+            raise ValueError("All the meshes must be on the same device for ray-casting.")
+        if instanced_meshes is None:
+            instanced_meshes = [False] * len(self._meshes)
+        if len(instanced_meshes) != len(self._meshes):
+            raise ValueError(
+                f"The number of instancing flags ({len(instanced_meshes)}) does not match the number of meshes"
+                f" ({len(self._meshes)})."
+            )
+        self._num_envs = num_envs
+        self._num_rays = num_rays
+        self._max_dist = float(max_dist)
+        self._return_distance = return_distance
+        self._return_normal = return_normal
+        self._return_face_id = return_face_id
+        self._wp_device = self._meshes[0].device
+        self._device = wp.device_to_torch(self._wp_device)
+
+        # environment indices
+        self._ALL_ENV_IDS = torch.arange(num_envs, dtype=torch.int32, device=self._device)
+        self._all_env_ids_wp = wp.from_torch(self._ALL_ENV_IDS, dtype=wp.int32)
+
+        # input buffers
+        self._ray_starts = torch.zeros(num_envs, num_rays, 3, device=self._device)
+        self._ray_directions = torch.zeros(num_envs, num_rays, 3, device=self._device)
+        self._ray_starts_wp = wp.from_torch(self._ray_starts, dtype=wp.vec3)
+        self._ray_directions_wp = wp.from_torch(self._ray_directions, dtype=wp.vec3)
+
+        # output buffers
+        self._ray_hits = self._resolve_buffer("ray_hits", ray_hits, (num_envs, num_rays, 3), torch.float32, True)
+        self._ray_distance = self._resolve_buffer(
+            "ray_distance", ray_distance, (num_envs, num_rays), torch.float32, return_distance
+        )
+        self._ray_normal = self._resolve_buffer(
+            "ray_normal", ray_normal, (num_envs, num_rays, 3), torch.float32, return_normal
+        )
+        self._ray_face_id = self._resolve_buffer(
+            "ray_face_id", ray_face_id, (num_envs, num_rays), torch.int32, return_face_id
+        )
+        # note: the outputs that are not computed are mapped to dummy arrays, as for the kernel inputs
+        self._ray_hits_wp = wp.from_torch(self._ray_hits, dtype=wp.vec3)
+        if return_distance:
+            self._ray_distance_wp = wp.from_torch(self._ray_distance, dtype=wp.float32)
+        else:
+            self._ray_distance_wp = wp.empty((1, 1), dtype=wp.float32, device=self._wp_device)
+        if return_normal:
+            self._ray_normal_wp = wp.from_torch(self._ray_normal, dtype=wp.vec3)
+        else:
+            self._ray_normal_wp = wp.empty((1, 1), dtype=wp.vec3, device=self._wp_device)
+        if return_face_id:
+            self._ray_face_id_wp = wp.from_torch(self._ray_face_id, dtype=wp.int32)
+        else:
+            self._ray_face_id_wp = wp.empty((1, 1), dtype=wp.int32, device=self._wp_device)
+
+        # instances of the meshes and their BVH
+        self._bvh = None
+        self._instance_offsets: list[int | None] = []
+        if len(self._meshes) > 1 or any(instanced_meshes):
+            self._initialize_instances(instanced_meshes)
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def num_rays(self) -> int:
+        """The number of rays per environment."""
+        return self._num_rays
+
+    @property
+    def ray_hits(self) -> torch.Tensor:
+        """The ray hit positions. Shape is (num_envs, num_rays, 3).
+
+        The tensor contains :obj:`float('inf')` for missed hits.
+        """
+        return self._ray_hits
+
+    @property
+    def ray_distance(self) -> torch.Tensor | None:
+        """The ray hit distances. Shape is (num_envs, num_rays).
+
+        None if the distances are not computed. The tensor contains :obj:`float('inf')` for missed hits.
+        """
+        return self._ray_distance
+
+    @property
+    def ray_normal(self) -> torch.Tensor | None:
+        """The ray hit normals. Shape is (num_envs, num_rays, 3).
+
+        None if the normals are not computed. The tensor contains :obj:`float('inf')` for missed hits.
+        """
+        return self._ray_normal
+
+    @property
+    def ray_face_id(self) -> torch.Tensor | None:
+        """The ray hit face ids. Shape is (num_envs, num_rays).
+
+        None if the face ids are not computed. The tensor contains :obj:`int(-1)` for missed hits.
+
+        For multiple meshes, the face ids of each mesh are offset by the total number of faces of the previous
+        meshes, i.e. the face ids index the faces of the meshes concatenated in order. The instances of an
+        instanced mesh share the same face ids, and are told apart by the environment of the ray.
+        """
+        return self._ray_face_id
+
+    """
+    Operations.
+    """
+
+    def raycast(
+        self,
+        ray_starts: torch.Tensor,
+        ray_directions: torch.Tensor,
+        env_ids: Sequence[int] | torch.Tensor | None = None,
+        mesh_transforms: Sequence[torch.Tensor | None] | None = None,
+    ):
+        """Ray-casts the rays of the given environments and writes the results into the output buffers.
+
+        Args:
+            ray_starts: The starting position of the rays. Shape is (len(env_ids), num_rays, 3).
+            ray_directions: The ray directions for each ray. Shape is (len(env_ids), num_rays, 3).
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+            mesh_transforms: The new transforms of the instanced meshes in the given environments. For each mesh,
+                either None to keep its current transforms, or the pose of its instances as (x, y, z, qw, qx, qy, qz)
+                with shape (len(env_ids), 7). Defaults to None, in which case no transforms are updated.
+        """
+        # resolve the environment ids and copy the rays into the input buffers
+        if env_ids is None:
+            env_ids_wp = self._all_env_ids_wp
+            self._ray_starts.copy_(ray_starts.reshape(self._num_envs, self._num_rays, 3))
+            self._ray_directions.copy_(ray_directions.reshape(self._num_envs, self._num_rays, 3))
+        else:
+            if isinstance(env_ids, torch.Tensor):
+                env_ids = env_ids.to(device=self._device, dtype=torch.long)
+            env_ids = self._ALL_ENV_IDS[env_ids].contiguous()
+            env_ids_wp = wp.from_torch(env_ids, dtype=wp.int32)
+            env_ids_long = env_ids.long()
+            self._ray_starts[env_ids_long] = ray_starts.to(self._device).reshape(-1, self._num_rays, 3)
+            self._ray_directions[env_ids_long] = ray_directions.to(self._device).reshape(-1, self._num_rays, 3)
+
+        # launch the kernels on the current torch stream
+        stream = wp.stream_from_torch(self._device) if self._wp_device.is_cuda else None
+        with wp.ScopedStream(stream):
+            if self._bvh is None:
+                wp.launch(
+                    kernel=kernels.raycast_mesh_env_kernel,
+                    dim=(env_ids_wp.shape[0], self._num_rays),
+                    inputs=[
+                        self._meshes[0].id,
+                        env_ids_wp,
+                        *self._kernel_ray_arrays(),
+                    ],
+                    device=self._wp_device,
+                )
+            else:
+                if mesh_transforms is not None:
+                    self._update_instances(mesh_transforms, self._ALL_ENV_IDS if env_ids is None else env_ids)
+                wp.launch(
+                    kernel=kernels.raycast_multi_mesh_kernel,
+                    dim=(env_ids_wp.shape[0], self._num_rays),
+                    inputs=[
+                        self._bvh.id,
+                        self._mesh_ids_wp,
+                        self._mesh_face_offsets_wp,
+                        self._instance_meshes_wp,
+                        self._instance_envs_wp,
+                        self._instance_transforms_wp,
+                        env_ids_wp,
+                        *self._kernel_ray_arrays(),
+                    ],
+                    device=self._wp_device,
+                )
+
+    """
+    Helper functions.
+    """
+
+    def _resolve_buffer(
+        self, name: str, buffer: torch.Tensor | None, shape: tuple[int, ...], dtype: torch.dtype, enabled: bool
+    ) -> torch.Tensor | None:
+        """Check a provided output buffer or allocate it, if the output is computed."""
+        if not enabled:
+            return None
+        if buffer is None:
+            fill_value = -1 if dtype == torch.int32 else float("inf")
+            return torch.full(shape, fill_value, dtype=dtype, device=self._device)
+        if tuple(buffer.shape) != shape or buffer.dtype != dtype or buffer.device != torch.device(self._device):
+            raise ValueError(
+                f"The buffer '{name}' has shape {tuple(buffer.shape)}, data type {buffer.dtype} and device"
+                f" {buffer.device}. Expected shape {shape}, data type {dtype} and device {self._device}."
+            )
+        if not buffer.is_contiguous():
+            raise ValueError(f"The buffer '{name}' must be contiguous.")
+        return buffer
+
+    def _kernel_ray_arrays(self) -> list:
+        """The ray inputs, outputs and options of the ray-casting kernels."""
+        return [
+            self._ray_starts_wp,
+            self._ray_directions_wp,
+            self._ray_hits_wp,
+            self._ray_distance_wp,
+            self._ray_normal_wp,
+            self._ray_face_id_wp,
+            self._max_dist,
+            int(self._return_distance),
+            int(self._return_normal),
+            int(self._return_face_id),
+        ]
+
+    def _initialize_instances(self, instanced_meshes: Sequence[bool]):
+        """Create the instances of the meshes and build their BVH."""
+        instance_meshes = []
+        instance_envs = []
+        num_instances = 0
+        for mesh_index, instanced in enumerate(instanced_meshes):
+            if instanced:
+                # one instance per environment
+                instance_meshes.append(torch.full((self._num_envs,), mesh_index, dtype=torch.int32))
+                instance_envs.append(torch.arange(self._num_envs, dtype=torch.int32))
+                self._instance_offsets.append(num_instances)
+                num_instances += self._num_envs
+            else:
+                # a single instance shared by all the environments, in the world frame
+                instance_meshes.append(torch.tensor([mesh_index], dtype=torch.int32))
+                instance_envs.append(torch.tensor([-1], dtype=torch.int32))
+                self._instance_offsets.append(None)
+                num_instances += 1
+        self._instance_meshes = torch.cat(instance_meshes).to(self._device)
+        self._instance_envs = torch.cat(instance_envs).to(self._device)
+        # note: the transforms follow the (x, y, z, qx, qy, qz, qw) convention of warp and start as identities
+        self._instance_transforms = torch.zeros(num_instances, 7, device=self._device)
+        self._instance_transforms[:, 6] = 1.0
+        self._mesh_ids_wp = wp.array([mesh.id for mesh in self._meshes], dtype=wp.uint64, device=self._wp_device)
+        # note: the face ids of each mesh are offset by the number of faces of the previous meshes
+        num_faces = [mesh.indices.shape[0] // 3 for mesh in self._meshes]
+        self._mesh_face_offsets_wp = wp.array(np.cumsum([0] + num_faces[:-1]), dtype=wp.int32, device=self._wp_device)
+        self._instance_meshes_wp = wp.from_torch(self._instance_meshes, dtype=wp.int32)
+        self._instance_envs_wp = wp.from_torch(self._instance_envs, dtype=wp.int32)
+        self._instance_transforms_wp = wp.from_torch(self._instance_transforms, dtype=wp.transform)
+
+        # compute the bounding boxes of the instances and build the BVH over them
+        mesh_bounds = [_get_mesh_bounds(mesh) for mesh in self._meshes]
+        self._mesh_lowers_wp = wp.array(
+            np.stack([bounds[0] for bounds in mesh_bounds]), dtype=wp.vec3, device=self._wp_device
+        )
+        self._mesh_uppers_wp = wp.array(
+            np.stack([bounds[1] for bounds in mesh_bounds]), dtype=wp.vec3, device=self._wp_device
+        )
+        self._instance_lowers_wp = wp.empty((num_instances,), dtype=wp.vec3, device=self._wp_device)
+        self._instance_uppers_wp = wp.empty((num_instances,), dtype=wp.vec3, device=self._wp_device)
+        self._compute_instance_bounds()
+        self._bvh = wp.Bvh(self._instance_lowers_wp, self._instance_uppers_wp)
+
+    def _update_instances(self, mesh_transforms: Sequence[torch.Tensor | None], env_ids: torch.Tensor):
+        """Update the transforms of the instanced meshes in the given environments and refit the BVH."""
+        updated = False
+        for mesh_index, transforms in enumerate(mesh_transforms):
+            if transforms is None:
+                continue
+            offset = self._instance_offsets[mesh_index]
+            if offset is None:
+                raise ValueError(f"The mesh {mesh_index} is not instanced, its transforms cannot be updated.")
+            transforms = transforms.to(device=self._device, dtype=torch.float32).view(-1, 7)
+            # convert the quaternions from (w, x, y, z) to the (x, y, z, w) convention of warp
+            self._instance_transforms[offset + env_ids.long()] = transforms[:, [0, 1, 2, 4, 5, 6, 3]]
+            updated = True
+        if updated:
+            self._compute_instance_bounds()
+            self._bvh.refit()
+
+    def _compute_instance_bounds(self):
+        """Compute the world-frame bounding boxes of the instances into the BVH bounds."""
+        wp.launch(
+            kernel=kernels.compute_mesh_instance_bounds_kernel,
+            dim=self._instance_lowers_wp.shape[0],
+            inputs=[
+                self._mesh_lowers_wp,
+                self._mesh_uppers_wp,
+                self._instance_meshes_wp,
+                self._instance_transforms_wp,
+                self._instance_lowers_wp,
+                self._instance_uppers_wp,
+            ],
+            device=self._wp_device,
+        )
@@ -0,0 +1,97 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher
+
+HEADLESS = True
+
+# if not AppLauncher.instance():
+simulation_app = AppLauncher(headless=HEADLESS).app
+
+"""Rest of imports follows"""
+
+import os
+import tempfile
+import torch
+
+import pytest
+
+from isaaclab.actuators import ActuatorNetMLPCfg
+from isaaclab.utils.types import ArticulationActions
+
+
+@pytest.fixture
+def network_file():
+    """Create a TorchScript MLP taking three history entries of position errors and velocities."""
+    temp_dir = tempfile.TemporaryDirectory()
+    torch.manual_seed(0)
+    network = torch.nn.Sequential(torch.nn.Linear(6, 8), torch.nn.Tanh(), torch.nn.Linear(8, 1))
+    file_path = os.path.join(temp_dir.name, "actuator_net.pt")
+    torch.jit.script(network).save(file_path)
+    yield file_path, network
+    temp_dir.cleanup()
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("input_order", ["pos_vel", "vel_pos"])
+def test_actuator_net_mlp_history(network_file, device, input_order):
+    """Test the network inputs gathered from the ring buffer against a shifted history."""
+    file_path, network = network_file
+    network = network.to(device)
+    num_envs, num_joints = 4, 3
+    input_idx = [0, 2, 4]
+    pos_scale, vel_scale = -1.0, 0.5
+
+    actuator_cfg = ActuatorNetMLPCfg(
+        joint_names_expr=[".*"],
+        network_file=file_path,
+        pos_scale=pos_scale,
+        vel_scale=vel_scale,
+        torque_scale=1.0,
+        input_order=input_order,
+        input_idx=input_idx,
+        effort_limit=1e6,
+        velocity_limit=1e6,
+        saturation_effort=1e6,
+    )
+    actuator = actuator_cfg.class_type(
+        actuator_cfg,
+        joint_names=[f"joint_{i}" for i in range(num_joints)],
+        joint_ids=list(range(num_joints)),
+        num_envs=num_envs,
+        device=device,
+    )
+
+    # reference history, where index 0 is the current time-step
+    pos_error_history = torch.zeros(num_envs, max(input_idx) + 1, num_joints, device=device)
+    vel_history = torch.zeros_like(pos_error_history)
+    for step in range(12):
+        # reset some of the environments in between
+        if step == 7:
+            actuator.reset([1, 2])
+            pos_error_history[[1, 2]] = 0.0
+            vel_history[[1, 2]] = 0.0
+
+        joint_pos_target = torch.rand(num_envs, num_joints, device=device)
+        joint_pos = torch.rand(num_envs, num_joints, device=device)
+        joint_vel = torch.rand(num_envs, num_joints, device=device)
+        control_action = ArticulationActions(joint_positions=joint_pos_target.clone())
+        control_action = actuator.compute(control_action, joint_pos, joint_vel)
+
+        # compute the expected torques
+        pos_error_history = pos_error_history.roll(1, 1)
+        pos_error_history[:, 0] = joint_pos_target - joint_pos
+        vel_history = vel_history.roll(1, 1)
+        vel_history[:, 0] = joint_vel
+        pos_input = pos_error_history[:, input_idx].permute(0, 2, 1).reshape(num_envs * num_joints, -1) * pos_scale
+        vel_input = vel_history[:, input_idx].permute(0, 2, 1).reshape(num_envs * num_joints, -1) * vel_scale
+        if input_order == "pos_vel":
+            network_input = torch.cat([pos_input, vel_input], dim=1)
+        else:
+            network_input = torch.cat([vel_input, pos_input], dim=1)
+        with torch.no_grad():
+            expected_effort = network(network_input).view(num_envs, num_joints)
+
+        torch.testing.assert_close(control_action.joint_efforts, expected_effort)
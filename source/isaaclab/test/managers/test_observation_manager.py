@@ -16,6 +16,7 @@ simulation_app = AppLauncher(headless=True).app
 """Rest everything follows."""
 
 import torch
+import torch.utils.benchmark as benchmark
 from collections import namedtuple
 from typing import TYPE_CHECKING
 
@@ -30,6 +31,7 @@ from isaaclab.managers import (
     RewardTermCfg,
 )
 from isaaclab.utils import configclass, modifiers
+from isaaclab.utils.noise import ConstantNoiseCfg
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
@@ -528,6 +530,234 @@ def test_compute_with_group_history(setup_env):
     torch.testing.assert_close(expected_obs_data_t0[reset_env_ids], obs_policy[reset_env_ids])
 
 
+def test_compute_with_fused_group_history(setup_env):
+    env = setup_env
+    """Test the observation computation with a fused group level history buffer."""
+    HISTORY_LENGTH = 4
+
+    @configclass
+    class MyObservationManagerCfg:
+        """Test config class for observation manager."""
+
+        @configclass
+        class PolicyCfg(ObservationGroupCfg):
+            """Test config class for policy observation group."""
+
+            history_length = HISTORY_LENGTH
+            term_1 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5})
+            term_2 = ObservationTermCfg(func=lin_vel_w_data, scale=2.0)
+
+        @configclass
+        class FusedPolicyCfg(PolicyCfg):
+            """Test config class for fused policy observation group."""
+
+            fuse_history = True
+
+        policy: ObservationGroupCfg = PolicyCfg()
+        fused_policy: ObservationGroupCfg = FusedPolicyCfg()
+
+    # create observation manager
+    cfg = MyObservationManagerCfg()
+    obs_man = ObservationManager(cfg, env)
+    assert obs_man.group_obs_dim["fused_policy"] == obs_man.group_obs_dim["policy"] == (4 * HISTORY_LENGTH,)
+
+    def to_time_major(obs: torch.Tensor) -> torch.Tensor:
+        # the default layout stores the complete history of each term contiguously
+        term_1, term_2 = obs.split([HISTORY_LENGTH, 3 * HISTORY_LENGTH], dim=-1)
+        term_1 = term_1.reshape(env.num_envs, HISTORY_LENGTH, 1)
+        term_2 = term_2.reshape(env.num_envs, HISTORY_LENGTH, 3)
+        return torch.cat([term_1, term_2], dim=-1).reshape(env.num_envs, -1)
+
+    for step in range(2 * HISTORY_LENGTH):
+        # reset some environments in between
+        if step == HISTORY_LENGTH:
+            obs_man.reset([2, 4, 16])
+        observations = obs_man.compute(update_history=True)
+        # check the observations
+        torch.testing.assert_close(observations["fused_policy"], to_time_major(observations["policy"]))
+
+    # check that the active terms are reported in the default layout
+    terms = dict(obs_man.get_active_iterable_terms(env_idx=2))
+    assert terms["fused_policy-term_1"] == terms["policy-term_1"]
+    assert terms["fused_policy-term_2"] == terms["policy-term_2"]
+
+
+def test_invalid_fused_group_history_config(setup_env):
+    env = setup_env
+    """Test the invalid configurations for a fused group level history buffer."""
+
+    @configclass
+    class NoHistoryCfg(ObservationGroupCfg):
+        """Test config class for group without history."""
+
+        fuse_history = True
+        term_1 = ObservationTermCfg(func=grilled_chicken)
+
+    @configclass
+    class NoConcatenateCfg(NoHistoryCfg):
+        """Test config class for group without concatenation."""
+
+        history_length = 2
+        concatenate_terms = False
+
+    @configclass
+    class ImageCfg(ObservationGroupCfg):
+        """Test config class for group with image terms."""
+
+        fuse_history = True
+        history_length = 2
+        term_1 = ObservationTermCfg(func=grilled_chicken_image, params={"bland": 1.0})
+
+    @configclass
+    class HistoryDimCfg(NoHistoryCfg):
+        """Test config class for group concatenated along the history dimension."""
+
+        history_length = 2
+        flatten_history_dim = False
+        concatenate_dim = 0
+
+    for group_cfg in [NoHistoryCfg(), NoConcatenateCfg(), ImageCfg(), HistoryDimCfg()]:
+        with pytest.raises(ValueError):
+            ObservationManager({"policy": group_cfg}, env)
+
+
+def test_fused_group_history_concatenate_dim(setup_env):
+    env = setup_env
+    """Test that a fused group history concatenated along the first dimension matches the group dimensions."""
+
+    @configclass
+    class PolicyCfg(ObservationGroupCfg):
+        """Test config class for policy observation group."""
+
+        history_length = 3
+        concatenate_dim = 0
+        term_1 = ObservationTermCfg(func=grilled_chicken)
+        term_2 = ObservationTermCfg(func=lin_vel_w_data)
+
+    @configclass
+    class FusedPolicyCfg(PolicyCfg):
+        """Test config class for fused policy observation group."""
+
+        fuse_history = True
+
+    obs_man = ObservationManager({"policy": PolicyCfg(), "fused_policy": FusedPolicyCfg()}, env)
+    assert obs_man.group_obs_dim["fused_policy"] == obs_man.group_obs_dim["policy"] == (3 * 7,)
+    observations = obs_man.compute()
+    assert observations["fused_policy"].shape == observations["policy"].shape == (env.num_envs, 3 * 7)
+
+
+def test_compute_with_static_layout(setup_env):
+    env = setup_env
+    """Test the observation computation with the static layout of the group output."""
+
+    @configclass
+    class MyObservationManagerCfg:
+        """Test config class for observation manager."""
+
+        @configclass
+        class PolicyCfg(ObservationGroupCfg):
+            """Test config class for policy observation group."""
+
+            enable_corruption = True
+            term_1 = ObservationTermCfg(func=grilled_chicken, scale=10, clip=(-5.0, 5.0))
+            term_2 = ObservationTermCfg(
+                func=lin_vel_w_data,
+                modifiers=[modifiers.ModifierCfg(func=modifiers.bias, params={"value": 1.0})],
+                noise=ConstantNoiseCfg(bias=0.5),
+                scale=(1.0, 2.0, 3.0),
+            )
+            term_3 = ObservationTermCfg(func=pos_w_data, history_length=3)
+            term_4 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5})
+
+        @configclass
+        class StaticPolicyCfg(PolicyCfg):
+            """Test config class for static policy observation group."""
+
+            static_layout = True
+
+        policy: ObservationGroupCfg = PolicyCfg()
+        static_policy: ObservationGroupCfg = StaticPolicyCfg()
+
+    # create observation manager
+    cfg = MyObservationManagerCfg()
+    obs_man = ObservationManager(cfg, env)
+    # store the source data to check that it is not modified
+    lin_vel_w = env.data.lin_vel_w.clone()
+
+    static_obs_buffer = None
+    for step in range(5):
+        # reset some environments in between
+        if step == 3:
+            obs_man.reset([2, 4, 16])
+        env.data.pos_w[:] = torch.rand_like(env.data.pos_w)
+        observations = obs_man.compute(update_history=True)
+        # check the observations
+        assert observations["static_policy"].shape == (env.num_envs, *obs_man.group_obs_dim["policy"])
+        torch.testing.assert_close(observations["static_policy"], observations["policy"])
+        # check that the same output buffer is returned
+        if static_obs_buffer is None:
+            static_obs_buffer = observations["static_policy"]
+        assert observations["static_policy"] is static_obs_buffer
+    # check that the source data is not modified by the in-place operations
+    torch.testing.assert_close(env.data.lin_vel_w, lin_vel_w)
+
+
+def test_static_layout_benchmark(setup_env):
+    env = setup_env
+    """Benchmark the allocations and wall time per step of the static layout against the default layout."""
+
+    @configclass
+    class PolicyCfg(ObservationGroupCfg):
+        """Test config class for policy observation group."""
+
+        term_1 = ObservationTermCfg(func=grilled_chicken, scale=10)
+        term_2 = ObservationTermCfg(func=lin_vel_w_data, clip=(-1.0, 1.0))
+        term_3 = ObservationTermCfg(func=pos_w_data, scale=(1.0, 2.0, 3.0))
+        term_4 = ObservationTermCfg(func=lin_vel_w_data, history_length=5)
+        term_5 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5})
+        term_6 = ObservationTermCfg(
+            func=pos_w_data, modifiers=[modifiers.ModifierCfg(func=modifiers.bias, params={"value": 1.0})]
+        )
+
+    @configclass
+    class StaticPolicyCfg(PolicyCfg):
+        """Test config class for static policy observation group."""
+
+        static_layout = True
+
+    obs_man = ObservationManager({"policy": PolicyCfg(), "static_policy": StaticPolicyCfg()}, env)
+
+    def count_allocations(group_name: str, num_steps: int = 10) -> float:
+        """Counts the number of operators that allocate memory per call to compute the group."""
+        activities = [torch.profiler.ProfilerActivity.CPU]
+        if "cuda" in env.device:
+            activities.append(torch.profiler.ProfilerActivity.CUDA)
+        with torch.profiler.profile(activities=activities, profile_memory=True) as prof:
+            for _ in range(num_steps):
+                obs_man.compute_group(group_name, update_history=True)
+        num_allocations = sum(
+            1
+            for event in prof.events()
+            if event.self_cpu_memory_usage > 0 or getattr(event, "self_device_memory_usage", 0) > 0
+        )
+        return num_allocations / num_steps
+
+    # run the benchmark
+    print("--------------------------------")
+    print(f"Device: {env.device}")
+    for group_name in ["policy", "static_policy"]:
+        timer = benchmark.Timer(
+            stmt="obs_man.compute_group(group_name, update_history=True)",
+            globals={"obs_man": obs_man, "group_name": group_name},
+        )
+        measurement = timer.blocked_autorange(min_run_time=0.5)
+        print(
+            f"Group '{group_name}': {measurement.median * 1e6:.2f} us per step,"
+            f" {count_allocations(group_name):.1f} allocations per step"
+        )
+    print("--------------------------------")
+
+
 def test_invalid_observation_config(setup_env):
     env = setup_env
     """Test the invalid observation config."""
@@ -14,6 +14,7 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows."""
 
+import h5py
 import os
 import shutil
 import tempfile
@@ -179,3 +180,54 @@ def test_record(dataset_dir):
         for env_id in range(env.num_envs):
             episode = recorder_manager.get_episode(env_id)
             assert torch.stack(episode.data["record_post_reset"]).shape == (1, 3)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_record_with_episode_buffer(dataset_dir, device):
+    """Test the recording of the data into the preallocated episode buffer."""
+    env = create_dummy_env(device)
+    # create recorder managers with and without the episode buffer
+    recorder_managers = []
+    for episode_buffer_length in (None, 4):
+        cfg = DummyRecorderManagerCfg()
+        cfg.dataset_export_dir_path = dataset_dir
+        cfg.dataset_filename = f"{uuid.uuid4()}.hdf5"
+        cfg.episode_buffer_length = episode_buffer_length
+        recorder_managers.append(RecorderManager(cfg, env))
+
+    for recorder_manager in recorder_managers:
+        # record the step data
+        for _ in range(2):
+            recorder_manager.record_pre_step()
+            recorder_manager.record_post_step()
+        recorder_manager.set_success_to_episodes(
+            [0, 1], torch.tensor([[True], [False]], dtype=torch.bool, device=device)
+        )
+
+    # check the recorded data against the list-based episodes
+    list_manager, buffered_manager = recorder_managers
+    for env_id in range(env.num_envs):
+        expected = list_manager.get_episode(env_id)
+        episode = buffered_manager.get_episode(env_id)
+        assert episode.success == expected.success
+        for key in ("record_pre_step", "record_post_step"):
+            torch.testing.assert_close(episode.data[key], torch.stack(expected.data[key]))
+
+    # export a subset of the episodes and check that only these are cleared
+    buffered_manager.export_episodes(env_ids=[0, 1])
+    assert buffered_manager.get_episode(0).is_empty()
+    assert buffered_manager.get_episode(0).success is None
+    assert not buffered_manager.get_episode(2).is_empty()
+    assert buffered_manager.exported_successful_episode_count == 1
+    assert buffered_manager.exported_failed_episode_count == 1
+    with h5py.File(os.path.join(dataset_dir, buffered_manager.cfg.dataset_filename), "r") as f:
+        assert len(f["data"]) == 2
+        assert f["data"]["demo_0"]["record_pre_step"].shape == (2, 4)
+        assert bool(f["data"]["demo_0"].attrs["success"])
+
+    # check that the reset clears the remaining episodes
+    buffered_manager.reset()
+    buffered_manager.record_post_reset(env_ids=None)
+    episode = buffered_manager.get_episode(2)
+    assert "record_pre_step" not in episode.data
+    assert episode.data["record_post_reset"].shape == (1, 3)
@@ -38,10 +38,16 @@ def grilled_chicken_with_yoghurt(env, hot: bool, bland: float):
     return 0
 
 
+def grilled_chicken_with_sauce(env, spice: float):
+    return spice * torch.arange(env.num_envs, dtype=torch.float, device=env.device)
+
+
 @pytest.fixture
 def env():
     sim = SimulationContext()
-    return namedtuple("ManagerBasedRLEnv", ["num_envs", "dt", "device", "sim"])(20, 0.1, "cpu", sim)
+    return namedtuple("ManagerBasedRLEnv", ["num_envs", "dt", "device", "sim", "max_episode_length_s"])(
+        20, 0.1, "cpu", sim, 10.0
+    )
 
 
 def test_str(env):
@@ -129,6 +135,51 @@ def test_compute(env):
     assert tuple(rewards.shape) == (env.num_envs,)
 
 
+@pytest.mark.parametrize("compile_terms", [False, True])
+def test_compute_weighted_sum(env, compile_terms):
+    """Test the weighted sum and the episodic sums of the reward terms against a per-term computation."""
+    cfg = {
+        "term_1": RewardTermCfg(func=grilled_chicken_with_sauce, weight=2.0, params={"spice": 0.5}),
+        "term_2": RewardTermCfg(func=grilled_chicken, weight=-0.5),
+        "term_3": RewardTermCfg(func=grilled_chicken_with_sauce, weight=0.0, params={"spice": 3.0}),
+    }
+    rew_man = RewardManager(cfg, env, compile_terms=compile_terms)
+
+    def expected_step_reward() -> torch.Tensor:
+        return torch.stack(
+            [
+                torch.as_tensor(term_cfg.func(env, **term_cfg.params), dtype=torch.float).expand(env.num_envs)
+                * term_cfg.weight
+                for term_cfg in rew_man._term_cfgs
+            ],
+            dim=1,
+        )
+
+    expected_episode_sums = torch.zeros(env.num_envs, len(cfg))
+    for step in range(4):
+        # change the weight of a term in between
+        if step == 2:
+            term_cfg = rew_man.get_term_cfg("term_2")
+            term_cfg.weight = 0.0
+            rew_man.set_term_cfg("term_2", term_cfg)
+            rew_man.get_term_cfg("term_3").weight = 1.5
+        rewards = rew_man.compute(dt=env.dt)
+        step_reward = expected_step_reward()
+        expected_episode_sums += step_reward * env.dt
+        # check the rewards
+        torch.testing.assert_close(rewards, step_reward.sum(dim=1) * env.dt)
+        torch.testing.assert_close(rew_man._step_reward, step_reward)
+        torch.testing.assert_close(rew_man.get_active_iterable_terms(1)[0][1], [step_reward[1, 0].item()])
+
+    # check the episodic sums at reset
+    extras = rew_man.reset(env_ids=[1, 3])
+    for term_idx, term_name in enumerate(cfg):
+        expected_value = expected_episode_sums[[1, 3], term_idx].mean() / env.max_episode_length_s
+        torch.testing.assert_close(extras["Episode_Reward/" + term_name], expected_value)
+    assert torch.all(rew_man._episode_sums[[1, 3]] == 0.0)
+    assert torch.all(rew_man._episode_sums[2] != 0.0)
+
+
 def test_config_empty(env):
     """Test the creation of reward manager with empty config."""
     rew_man = RewardManager(None, env)
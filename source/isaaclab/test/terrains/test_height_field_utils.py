@@ -0,0 +1,183 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch.utils.benchmark as benchmark
+
+import pytest
+
+import isaaclab.terrains.height_field as hf_gen
+from isaaclab.terrains.height_field.utils import convert_height_field_to_mesh
+
+
+def _reference_convert_height_field_to_mesh(
+    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Previous implementation of :func:`convert_height_field_to_mesh`, which builds the triangles row by row."""
+    num_rows, num_cols = height_field.shape
+    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
+    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
+    yy, xx = np.meshgrid(y, x)
+    hf = height_field.copy()
+    if slope_threshold is not None:
+        slope_threshold *= horizontal_scale / vertical_scale
+        move_x = np.zeros((num_rows, num_cols))
+        move_y = np.zeros((num_rows, num_cols))
+        move_corners = np.zeros((num_rows, num_cols))
+        move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
+        move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
+        move_y[:, : num_cols - 1] += hf[:, 1:num_cols] - hf[:, : num_cols - 1] > slope_threshold
+        move_y[:, 1:num_cols] -= hf[:, : num_cols - 1] - hf[:, 1:num_cols] > slope_threshold
+        move_corners[: num_rows - 1, : num_cols - 1] += (
+            hf[1:num_rows, 1:num_cols] - hf[: num_rows - 1, : num_cols - 1] > slope_threshold
+        )
+        move_corners[1:num_rows, 1:num_cols] -= (
+            hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
+        )
+        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
+        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+    vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
+    vertices[:, 0] = xx.flatten()
+    vertices[:, 1] = yy.flatten()
+    vertices[:, 2] = hf.flatten() * vertical_scale
+    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
+    for i in range(num_rows - 1):
+        ind0 = np.arange(0, num_cols - 1) + i * num_cols
+        ind1 = ind0 + 1
+        ind2 = ind0 + num_cols
+        ind3 = ind2 + 1
+        start = 2 * i * (num_cols - 1)
+        stop = start + 2 * (num_cols - 1)
+        triangles[start:stop:2, 0] = ind0
+        triangles[start:stop:2, 1] = ind3
+        triangles[start:stop:2, 2] = ind1
+        triangles[start + 1 : stop : 2, 0] = ind0
+        triangles[start + 1 : stop : 2, 1] = ind2
+        triangles[start + 1 : stop : 2, 2] = ind3
+    return vertices, triangles
+
+
+@pytest.mark.parametrize("shape", [(2, 2), (5, 9), (64, 48)])
+@pytest.mark.parametrize("slope_threshold", [None, 0.75])
+@pytest.mark.parametrize("seed", range(5))
+def test_convert_height_field_to_mesh(shape, slope_threshold, seed):
+    """Test the vertices and triangles of the mesh created from a height field."""
+    rng = np.random.default_rng(seed)
+    horizontal_scale, vertical_scale = 0.1, 0.005
+    height_field = rng.integers(-100, 100, size=shape, dtype=np.int16)
+    height_field_copy = height_field.copy()
+
+    vertices, triangles = convert_height_field_to_mesh(height_field, horizontal_scale, vertical_scale, slope_threshold)
+
+    # the height field is not modified
+    np.testing.assert_array_equal(height_field, height_field_copy)
+    # compare with the previous implementation
+    # note: the vertices are the same up to float rounding, since the offsets are computed in a different order
+    expected_vertices, expected_triangles = _reference_convert_height_field_to_mesh(
+        height_field, horizontal_scale, vertical_scale, slope_threshold
+    )
+    assert triangles.dtype == np.uint32
+    np.testing.assert_array_equal(triangles, expected_triangles)
+    assert vertices.dtype == np.float32
+    np.testing.assert_allclose(vertices, expected_vertices, rtol=0.0, atol=1e-6)
+    # check the vertices
+    assert vertices.shape == (shape[0] * shape[1], 3)
+    np.testing.assert_allclose(vertices[:, 2], height_field.flatten() * vertical_scale, rtol=1e-6)
+    xx, yy = np.meshgrid(np.arange(shape[0]), np.arange(shape[1]), indexing="ij")
+    offset_x = vertices[:, 0] / horizontal_scale - xx.flatten()
+    offset_y = vertices[:, 1] / horizontal_scale - yy.flatten()
+    if slope_threshold is None:
+        np.testing.assert_allclose(offset_x, 0.0, atol=1e-4)
+        np.testing.assert_allclose(offset_y, 0.0, atol=1e-4)
+    else:
+        # the vertices of steep surfaces are moved by at most one cell
+        np.testing.assert_allclose(offset_x, np.round(offset_x), atol=1e-4)
+        np.testing.assert_allclose(offset_y, np.round(offset_y), atol=1e-4)
+        assert np.all(np.abs(offset_x) <= 1.0 + 1e-4) and np.all(np.abs(offset_y) <= 1.0 + 1e-4)
+        assert np.any(np.abs(offset_x) > 0.5) and np.any(np.abs(offset_y) > 0.5)
+
+
+@pytest.mark.parametrize("obstacle_height_mode", ["choice", "fixed"])
+@pytest.mark.parametrize("num_obstacles", [0, 20, 2000])
+def test_discrete_obstacles_terrain(obstacle_height_mode, num_obstacles):
+    """Test the vectorized obstacles against placing the obstacles one after the other with the same seed."""
+    cfg = hf_gen.HfDiscreteObstaclesTerrainCfg(
+        size=(8.0, 8.0),
+        horizontal_scale=0.05,
+        obstacle_height_mode=obstacle_height_mode,
+        obstacle_width_range=(0.1, 0.8),
+        obstacle_height_range=(0.05, 0.3),
+        num_obstacles=num_obstacles,
+        platform_width=2.0,
+    )
+    # generate the height field without converting it to a mesh
+    np.random.seed(0)
+    height_field = hf_gen.hf_terrains.discrete_obstacles_terrain.__wrapped__(0.5, cfg)
+    next_sample = np.random.rand()
+
+    # place the obstacles one after the other
+    np.random.seed(0)
+    width_pixels, length_pixels = height_field.shape
+    obs_height = int((0.05 + 0.5 * 0.25) / cfg.vertical_scale)
+    obs_width_range = np.arange(int(0.1 / cfg.horizontal_scale), int(0.8 / cfg.horizontal_scale), 4)
+    expected_height_field = np.zeros((width_pixels, length_pixels))
+    for _ in range(num_obstacles):
+        if obstacle_height_mode == "choice":
+            height = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
+        else:
+            height = obs_height
+        width = int(np.random.choice(obs_width_range))
+        length = int(np.random.choice(obs_width_range))
+        x_start = min(int(np.random.choice(np.arange(0, width_pixels, 4))), width_pixels - width)
+        y_start = min(int(np.random.choice(np.arange(0, length_pixels, 4))), length_pixels - length)
+        expected_height_field[x_start : x_start + width, y_start : y_start + length] = height
+    expected_height_field[60:100, 60:100] = 0
+
+    np.testing.assert_array_equal(height_field, np.rint(expected_height_field).astype(np.int16))
+    # the same number of random samples is drawn
+    assert next_sample == np.random.rand()
+
+
+def test_height_field_terrains_benchmark():
+    """Benchmark the generation of the built-in height field terrains at a fine resolution."""
+    cfgs = {
+        "random_uniform": hf_gen.HfRandomUniformTerrainCfg(
+            noise_range=(0.02, 0.10), noise_step=0.02, border_width=0.25
+        ),
+        "pyramid_sloped": hf_gen.HfPyramidSlopedTerrainCfg(slope_range=(0.0, 0.4), platform_width=2.0),
+        "pyramid_stairs": hf_gen.HfPyramidStairsTerrainCfg(
+            step_height_range=(0.05, 0.23), step_width=0.3, platform_width=3.0
+        ),
+        "discrete_obstacles": hf_gen.HfDiscreteObstaclesTerrainCfg(
+            obstacle_width_range=(0.25, 0.75), obstacle_height_range=(0.05, 0.3), num_obstacles=40
+        ),
+        "wave": hf_gen.HfWaveTerrainCfg(amplitude_range=(0.1, 0.3), num_waves=4),
+        "stepping_stones": hf_gen.HfSteppingStonesTerrainCfg(
+            stone_height_max=0.1, stone_width_range=(0.25, 1.0), stone_distance_range=(0.1, 0.3)
+        ),
+    }
+    results = []
+    for name, cfg in cfgs.items():
+        cfg.size = (8.0, 8.0)
+        cfg.horizontal_scale = 0.05
+        cfg.slope_threshold = 0.75
+        timer = benchmark.Timer(
+            stmt="cfg.function(0.5, cfg)",
+            globals={"cfg": cfg},
+            label="height field terrains",
+            sub_label=f"size={cfg.size}, horizontal_scale={cfg.horizontal_scale}",
+            description=name,
+        )
+        results.append(timer.blocked_autorange(min_run_time=0.2))
+    benchmark.Compare(results).print()
@@ -0,0 +1,141 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import os
+import time
+
+import pytest
+
+from isaaclab.terrains import TerrainCache
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_save_and_load(tmp_path, compress):
+    """Test that the arrays of an entry are loaded as they were saved."""
+    cache = TerrainCache(str(tmp_path), compress=compress)
+    vertices = np.random.rand(100, 3)
+    faces = np.random.randint(0, 100, size=(50, 3))
+
+    # load a missing entry
+    assert cache.load("terrain") is None
+    # save and load the entry
+    cache.save("terrain", vertices=vertices, faces=faces)
+    entry = cache.load("terrain")
+
+    np.testing.assert_array_equal(entry["vertices"], vertices)
+    np.testing.assert_array_equal(entry["faces"], faces)
+    assert entry["faces"].dtype == faces.dtype
+    # check the statistics
+    assert cache.num_hits == 1
+    assert cache.num_misses == 1
+    assert cache.hit_rate == pytest.approx(0.5)
+    # only the entry is stored in the cache directory
+    assert os.listdir(tmp_path) == ["terrain.npz"]
+
+
+def test_eviction(tmp_path):
+    """Test that the least recently used entries are evicted when the cache is full."""
+    array = np.zeros(2**16)  # 0.5 MB
+    cache = TerrainCache(str(tmp_path), max_size_mb=1.8)
+
+    # fill the cache
+    for key in ["a", "b", "c"]:
+        cache.save(key, array=array)
+        # ensure distinct modification times
+        time.sleep(0.01)
+    # use the oldest entry
+    assert cache.load("a") is not None
+    time.sleep(0.01)
+    # adding a new entry evicts the least recently used one
+    cache.save("d", array=array)
+
+    assert cache.num_evictions == 1
+    assert cache.load("b") is None
+    for key in ["a", "c", "d"]:
+        assert cache.load(key) is not None
+    assert cache.size_mb <= 1.8
+
+
+def test_size_total(tmp_path, monkeypatch):
+    """Test that the cache directory is only listed when the running size exceeds the limit."""
+    array = np.zeros(2**13)  # 64 KB
+    cache = TerrainCache(str(tmp_path), max_size_mb=1.0)
+    num_listings = 0
+    list_entries = cache._list_entries
+
+    def counting_list_entries():
+        nonlocal num_listings
+        num_listings += 1
+        return list_entries()
+
+    monkeypatch.setattr(cache, "_list_entries", counting_list_entries)
+    # the first entry lists the directory, the next ones only update the running size
+    for index in range(15):
+        cache.save(str(index), array=array)
+    assert num_listings == 1
+    # exceeding the limit lists the directory and evicts entries
+    for index in range(15, 20):
+        cache.save(str(index), array=array)
+    assert num_listings > 1
+    assert cache.num_evictions > 0
+    assert cache.size_mb <= 1.0
+
+
+@pytest.mark.parametrize("corruption", ["truncated", "garbage", "missing_array"])
+def test_corrupted_entry(tmp_path, corruption):
+    """Test that a corrupted entry is treated as a miss and removed from the cache."""
+    cache = TerrainCache(str(tmp_path))
+    cache.save("terrain", vertices=np.random.rand(100, 3), faces=np.zeros((50, 3), dtype=np.int64))
+    filename = os.path.join(tmp_path, "terrain.npz")
+    if corruption == "truncated":
+        with open(filename, "rb") as f:
+            data = f.read()
+        with open(filename, "wb") as f:
+            f.write(data[: len(data) // 2])
+    elif corruption == "garbage":
+        with open(filename, "wb") as f:
+            f.write(b"not a numpy archive")
+
+    assert cache.load("terrain", names=("vertices", "faces", "origin")) is None
+    assert cache.num_misses == 1
+    assert not os.path.exists(filename)
+
+
+def test_failed_save(tmp_path, monkeypatch):
+    """Test that no temporary file is left in the cache directory when an entry cannot be written."""
+    cache = TerrainCache(str(tmp_path))
+
+    def failing_savez(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(np, "savez", failing_savez)
+    with pytest.raises(OSError):
+        cache.save("terrain", array=np.zeros(10))
+    assert os.listdir(tmp_path) == []
+
+
+def test_stale_temp_files(tmp_path):
+    """Test that the temporary files left by crashed processes are removed when the cache is created."""
+    stale_filename = os.path.join(tmp_path, "stale.tmp")
+    recent_filename = os.path.join(tmp_path, "recent.tmp")
+    for filename in (stale_filename, recent_filename):
+        with open(filename, "wb") as f:
+            f.write(b"partial entry")
+    stale_mtime = time.time() - 2 * TerrainCache.STALE_TEMP_FILE_AGE
+    os.utime(stale_filename, (stale_mtime, stale_mtime))
+
+    TerrainCache(str(tmp_path))
+    # the recent file may still be written by another process
+    assert os.listdir(tmp_path) == ["recent.tmp"]
@@ -12,16 +12,22 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows."""
 
+import multiprocessing
 import numpy as np
 import os
 import shutil
 import torch
+import trimesh
+import warnings
 
 import isaacsim.core.utils.torch as torch_utils
 import pytest
 
+import isaaclab.terrains.terrain_generator as terrain_generator_module
 from isaaclab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
 from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.terrains.utils import find_flat_patches_batched
+from isaaclab.utils.warp import convert_to_warp_mesh
 
 
 @pytest.fixture
@@ -127,6 +133,9 @@ def test_generation_cache(output_dir, curriculum):
     hash_ids_2 = set(os.listdir(cfg.cache_dir))
     assert len(hash_ids_1) == len(hash_ids_2)
     assert hash_ids_1 == hash_ids_2
+    # check the terrain is loaded from the cache
+    assert terrain_generator.cache.num_hits == 1
+    assert terrain_generator.cache.num_misses == 0
 
     # check if the mesh is the same
     # check they don't point to the same object
@@ -139,6 +148,38 @@ def test_generation_cache(output_dir, curriculum):
     np.testing.assert_allclose(terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal")
 
 
+@pytest.mark.parametrize("curriculum", [True, False])
+def test_generation_num_workers(curriculum):
+    """Generate the terrain with a pool of workers and check that it is the same as the sequential generation."""
+    cfg = ROUGH_TERRAINS_CFG.replace(num_rows=4, num_cols=6, curriculum=curriculum, use_cache=False, seed=10)
+
+    terrain_meshes, terrain_origins = [], []
+    for num_workers in [0, 3]:
+        # set a random seed to check that the global random state is not affected by the generation
+        np.random.seed(0)
+        terrain_generator = TerrainGenerator(cfg=cfg.replace(num_workers=num_workers))
+        terrain_meshes.append(terrain_generator.terrain_mesh.copy())
+        terrain_origins.append(terrain_generator.terrain_origins.copy())
+        assert np.random.rand() == pytest.approx(0.5488135)
+
+    # check that the terrains are identical
+    np.testing.assert_array_equal(terrain_meshes[0].vertices, terrain_meshes[1].vertices)
+    np.testing.assert_array_equal(terrain_meshes[0].faces, terrain_meshes[1].faces)
+    np.testing.assert_array_equal(terrain_origins[0], terrain_origins[1])
+
+
+def test_generation_num_workers_without_fork(monkeypatch):
+    """Check that the sub-terrains are generated sequentially when worker processes cannot be forked."""
+    cfg = ROUGH_TERRAINS_CFG.replace(num_rows=2, num_cols=3, use_cache=False, seed=10)
+    reference_generator = TerrainGenerator(cfg=cfg)
+
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    monkeypatch.setattr(terrain_generator_module, "ProcessPoolExecutor", None)
+    terrain_generator = TerrainGenerator(cfg=cfg.replace(num_workers=3))
+
+    np.testing.assert_array_equal(terrain_generator.terrain_mesh.vertices, reference_generator.terrain_mesh.vertices)
+
+
 def test_terrain_flat_patches():
     """Test the flat patches generation."""
     # create terrain generator
@@ -160,3 +201,53 @@ def test_terrain_flat_patches():
     # check that no flat patches are zero
     for _, flat_patches in terrain_generator.flat_patches.items():
         assert not torch.allclose(flat_patches, torch.zeros_like(flat_patches))
+
+
+def test_find_flat_patches_batched():
+    """Test sampling the flat patches of multiple regions of a mesh at once."""
+    torch.manual_seed(0)
+    # two flat tiles at different heights, with a pillar in the center of the second one
+    tile_1 = trimesh.creation.box((4.0, 4.0, 1.0), trimesh.transformations.translation_matrix((2.0, 2.0, -0.5)))
+    tile_2 = trimesh.creation.box((4.0, 4.0, 1.0), trimesh.transformations.translation_matrix((6.0, 2.0, 0.5)))
+    pillar = trimesh.creation.box((1.0, 1.0, 1.0), trimesh.transformations.translation_matrix((6.0, 2.0, 1.5)))
+    mesh = trimesh.util.concatenate([tile_1, tile_2, pillar])
+    wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device="cpu")
+    # search spaces: the first tile, and the second tile with two configurations
+    patch_cfgs = [
+        FlatPatchSamplingCfg(num_patches=16, patch_radius=0.5, max_height_diff=0.05),
+        FlatPatchSamplingCfg(num_patches=8, patch_radius=[0.2, 0.4], max_height_diff=0.05, z_range=(-0.1, 0.1)),
+        FlatPatchSamplingCfg(num_patches=4, patch_radius=0.3, max_height_diff=0.05, x_range=(-1.0, 1.0)),
+    ]
+    origins = torch.tensor([[2.0, 2.0, 0.0], [6.0, 2.0, 1.0], [6.0, 2.0, 1.0]])
+    search_bounds = torch.tensor([[[0.0, 0.0], [4.0, 4.0]], [[4.0, 0.0], [8.0, 4.0]], [[4.0, 0.0], [8.0, 4.0]]])
+
+    flat_patches, acceptance_rate = find_flat_patches_batched(wp_mesh, patch_cfgs, origins, search_bounds)
+
+    assert [patches.shape for patches in flat_patches] == [(16, 3), (8, 3), (4, 3)]
+    assert acceptance_rate.shape == (3,)
+    assert torch.all(acceptance_rate > 0.0) and torch.all(acceptance_rate <= 1.0)
+    for patch_cfg, origin, patches in zip(patch_cfgs, origins, flat_patches):
+        radius = max(patch_cfg.patch_radius) if isinstance(patch_cfg.patch_radius, list) else patch_cfg.patch_radius
+        # the patches are on the ground of their tile, away from its edges and from the pillar
+        torch.testing.assert_close(patches[:, 2], torch.zeros(len(patches)), atol=1e-4, rtol=0.0)
+        # note: the patches are checked with a ring of points, so they can be slightly closer to the edges
+        assert torch.all(patches[:, :2].abs() <= 2.0 - 0.9 * radius)
+        assert torch.all(torch.linalg.norm(patches[:, :2] - (torch.tensor([6.0, 2.0]) - origin[:2]), dim=1) > 0.5)
+    # the x range restricts the search space
+    assert torch.all(flat_patches[2][:, 0].abs() <= 1.0)
+
+
+def test_find_flat_patches_default_bounds():
+    """Test sampling the flat patches within the bounds of the mesh without any warning."""
+    torch.manual_seed(0)
+    mesh = trimesh.creation.box((4.0, 4.0, 1.0), trimesh.transformations.translation_matrix((0.0, 0.0, -0.5)))
+    wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device="cpu")
+    patch_cfgs = [FlatPatchSamplingCfg(num_patches=8, patch_radius=0.5, max_height_diff=0.05, x_range=(-5.0, 5.0))]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        flat_patches, _ = find_flat_patches_batched(wp_mesh, patch_cfgs, torch.zeros(1, 3))
+
+    # the sampling is bounded by the mesh, even though the x range is larger
+    assert torch.all(flat_patches[0][:, :2].abs() <= 2.0)
+    torch.testing.assert_close(flat_patches[0][:, 2], torch.zeros(8), atol=1e-4, rtol=0.0)
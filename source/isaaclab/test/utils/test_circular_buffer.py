@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import torch
+import torch.utils.benchmark as benchmark
 
 import pytest
 
@@ -19,13 +20,13 @@ simulation_app = AppLauncher(headless=True).app
 from isaaclab.utils import CircularBuffer
 
 
-@pytest.fixture
-def circular_buffer():
+@pytest.fixture(params=[False, True], ids=["time_major", "mirrored"])
+def circular_buffer(request):
     """Create a circular buffer for testing."""
     max_len = 5
     batch_size = 3
     device = "cpu"
-    return CircularBuffer(max_len, batch_size, device)
+    return CircularBuffer(max_len, batch_size, device, mirrored=request.param)
 
 
 def test_initialization(circular_buffer):
@@ -181,3 +182,74 @@ def test_return_buffer_prop(circular_buffer):
     # check that it is returned oldest first
     for idx in range(circular_buffer.max_length - 1):
         assert torch.all(torch.le(retrieved_buffer[:, idx], retrieved_buffer[:, idx + 1]))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_mirrored_layout_matches_time_major(device):
+    """Test that the mirrored layout returns the same history as the time-major layout."""
+    max_len, batch_size = 4, 6
+    ref_buffer = CircularBuffer(max_len, batch_size, device)
+    mirrored_buffer = CircularBuffer(max_len, batch_size, device, mirrored=True)
+
+    for step in range(3 * max_len):
+        # reset a random subset of the batch every few steps
+        if step % 3 == 2:
+            reset_ids = torch.randperm(batch_size, device=device)[:2]
+            ref_buffer.reset(reset_ids)
+            mirrored_buffer.reset(reset_ids)
+        data = torch.rand(batch_size, 2, 3, device=device)
+        ref_buffer.append(data)
+        mirrored_buffer.append(data)
+
+        # check the complete history and the lagged access
+        torch.testing.assert_close(mirrored_buffer.buffer, ref_buffer.buffer)
+        key = torch.randint(0, max_len + 1, (batch_size,), device=device)
+        torch.testing.assert_close(mirrored_buffer[key], ref_buffer[key])
+        assert mirrored_buffer.current_length.tolist() == ref_buffer.current_length.tolist()
+
+
+def test_mirrored_buffer_is_view():
+    """Test that the mirrored layout returns a view that can be flattened without a copy."""
+    circular_buffer = CircularBuffer(max_len=3, batch_size=2, device="cpu", mirrored=True)
+    for i in range(5):
+        circular_buffer.append(torch.full((2, 4), float(i)))
+
+    history = circular_buffer.buffer
+    assert history.shape == (2, 3, 4)
+    # the history shares the memory of the storage
+    assert history.untyped_storage().data_ptr() == circular_buffer._buffer.untyped_storage().data_ptr()
+    # flattening the history dimension does not require a copy
+    flat_history = history.view(2, -1)
+    torch.testing.assert_close(flat_history[0], torch.tensor([2.0] * 4 + [3.0] * 4 + [4.0] * 4))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("num_envs,max_len,feature_dim", [(1024, 3, 48), (4096, 10, 48), (8192, 10, 187)])
+def test_mirrored_layout_benchmark(device, num_envs, max_len, feature_dim):
+    """Benchmark the append and read throughput of the time-major and mirrored layouts.
+
+    The read mimics the access pattern of the observation manager, which flattens the history dimension.
+    """
+    data = torch.rand(num_envs, feature_dim, device=device)
+
+    def append_and_read(circular_buffer: CircularBuffer) -> torch.Tensor:
+        circular_buffer.append(data)
+        return circular_buffer.buffer.reshape(num_envs, -1)
+
+    # create benchmarks for both layouts
+    timers = dict()
+    for name, mirrored in [("time-major", False), ("mirrored", True)]:
+        circular_buffer = CircularBuffer(max_len, num_envs, device, mirrored=mirrored)
+        timers[name] = benchmark.Timer(
+            stmt="append_and_read(circular_buffer)",
+            globals={"append_and_read": append_and_read, "circular_buffer": circular_buffer},
+            label="CircularBuffer append + read",
+            sub_label=f"num_envs={num_envs}, max_len={max_len}, feature_dim={feature_dim}",
+            description=name,
+        )
+
+    # run the benchmark
+    results = [timer.blocked_autorange(min_run_time=0.2) for timer in timers.values()]
+    print("--------------------------------")
+    print(f"Device: {device}")
+    benchmark.Compare(results).print()
@@ -0,0 +1,91 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+
+import pytest
+
+from isaaclab.utils.datasets import EpisodeData, EpisodeDataBuffer
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_is_empty(device):
+    """Test checking whether the episode of an environment is empty."""
+    buffer = EpisodeDataBuffer(num_envs=4, max_episode_length=8, device=device)
+    assert buffer.is_empty(0)
+
+    buffer.add("key", torch.ones(2, 3, device=device), env_ids=[1, 2])
+    assert buffer.is_empty(0)
+    assert not buffer.is_empty(1)
+    assert not buffer.is_empty(2)
+
+    buffer.reset([1])
+    assert buffer.is_empty(1)
+    assert not buffer.is_empty(2)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_parity_with_episode_data(device):
+    """Test that the buffer produces the same episodes as recording each environment separately."""
+    num_envs = 5
+    buffer = EpisodeDataBuffer(num_envs=num_envs, max_episode_length=16, device=device)
+    episodes = [EpisodeData() for _ in range(num_envs)]
+
+    def add(key, value, env_ids):
+        buffer.add(key, value, env_ids)
+        for value_index, env_id in enumerate(env_ids.tolist()):
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    episodes[env_id].add(f"{key}/{sub_key}", sub_value[value_index])
+            else:
+                episodes[env_id].add(key, value[value_index])
+
+    # record keys at different rates and for different subsets of environments
+    all_env_ids = torch.arange(num_envs, device=device)
+    add("initial_state", {"joint_pos": torch.rand(num_envs, 3, device=device)}, all_env_ids)
+    for step in range(10):
+        env_ids = all_env_ids[step % 2 :: 2] if step % 3 == 0 else all_env_ids
+        add("actions", torch.rand(len(env_ids), 2, device=device), env_ids)
+        add("obs", {"policy": torch.rand(len(env_ids), 4, device=device)}, env_ids)
+
+    for env_id in range(num_envs):
+        expected = episodes[env_id]
+        expected.pre_export()
+        episode = buffer.get_episode(env_id)
+        assert episode.env_id == env_id
+        torch.testing.assert_close(episode.data["actions"], expected.data["actions"])
+        torch.testing.assert_close(episode.data["obs"]["policy"], expected.data["obs"]["policy"])
+        torch.testing.assert_close(
+            episode.data["initial_state"]["joint_pos"], expected.data["initial_state"]["joint_pos"]
+        )
+
+    # check that the returned episode is not affected by new data after a reset
+    episode = buffer.get_episode(0)
+    buffer.reset()
+    buffer.add("actions", torch.zeros(num_envs, 2, device=device))
+    torch.testing.assert_close(episode.data["actions"], episodes[0].data["actions"])
+    assert buffer.get_episode(0).data["actions"].shape == (1, 2)
+    assert "initial_state" not in buffer.get_episode(0).data
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_overflow(device):
+    """Test that recording more entries than the maximum episode length is reported."""
+    with pytest.raises(ValueError):
+        EpisodeDataBuffer(num_envs=2, max_episode_length=0, device=device)
+
+    buffer = EpisodeDataBuffer(num_envs=2, max_episode_length=2, device=device)
+    for _ in range(3):
+        buffer.add("key", torch.ones(2, 1, device=device))
+    with pytest.raises(RuntimeError):
+        buffer.get_episode(0)
@@ -19,7 +19,7 @@ import uuid
 
 import pytest
 
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import EpisodeData, HDF5ChunkCache, HDF5DatasetFileHandler, LazyEpisodeData
 
 
 def create_test_episode(device):
@@ -118,3 +118,140 @@ def test_write_and_load_episode(temp_dir, device):
             assert torch.equal(loaded_episode.get_next_action(), action)
 
     dataset_file_handler.close()
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("compression", ["gzip", "lzf", None])
+def test_async_write_episode(temp_dir, device, compression):
+    """Test writing episodes in the background writer thread."""
+    dataset_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}.hdf5")
+    dataset_file_handler = HDF5DatasetFileHandler(compression=compression, async_write=True, max_queue_size=2)
+    dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+    test_episode = create_test_episode(device)
+    test_episode.pre_export()
+
+    # write more episodes than the queue can hold to exercise the backpressure
+    num_episodes = 5
+    for _ in range(num_episodes):
+        dataset_file_handler.write_episode(test_episode)
+        dataset_file_handler.flush()
+        assert dataset_file_handler.queue_depth <= 2
+    assert dataset_file_handler.demo_count == num_episodes
+
+    # wait for the writer thread and check the counters
+    dataset_file_handler.wait()
+    assert dataset_file_handler.queue_depth == 0
+    episode_bytes = sum(
+        value.numel() * value.element_size()
+        for value in (
+            test_episode.data["initial_state"],
+            test_episode.data["actions"],
+            test_episode.data["obs"]["policy"]["term1"],
+        )
+    )
+    assert dataset_file_handler.bytes_written == num_episodes * episode_bytes
+
+    # closing the file drains the queue
+    dataset_file_handler.write_episode(test_episode)
+    dataset_file_handler.close()
+
+    dataset_file_handler = HDF5DatasetFileHandler()
+    dataset_file_handler.open(dataset_file_path)
+    assert dataset_file_handler.get_num_episodes() == num_episodes + 1
+    for episode_name in dataset_file_handler.get_episode_names():
+        loaded_episode = dataset_file_handler.load_episode(episode_name, device=device)
+        assert loaded_episode.success == test_episode.success
+        assert torch.equal(loaded_episode.data["actions"], test_episode.data["actions"])
+        assert torch.equal(loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"])
+    dataset_file_handler.close()
+
+
+def test_invalid_compression():
+    """Test that unsupported compression settings are rejected."""
+    with pytest.raises(ValueError):
+        HDF5DatasetFileHandler(compression="zstd")
+    with pytest.raises(ValueError):
+        HDF5DatasetFileHandler(compression="lzf", compression_opts=4)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_lazy_load_episode(temp_dir, device):
+    """Test loading an episode whose data is read from the file on access."""
+    dataset_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}.hdf5")
+    dataset_file_handler = HDF5DatasetFileHandler()
+    dataset_file_handler.create(dataset_file_path, "test_env_name")
+    test_episode = create_test_episode(device)
+    test_episode.add("states/articulation/robot/joint_position", torch.tensor([0.0, 1.0], device=device))
+    test_episode.add("states/articulation/robot/joint_position", torch.tensor([2.0, 3.0], device=device))
+    test_episode.pre_export()
+    dataset_file_handler.write_episode(test_episode)
+    dataset_file_handler.close()
+
+    dataset_file_handler = HDF5DatasetFileHandler(max_cached_chunks=2)
+    dataset_file_handler.open(dataset_file_path)
+    eager_episode = dataset_file_handler.load_episode("demo_0", device=device)
+    lazy_episode = dataset_file_handler.load_episode("demo_0", device=device, lazy=True, read_ahead=2)
+    assert isinstance(lazy_episode, LazyEpisodeData)
+    assert lazy_episode.success == eager_episode.success
+    assert lazy_episode.env_id == "test_env_name"
+
+    # check the access patterns against the eagerly loaded episode
+    actions = lazy_episode.data["actions"]
+    eager_actions = eager_episode.data["actions"]
+    assert len(actions) == 3
+    assert actions.shape == eager_actions.shape
+    assert torch.equal(actions[-1], eager_actions[-1])
+    assert torch.equal(actions[1:], eager_actions[1:])
+    assert torch.equal(actions[0, 1:], eager_actions[0, 1:])
+    assert torch.equal(actions[:, 0], eager_actions[:, 0])
+    assert torch.equal(torch.stack(list(actions)), eager_actions)
+    with pytest.raises(IndexError):
+        actions[3]
+    assert torch.equal(lazy_episode.get_initial_state(), eager_episode.get_initial_state())
+    for _ in range(3):
+        assert torch.equal(lazy_episode.get_next_action(), eager_episode.get_next_action())
+    assert lazy_episode.get_next_action() is None
+    for _ in range(2):
+        lazy_state = lazy_episode.get_next_state()
+        eager_state = eager_episode.get_next_state()
+        assert torch.equal(
+            lazy_state["articulation"]["robot"]["joint_position"],
+            eager_state["articulation"]["robot"]["joint_position"],
+        )
+    assert lazy_episode.get_next_state() is None
+
+    # check that the materialized episode matches the eagerly loaded episode
+    materialized_episode = lazy_episode.materialize()
+    assert torch.equal(
+        materialized_episode.data["obs"]["policy"]["term1"], eager_episode.data["obs"]["policy"]["term1"]
+    )
+    with pytest.raises(RuntimeError):
+        lazy_episode.add("actions", torch.zeros(3, device=device))
+    dataset_file_handler.close()
+
+
+def test_chunk_cache():
+    """Test the least-recently-used eviction of the chunk cache."""
+    cache = HDF5ChunkCache(max_num_chunks=2)
+    num_loads = 0
+
+    def loader():
+        nonlocal num_loads
+        num_loads += 1
+        return torch.zeros(1)
+
+    cache.get("a", loader)
+    cache.get("b", loader)
+    cache.get("a", loader)
+    assert num_loads == 2
+    # the least recently used chunk is evicted
+    cache.get("c", loader)
+    assert len(cache) == 2
+    cache.get("a", loader)
+    assert num_loads == 3
+    cache.get("b", loader)
+    assert num_loads == 4
+
+    with pytest.raises(ValueError):
+        HDF5ChunkCache(max_num_chunks=0)
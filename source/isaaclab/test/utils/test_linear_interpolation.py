@@ -0,0 +1,114 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import torch
+import torch.utils.benchmark as benchmark
+
+import pytest
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+from isaaclab.utils import LinearInterpolation
+
+
+def comparison_interpolation(x: torch.Tensor, y: torch.Tensor, q: torch.Tensor) -> torch.Tensor:
+    """Reference implementation that compares each query point against all the samples."""
+    q_1d = q.view(-1)
+    num_smaller_elements = torch.sum(x.unsqueeze(1) < q_1d.unsqueeze(0), dim=0, dtype=torch.int)
+    lower_bound = torch.clamp(num_smaller_elements - 1, min=0)
+    upper_bound = torch.clamp(num_smaller_elements, max=x.numel() - 1)
+    weight = (q_1d - x[lower_bound]) / (x[upper_bound] - x[lower_bound])
+    weight[upper_bound == lower_bound] = 0.0
+    return (y[lower_bound] + weight * (y[upper_bound] - y[lower_bound])).view(q.shape)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("uniform_grid", [False, True])
+def test_compute(device, uniform_grid):
+    """Test the interpolation against numpy, including the extrapolation and the queries at the samples."""
+    x = torch.linspace(-1.0, 2.1, 32, device=device)
+    y = torch.sin(3.0 * x)
+    interpolation = LinearInterpolation(x, y, device=device, uniform_grid=uniform_grid)
+
+    q = torch.cat([torch.rand(64, 8, device=device).view(-1) * 4.0 - 1.5, x]).view(-1, 4)
+    fq = interpolation.compute(q)
+    expected = np.interp(q.cpu().numpy(), x.cpu().numpy(), y.cpu().numpy())
+    assert fq.shape == q.shape
+    np.testing.assert_allclose(fq.cpu().numpy(), expected, rtol=1e-5, atol=1e-5)
+    torch.testing.assert_close(fq, comparison_interpolation(interpolation._x, interpolation._y, q))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("uniform_grid", [False, True])
+def test_compute_batched(device, uniform_grid):
+    """Test the interpolation of a batch of functions against the interpolation of each function."""
+    num_joints = 5
+    x = torch.linspace(-1.0, 1.0, 21, device=device) * torch.arange(1, num_joints + 1, device=device).unsqueeze(1)
+    y = torch.rand(num_joints, 21, device=device)
+    interpolation = LinearInterpolation(x, y, device=device, uniform_grid=uniform_grid)
+
+    q = torch.rand(128, num_joints, device=device) * 12.0 - 6.0
+    fq = interpolation.compute(q)
+    assert fq.shape == q.shape
+    for joint_id in range(num_joints):
+        expected = LinearInterpolation(x[joint_id], y[joint_id], device=device).compute(q[:, joint_id])
+        torch.testing.assert_close(fq[:, joint_id], expected)
+
+
+def test_invalid_inputs():
+    """Test that invalid samples are rejected."""
+    with pytest.raises(ValueError):
+        LinearInterpolation(torch.tensor([]), torch.tensor([]), device="cpu")
+    with pytest.raises(ValueError):
+        LinearInterpolation(torch.tensor([0.0, 1.0]), torch.tensor([0.0]), device="cpu")
+    with pytest.raises(ValueError):
+        LinearInterpolation(torch.tensor([1.0, 0.0]), torch.tensor([0.0, 1.0]), device="cpu")
+    with pytest.raises(ValueError):
+        LinearInterpolation(
+            torch.tensor([0.0, 1.0, 3.0]), torch.tensor([0.0, 1.0, 2.0]), device="cpu", uniform_grid=True
+        )
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("num_samples", [16, 256, 4096])
+def test_interpolation_benchmark(device, num_samples):
+    """Benchmark the interpolation of the joint positions of a batch of environments against the comparison matrix."""
+    num_envs, num_joints = 4096, 12
+    x = torch.linspace(-3.0, 3.0, num_samples, device=device)
+    y = torch.cos(x)
+    q = torch.rand(num_envs, num_joints, device=device) * 6.0 - 3.0
+
+    # create benchmarks for the implementations
+    timers = dict()
+    for name, interpolation in [
+        ("comparison matrix", None),
+        ("searchsorted", LinearInterpolation(x, y, device=device)),
+        ("uniform grid", LinearInterpolation(x, y, device=device, uniform_grid=True)),
+    ]:
+        if interpolation is None:
+            stmt, stmt_globals = "compute(x, y, q)", {"compute": comparison_interpolation, "x": x, "y": y, "q": q}
+        else:
+            stmt, stmt_globals = "interpolation.compute(q)", {"interpolation": interpolation, "q": q}
+        timers[name] = benchmark.Timer(
+            stmt=stmt,
+            globals=stmt_globals,
+            label="LinearInterpolation.compute",
+            sub_label=f"num_envs={num_envs}, num_joints={num_joints}, num_samples={num_samples}",
+            description=name,
+        )
+
+    # run the benchmark
+    results = [timer.blocked_autorange(min_run_time=0.2) for timer in timers.values()]
+    print("--------------------------------")
+    print(f"Device: {device}")
+    benchmark.Compare(results).print()
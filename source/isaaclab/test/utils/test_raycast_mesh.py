@@ -0,0 +1,274 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import torch.utils.benchmark as benchmark
+import trimesh
+
+import pytest
+
+from isaaclab.utils.math import quat_apply, random_orientation
+from isaaclab.utils.warp import RaycastContext, convert_to_warp_mesh, raycast_mesh
+
+
+def _make_rays(num_envs: int, num_rays: int, device: str) -> tuple[torch.Tensor, torch.Tensor]:
+    """Create downward rays above the region [-2, 2] x [-2, 2]."""
+    ray_starts = torch.rand(num_envs, num_rays, 3, device=device) * 4.0 - 2.0
+    ray_starts[..., 2] = 5.0
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[..., 2] = -1.0
+    return ray_starts, ray_directions
+
+
+def _closest_hits(
+    ray_starts: torch.Tensor, ray_directions: torch.Tensor, meshes: list
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Reference implementation that ray-casts against each mesh separately and keeps the closest hit."""
+    shape = ray_starts.shape
+    hits = torch.full(shape, float("inf"), device=ray_starts.device)
+    distance = torch.full(shape[:-1], float("inf"), device=ray_starts.device)
+    normal = torch.full(shape, float("inf"), device=ray_starts.device)
+    for mesh in meshes:
+        mesh_hits, mesh_distance, mesh_normal, _ = raycast_mesh(
+            ray_starts, ray_directions, mesh, return_distance=True, return_normal=True
+        )
+        closer = mesh_distance < distance
+        hits[closer] = mesh_hits[closer]
+        distance[closer] = mesh_distance[closer]
+        normal[closer] = mesh_normal[closer]
+    return hits, distance, normal
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_static_meshes(device):
+    """Test ray-casting against a list of meshes in the world frame."""
+    torch.manual_seed(0)
+    ground = trimesh.creation.box((4.0, 4.0, 0.2))
+    box_1 = trimesh.creation.box((1.0, 1.0, 1.0), trimesh.transformations.translation_matrix((0.5, 0.5, 0.5)))
+    box_2 = trimesh.creation.box((1.0, 2.0, 2.0), trimesh.transformations.translation_matrix((-0.8, 0.0, 1.0)))
+    meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device) for mesh in (ground, box_1, box_2)]
+    ray_starts, ray_directions = _make_rays(4, 256, device)
+
+    hits, distance, normal, face_id = raycast_mesh(
+        ray_starts, ray_directions, meshes, return_distance=True, return_normal=True, return_face_id=True
+    )
+    expected_hits, expected_distance, expected_normal = _closest_hits(ray_starts, ray_directions, meshes)
+
+    torch.testing.assert_close(hits, expected_hits)
+    torch.testing.assert_close(distance, expected_distance)
+    torch.testing.assert_close(normal, expected_normal)
+    assert face_id.shape == (4, 256)
+    assert torch.all(face_id >= 0)
+    # the face ids index the faces of the meshes concatenated in order
+    combined_mesh = trimesh.util.concatenate([ground, box_1, box_2])
+    combined_mesh_wp = convert_to_warp_mesh(combined_mesh.vertices, combined_mesh.faces, device=device)
+    _, _, _, expected_face_id = raycast_mesh(ray_starts, ray_directions, combined_mesh_wp, return_face_id=True)
+    torch.testing.assert_close(face_id, expected_face_id)
+    assert torch.any(face_id >= len(ground.faces) + len(box_1.faces))
+    # the rays outside the meshes miss
+    hits, _, _, _ = raycast_mesh(ray_starts + torch.tensor([10.0, 0.0, 0.0], device=device), ray_directions, meshes)
+    assert torch.all(torch.isinf(hits))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_instanced_meshes(device):
+    """Test ray-casting against meshes instanced with per-environment transforms."""
+    torch.manual_seed(0)
+    num_envs = 8
+    ground = trimesh.creation.box((4.0, 4.0, 0.2))
+    obstacle = trimesh.creation.box((1.0, 0.5, 0.8))
+    ground_wp = convert_to_warp_mesh(ground.vertices, ground.faces, device=device)
+    obstacle_wp = convert_to_warp_mesh(obstacle.vertices, obstacle.faces, device=device)
+    ray_starts, ray_directions = _make_rays(num_envs, 256, device)
+    # random poses of the obstacle in each environment
+    pos = torch.rand(num_envs, 3, device=device) * 2.0 - 1.0
+    pos[:, 2] = 1.0
+    quat = random_orientation(num_envs, device=device)
+    poses = torch.cat([pos, quat], dim=-1)
+
+    hits, distance, normal, _ = raycast_mesh(
+        ray_starts,
+        ray_directions,
+        [ground_wp, obstacle_wp],
+        return_distance=True,
+        return_normal=True,
+        mesh_transforms=[None, poses],
+    )
+
+    # compare against the obstacle mesh transformed into the world frame for each environment
+    for env_id in range(num_envs):
+        vertices = torch.tensor(obstacle.vertices, dtype=torch.float32, device=device)
+        vertices = quat_apply(quat[env_id].expand(len(vertices), 4), vertices) + pos[env_id]
+        obstacle_w = convert_to_warp_mesh(vertices.cpu().numpy(), np.asarray(obstacle.faces), device=device)
+        expected_hits, expected_distance, expected_normal = _closest_hits(
+            ray_starts[env_id : env_id + 1], ray_directions[env_id : env_id + 1], [ground_wp, obstacle_w]
+        )
+        torch.testing.assert_close(hits[env_id : env_id + 1], expected_hits, atol=1e-4, rtol=1e-4)
+        torch.testing.assert_close(distance[env_id : env_id + 1], expected_distance, atol=1e-4, rtol=1e-4)
+        torch.testing.assert_close(normal[env_id : env_id + 1], expected_normal, atol=1e-4, rtol=1e-4)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_instanced_meshes_per_env(device):
+    """Test that the rays of an environment only hit the instances of that environment."""
+    obstacle = trimesh.creation.box((1.0, 1.0, 1.0))
+    obstacle_wp = convert_to_warp_mesh(obstacle.vertices, obstacle.faces, device=device)
+    # the same ray in both environments, above the obstacle of the first environment only
+    ray_starts = torch.tensor([[[0.0, 0.0, 5.0]], [[0.0, 0.0, 5.0]]], device=device)
+    ray_directions = torch.tensor([[[0.0, 0.0, -1.0]], [[0.0, 0.0, -1.0]]], device=device)
+    poses = torch.tensor([[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0], [5.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]], device=device)
+
+    hits, distance, _, _ = raycast_mesh(
+        ray_starts, ray_directions, [obstacle_wp], return_distance=True, mesh_transforms=[poses]
+    )
+
+    torch.testing.assert_close(hits[0, 0], torch.tensor([0.0, 0.0, 0.5], device=device))
+    torch.testing.assert_close(distance[0, 0], torch.tensor(4.5, device=device))
+    assert torch.all(torch.isinf(hits[1]))
+
+
+def test_raycast_multi_mesh_invalid_inputs():
+    """Test the errors raised for invalid lists of meshes and transforms."""
+    obstacle = trimesh.creation.box((1.0, 1.0, 1.0))
+    obstacle_wp = convert_to_warp_mesh(obstacle.vertices, obstacle.faces, device="cpu")
+    ray_starts, ray_directions = _make_rays(2, 8, "cpu")
+    poses = torch.tensor([[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]] * 3)
+    # no meshes
+    with pytest.raises(ValueError):
+        raycast_mesh(ray_starts, ray_directions, [])
+    # number of transforms does not match the number of meshes
+    with pytest.raises(ValueError):
+        raycast_mesh(ray_starts, ray_directions, [obstacle_wp], mesh_transforms=[None, None])
+    # number of transforms does not match the number of environments
+    with pytest.raises(ValueError):
+        raycast_mesh(ray_starts, ray_directions, [obstacle_wp], mesh_transforms=[poses])
+    # rays not batched per environment
+    with pytest.raises(ValueError):
+        raycast_mesh(ray_starts.view(-1, 3), ray_directions.view(-1, 3), [obstacle_wp], mesh_transforms=[poses[:2]])
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_context(device):
+    """Test that the ray-casting context writes the hits of the given environments into the provided buffers."""
+    torch.manual_seed(0)
+    num_envs, num_rays = 6, 64
+    ground = trimesh.creation.box((4.0, 4.0, 0.2))
+    ground_wp = convert_to_warp_mesh(ground.vertices, ground.faces, device=device)
+    ray_starts, ray_directions = _make_rays(num_envs, num_rays, device)
+    # the rays of the last environment miss the mesh
+    ray_starts[-1, :, 0] += 10.0
+    ray_hits = torch.zeros(num_envs, num_rays, 3, device=device)
+    context = RaycastContext(
+        ground_wp, num_envs, num_rays, return_distance=True, return_face_id=True, ray_hits=ray_hits
+    )
+
+    # ray-cast a subset of the environments
+    env_ids = torch.tensor([1, 3, 5], device=device)
+    context.raycast(ray_starts[env_ids], ray_directions[env_ids], env_ids)
+    expected_hits, expected_distance, _, expected_face_id = raycast_mesh(
+        ray_starts[env_ids], ray_directions[env_ids], ground_wp, return_distance=True, return_face_id=True
+    )
+    assert context.ray_hits is ray_hits
+    assert context.ray_normal is None
+    torch.testing.assert_close(ray_hits[env_ids], expected_hits)
+    torch.testing.assert_close(context.ray_distance[env_ids], expected_distance)
+    torch.testing.assert_close(context.ray_face_id[env_ids], expected_face_id)
+    assert torch.all(torch.isinf(ray_hits[5]))
+    # the other environments are not modified
+    assert torch.all(ray_hits[[0, 2, 4]] == 0.0)
+
+    # ray-cast all the environments
+    context.raycast(ray_starts, ray_directions)
+    torch.testing.assert_close(ray_hits, raycast_mesh(ray_starts, ray_directions, ground_wp)[0])
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_context_instanced_meshes(device):
+    """Test updating the transforms of instanced meshes in a ray-casting context."""
+    torch.manual_seed(0)
+    num_envs, num_rays = 4, 128
+    ground = trimesh.creation.box((4.0, 4.0, 0.2))
+    obstacle = trimesh.creation.box((1.0, 0.5, 0.8))
+    meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device) for mesh in (ground, obstacle)]
+    ray_starts, ray_directions = _make_rays(num_envs, num_rays, device)
+    context = RaycastContext(meshes, num_envs, num_rays, return_normal=True, instanced_meshes=[False, True])
+
+    for _ in range(3):
+        # move the obstacles of a subset of the environments
+        env_ids = torch.randperm(num_envs, device=device)[:2]
+        poses = torch.cat([torch.rand(num_envs, 3, device=device), random_orientation(num_envs, device)], dim=-1)
+        context.raycast(ray_starts[env_ids], ray_directions[env_ids], env_ids, mesh_transforms=[None, poses[env_ids]])
+        expected_hits, _, expected_normal, _ = raycast_mesh(
+            ray_starts[env_ids],
+            ray_directions[env_ids],
+            meshes,
+            return_normal=True,
+            mesh_transforms=[None, poses[env_ids]],
+        )
+        torch.testing.assert_close(context.ray_hits[env_ids], expected_hits)
+        torch.testing.assert_close(context.ray_normal[env_ids], expected_normal)
+
+
+def test_raycast_context_invalid_buffers():
+    """Test the errors raised for output buffers that cannot be written by the ray-casting context."""
+    obstacle = trimesh.creation.box((1.0, 1.0, 1.0))
+    obstacle_wp = convert_to_warp_mesh(obstacle.vertices, obstacle.faces, device="cpu")
+    # wrong shape
+    with pytest.raises(ValueError):
+        RaycastContext(obstacle_wp, 2, 8, ray_hits=torch.zeros(2, 4, 3))
+    # wrong data type
+    with pytest.raises(ValueError):
+        RaycastContext(obstacle_wp, 2, 8, return_face_id=True, ray_face_id=torch.zeros(2, 8, dtype=torch.int64))
+    # not contiguous
+    with pytest.raises(ValueError):
+        RaycastContext(obstacle_wp, 2, 8, ray_hits=torch.zeros(8, 2, 3).transpose(0, 1))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_context_benchmark(device):
+    """Benchmark the ray-casting of a height scanner with and without a ray-casting context."""
+    num_envs, num_rays = 4096, 187
+    ground = trimesh.creation.box((40.0, 40.0, 0.2))
+    ground_wp = convert_to_warp_mesh(ground.vertices, ground.faces, device=device)
+    ray_starts = torch.rand(num_envs, num_rays, 3, device=device) * 40.0 - 20.0
+    ray_starts[..., 2] = 5.0
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[..., 2] = -1.0
+    ray_hits_w = torch.zeros(num_envs, num_rays, 3, device=device)
+    context = RaycastContext(ground_wp, num_envs, num_rays, ray_hits=ray_hits_w)
+
+    def raycast_function():
+        ray_hits_w[:] = raycast_mesh(ray_starts, ray_directions, ground_wp)[0]
+
+    statements = {
+        "raycast_mesh": ("raycast()", {"raycast": raycast_function}),
+        "RaycastContext": (
+            "context.raycast(ray_starts, ray_directions)",
+            {"context": context, "ray_starts": ray_starts, "ray_directions": ray_directions},
+        ),
+    }
+    results = []
+    for name, (stmt, stmt_globals) in statements.items():
+        timer = benchmark.Timer(
+            stmt=stmt,
+            globals=stmt_globals,
+            label="ray-casting",
+            sub_label=f"num_envs={num_envs}, num_rays={num_rays}",
+            description=name,
+        )
+        results.append(timer.blocked_autorange(min_run_time=0.2))
+    print("--------------------------------")
+    print(f"Device: {device}")
+    benchmark.Compare(results).print()
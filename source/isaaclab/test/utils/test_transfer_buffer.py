@@ -0,0 +1,98 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+
+import pytest
+
+from isaaclab.utils import TransferBuffer
+
+
+def _generate_data(num_envs: int, device: str) -> dict:
+    """Generate step outputs of an environment."""
+    return {
+        "obs": {
+            "policy": torch.rand(num_envs, 7, device=device),
+            "image": torch.randint(0, 255, (num_envs, 4, 4, 3), dtype=torch.uint8, device=device),
+        },
+        "rewards": torch.rand(num_envs, device=device),
+        "dones": torch.rand(num_envs, device=device) > 0.5,
+        "episode_length": torch.randint(0, 100, (num_envs,), dtype=torch.long, device=device),
+        "name": "step",
+    }
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_transfer(device):
+    """Test that the transferred data matches the input data."""
+    transfer_buffer = TransferBuffer("cpu")
+    data = _generate_data(10, device)
+    # the image is not contiguous
+    data["obs"]["image"] = data["obs"]["image"].permute(0, 3, 1, 2)
+    output = transfer_buffer.transfer(data)
+
+    # check the structure and content of the output
+    assert output["name"] == "step"
+    assert set(output["obs"].keys()) == {"policy", "image"}
+    for value, expected_value in [
+        (output["obs"]["policy"], data["obs"]["policy"]),
+        (output["obs"]["image"], data["obs"]["image"]),
+        (output["rewards"], data["rewards"]),
+        (output["dones"], data["dones"]),
+        (output["episode_length"], data["episode_length"]),
+    ]:
+        assert value.device == torch.device("cpu")
+        assert value.dtype == expected_value.dtype
+        torch.testing.assert_close(value, expected_value.cpu())
+    # numpy views are supported
+    assert output["dones"].numpy().dtype == bool
+    # the input data is unchanged
+    assert data["obs"]["policy"].device == torch.device(device)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_double_buffering(device):
+    """Test that the outputs are only overwritten after cycling through all the buffers."""
+    transfer_buffer = TransferBuffer("cpu", num_buffers=2)
+    data_0 = _generate_data(10, device)
+    output_0 = transfer_buffer.transfer(data_0)
+    output_1 = transfer_buffer.transfer(_generate_data(10, device))
+    # the outputs of the previous transfer are still valid
+    torch.testing.assert_close(output_0["rewards"], data_0["rewards"].cpu())
+    assert output_0["rewards"].data_ptr() != output_1["rewards"].data_ptr()
+    # the third transfer reuses the buffer of the first one
+    output_2 = transfer_buffer.transfer(_generate_data(10, device))
+    assert output_2["rewards"].data_ptr() == output_0["rewards"].data_ptr()
+
+
+def test_layout_change():
+    """Test that the buffers are re-allocated when the layout of the data changes."""
+    transfer_buffer = TransferBuffer("cpu")
+    transfer_buffer.transfer(_generate_data(10, "cpu"))
+    data = _generate_data(20, "cpu")
+    data["extra"] = torch.ones(3, dtype=torch.float64)
+    output = transfer_buffer.transfer(data)
+    assert output["rewards"].shape == (20,)
+    torch.testing.assert_close(output["extra"], data["extra"])
+    # data without tensors is returned as is
+    assert transfer_buffer.transfer({"name": "step"}) == {"name": "step"}
+
+
+def test_invalid_arguments():
+    """Test the invalid arguments of the transfer buffer."""
+    with pytest.raises(ValueError):
+        TransferBuffer("cpu", num_buffers=0)
+    if torch.cuda.is_available():
+        with pytest.raises(ValueError):
+            TransferBuffer("cpu").transfer({"a": torch.zeros(1), "b": torch.zeros(1, device="cuda:0")})
@@ -277,6 +277,26 @@ class DataGenerator:
             # no reference object - only random selection is supported
             assert selection_strategy_name == "random", selection_strategy_name
 
+        # Make selection strategy object
+        selection_strategy_obj = make_selection_strategy(selection_strategy_name)
+        if selection_strategy_kwargs is None:
+            selection_strategy_kwargs = dict()
+
+        if selection_strategy_obj.supports_batched_selection():
+            # The selection strategy only needs the poses at the start of the subtask segment in each source demo,
+            # which are gathered from the datagen info pool without building datagen info objects for each demo.
+            src_eef_poses, src_object_poses = self.src_demo_datagen_info_pool.get_subtask_start_poses(
+                eef_name, subtask_object_name, src_demo_current_subtask_boundaries[:, 0]
+            )
+            selected_src_demo_inds = selection_strategy_obj.select_source_demos(
+                eef_poses=eef_pose.to(src_eef_poses.device).unsqueeze(0),
+                object_poses=object_pose.to(src_eef_poses.device).unsqueeze(0) if object_pose is not None else None,
+                src_eef_poses=src_eef_poses,
+                src_object_poses=src_object_poses,
+                **selection_strategy_kwargs,
+            )
+            return selected_src_demo_inds[0].item()
+
         # We need to collect the datagen info objects over the timesteps for the subtask segment in each source
         # demo, so that it can be used by the selection strategy.
         src_subtask_datagen_infos = []
@@ -309,12 +329,7 @@ class DataGenerator:
                 )
             )
 
-        # Make selection strategy object
-        selection_strategy_obj = make_selection_strategy(selection_strategy_name)
-
         # Run selection
-        if selection_strategy_kwargs is None:
-            selection_strategy_kwargs = dict()
         selected_src_demo_ind = selection_strategy_obj.select_source_demo(
             eef_pose=eef_pose,
             object_pose=object_pose,
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import torch
 
 from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
 
@@ -31,6 +32,10 @@ class DataGenInfoPool:
         # Start and end step indices of each subtask in each episode for each eef
         self._subtask_boundaries: dict[str, list[list[tuple[int, int]]]] = {}
 
+        # Poses of all episodes concatenated along the time axis and the index of the first step of each episode
+        # in the concatenated poses, for each eef and each object. They are built when first queried.
+        self._stacked_poses: dict[tuple[str, str], tuple[torch.Tensor, torch.Tensor]] = {}
+
         self.env = env
         self.env_cfg = env_cfg
         self.device = device
@@ -203,6 +208,72 @@ class DataGenInfoPool:
 
             self._subtask_boundaries[eef_name].append(eef_subtask_boundaries)
 
+    def get_subtask_start_poses(
+        self, eef_name: str, object_name: str | None, start_inds
+    ) -> tuple[torch.Tensor, torch.Tensor | None]:
+        """
+        Get the eef and object poses at the start of a subtask segment in each episode.
+
+        The poses of all episodes are concatenated once per eef and per object, so that the poses
+        at the (randomized) start of the subtask segments are gathered with a single indexing operation
+        instead of iterating over the episodes.
+
+        Args:
+            eef_name (str): name of the end effector
+            object_name (str or None): name of the reference object of the subtask. If None, no object
+                poses are returned.
+            start_inds (np.ndarray or torch.Tensor): start step index of the subtask segment in each of
+                the first N episodes of shape (N,)
+
+        Returns:
+            A tuple containing the eef poses of shape (N, 4, 4) and the object poses of shape (N, 4, 4)
+            at the start of the subtask segments. The object poses are None if no object name is given.
+        """
+        eef_poses, episode_offsets = self._get_stacked_poses("eef_pose", eef_name)
+        start_inds = torch.as_tensor(start_inds, dtype=torch.long, device=episode_offsets.device)
+        step_inds = episode_offsets[: len(start_inds)] + start_inds
+        if object_name is None:
+            return eef_poses[step_inds], None
+        object_poses, _ = self._get_stacked_poses("object_pose", object_name)
+        return eef_poses[step_inds], object_poses[step_inds]
+
+    def _get_stacked_poses(self, pose_type: str, name: str) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Get the poses of all episodes concatenated along the time axis.
+
+        The concatenated poses are extended with the episodes that were added since the last query.
+
+        Args:
+            pose_type: Type of the poses, either "eef_pose" or "object_pose".
+            name: Name of the end effector or object.
+
+        Returns:
+            A tuple containing the concatenated poses of shape (T, 4, 4) and the index of the first
+            step of each episode in the concatenated poses of shape (num_episodes,).
+        """
+        stacked_poses, episode_offsets = self._stacked_poses.get((pose_type, name), (None, None))
+        num_stacked_episodes = 0 if episode_offsets is None else len(episode_offsets)
+        if num_stacked_episodes == len(self._datagen_infos):
+            return stacked_poses, episode_offsets
+
+        # collect the poses of the new episodes
+        new_poses = []
+        for datagen_info in self._datagen_infos[num_stacked_episodes:]:
+            poses = datagen_info.eef_pose if pose_type == "eef_pose" else datagen_info.object_poses
+            new_poses.append(poses[name])
+        new_episode_lengths = torch.tensor([len(poses) for poses in new_poses], device=new_poses[0].device)
+        new_episode_offsets = torch.cumsum(new_episode_lengths, dim=0) - new_episode_lengths
+
+        # append them to the concatenated poses
+        if stacked_poses is None:
+            stacked_poses = torch.cat(new_poses)
+            episode_offsets = new_episode_offsets
+        else:
+            episode_offsets = torch.cat([episode_offsets, new_episode_offsets + len(stacked_poses)])
+            stacked_poses = torch.cat([stacked_poses] + new_poses)
+        self._stacked_poses[(pose_type, name)] = (stacked_poses, episode_offsets)
+        return stacked_poses, episode_offsets
+
     def load_from_dataset_file(self, file_path, select_demo_keys: str | None = None):
         """
         Load from a dataset file.
@@ -45,6 +45,90 @@ def assert_selection_strategy_exists(name):
         )
 
 
+def compute_pose_distances(poses, src_poses, pos_weight=1.0, rot_weight=1.0):
+    """
+    Computes the weighted distances between a batch of query poses and a batch of source poses.
+
+    The distance between two poses is the weighted sum of the L2 distance between their positions and the
+    angle of their delta rotation. The distances for all pairs of poses are computed at once, so that many
+    queries can be scored against a large set of source poses with a couple of matrix multiplications.
+
+    Args:
+        poses (torch.Tensor): query poses of shape [E, 4, 4]
+        src_poses (torch.Tensor): source poses of shape [N, 4, 4]
+        pos_weight (float): weight on position distances
+        rot_weight (float): weight on rotation distances
+
+    Returns:
+        dists (torch.Tensor): weighted distances of shape [E, N]
+    """
+    pos, rot = PoseUtils.unmake_pose(poses)
+    src_pos, src_rot = PoseUtils.unmake_pose(src_poses)
+
+    # pos dist is just L2 between positions
+    pos_dists = torch.cdist(pos, src_pos)
+
+    # get angle (in axis-angle representation of delta rotation matrix) using the following formula
+    # (see http://www.boris-belousov.net/2016/12/01/quat-dist/)
+    # note: trace(R_src @ R^T) is the dot product of the flattened rotation matrices, so the traces
+    #   of all pairs of rotations are given by a single matrix multiplication [E, 9] x [9, N] -> [E, N]
+    traces = torch.matmul(rot.reshape(-1, 9), src_rot.reshape(-1, 9).transpose(0, 1))
+    arc_cos_in = (traces - 1.0) / 2.0
+    arc_cos_in = torch.clamp(arc_cos_in, -1.0, 1.0)  # clip for numerical stability
+    rot_dists = torch.acos(arc_cos_in)
+
+    # weight distances with coefficients
+    return pos_weight * pos_dists + rot_weight * rot_dists
+
+
+def sample_from_nearest_neighbors(dists, nn_k=3):
+    """
+    Picks one of the top-K nearest neighbors uniformly at random for each query.
+
+    Args:
+        dists (torch.Tensor): distances of shape [E, N] between E queries and N candidates
+        nn_k (int): number of nearest neighbors to pick from
+
+    Returns:
+        inds (torch.Tensor): indices of the picked candidates of shape [E]
+    """
+    # clip top-k parameter to max possible value
+    nn_k = min(nn_k, dists.shape[-1])
+
+    # return one of the top-K nearest neighbors uniformly at random
+    top_k_neighbors = torch.topk(dists, nn_k, dim=-1, largest=False).indices
+    # note: the draw uses the CPU generator, as for a single request, to keep seeded runs reproducible
+    rand_k = torch.randint(0, nn_k, (dists.shape[0], 1)).to(dists.device)
+    return top_k_neighbors.gather(-1, rand_k).squeeze(-1)
+
+
+def stack_subtask_start_poses(src_subtask_datagen_infos, include_eef_pose=True):
+    """
+    Collects the poses at the start of the subtask segments of the source demonstrations.
+
+    Args:
+        src_subtask_datagen_infos (list): DatagenInfo instance for the relevant subtask segment
+            in the source demonstrations
+        include_eef_pose (bool): whether to collect the eef poses
+
+    Returns:
+        src_eef_poses (torch.Tensor or None): eef poses of shape [N, 4, 4]. None if not collected.
+        src_object_poses (torch.Tensor): poses of the object in the subtask of shape [N, 4, 4]
+    """
+    src_eef_poses = []
+    src_object_poses = []
+    for di in src_subtask_datagen_infos:
+        # use eef pose at start of subtask segment
+        if include_eef_pose:
+            src_eef_poses.append(di.eef_pose[0])
+        # use object pose at start of subtask segment
+        src_obj_pose = list(di.object_poses.values())
+        assert len(src_obj_pose) == 1
+        src_object_poses.append(src_obj_pose[0][0])
+    src_eef_poses = torch.stack(src_eef_poses) if include_eef_pose else None
+    return src_eef_poses, torch.stack(src_object_poses)
+
+
 class SelectionStrategyMeta(type):
     """
     This metaclass adds selection strategy classes into the global registry.
@@ -73,6 +157,14 @@ class SelectionStrategy(metaclass=SelectionStrategyMeta):
         """
         raise NotImplementedError
 
+    @classmethod
+    def supports_batched_selection(cls):
+        """
+        Whether the selection strategy implements :meth:`select_source_demos`, i.e. it only depends on the
+        poses at the start of the subtask segments and can score a batch of requests at once.
+        """
+        return cls.select_source_demos is not SelectionStrategy.select_source_demos
+
     @abc.abstractmethod
     def select_source_demo(
         self,
@@ -96,6 +188,31 @@ class SelectionStrategy(metaclass=SelectionStrategyMeta):
         """
         raise NotImplementedError
 
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        src_eef_poses,
+        src_object_poses,
+    ):
+        """
+        Selects source demonstration indices for a batch of requests at once, using the current robot poses,
+        relevant object poses for the current subtask, and the poses at the start of the relevant subtask
+        segment in the source demonstrations.
+
+        Args:
+            eef_poses (torch.Tensor): current eef poses of shape [E, 4, 4]
+            object_poses (torch.Tensor or None): current poses of the object in this subtask of shape [E, 4, 4]
+            src_eef_poses (torch.Tensor): eef poses at the start of the subtask segment in the source
+                demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): object poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [E]
+        """
+        raise NotImplementedError
+
 
 class RandomStrategy(SelectionStrategy):
     """
@@ -130,6 +247,36 @@ class RandomStrategy(SelectionStrategy):
         n_src_demo = len(src_subtask_datagen_infos)
         return torch.randint(0, n_src_demo, (1,)).item()
 
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        src_eef_poses,
+        src_object_poses,
+    ):
+        """
+        Selects source demonstration indices for a batch of requests at once, using the current robot poses,
+        relevant object poses for the current subtask, and the poses at the start of the relevant subtask
+        segment in the source demonstrations.
+
+        Args:
+            eef_poses (torch.Tensor): current eef poses of shape [E, 4, 4]
+            object_poses (torch.Tensor or None): current poses of the object in this subtask of shape [E, 4, 4]
+            src_eef_poses (torch.Tensor): eef poses at the start of the subtask segment in the source
+                demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): object poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [E]
+        """
+
+        # random selection
+        # note: the indices are drawn with the CPU generator, as for a single request, so that seeded runs
+        #   select the same source demonstrations on all devices
+        n_src_demo = src_eef_poses.shape[0]
+        return torch.randint(0, n_src_demo, (eef_poses.shape[0],)).to(eef_poses.device)
+
 
 class NearestNeighborObjectStrategy(SelectionStrategy):
     """
@@ -168,44 +315,53 @@ class NearestNeighborObjectStrategy(SelectionStrategy):
         """
 
         # collect object poses from start of subtask source segments into tensor of shape [N, 4, 4]
-        src_object_poses = []
-        for di in src_subtask_datagen_infos:
-            src_obj_pose = list(di.object_poses.values())
-            assert len(src_obj_pose) == 1
-            # use object pose at start of subtask segment
-            src_object_poses.append(src_obj_pose[0][0])
-        src_object_poses = torch.stack(src_object_poses)
-
-        # split into positions and rotations
-        all_src_obj_pos, all_src_obj_rot = PoseUtils.unmake_pose(src_object_poses)
-        obj_pos, obj_rot = PoseUtils.unmake_pose(object_pose)
-
-        # prepare for broadcasting
-        obj_pos = obj_pos.view(-1, 3)
-        obj_rot_T = obj_rot.transpose(0, 1).view(-1, 3, 3)
-
-        # pos dist is just L2 between positions
-        pos_dists = torch.sqrt(((all_src_obj_pos - obj_pos) ** 2).sum(dim=-1))
-
-        # get angle (in axis-angle representation of delta rotation matrix) using the following formula
-        # (see http://www.boris-belousov.net/2016/12/01/quat-dist/)
+        _, src_object_poses = stack_subtask_start_poses(src_subtask_datagen_infos, include_eef_pose=False)
+
+        return self.select_source_demos(
+            eef_pose.unsqueeze(0),
+            object_pose.unsqueeze(0),
+            None,
+            src_object_poses,
+            pos_weight=pos_weight,
+            rot_weight=rot_weight,
+            nn_k=nn_k,
+        )[0].item()
+
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        src_eef_poses,
+        src_object_poses,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Selects source demonstration indices for a batch of requests at once, using the current robot poses,
+        relevant object poses for the current subtask, and the poses at the start of the relevant subtask
+        segment in the source demonstrations.
 
-        # batched matrix mult, [N, 3, 3] x [1, 3, 3] -> [N, 3, 3]
-        delta_R = torch.matmul(all_src_obj_rot, obj_rot_T)
-        arc_cos_in = (torch.diagonal(delta_R, dim1=-2, dim2=-1).sum(dim=-1) - 1.0) / 2.0
-        arc_cos_in = torch.clamp(arc_cos_in, -1.0, 1.0)  # clip for numerical stability
-        rot_dists = torch.acos(arc_cos_in)
+        Args:
+            eef_poses (torch.Tensor): current eef poses of shape [E, 4, 4]
+            object_poses (torch.Tensor or None): current poses of the object in this subtask of shape [E, 4, 4]
+            src_eef_poses (torch.Tensor): eef poses at the start of the subtask segment in the source
+                demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): object poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): pick source demo index uniformly at randomly from the top @nn_k nearest neighbors
 
-        # weight distances with coefficients
-        dists_to_minimize = pos_weight * pos_dists + rot_weight * rot_dists
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [E]
+        """
 
-        # clip top-k parameter to max possible value
-        nn_k = min(nn_k, len(dists_to_minimize))
+        # distances between the current object poses and the object poses at the start of the source segments
+        dists_to_minimize = compute_pose_distances(object_poses, src_object_poses, pos_weight, rot_weight)
 
         # return one of the top-K nearest neighbors uniformly at random
-        rand_k = torch.randint(0, nn_k, (1,)).item()
-        top_k_neighbors_in_order = torch.argsort(dists_to_minimize)[:nn_k]
-        return top_k_neighbors_in_order[rand_k]
+        return sample_from_nearest_neighbors(dists_to_minimize, nn_k)
 
 
 class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
@@ -246,63 +402,68 @@ class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
         """
 
         # collect eef and object poses from start of subtask source segments into tensors of shape [N, 4, 4]
-        src_eef_poses = []
-        src_object_poses = []
-        for di in src_subtask_datagen_infos:
-            # use eef pose at start of subtask segment
-            src_eef_poses.append(di.eef_pose[0])
-            # use object pose at start of subtask segment
-            src_obj_pose = list(di.object_poses.values())
-            assert len(src_obj_pose) == 1
-            src_object_poses.append(src_obj_pose[0][0])
-        src_eef_poses = torch.stack(src_eef_poses)
-        src_object_poses = torch.stack(src_object_poses)
+        src_eef_poses, src_object_poses = stack_subtask_start_poses(src_subtask_datagen_infos)
+
+        return self.select_source_demos(
+            eef_pose.unsqueeze(0),
+            object_pose.unsqueeze(0),
+            src_eef_poses,
+            src_object_poses,
+            pos_weight=pos_weight,
+            rot_weight=rot_weight,
+            nn_k=nn_k,
+        )[0].item()
+
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        src_eef_poses,
+        src_object_poses,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Selects source demonstration indices for a batch of requests at once, using the current robot poses,
+        relevant object poses for the current subtask, and the poses at the start of the relevant subtask
+        segment in the source demonstrations.
+
+        Args:
+            eef_poses (torch.Tensor): current eef poses of shape [E, 4, 4]
+            object_poses (torch.Tensor or None): current poses of the object in this subtask of shape [E, 4, 4]
+            src_eef_poses (torch.Tensor): eef poses at the start of the subtask segment in the source
+                demonstrations of shape [N, 4, 4]
+            src_object_poses (torch.Tensor or None): object poses at the start of the subtask segment in the
+                source demonstrations of shape [N, 4, 4]
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): pick source demo index uniformly at randomly from the top @nn_k nearest neighbors
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [E]
+        """
 
         # Get source eef poses with respect to object frames.
         # note: frame A is world, frame B is object
-        src_object_poses_inv = PoseUtils.pose_inv(src_object_poses)
         src_eef_poses_in_obj = PoseUtils.pose_in_A_to_pose_in_B(
             pose_in_A=src_eef_poses,
-            pose_A_in_B=src_object_poses_inv,
+            pose_A_in_B=PoseUtils.pose_inv(src_object_poses),
         )
 
-        # Use this to find the first pose for the transformed subtask segment for each source demo.
-        # Note this is the same logic used in PoseUtils.transform_poses_from_frame_A_to_frame_B
-        transformed_eef_poses = PoseUtils.pose_in_A_to_pose_in_B(
-            pose_in_A=src_eef_poses_in_obj,
-            pose_A_in_B=object_pose,
+        # The transformed subtask segment of each source demo starts at the source eef pose in the object frame,
+        # expressed with respect to the current object pose. Rigid transformations preserve the position and rotation
+        # distances, so the distance between the current eef pose and the first pose of the transformed segment is
+        # the same as the distance between both poses expressed in the current object frame. This avoids
+        # transforming the source poses separately for each request.
+        eef_poses_in_obj = PoseUtils.pose_in_A_to_pose_in_B(
+            pose_in_A=eef_poses,
+            pose_A_in_B=PoseUtils.pose_inv(object_poses),
         )
 
-        # split into positions and rotations
-        all_transformed_eef_pos, all_transformed_eef_rot = PoseUtils.unmake_pose(transformed_eef_poses)
-        eef_pos, eef_rot = PoseUtils.unmake_pose(eef_pose)
-
         # now measure distance from each of these transformed eef poses to our current eef pose
         # and choose the source demo that minimizes this distance
-
-        # prepare for broadcasting
-        eef_pos = eef_pos.view(-1, 3)
-        eef_rot_T = eef_rot.transpose(0, 1).view(-1, 3, 3)
-
-        # pos dist is just L2 between positions
-        pos_dists = torch.sqrt(((all_transformed_eef_pos - eef_pos) ** 2).sum(dim=-1))
-
-        # get angle (in axis-angle representation of delta rotation matrix) using the following formula
-        # (see http://www.boris-belousov.net/2016/12/01/quat-dist/)
-
-        # batched matrix mult, [N, 3, 3] x [1, 3, 3] -> [N, 3, 3]
-        delta_R = torch.matmul(all_transformed_eef_rot, eef_rot_T)
-        arc_cos_in = (torch.diagonal(delta_R, dim1=-2, dim2=-1).sum(dim=-1) - 1.0) / 2.0
-        arc_cos_in = torch.clamp(arc_cos_in, -1.0, 1.0)  # clip for numerical stability
-        rot_dists = torch.acos(arc_cos_in)
-
-        # weight distances with coefficients
-        dists_to_minimize = pos_weight * pos_dists + rot_weight * rot_dists
-
-        # clip top-k parameter to max possible value
-        nn_k = min(nn_k, len(dists_to_minimize))
+        dists_to_minimize = compute_pose_distances(eef_poses_in_obj, src_eef_poses_in_obj, pos_weight, rot_weight)
 
         # return one of the top-K nearest neighbors uniformly at random
-        rand_k = torch.randint(0, nn_k, (1,)).item()
-        top_k_neighbors_in_order = torch.argsort(dists_to_minimize)[:nn_k]
-        return top_k_neighbors_in_order[rand_k]
+        return sample_from_nearest_neighbors(dists_to_minimize, nn_k)
@@ -10,17 +10,20 @@ simulation_app = AppLauncher(headless=True).app
 
 import numpy as np
 import torch
+from types import SimpleNamespace
 
 import pytest
 
 import isaaclab.utils.math as PoseUtils
 
 from isaaclab_mimic.datagen.datagen_info import DatagenInfo
+from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
 
 # Importing the necessary classes for the testing
 from isaaclab_mimic.datagen.selection_strategy import (
     NearestNeighborObjectStrategy,
     NearestNeighborRobotDistanceStrategy,
+    RandomStrategy,
 )
 
 # Number of iterations to run the batched tests
@@ -275,3 +278,134 @@ def test_select_source_demo_identity_orientations_robot_distance_strategy(neares
     assert np.all(
         np.array(selected_indices) > (len(transformed_eef_pose_cluster_1) - 1)
     ), "Some selected indices are not part of cluster 2."
+
+
+def _random_poses(num_poses: int, device: str) -> torch.Tensor:
+    """Generate random poses of shape (num_poses, 4, 4)."""
+    return torch.stack([
+        PoseUtils.generate_random_transformation_matrix(pos_boundary=1, rot_boundary=(2 * np.pi))
+        for _ in range(num_poses)
+    ]).to(device)
+
+
+def _reference_pose_distances(pose: torch.Tensor, src_poses: torch.Tensor) -> torch.Tensor:
+    """Compute the distances between a pose and a batch of source poses one pair at a time."""
+    dists = []
+    for src_pose in src_poses:
+        pos_dist = torch.linalg.norm(src_pose[:3, 3] - pose[:3, 3])
+        delta_rot = src_pose[:3, :3] @ pose[:3, :3].T
+        rot_dist = torch.acos(torch.clamp((torch.trace(delta_rot) - 1.0) / 2.0, -1.0, 1.0))
+        dists.append(pos_dist + rot_dist)
+    return torch.stack(dists)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_select_source_demos_object_strategy(device):
+    """Test that the batched selection picks the source demos with the closest object poses."""
+    torch.manual_seed(0)
+    strategy = NearestNeighborObjectStrategy()
+    src_object_poses = _random_poses(50, device)
+    src_eef_poses = _random_poses(50, device)
+    object_poses = _random_poses(16, device)
+    eef_poses = _random_poses(16, device)
+
+    # with a single neighbor, the selection is deterministic
+    selected_inds = strategy.select_source_demos(eef_poses, object_poses, src_eef_poses, src_object_poses, nn_k=1)
+    assert selected_inds.shape == (16,)
+    src_subtask_datagen_infos = [
+        DatagenInfo(eef_pose=eef_pose.unsqueeze(0), object_poses={"cube": object_pose.unsqueeze(0)})
+        for eef_pose, object_pose in zip(src_eef_poses, src_object_poses)
+    ]
+    for env_ind in range(16):
+        expected_ind = torch.argmin(_reference_pose_distances(object_poses[env_ind], src_object_poses)).item()
+        assert selected_inds[env_ind].item() == expected_ind
+        # the single request API matches the batched one
+        selected_ind = strategy.select_source_demo(
+            eef_poses[env_ind], object_poses[env_ind], src_subtask_datagen_infos, nn_k=1
+        )
+        assert selected_ind == expected_ind
+
+    # with more neighbors, the selected demos are among the closest ones
+    selected_inds = strategy.select_source_demos(eef_poses, object_poses, src_eef_poses, src_object_poses, nn_k=5)
+    for env_ind in range(16):
+        dists = _reference_pose_distances(object_poses[env_ind], src_object_poses)
+        assert selected_inds[env_ind].item() in torch.argsort(dists)[:5].tolist()
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_select_source_demos_robot_distance_strategy(device):
+    """Test that the batched selection picks the source demos whose transformed segments start closest to the eef."""
+    torch.manual_seed(0)
+    strategy = NearestNeighborRobotDistanceStrategy()
+    src_object_poses = _random_poses(50, device)
+    src_eef_poses = _random_poses(50, device)
+    object_poses = _random_poses(16, device)
+    eef_poses = _random_poses(16, device)
+
+    selected_inds = strategy.select_source_demos(eef_poses, object_poses, src_eef_poses, src_object_poses, nn_k=1)
+    src_subtask_datagen_infos = [
+        DatagenInfo(eef_pose=eef_pose.unsqueeze(0), object_poses={"cube": object_pose.unsqueeze(0)})
+        for eef_pose, object_pose in zip(src_eef_poses, src_object_poses)
+    ]
+    for env_ind in range(16):
+        # transform the start of each source segment to the current object pose in the world frame
+        transformed_eef_poses = object_poses[env_ind] @ PoseUtils.pose_inv(src_object_poses) @ src_eef_poses
+        dists = _reference_pose_distances(eef_poses[env_ind], transformed_eef_poses)
+        expected_ind = torch.argmin(dists).item()
+        assert selected_inds[env_ind].item() == expected_ind
+        # the single request API matches the batched one
+        selected_ind = strategy.select_source_demo(
+            eef_poses[env_ind], object_poses[env_ind], src_subtask_datagen_infos, nn_k=1
+        )
+        assert selected_ind == expected_ind
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_select_source_demos_random_strategy(device):
+    """Test the batched random selection."""
+    strategy = RandomStrategy()
+    assert strategy.supports_batched_selection()
+    selected_inds = strategy.select_source_demos(_random_poses(64, device), None, _random_poses(10, device), None)
+    assert selected_inds.shape == (64,)
+    assert torch.all((selected_inds >= 0) & (selected_inds < 10))
+
+    # a seeded batched selection matches the sequence of single requests on all devices
+    eef_poses, src_eef_poses = _random_poses(64, device), _random_poses(10, device)
+    torch.manual_seed(0)
+    selected_inds = strategy.select_source_demos(eef_poses, None, src_eef_poses, None)
+    torch.manual_seed(0)
+    src_subtask_datagen_infos = [None] * 10
+    expected_inds = [strategy.select_source_demo(None, None, src_subtask_datagen_infos) for _ in range(64)]
+    assert selected_inds.tolist() == expected_inds
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_datagen_info_pool_subtask_start_poses(device):
+    """Test gathering the poses at the start of the subtask segments from the datagen info pool."""
+    env_cfg = SimpleNamespace(subtask_configs={})
+    pool = DataGenInfoPool(env=None, env_cfg=env_cfg, device=device)
+    episode_lengths = [5, 12, 7]
+    for episode_length in episode_lengths:
+        pool.datagen_infos.append(
+            DatagenInfo(
+                eef_pose={"right": _random_poses(episode_length, device)},
+                object_poses={"cube": _random_poses(episode_length, device)},
+            )
+        )
+
+    start_inds = np.array([4, 0, 6])
+    eef_poses, object_poses = pool.get_subtask_start_poses("right", "cube", start_inds)
+    for i, (datagen_info, start_ind) in enumerate(zip(pool.datagen_infos, start_inds)):
+        torch.testing.assert_close(eef_poses[i], datagen_info.eef_pose["right"][start_ind])
+        torch.testing.assert_close(object_poses[i], datagen_info.object_poses["cube"][start_ind])
+    # no object poses are returned without a reference object
+    assert pool.get_subtask_start_poses("right", None, start_inds)[1] is None
+
+    # the stacked poses are extended when episodes are added to the pool
+    pool.datagen_infos.append(
+        DatagenInfo(eef_pose={"right": _random_poses(3, device)}, object_poses={"cube": _random_poses(3, device)})
+    )
+    eef_poses, object_poses = pool.get_subtask_start_poses("right", "cube", np.array([1, 2, 3, 2]))
+    assert eef_poses.shape == (4, 4, 4)
+    torch.testing.assert_close(eef_poses[3], pool.datagen_infos[3].eef_pose["right"][2])
+    torch.testing.assert_close(object_poses[2], pool.datagen_infos[2].object_poses["cube"][3])
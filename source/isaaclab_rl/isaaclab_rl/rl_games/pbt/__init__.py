@@ -5,3 +5,4 @@
 
 from .pbt import MultiObserver, PbtAlgoObserver
 from .pbt_cfg import PbtCfg
+from .pbt_store import PbtStore
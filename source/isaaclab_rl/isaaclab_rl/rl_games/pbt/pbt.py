@@ -10,15 +10,34 @@ import sys
 import torch
 import torch.distributed as dist
 
+from rl_games.algos_torch import torch_ext
 from rl_games.common.algo_observer import AlgoObserver
 
 from . import pbt_utils
 from .mutation import mutate
 from .pbt_cfg import PbtCfg
+from .pbt_store import PbtStore
 
 # i.e. value for target objective when it is not known
 _UNINITIALIZED_VALUE = float(-1e9)
 
+# prefix of the params in the rl_games agent config
+_AGENT_CONFIG_PREFIX = "agent.params.config."
+
+# params of the agent config that can be changed in-process, and the agent attributes that hold their values
+_IN_PROCESS_PARAMS = {
+    "learning_rate": "last_lr",
+    "kl_threshold": "kl_threshold",
+    "entropy_coef": "entropy_coef",
+    "critic_coef": "critic_coef",
+    "bounds_loss_coef": "bounds_loss_coef",
+    "grad_norm": "grad_norm",
+    "e_clip": "e_clip",
+    "gamma": "gamma",
+    "tau": "tau",
+    "mini_epochs": "mini_epochs_num",
+}
+
 
 class PbtAlgoObserver(AlgoObserver):
     """rl_games observer that implements Population-Based Training for a single policy process."""
@@ -48,6 +67,7 @@ class PbtAlgoObserver(AlgoObserver):
 
         self.device = params["params"]["config"]["device"]
         self.restart_flag = torch.tensor([0], device=self.device)
+        self.store = None
 
     def after_init(self, algo):
         """Capture training directories on rank 0 and create this policy's workspace folder.
@@ -63,6 +83,8 @@ class PbtAlgoObserver(AlgoObserver):
         self.ws_dir = os.path.join(self.root_dir, self.cfg.workspace)
         self.curr_policy_dir = os.path.join(self.ws_dir, f"{self.cfg.policy_idx:03d}")
         os.makedirs(self.curr_policy_dir, exist_ok=True)
+        if self.cfg.exchange_mode == "sqlite":
+            self.store = PbtStore(os.path.join(self.ws_dir, "pbt_index.sqlite"))
 
     def process_infos(self, infos, done_indices):
         """Extract the scalar objective from environment infos and store in `self.score`.
@@ -108,9 +130,12 @@ class PbtAlgoObserver(AlgoObserver):
         frame_left = (self.pbt_it + 1) * self.cfg.interval_steps - self.algo.frame
         print(f"Policy {self.cfg.policy_idx}, frames_left {frame_left}, PBT it {self.pbt_it}")
         try:
-            pbt_utils.save_pbt_checkpoint(self.curr_policy_dir, self.score, self.pbt_it, self.algo, self.pbt_params)
-            ckpts = pbt_utils.load_pbt_ckpts(self.ws_dir, self.cfg.policy_idx, self.cfg.num_policies, self.pbt_it)
-            pbt_utils.cleanup(ckpts, self.curr_policy_dir)
+            if self.store is None:
+                pbt_utils.save_pbt_checkpoint(self.curr_policy_dir, self.score, self.pbt_it, self.algo, self.pbt_params)
+                ckpts = pbt_utils.load_pbt_ckpts(self.ws_dir, self.cfg.policy_idx, self.cfg.num_policies, self.pbt_it)
+                pbt_utils.cleanup(ckpts, self.curr_policy_dir)
+            else:
+                ckpts = self._exchange_with_store()
         except Exception as exc:
             print(f"Policy {self.cfg.policy_idx}: Exception {exc} during sanity log!")
             return
@@ -153,12 +178,101 @@ class PbtAlgoObserver(AlgoObserver):
             cur_params = ckpts[replacement_policy_candidate]["params"]
             self.new_params = mutate(cur_params, self.cfg.mutation, self.cfg.mutation_rate, self.cfg.change_range)
             self.restart_from_checkpoint = os.path.abspath(ckpts[replacement_policy_candidate]["checkpoint"])
+            if self.store is not None and self._can_replace_in_process(self.new_params):
+                # note: if the checkpoint cannot be loaded, the policy is kept as is until the next PBT iteration
+                if self._replace_in_process(self.new_params, self.restart_from_checkpoint):
+                    self.printer.print_mutation_diff(cur_params, self.new_params)
+                return
             self.restart_flag[0] = 1
             if self.distributed_args.distributed:
                 dist.broadcast(self.restart_flag, src=0)
 
             self.printer.print_mutation_diff(cur_params, self.new_params)
 
+    def _exchange_with_store(self) -> dict[int, dict | None]:
+        """Save this policy's checkpoint, index it in the store and get the latest checkpoints of the population.
+
+        Returns:
+            A dictionary mapping each policy index to its latest checkpoint (or None), as in
+            :func:`pbt_utils.load_pbt_ckpts`.
+        """
+        checkpoint_file = os.path.abspath(os.path.join(self.curr_policy_dir, f"{self.pbt_it:06d}.pth"))
+        torch_ext.safe_save(self.algo.get_full_state_weights(), checkpoint_file)
+        self.store.add_checkpoint(
+            self.cfg.policy_idx,
+            self.pbt_it,
+            self.score,
+            self.algo.frame,
+            self.pbt_params,
+            checkpoint_file,
+            self.algo.experiment_name,
+        )
+        ckpts = self.store.get_latest_checkpoints(self.cfg.num_policies, self.pbt_it)
+        # remove the old checkpoints from the disk and from the index
+        threshold = pbt_utils.cleanup(ckpts, self.curr_policy_dir)
+        self.store.remove_checkpoints(self.cfg.policy_idx, threshold)
+        return ckpts
+
+    def _can_replace_in_process(self, new_params: dict) -> bool:
+        """Check whether the weights and params of the agent can be replaced without restarting the process.
+
+        Args:
+            new_params: The new (possibly mutated) params.
+
+        Returns:
+            Whether the replacement can be done in-process. If False, the process must be restarted instead.
+        """
+        # note: the other ranks of a distributed training are only updated through a restart
+        if self.distributed_args.distributed:
+            return False
+        unsupported = [
+            name
+            for name in new_params
+            if not name.startswith(_AGENT_CONFIG_PREFIX) or name[len(_AGENT_CONFIG_PREFIX) :] not in _IN_PROCESS_PARAMS
+        ]
+        if unsupported:
+            print(f"Policy {self.cfg.policy_idx}: Params {unsupported} cannot be changed in-process, restarting.")
+            return False
+        return True
+
+    def _replace_in_process(self, new_params: dict, checkpoint: str) -> bool:
+        """Load the weights of a checkpoint into the agent and apply new params without restarting the process.
+
+        The environment steps and epochs of the agent are kept, so that the PBT cadence of this policy is unchanged.
+        The params must be supported, as checked by :meth:`_can_replace_in_process`. They are only applied once
+        the weights are loaded.
+
+        Args:
+            new_params: The new (possibly mutated) params.
+            checkpoint: The path to the checkpoint to load.
+
+        Returns:
+            Whether the weights and params were replaced. False if the checkpoint could not be loaded, for
+            instance because it was removed by its policy in the meantime.
+        """
+        # note: the loading is retried for a while on errors, which is pointless if the checkpoint was removed
+        if not os.path.isfile(checkpoint):
+            print(f"Policy {self.cfg.policy_idx}: Checkpoint {checkpoint} not found, skipping replacement.")
+            return False
+        try:
+            weights = torch_ext.load_checkpoint(checkpoint)
+            self.algo.set_full_state_weights(weights, set_epoch=False)
+        except Exception as exc:
+            print(f"Policy {self.cfg.policy_idx}: Exception {exc} while loading {checkpoint}, skipping replacement.")
+            return False
+        for name, value in new_params.items():
+            key = name[len(_AGENT_CONFIG_PREFIX) :]
+            setattr(self.algo, _IN_PROCESS_PARAMS[key], value)
+            self.algo.config[key] = value
+            if key == "learning_rate":
+                for param_group in self.algo.optimizer.param_groups:
+                    param_group["lr"] = value
+            elif key == "kl_threshold" and hasattr(self.algo.scheduler, "kl_threshold"):
+                self.algo.scheduler.kl_threshold = value
+        self.pbt_params = new_params
+        print(f"Policy {self.cfg.policy_idx}: Replaced weights in-process with {checkpoint}")
+        return True
+
     def _restart_with_new_params(self, new_params, restart_from_checkpoint):
         """Re-exec the current process with a filtered/augmented CLI to apply new params.
 
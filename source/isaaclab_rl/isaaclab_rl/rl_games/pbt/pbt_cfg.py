@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Literal
+
 from isaaclab.utils import configclass
 
 
@@ -31,6 +33,16 @@ class PbtCfg:
     workspace: str = "pbt_workspace"
     """Subfolder under the training dir to isolate this PBT run."""
 
+    exchange_mode: Literal["filesystem", "sqlite"] = "filesystem"
+    """How the policies exchange their objectives, params and weights. Defaults to "filesystem".
+
+    * ``"filesystem"``: each policy writes a YAML file next to every checkpoint and reads the YAML files of all
+      the policies. An underperformer restarts its process to load the new weights and params.
+    * ``"sqlite"``: the policies index their checkpoints in a SQLite database in the workspace. An underperformer
+      loads the weights of the leader and applies the new params in-process, without restarting. It only restarts
+      if a param cannot be changed during training or if the training is distributed.
+    """
+
     objective: str = "Episode_Reward/success"
     """The key in info returned by env.step that pbt measures to determine leaders and underperformers,
     If reward is stationary, using the term that corresponds to task success is usually enough, when reward
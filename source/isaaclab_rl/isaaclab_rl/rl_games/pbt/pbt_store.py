@@ -0,0 +1,128 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import sqlite3
+from typing import Any
+
+
+class PbtStore:
+    """Index of the checkpoints of a PBT population stored in a SQLite database.
+
+    The policies of the population share a single database file in their common workspace. Every PBT
+    iteration, each policy adds a row with its objective, its (mutable) parameters and the path to its
+    checkpoint, and queries the latest row of every policy. This replaces listing the policy directories
+    and parsing one YAML file per checkpoint. The rows are indexed by policy and iteration, so a query only
+    reads one row per policy, independently of the number of stored iterations.
+
+    SQLite serializes the concurrent writes of the processes. The database must be on a local file
+    system, since file locking is not reliable on network file systems.
+    """
+
+    def __init__(self, path: str, timeout: float = 60.0):
+        """Open (or create) the index.
+
+        Args:
+            path: The path to the database file.
+            timeout: The time (in seconds) to wait for another process to release its lock on the database.
+                Defaults to 60.0.
+        """
+        self.path = path
+        # note: each statement is committed on its own (autocommit mode)
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        # the write-ahead log lets the policies read the index while another policy writes to it
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " policy_idx INTEGER NOT NULL,"
+            " iteration INTEGER NOT NULL,"
+            " true_objective REAL NOT NULL,"
+            " frame INTEGER NOT NULL,"
+            " params TEXT NOT NULL,"
+            " checkpoint TEXT NOT NULL,"
+            " experiment_name TEXT,"
+            " PRIMARY KEY (policy_idx, iteration))"
+        )
+
+    def add_checkpoint(
+        self,
+        policy_idx: int,
+        iteration: int,
+        true_objective: float,
+        frame: int,
+        params: dict[str, Any],
+        checkpoint: str,
+        experiment_name: str | None = None,
+    ):
+        """Add the checkpoint of a policy at a PBT iteration. An existing entry is replaced.
+
+        Args:
+            policy_idx: The index of the policy in the population.
+            iteration: The PBT iteration.
+            true_objective: The objective of the policy.
+            frame: The number of environment steps of the policy.
+            params: The mutable parameters of the policy. They must be serializable to JSON.
+            checkpoint: The path to the checkpoint file of the policy.
+            experiment_name: The name of the experiment of the policy. Defaults to None.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                policy_idx,
+                iteration,
+                float(true_objective),
+                int(frame),
+                json.dumps(params),
+                checkpoint,
+                experiment_name,
+            ),
+        )
+
+    def get_latest_checkpoints(self, num_policies: int, max_iteration: int) -> dict[int, dict | None]:
+        """Get the latest checkpoint of each policy up to an iteration.
+
+        Args:
+            num_policies: The number of policies in the population.
+            max_iteration: The latest PBT iteration to consider.
+
+        Returns:
+            A dictionary mapping the index of each policy to its latest checkpoint, or None if the policy has no
+            checkpoint yet. A checkpoint is a dictionary with the same entries as the arguments of
+            :meth:`add_checkpoint`.
+        """
+        rows = self._connection.execute(
+            "SELECT c.policy_idx, c.iteration, c.true_objective, c.frame, c.params, c.checkpoint, c.experiment_name"
+            " FROM checkpoints c JOIN ("
+            "  SELECT policy_idx, MAX(iteration) AS iteration FROM checkpoints"
+            "  WHERE policy_idx < ? AND iteration <= ? GROUP BY policy_idx"
+            " ) latest ON c.policy_idx = latest.policy_idx AND c.iteration = latest.iteration",
+            (num_policies, max_iteration),
+        ).fetchall()
+        checkpoints: dict[int, dict | None] = {policy_idx: None for policy_idx in range(num_policies)}
+        for policy_idx, iteration, true_objective, frame, params, checkpoint, experiment_name in rows:
+            checkpoints[policy_idx] = {
+                "iteration": iteration,
+                "true_objective": true_objective,
+                "frame": frame,
+                "params": json.loads(params),
+                "checkpoint": checkpoint,
+                "experiment_name": experiment_name,
+            }
+        return checkpoints
+
+    def remove_checkpoints(self, policy_idx: int, max_iteration: int):
+        """Remove the checkpoints of a policy up to an iteration (included).
+
+        Args:
+            policy_idx: The index of the policy in the population.
+            max_iteration: The latest PBT iteration to remove.
+        """
+        self._connection.execute(
+            "DELETE FROM checkpoints WHERE policy_idx = ? AND iteration <= ?", (policy_idx, max_iteration)
+        )
+
+    def close(self):
+        """Close the connection to the database."""
+        self._connection.close()
@@ -202,15 +202,16 @@ def load_pbt_ckpts(workspace_dir, cur_policy_id, num_policies, pbt_iteration) ->
     return checkpoints
 
 
-def cleanup(checkpoints: dict[int, dict], policy_dir, keep_back: int = 20, max_yaml: int = 50) -> None:
+def cleanup(checkpoints: dict[int, dict], policy_dir, keep_back: int = 20, max_checkpoints: int = 50) -> int:
     """
     Cleanup old checkpoints for the current policy directory (rank 0 only).
     - Delete files older than (oldest iteration - keep_back).
-    - Keep at most `max_yaml` latest YAML iterations.
+    - Keep at most `max_checkpoints` latest iterations (with a .yaml and/or a .pth file).
+    Returns the iteration up to which (included) all the checkpoints were deleted.
     """
+    oldest = min((ckpt["iteration"] if ckpt else 0) for ckpt in checkpoints.values())
+    threshold = max(0, oldest - keep_back)
     if int(os.environ.get("RANK", "0")) == 0:
-        oldest = min((ckpt["iteration"] if ckpt else 0) for ckpt in checkpoints.values())
-        threshold = max(0, oldest - keep_back)
         root = Path(policy_dir)
 
         # group files by numeric iteration (only *.yaml / *.pth)
@@ -225,12 +226,14 @@ def cleanup(checkpoints: dict[int, dict], policy_dir, keep_back: int = 20, max_y
                 p.unlink(missing_ok=True)
             groups.pop(it, None)
 
-        # 2) cap total YAML checkpoints: keep newest `max_yaml` iters
-        yaml_iters = sorted((i for i, ps in groups.items() if any(p.suffix == ".yaml" for p in ps)), reverse=True)
-        for it in yaml_iters[max_yaml:]:
-            for p in groups.get(it, []):
+        # 2) cap total checkpoints: keep newest `max_checkpoints` iters
+        # note: the checkpoints indexed in a PbtStore have no YAML file, so the .pth files are counted as well
+        for it in sorted(groups, reverse=True)[max_checkpoints:]:
+            for p in groups[it]:
                 p.unlink(missing_ok=True)
             groups.pop(it, None)
+            threshold = max(threshold, it)
+    return threshold
 
 
 class PbtTablePrinter:
@@ -43,6 +43,7 @@ from rl_games.common import env_configurations
 from rl_games.common.vecenv import IVecEnv
 
 from isaaclab.envs import DirectRLEnv, ManagerBasedRLEnv, VecEnvObs
+from isaaclab.utils.buffers import TransferBuffer
 
 """
 Vectorized environment wrapper.
@@ -91,6 +92,7 @@ class RlGamesVecEnvWrapper(IVecEnv):
         clip_actions: float,
         obs_groups: dict[str, list[str]] | None = None,
         concate_obs_group: bool = True,
+        packed_transfer: bool = False,
     ):
         """Initializes the wrapper instance.
 
@@ -102,6 +104,10 @@ class RlGamesVecEnvWrapper(IVecEnv):
             obs_groups: The remapping from isaaclab observation to rl-games, default to None for backward compatible.
             concate_obs_group: The boolean value indicates if input to rl-games network is dict or tensor. Default to
                 True for backward compatible.
+            packed_transfer: Move the observations, rewards, dones and extras of a step from the sim-device to the
+                rl-device with a single copy through a staging buffer instead of one copy per tensor (see
+                :class:`~isaaclab.utils.buffers.TransferBuffer`). The staging buffer is pinned when the rl-device is
+                the CPU. It is only used when the sim-device and rl-device differ. Defaults to False.
 
         Raises:
             ValueError: The environment is not inherited from :class:`ManagerBasedRLEnv` or :class:`DirectRLEnv`.
@@ -120,6 +126,10 @@ class RlGamesVecEnvWrapper(IVecEnv):
         self._clip_obs = clip_obs
         self._clip_actions = clip_actions
         self._sim_device = env.unwrapped.device
+        # staging buffer for moving the step outputs to the rl-device
+        self._transfer_buffer = None
+        if packed_transfer and torch.device(self._sim_device) != torch.device(self._rl_device):
+            self._transfer_buffer = TransferBuffer(self._rl_device, num_buffers=2)
 
         # resolve the observation group
         self._concate_obs_groups = concate_obs_group
@@ -281,16 +291,26 @@ class RlGamesVecEnvWrapper(IVecEnv):
         # this is only needed for infinite horizon tasks
         # note: only useful when `value_bootstrap` is True in the agent configuration
         if not self.unwrapped.cfg.is_finite_horizon:
-            extras["time_outs"] = truncated.to(device=self._rl_device)
+            # note: with the transfer buffer, the time outs are moved together with the other buffers
+            extras["time_outs"] = truncated if self._transfer_buffer is not None else truncated.to(self._rl_device)
         # process observations and states
         obs_and_states = self._process_obs(obs_dict)
         # move buffers to rl-device
-        # note: we perform clone to prevent issues when rl-device and sim-device are the same.
-        rew = rew.to(device=self._rl_device)
-        dones = (terminated | truncated).to(device=self._rl_device)
-        extras = {
-            k: v.to(device=self._rl_device, non_blocking=True) if hasattr(v, "to") else v for k, v in extras.items()
-        }
+        if self._transfer_buffer is not None:
+            # pack all the tensors of the step into a single copy
+            tensor_extras = {k: v for k, v in extras.items() if isinstance(v, torch.Tensor)}
+            step_data = self._transfer_buffer.transfer(
+                {"obs": obs_and_states, "rew": rew, "dones": terminated | truncated, "extras": tensor_extras}
+            )
+            obs_and_states, rew, dones = step_data["obs"], step_data["rew"], step_data["dones"]
+            extras = {**extras, **step_data["extras"]}
+        else:
+            # note: we perform clone to prevent issues when rl-device and sim-device are the same.
+            rew = rew.to(device=self._rl_device)
+            dones = (terminated | truncated).to(device=self._rl_device)
+            extras = {
+                k: v.to(device=self._rl_device, non_blocking=True) if hasattr(v, "to") else v for k, v in extras.items()
+            }
         # remap extras from "log" to "episode"
         if "log" in extras:
             extras["episode"] = extras.pop("log")
@@ -5,38 +5,85 @@
 
 import copy
 import os
+import tempfile
 import torch
+from typing import Literal
 
 
-def export_policy_as_jit(policy: object, normalizer: object | None, path: str, filename="policy.pt"):
+def export_policy_as_jit(
+    policy: object,
+    normalizer: object | None,
+    path: str,
+    filename="policy.pt",
+    fold_normalizer: bool = False,
+    precision: Literal["fp32", "int8"] = "fp32",
+):
     """Export policy into a Torch JIT file.
 
+    The exported module accepts observations with any batch size, except for recurrent policies whose
+    memory is stored in the module for a single environment.
+
     Args:
         policy: The policy torch module.
         normalizer: The empirical normalizer module. If None, Identity is used.
         path: The path to the saving directory.
         filename: The name of exported JIT file. Defaults to "policy.pt".
+        fold_normalizer: Whether to fold the normalizer into the first layer of the policy. Defaults to False.
+        precision: The precision of the exported weights. Defaults to "fp32". For "int8", the linear and
+            recurrent layers are dynamically quantized, i.e. their weights are stored as 8-bit integers and
+            their activations are quantized at run-time.
+
+    Raises:
+        ValueError: If the precision is not supported.
     """
+    if precision not in ("fp32", "int8"):
+        raise ValueError(f"Unsupported precision for the JIT export: '{precision}'. Expected 'fp32' or 'int8'.")
     policy_exporter = _TorchPolicyExporter(policy, normalizer)
-    policy_exporter.export(path, filename)
+    if fold_normalizer:
+        _fold_normalizer(policy_exporter)
+    policy_exporter.export(path, filename, precision)
 
 
 def export_policy_as_onnx(
-    policy: object, path: str, normalizer: object | None = None, filename="policy.onnx", verbose=False
+    policy: object,
+    path: str,
+    normalizer: object | None = None,
+    filename="policy.onnx",
+    verbose=False,
+    opset_version: int = 11,
+    dynamic_batch: bool = False,
+    fold_normalizer: bool = False,
+    precision: Literal["fp32", "fp16", "int8"] = "fp32",
 ):
     """Export policy into a Torch ONNX file.
 
     Args:
         policy: The policy torch module.
-        normalizer: The empirical normalizer module. If None, Identity is used.
         path: The path to the saving directory.
+        normalizer: The empirical normalizer module. If None, Identity is used.
         filename: The name of exported ONNX file. Defaults to "policy.onnx".
         verbose: Whether to print the model summary. Defaults to False.
+        opset_version: The ONNX operator set version. Defaults to 11.
+        dynamic_batch: Whether the batch dimension of the inputs and outputs is dynamic. Defaults to False,
+            in which case the model only accepts a single observation.
+        fold_normalizer: Whether to fold the normalizer into the first layer of the policy. Defaults to False.
+        precision: The precision of the exported model. Defaults to "fp32". For "fp16", the weights and
+            activations are stored in half precision while the inputs and outputs remain in single precision.
+            For "int8", the weights are dynamically quantized with :mod:`onnxruntime`.
+
+    Raises:
+        ValueError: If the precision is not supported.
     """
+    if precision not in ("fp32", "fp16", "int8"):
+        raise ValueError(
+            f"Unsupported precision for the ONNX export: '{precision}'. Expected 'fp32', 'fp16' or 'int8'."
+        )
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
     policy_exporter = _OnnxPolicyExporter(policy, normalizer, verbose)
-    policy_exporter.export(path, filename)
+    if fold_normalizer:
+        _fold_normalizer(policy_exporter)
+    policy_exporter.export(path, filename, opset_version, dynamic_batch, precision)
 
 
 """
@@ -108,10 +155,14 @@ class _TorchPolicyExporter(torch.nn.Module):
         if hasattr(self, "cell_state"):
             self.cell_state[:] = 0.0
 
-    def export(self, path, filename):
+    def export(self, path, filename, precision="fp32"):
         os.makedirs(path, exist_ok=True)
         path = os.path.join(path, filename)
         self.to("cpu")
+        if precision == "int8":
+            torch.ao.quantization.quantize_dynamic(
+                self, {torch.nn.Linear, torch.nn.LSTM, torch.nn.GRU}, dtype=torch.qint8, inplace=True
+            )
         traced_script_module = torch.jit.script(self)
         traced_script_module.save(path)
 
@@ -165,7 +216,7 @@ class _OnnxPolicyExporter(torch.nn.Module):
     def forward(self, x):
         return self.actor(self.normalizer(x))
 
-    def export(self, path, filename):
+    def export(self, path, filename, opset_version=11, dynamic_batch=False, precision="fp32"):
         self.to("cpu")
         self.eval()
         if self.is_recurrent:
@@ -174,41 +225,116 @@ class _OnnxPolicyExporter(torch.nn.Module):
 
             if self.rnn_type == "lstm":
                 c_in = torch.zeros(self.rnn.num_layers, 1, self.rnn.hidden_size)
-                torch.onnx.export(
-                    self,
-                    (obs, h_in, c_in),
-                    os.path.join(path, filename),
-                    export_params=True,
-                    opset_version=11,
-                    verbose=self.verbose,
-                    input_names=["obs", "h_in", "c_in"],
-                    output_names=["actions", "h_out", "c_out"],
-                    dynamic_axes={},
-                )
+                inputs = (obs, h_in, c_in)
+                input_names = ["obs", "h_in", "c_in"]
+                output_names = ["actions", "h_out", "c_out"]
             elif self.rnn_type == "gru":
-                torch.onnx.export(
-                    self,
-                    (obs, h_in),
-                    os.path.join(path, filename),
-                    export_params=True,
-                    opset_version=11,
-                    verbose=self.verbose,
-                    input_names=["obs", "h_in"],
-                    output_names=["actions", "h_out"],
-                    dynamic_axes={},
-                )
+                inputs = (obs, h_in)
+                input_names = ["obs", "h_in"]
+                output_names = ["actions", "h_out"]
             else:
                 raise NotImplementedError(f"Unsupported RNN type: {self.rnn_type}")
         else:
-            obs = torch.zeros(1, self.actor[0].in_features)
-            torch.onnx.export(
-                self,
-                obs,
-                os.path.join(path, filename),
-                export_params=True,
-                opset_version=11,
-                verbose=self.verbose,
-                input_names=["obs"],
-                output_names=["actions"],
-                dynamic_axes={},
-            )
+            inputs = (torch.zeros(1, self.actor[0].in_features),)
+            input_names = ["obs"]
+            output_names = ["actions"]
+        # the batch dimension is the first one for the observations and actions, and the second one
+        # for the hidden states of the recurrent network
+        dynamic_axes = {}
+        if dynamic_batch:
+            for name in input_names + output_names:
+                dynamic_axes[name] = {0 if name in ("obs", "actions") else 1: "batch"}
+        # cast the inputs and outputs of the half precision model
+        model = _HalfPrecisionWrapper(self) if precision == "fp16" else self
+        filepath = os.path.join(path, filename)
+        # the int8 model is quantized from an intermediate single precision model
+        if precision == "int8":
+            export_path = tempfile.NamedTemporaryFile(dir=path, suffix=".onnx", delete=False).name
+        else:
+            export_path = filepath
+        # note: the TorchScript-based exporter is used since it supports the older opsets
+        torch.onnx.export(
+            model,
+            inputs,
+            export_path,
+            export_params=True,
+            opset_version=opset_version,
+            verbose=self.verbose,
+            input_names=input_names,
+            output_names=output_names,
+            dynamic_axes=dynamic_axes,
+            dynamo=False,
+        )
+        if precision == "int8":
+            try:
+                from onnxruntime.quantization import QuantType, quantize_dynamic
+            except ImportError as e:
+                os.remove(export_path)
+                raise ImportError(
+                    "The int8 quantization of ONNX models requires 'onnxruntime'. Please install it with"
+                    " 'pip install onnxruntime'."
+                ) from e
+            try:
+                quantize_dynamic(export_path, filepath, weight_type=QuantType.QInt8)
+            finally:
+                os.remove(export_path)
+
+
+class _HalfPrecisionWrapper(torch.nn.Module):
+    """Wrapper that runs a module in half precision with single precision inputs and outputs."""
+
+    def __init__(self, module: torch.nn.Module):
+        super().__init__()
+        self.module = module.half()
+
+    def forward(self, *inputs):
+        outputs = self.module(*(x.half() for x in inputs))
+        if isinstance(outputs, tuple):
+            return tuple(y.float() for y in outputs)
+        return outputs.float()
+
+
+"""
+Helper Functions - Private.
+"""
+
+
+def _fold_normalizer(exporter: torch.nn.Module):
+    r"""Fold the empirical normalizer of the exporter into the first layer of the policy.
+
+    The normalizer computes :math:`\hat{x} = (x - \mu) / (\sigma + \epsilon)` and the first layer of the policy (the
+    first linear layer of the actor, or the input-to-hidden weights of the recurrent network) computes
+    :math:`W \hat{x} + b`. Both are affine, so they are replaced with a single layer of weights
+    :math:`W' = W \operatorname{diag}(1 / (\sigma + \epsilon))` and bias :math:`b' = b - W' \mu`. This removes the
+    normalization from the exported graph.
+
+    Args:
+        exporter: The policy exporter. Its normalizer is replaced with Identity.
+
+    Raises:
+        ValueError: If the normalizer is not an empirical normalizer or the first layer of the policy is not supported.
+    """
+    normalizer = exporter.normalizer
+    if isinstance(normalizer, torch.nn.Identity):
+        return
+    if not all(hasattr(normalizer, name) for name in ("_mean", "_std", "eps")):
+        raise ValueError(f"Cannot fold the normalizer of type '{type(normalizer).__name__}' into the policy.")
+    # obtain the weights of the first layer
+    if exporter.is_recurrent:
+        if not exporter.rnn.bias:
+            raise ValueError("Cannot fold the normalizer into a recurrent network without biases.")
+        weight, bias = exporter.rnn.weight_ih_l0, exporter.rnn.bias_ih_l0
+    else:
+        layer = exporter.actor[0]
+        if not isinstance(layer, torch.nn.Linear):
+            raise ValueError(f"Cannot fold the normalizer into the first layer of type '{type(layer).__name__}'.")
+        if layer.bias is None:
+            layer.bias = torch.nn.Parameter(torch.zeros(layer.out_features, device=layer.weight.device))
+        weight, bias = layer.weight, layer.bias
+    # fold the normalization into the weights
+    with torch.no_grad():
+        mean = normalizer._mean.reshape(-1).to(weight.device)
+        scale = 1.0 / (normalizer._std.reshape(-1).to(weight.device) + normalizer.eps)
+        weight.mul_(scale)
+        bias.sub_(weight @ mean)
+    exporter.normalizer = torch.nn.Identity()
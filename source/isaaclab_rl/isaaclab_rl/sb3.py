@@ -23,6 +23,7 @@ import numpy as np
 import torch
 import torch.nn as nn  # noqa: F401
 import warnings
+from collections.abc import Sequence
 from typing import Any
 
 from stable_baselines3.common.preprocessing import is_image_space, is_image_space_channels_first
@@ -30,6 +31,7 @@ from stable_baselines3.common.utils import constant_fn
 from stable_baselines3.common.vec_env.base_vec_env import VecEnv, VecEnvObs, VecEnvStepReturn
 
 from isaaclab.envs import DirectRLEnv, ManagerBasedRLEnv
+from isaaclab.utils.buffers import TransferBuffer
 
 # remove SB3 warnings because PPO with bigger net actually benefits from GPU
 warnings.filterwarnings("ignore", message="You are trying to run PPO on the GPU")
@@ -85,6 +87,168 @@ def process_sb3_cfg(cfg: dict, num_envs: int) -> dict:
     return update_dict(cfg, depth=0)
 
 
+"""
+Vectorized environment infos.
+"""
+
+
+class Sb3VecEnvInfos(Sequence):
+    """Lazily constructed list of info dictionaries for the sub-environments.
+
+    Stable-Baselines3 expects a list with an info dictionary for each sub-environment. Building these
+    dictionaries one environment at a time is expensive for thousands of environments, even though most
+    of them are empty. This class gathers the information of all sub-environments into arrays with
+    vectorized operations and only creates the dictionary of a sub-environment when it is indexed.
+    Iterating over the infos creates all the dictionaries at once. The created dictionaries are kept,
+    so that modifications made to them (for instance, by :class:`~stable_baselines3.common.vec_env.VecNormalize`)
+    are not lost.
+
+    The dictionaries have the same content as the ones created by :class:`Sb3VecEnvWrapper` without lazy
+    infos, except that the tensors in the extras are converted to NumPy arrays once for all sub-environments.
+
+    .. caution::
+
+        The terminal observations are views into a buffer that is reused by the wrapper at every step.
+        They must be copied if they are needed after the next call to :meth:`Sb3VecEnvWrapper.step`.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        reset_ids: np.ndarray,
+        episode_rewards: np.ndarray,
+        episode_lengths: np.ndarray,
+        time_outs: np.ndarray,
+        terminal_obs: np.ndarray | dict[str, np.ndarray],
+        extras: dict | None = None,
+    ):
+        """Initialize the infos.
+
+        Args:
+            num_envs: The number of sub-environments.
+            reset_ids: The indices of the sub-environments that were reset. Shape is (num_resets,).
+            episode_rewards: The un-discounted returns of the finished episodes. Shape is (num_resets,).
+            episode_lengths: The lengths of the finished episodes. Shape is (num_resets,).
+            time_outs: Whether the episode of each sub-environment was truncated and not terminated.
+                Shape is (num_envs,).
+            terminal_obs: The terminal observations of the reset sub-environments. Shape is (num_resets, ...).
+            extras: The extra information from the environment. Defaults to None, in which case only the
+                episode information, truncation and terminal observations of the reset sub-environments
+                are included (same as the fast variant of the wrapper).
+        """
+        self._num_envs = num_envs
+        self._reset_ids = reset_ids
+        self._episode_rewards = episode_rewards
+        self._episode_lengths = episode_lengths
+        self._time_outs = time_outs
+        self._terminal_obs = terminal_obs
+        # convert the per-environment extras to numpy once for all sub-environments
+        self._extras = None
+        if extras is not None:
+            self._extras = {
+                key: value.detach().cpu().numpy() if isinstance(value, torch.Tensor) else value
+                for key, value in extras.items()
+            }
+        # map from the index of a sub-environment to its index in the reset sub-environments
+        self._reset_index = np.full(num_envs, -1, dtype=np.int64)
+        self._reset_index[reset_ids] = np.arange(len(reset_ids))
+        # dictionaries created for indexed sub-environments and for all sub-environments
+        self._infos: dict[int, dict[str, Any]] = {}
+        self._all_infos: list[dict[str, Any]] | None = None
+
+    def __len__(self) -> int:
+        """The number of sub-environments."""
+        return self._num_envs
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        """Returns the info dictionary of a sub-environment, or a list of them for a slice."""
+        if self._all_infos is not None:
+            return self._all_infos[index]
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        # resolve negative indices
+        index = int(index)
+        if index < 0:
+            index += self._num_envs
+        if index < 0 or index >= self._num_envs:
+            raise IndexError(f"Info index {index} is out of range for {self._num_envs} environments.")
+        # create the dictionary if it was not indexed before
+        info = self._infos.get(index)
+        if info is None:
+            info = self._create_info(index)
+            self._infos[index] = info
+        return info
+
+    def __iter__(self):
+        """Iterates over the info dictionaries of all sub-environments."""
+        return iter(self.to_list())
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Returns the info dictionaries of all sub-environments as a list.
+
+        The dictionaries are only created once. Subsequent calls return the same list.
+        """
+        if self._all_infos is None:
+            if self._extras is None:
+                # faster version: only the reset sub-environments have information
+                infos = [{} for _ in range(self._num_envs)]
+                for idx in self._reset_ids:
+                    infos[idx] = self._create_info(idx)
+            else:
+                infos = [self._create_info(idx) for idx in range(self._num_envs)]
+            # keep the dictionaries that were already indexed
+            for idx, info in self._infos.items():
+                infos[idx] = info
+            self._all_infos = infos
+        return self._all_infos
+
+    """
+    Helper functions.
+    """
+
+    def _create_info(self, idx: int) -> dict[str, Any]:
+        """Creates the info dictionary of a sub-environment."""
+        reset_idx = self._reset_index[idx]
+        # faster version: only information of reset sub-environments is added
+        if self._extras is None:
+            if reset_idx < 0:
+                return {}
+            return {
+                "episode": {"r": self._episode_rewards[reset_idx], "l": self._episode_lengths[reset_idx]},
+                "TimeLimit.truncated": self._time_outs[idx],
+                "terminal_observation": self._get_terminal_obs(reset_idx),
+            }
+
+        info: dict[str, Any] = dict.fromkeys(self._extras.keys())
+        # fill-in episode monitoring info
+        if reset_idx >= 0:
+            info["episode"] = {
+                "r": float(self._episode_rewards[reset_idx]),
+                "l": float(self._episode_lengths[reset_idx]),
+            }
+        else:
+            info["episode"] = None
+        # fill-in bootstrap information
+        info["TimeLimit.truncated"] = self._time_outs[idx]
+        # fill-in information from extras
+        for key, value in self._extras.items():
+            if key == "log":
+                # only log this data for episodes that are terminated
+                if info["episode"] is not None:
+                    info["episode"].update(value)
+            else:
+                info[key] = value[idx]
+        # add information about terminal observation separately
+        info["terminal_observation"] = self._get_terminal_obs(reset_idx) if reset_idx >= 0 else None
+        return info
+
+    def _get_terminal_obs(self, reset_idx: int) -> np.ndarray | dict[str, np.ndarray]:
+        """Returns the terminal observation of a reset sub-environment."""
+        if isinstance(self._terminal_obs, dict):
+            return {key: value[reset_idx] for key, value in self._terminal_obs.items()}
+        return self._terminal_obs[reset_idx]
+
+
 """
 Vectorized environment wrapper.
 """
@@ -135,13 +299,26 @@ class Sb3VecEnvWrapper(VecEnv):
 
     """
 
-    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv, fast_variant: bool = True):
+    def __init__(
+        self,
+        env: ManagerBasedRLEnv | DirectRLEnv,
+        fast_variant: bool = True,
+        lazy_infos: bool = False,
+        packed_transfer: bool = False,
+    ):
         """Initialize the wrapper.
 
         Args:
             env: The environment to wrap around.
             fast_variant: Use fast variant for processing info
                 (Only episodic reward, lengths and truncation info are included)
+            lazy_infos: Return the infos as a :class:`Sb3VecEnvInfos` instead of a list of dictionaries.
+                The dictionary of a sub-environment is then only created when it is indexed, and the terminal
+                observations are gathered into a preallocated buffer. Defaults to False.
+            packed_transfer: Copy the observations, rewards and dones of a step to the host with a single
+                non-blocking copy through a pinned staging buffer (see :class:`~isaaclab.utils.buffers.TransferBuffer`)
+                instead of one synchronous copy per tensor. The returned arrays are then views into a double
+                buffer, i.e. they are overwritten two steps later. Defaults to False.
         Raises:
             ValueError: When the environment is not an instance of :class:`ManagerBasedRLEnv` or :class:`DirectRLEnv`.
         """
@@ -154,6 +331,8 @@ class Sb3VecEnvWrapper(VecEnv):
         # initialize the wrapper
         self.env = env
         self.fast_variant = fast_variant
+        self.lazy_infos = lazy_infos
+        self._transfer_buffer = TransferBuffer("cpu", num_buffers=2) if packed_transfer else None
         # collect common information
         self.num_envs = self.unwrapped.num_envs
         self.sim_device = self.unwrapped.device
@@ -163,6 +342,8 @@ class Sb3VecEnvWrapper(VecEnv):
         # add buffer for logging episodic information
         self._ep_rew_buf = np.zeros(self.num_envs)
         self._ep_len_buf = np.zeros(self.num_envs)
+        # buffer for gathering the terminal observations (created on first use)
+        self._terminal_obs_buf: np.ndarray | dict[str, np.ndarray] | None = None
 
     def __str__(self):
         """Returns the wrapper name and the :attr:`env` representation string."""
@@ -234,11 +415,27 @@ class Sb3VecEnvWrapper(VecEnv):
 
         # convert data types to numpy depending on backend
         # note: ManagerBasedRLEnv uses torch backend (by default).
-        obs = self._process_obs(obs_dict)
-        rewards = rew.detach().cpu().numpy()
-        terminated = terminated.detach().cpu().numpy()
-        truncated = truncated.detach().cpu().numpy()
-        dones = dones.detach().cpu().numpy()
+        if self._transfer_buffer is not None:
+            # move all the step outputs to the host with a single copy
+            step_data = self._transfer_buffer.transfer({
+                "obs": self._process_obs_tensors(obs_dict),
+                "rewards": rew,
+                "terminated": terminated,
+                "truncated": truncated,
+                "dones": dones,
+            })
+            obs = step_data["obs"]
+            obs = {key: value.numpy() for key, value in obs.items()} if isinstance(obs, dict) else obs.numpy()
+            rewards = step_data["rewards"].numpy()
+            terminated = step_data["terminated"].numpy()
+            truncated = step_data["truncated"].numpy()
+            dones = step_data["dones"].numpy()
+        else:
+            obs = self._process_obs(obs_dict)
+            rewards = rew.detach().cpu().numpy()
+            terminated = terminated.detach().cpu().numpy()
+            truncated = truncated.detach().cpu().numpy()
+            dones = dones.detach().cpu().numpy()
 
         reset_ids = dones.nonzero()[0]
 
@@ -350,24 +547,43 @@ class Sb3VecEnvWrapper(VecEnv):
 
     def _process_obs(self, obs_dict: torch.Tensor | dict[str, torch.Tensor]) -> np.ndarray | dict[str, np.ndarray]:
         """Convert observations into NumPy data type."""
+        obs = self._process_obs_tensors(obs_dict)
+        if isinstance(obs, dict):
+            return {key: value.detach().cpu().numpy() for key, value in obs.items()}
+        return obs.detach().cpu().numpy()
+
+    def _process_obs_tensors(
+        self, obs_dict: torch.Tensor | dict[str, torch.Tensor]
+    ) -> torch.Tensor | dict[str, torch.Tensor]:
+        """Select the policy observations and apply the observation processors."""
         # Sb3 doesn't support asymmetric observation spaces, so we only use "policy"
         obs = obs_dict["policy"]
         # note: ManagerBasedRLEnv uses torch backend (by default).
         if isinstance(obs, dict):
-            for key, value in obs.items():
-                if key in self.observation_processors:
-                    obs[key] = self.observation_processors[key](value)
-                obs[key] = obs[key].detach().cpu().numpy()
-        elif isinstance(obs, torch.Tensor):
-            obs = obs.detach().cpu().numpy()
-        else:
+            obs = {
+                key: self.observation_processors[key](value) if key in self.observation_processors else value
+                for key, value in obs.items()
+            }
+        elif not isinstance(obs, torch.Tensor):
             raise NotImplementedError(f"Unsupported data type: {type(obs)}")
         return obs
 
     def _process_extras(
         self, obs: np.ndarray, terminated: np.ndarray, truncated: np.ndarray, extras: dict, reset_ids: np.ndarray
-    ) -> list[dict[str, Any]]:
+    ) -> list[dict[str, Any]] | Sb3VecEnvInfos:
         """Convert miscellaneous information into dictionary for each sub-environment."""
+        # lazy version: gather information of reset envs with vectorized operations and defer the dictionaries
+        if self.lazy_infos:
+            return Sb3VecEnvInfos(
+                num_envs=self.num_envs,
+                reset_ids=reset_ids,
+                episode_rewards=self._ep_rew_buf[reset_ids],
+                episode_lengths=self._ep_len_buf[reset_ids],
+                time_outs=truncated & ~terminated,
+                terminal_obs=self._gather_terminal_obs(obs, reset_ids),
+                extras=None if self.fast_variant else extras,
+            )
+
         # faster version: only process env that terminated and add bootstrapping info
         if self.fast_variant:
             infos = [{} for _ in range(self.num_envs)]
@@ -431,3 +647,21 @@ class Sb3VecEnvWrapper(VecEnv):
                 infos[idx]["terminal_observation"] = None
         # return list of dictionaries
         return infos
+
+    def _gather_terminal_obs(
+        self, obs: np.ndarray | dict[str, np.ndarray], reset_ids: np.ndarray
+    ) -> np.ndarray | dict[str, np.ndarray]:
+        """Gather the observations of the reset environments into the preallocated terminal observation buffer."""
+        if isinstance(obs, dict):
+            if self._terminal_obs_buf is None:
+                self._terminal_obs_buf = {key: np.empty_like(value) for key, value in obs.items()}
+            terminal_obs = {}
+            for key, value in obs.items():
+                terminal_obs[key] = self._terminal_obs_buf[key][: len(reset_ids)]
+                np.take(value, reset_ids, axis=0, out=terminal_obs[key], mode="clip")
+        else:
+            if self._terminal_obs_buf is None:
+                self._terminal_obs_buf = np.empty_like(obs)
+            terminal_obs = self._terminal_obs_buf[: len(reset_ids)]
+            np.take(obs, reset_ids, axis=0, out=terminal_obs, mode="clip")
+        return terminal_obs
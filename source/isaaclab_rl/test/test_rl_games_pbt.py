@@ -0,0 +1,228 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import os
+import torch
+from types import SimpleNamespace
+
+import pytest
+from rl_games.algos_torch import torch_ext
+
+from isaaclab_rl.rl_games.pbt import PbtAlgoObserver, PbtStore
+
+INTERVAL_STEPS = 100
+
+
+class _FakeWriter:
+    """Tensorboard writer that discards the scalars."""
+
+    def add_scalar(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+
+class _FakeAlgo:
+    """Minimal rl_games agent with the attributes and methods used by the PBT observer."""
+
+    def __init__(self, train_dir: str, learning_rate: float, entropy_coef: float):
+        self.train_dir = train_dir
+        self.experiment_name = "test"
+        self.frame = 0
+        self.writer = _FakeWriter()
+        self.model = torch.nn.Linear(4, 2)
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=learning_rate)
+        self.scheduler = SimpleNamespace()
+        self.config = {"learning_rate": learning_rate, "entropy_coef": entropy_coef}
+        self.last_lr = learning_rate
+        self.entropy_coef = entropy_coef
+
+    def get_full_state_weights(self) -> dict:
+        return {"model": self.model.state_dict(), "optimizer": self.optimizer.state_dict(), "frame": self.frame}
+
+    def set_full_state_weights(self, weights: dict, set_epoch: bool = True):
+        self.model.load_state_dict(weights["model"])
+        self.optimizer.load_state_dict(weights["optimizer"])
+
+
+def _create_observer(train_dir: str, policy_idx: int, exchange_mode: str) -> PbtAlgoObserver:
+    """Create the observer of a policy in a population of two policies."""
+    params = {
+        "pbt": {
+            "enabled": True,
+            "policy_idx": policy_idx,
+            "num_policies": 2,
+            "directory": ".",
+            "exchange_mode": exchange_mode,
+            "objective": "score",
+            "interval_steps": INTERVAL_STEPS,
+            "mutation_rate": 1.0,
+            "mutation": {
+                "agent.params.config.learning_rate": "mutate_float",
+                "agent.params.config.entropy_coef": "mutate_float",
+            },
+        },
+        "params": {"config": {"device": "cpu", "learning_rate": 1e-3 * (policy_idx + 1), "entropy_coef": 0.01}},
+    }
+    args_cli = SimpleNamespace(
+        distributed=False,
+        task="Isaac-Test-v0",
+        seed=None,
+        headless=True,
+        num_envs=16,
+        enable_cameras=False,
+        video=False,
+        video_length=200,
+        video_interval=2000,
+        track=False,
+        wandb_project_name=None,
+        wandb_name=None,
+        wandb_entity=None,
+    )
+    observer = PbtAlgoObserver(params, args_cli)
+    agent_cfg = params["params"]["config"]
+    observer.after_init(_FakeAlgo(train_dir, agent_cfg["learning_rate"], agent_cfg["entropy_coef"]))
+    # initialize the PBT iteration
+    observer.after_steps()
+    return observer
+
+
+def _run_pbt_iteration(observers: list[PbtAlgoObserver], scores: list[float]):
+    """Step the policies to the next PBT iteration in order."""
+    for observer, score in zip(observers, scores):
+        observer.algo.frame += INTERVAL_STEPS
+        observer.process_infos({"episode": {"score": score}}, None)
+        observer.after_steps()
+
+
+def test_store(tmp_path):
+    """Test that the store returns the latest checkpoint of each policy."""
+    store = PbtStore(os.path.join(tmp_path, "pbt_index.sqlite"))
+    for iteration in range(3):
+        store.add_checkpoint(
+            0, iteration, float(iteration), 10 * iteration, {"lr": 0.1 * iteration}, f"{iteration}.pth"
+        )
+    store.add_checkpoint(2, 1, -1.0, 10, {"lr": 1.0}, "other.pth", "experiment")
+
+    checkpoints = store.get_latest_checkpoints(num_policies=3, max_iteration=1)
+    assert checkpoints[1] is None
+    assert checkpoints[0] == {
+        "iteration": 1,
+        "true_objective": 1.0,
+        "frame": 10,
+        "params": {"lr": 0.1},
+        "checkpoint": "1.pth",
+        "experiment_name": None,
+    }
+    assert checkpoints[2]["experiment_name"] == "experiment"
+    # the index is shared between the processes
+    other_store = PbtStore(os.path.join(tmp_path, "pbt_index.sqlite"))
+    assert other_store.get_latest_checkpoints(num_policies=3, max_iteration=5)[0]["iteration"] == 2
+
+    store.remove_checkpoints(0, max_iteration=1)
+    assert other_store.get_latest_checkpoints(num_policies=3, max_iteration=1)[0] is None
+    store.close()
+    other_store.close()
+
+
+def test_in_process_replacement(tmp_path):
+    """Test that an underperformer loads the weights of the leader without restarting in sqlite mode."""
+    observers = [_create_observer(str(tmp_path), policy_idx, "sqlite") for policy_idx in range(2)]
+    leader, underperformer = observers
+    # policy 1 steps after policy 0, so it sees the checkpoint of the leader
+    _run_pbt_iteration(observers, scores=[1.0, 0.0])
+
+    assert underperformer.restart_flag.item() == 0
+    torch.testing.assert_close(underperformer.algo.model.weight, leader.algo.model.weight)
+    # the mutated params of the leader are applied to the agent
+    new_lr = underperformer.new_params["agent.params.config.learning_rate"]
+    assert new_lr != 1e-3
+    assert underperformer.pbt_params == underperformer.new_params
+    assert underperformer.algo.last_lr == underperformer.algo.config["learning_rate"] == new_lr
+    assert underperformer.algo.optimizer.param_groups[0]["lr"] == new_lr
+    assert underperformer.algo.entropy_coef == underperformer.new_params["agent.params.config.entropy_coef"]
+    # no YAML file is written
+    for policy_dir in ("000", "001"):
+        assert os.listdir(os.path.join(tmp_path, "pbt_workspace", policy_dir)) == ["000001.pth"]
+    # the next checkpoint of the policy is indexed with its new params
+    _run_pbt_iteration(observers, scores=[1.0, 1.0])
+    checkpoints = underperformer.store.get_latest_checkpoints(num_policies=2, max_iteration=2)
+    assert checkpoints[1]["params"] == underperformer.new_params
+
+
+@pytest.mark.parametrize("corruption", ["missing", "truncated"])
+def test_in_process_replacement_invalid_checkpoint(tmp_path, monkeypatch, corruption):
+    """Test that the underperformer is kept as is if the checkpoint of the leader cannot be loaded."""
+    # note: rl_games retries the loading of a checkpoint with increasing waits
+    monkeypatch.setattr(torch_ext.time, "sleep", lambda _: None)
+    observers = [_create_observer(str(tmp_path), policy_idx, "sqlite") for policy_idx in range(2)]
+    leader, underperformer = observers
+    weight = underperformer.algo.model.weight.clone()
+    pbt_params = dict(underperformer.pbt_params)
+    # the leader saves its checkpoint, which is then removed or partially written
+    _run_pbt_iteration([leader], scores=[1.0])
+    checkpoint = os.path.join(tmp_path, "pbt_workspace", "000", "000001.pth")
+    if corruption == "missing":
+        os.remove(checkpoint)
+    else:
+        with open(checkpoint, "r+b") as f:
+            f.truncate(os.path.getsize(checkpoint) // 2)
+    _run_pbt_iteration([underperformer], scores=[0.0])
+
+    assert underperformer.restart_flag.item() == 0
+    torch.testing.assert_close(underperformer.algo.model.weight, weight)
+    assert underperformer.pbt_params == pbt_params
+    assert underperformer.algo.last_lr == 2e-3
+    assert underperformer.algo.optimizer.param_groups[0]["lr"] == 2e-3
+
+
+def test_checkpoints_bounded(tmp_path):
+    """Test that the checkpoints of a policy are bounded while another policy never reports."""
+    # note: the second policy of the population is never started
+    observer = _create_observer(str(tmp_path), 0, "sqlite")
+    for _ in range(60):
+        _run_pbt_iteration([observer], scores=[1.0])
+
+    assert len(os.listdir(os.path.join(tmp_path, "pbt_workspace", "000"))) == 50
+    # the removed checkpoints are removed from the index
+    assert observer.store.get_latest_checkpoints(num_policies=2, max_iteration=10)[0] is None
+    assert observer.store.get_latest_checkpoints(num_policies=2, max_iteration=11)[0]["iteration"] == 11
+
+
+def test_restart_fallback(tmp_path):
+    """Test that the underperformer restarts if a mutated param cannot be changed in-process."""
+    observers = [_create_observer(str(tmp_path), policy_idx, "sqlite") for policy_idx in range(2)]
+    observers[1].cfg.mutation["agent.params.config.horizon_length"] = "mutate_float"
+    observers[0].pbt_params["agent.params.config.horizon_length"] = 16
+    _run_pbt_iteration(observers, scores=[1.0, 0.0])
+    assert observers[1].restart_flag.item() == 1
+
+
+@pytest.mark.parametrize("exchange_mode", ["filesystem", "sqlite"])
+def test_exchange_modes_rank_policies(tmp_path, exchange_mode):
+    """Test that both exchange modes see the checkpoints of the whole population."""
+    observers = [_create_observer(str(tmp_path), policy_idx, exchange_mode) for policy_idx in range(2)]
+    _run_pbt_iteration(observers, scores=[0.0, 1.0])
+    # policy 0 does not see the checkpoint of policy 1 yet, and is the only initialized policy
+    assert observers[0].restart_flag.item() == 0
+    # policy 1 is the leader
+    assert observers[1].restart_flag.item() == 0
+    _run_pbt_iteration(observers[:1], scores=[0.0])
+    if exchange_mode == "filesystem":
+        assert observers[0].restart_flag.item() == 1
+    else:
+        torch.testing.assert_close(observers[0].algo.model.weight, observers[1].algo.model.weight)
@@ -112,6 +112,37 @@ def test_random_actions(registered_tasks):
         env.close()
 
 
+def test_random_actions_packed_transfer(registered_tasks):
+    """Run random actions with the step outputs moved to a separate rl-device through the transfer buffer."""
+    num_envs = 64
+    task_name = registered_tasks[0]
+    omni.usd.get_context().new_stage()
+    carb.settings.get_settings().set_bool("/isaaclab/render/rtx_sensors", False)
+    # create environment
+    env_cfg = parse_env_cfg(task_name, device="cuda", num_envs=num_envs)
+    env = gym.make(task_name, cfg=env_cfg)
+    if isinstance(env.unwrapped, DirectMARLEnv):
+        env = multi_agent_to_single_agent(env)
+    env = RlGamesVecEnvWrapper(env, "cpu", 100, 100, packed_transfer=True)
+    env.unwrapped.sim._app_control_on_stop_handle = None
+
+    env.reset()
+    with torch.inference_mode():
+        for _ in range(100):
+            actions = 2 * torch.rand(env.num_envs, *env.action_space.shape, device=env.unwrapped.device) - 1
+            obs, rew, dones, extras = env.step(actions)
+            # all the step outputs are on the rl-device
+            for data in (obs, rew, dones):
+                assert _check_valid_tensor(data)
+            assert rew.device == torch.device("cpu")
+            assert dones.device == torch.device("cpu")
+            assert dones.dtype == torch.bool
+            if "time_outs" in extras:
+                assert extras["time_outs"].device == torch.device("cpu")
+
+    env.close()
+
+
 """
 Helper functions.
 """
@@ -0,0 +1,137 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import numpy as np
+import os
+import torch
+
+import onnx
+import pytest
+from rsl_rl.modules import ActorCritic, ActorCriticRecurrent
+
+from isaaclab_rl.rsl_rl import export_policy_as_jit, export_policy_as_onnx
+
+NUM_OBS = 10
+NUM_ACTIONS = 4
+HIDDEN_DIM = 16
+
+
+def _create_policy(rnn_type: str | None) -> torch.nn.Module:
+    """Create a policy with a non-trivial observation normalizer."""
+    obs = {"policy": torch.zeros(1, NUM_OBS)}
+    obs_groups = {"policy": ["policy"], "critic": ["policy"]}
+    kwargs = dict(actor_obs_normalization=True, actor_hidden_dims=[32, 32], critic_hidden_dims=[32])
+    if rnn_type is None:
+        policy = ActorCritic(obs, obs_groups, NUM_ACTIONS, **kwargs)
+    else:
+        policy = ActorCriticRecurrent(
+            obs, obs_groups, NUM_ACTIONS, rnn_type=rnn_type, rnn_hidden_dim=HIDDEN_DIM, **kwargs
+        )
+    policy.actor_obs_normalizer._mean[:] = torch.randn(NUM_OBS)
+    policy.actor_obs_normalizer._std[:] = torch.rand(NUM_OBS) + 0.5
+    return policy.eval()
+
+
+def _compute_actions(policy: torch.nn.Module, obs: torch.Tensor) -> torch.Tensor:
+    """Compute the actions of the policy for a sequence of a single step starting from zero memory."""
+    with torch.no_grad():
+        x = policy.actor_obs_normalizer(obs)
+        if policy.is_recurrent:
+            x = policy.memory_a.rnn(x.unsqueeze(0))[0].squeeze(0)
+        return policy.actor(x)
+
+
+@pytest.mark.parametrize("rnn_type", [None, "lstm", "gru"])
+@pytest.mark.parametrize("fold_normalizer", [False, True])
+def test_onnx_dynamic_batch(tmp_path, rnn_type, fold_normalizer):
+    """Test that the ONNX policy with a dynamic batch dimension matches the policy."""
+    ort = pytest.importorskip("onnxruntime")
+    policy = _create_policy(rnn_type)
+    export_policy_as_onnx(
+        policy,
+        str(tmp_path),
+        normalizer=policy.actor_obs_normalizer,
+        opset_version=17,
+        dynamic_batch=True,
+        fold_normalizer=fold_normalizer,
+    )
+    model = onnx.load(os.path.join(tmp_path, "policy.onnx"))
+    assert model.opset_import[0].version == 17
+    # the normalization is removed from the graph when it is folded
+    op_types = {node.op_type for node in model.graph.node}
+    assert ("Div" in op_types) != fold_normalizer
+
+    session = ort.InferenceSession(os.path.join(tmp_path, "policy.onnx"), providers=["CPUExecutionProvider"])
+    for batch_size in (1, 7):
+        obs = torch.randn(batch_size, NUM_OBS) * 3.0
+        inputs = {"obs": obs.numpy()}
+        for node in session.get_inputs()[1:]:
+            inputs[node.name] = np.zeros((1, batch_size, HIDDEN_DIM), dtype=np.float32)
+        actions = session.run(None, inputs)[0]
+        np.testing.assert_allclose(actions, _compute_actions(policy, obs).numpy(), atol=1e-5)
+
+
+@pytest.mark.parametrize("precision", ["fp16", "int8"])
+def test_onnx_precision(tmp_path, precision):
+    """Test that the reduced precision ONNX policy is close to the policy."""
+    ort = pytest.importorskip("onnxruntime")
+    policy = _create_policy(None)
+    export_policy_as_onnx(
+        policy,
+        str(tmp_path),
+        normalizer=policy.actor_obs_normalizer,
+        opset_version=17,
+        dynamic_batch=True,
+        fold_normalizer=True,
+        precision=precision,
+    )
+    # only the exported policy is left in the directory
+    assert os.listdir(tmp_path) == ["policy.onnx"]
+
+    session = ort.InferenceSession(os.path.join(tmp_path, "policy.onnx"), providers=["CPUExecutionProvider"])
+    # the inputs and outputs remain in single precision
+    obs = torch.randn(16, NUM_OBS)
+    actions = session.run(None, {"obs": obs.numpy()})[0]
+    assert actions.dtype == np.float32
+    np.testing.assert_allclose(actions, _compute_actions(policy, obs).numpy(), atol=0.1)
+
+
+@pytest.mark.parametrize("rnn_type", [None, "lstm", "gru"])
+@pytest.mark.parametrize("precision", ["fp32", "int8"])
+def test_jit(tmp_path, rnn_type, precision):
+    """Test that the JIT policy with a folded normalizer matches the policy."""
+    policy = _create_policy(rnn_type)
+    export_policy_as_jit(policy, policy.actor_obs_normalizer, str(tmp_path), fold_normalizer=True, precision=precision)
+    module = torch.jit.load(os.path.join(tmp_path, "policy.pt"))
+
+    batch_size = 1 if rnn_type is not None else 7
+    obs = torch.randn(batch_size, NUM_OBS) * 3.0
+    with torch.no_grad():
+        actions = module(obs)
+    torch.testing.assert_close(
+        actions, _compute_actions(policy, obs), atol=1e-5 if precision == "fp32" else 0.1, rtol=0
+    )
+
+
+def test_invalid_arguments(tmp_path):
+    """Test the invalid arguments of the export functions."""
+    policy = _create_policy(None)
+    with pytest.raises(ValueError):
+        export_policy_as_jit(policy, None, str(tmp_path), precision="fp16")
+    with pytest.raises(ValueError):
+        export_policy_as_onnx(policy, str(tmp_path), precision="bf16")
+    with pytest.raises(ValueError):
+        export_policy_as_onnx(policy, str(tmp_path), normalizer=torch.nn.LayerNorm(NUM_OBS), fold_normalizer=True)
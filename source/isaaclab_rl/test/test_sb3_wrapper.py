@@ -24,7 +24,7 @@ import pytest
 
 from isaaclab.envs import DirectMARLEnv, multi_agent_to_single_agent
 
-from isaaclab_rl.sb3 import Sb3VecEnvWrapper
+from isaaclab_rl.sb3 import Sb3VecEnvInfos, Sb3VecEnvWrapper
 
 import isaaclab_tasks  # noqa: F401
 from isaaclab_tasks.utils.parse_cfg import parse_env_cfg
@@ -104,6 +104,82 @@ def test_random_actions(registered_tasks):
         env.close()
 
 
+@pytest.mark.parametrize("packed_transfer", [False, True])
+def test_random_actions_lazy_infos(registered_tasks, packed_transfer):
+    """Run random actions with lazy infos and check that the infos of reset environments are valid."""
+    num_envs = 64
+    task_name = registered_tasks[0]
+    omni.usd.get_context().new_stage()
+    carb.settings.get_settings().set_bool("/isaaclab/render/rtx_sensors", False)
+    # create environment
+    env_cfg = parse_env_cfg(task_name, device="cuda", num_envs=num_envs)
+    env = gym.make(task_name, cfg=env_cfg)
+    if isinstance(env.unwrapped, DirectMARLEnv):
+        env = multi_agent_to_single_agent(env)
+    env = Sb3VecEnvWrapper(env, lazy_infos=True, packed_transfer=packed_transfer)
+
+    obs = env.reset()
+    with torch.inference_mode():
+        for _ in range(100):
+            actions = 2 * np.random.rand(env.num_envs, *env.action_space.shape) - 1
+            obs, rewards, dones, infos = env.step(actions)
+            assert _check_valid_array(obs) and _check_valid_array(rewards)
+            assert dones.dtype == bool
+            assert isinstance(infos, Sb3VecEnvInfos)
+            assert len(infos) == num_envs
+            # only the reset environments have information
+            for idx in range(num_envs):
+                if dones[idx]:
+                    assert set(infos[idx].keys()) == {"episode", "TimeLimit.truncated", "terminal_observation"}
+                    assert _check_valid_array(infos[idx]["terminal_observation"])
+                else:
+                    assert infos[idx] == {}
+
+    env.close()
+
+
+@pytest.mark.parametrize("fast_variant", [True, False])
+def test_lazy_infos(fast_variant):
+    """Check the content of the lazily constructed infos."""
+    num_envs = 6
+    reset_ids = np.array([1, 4])
+    obs = {"policy": np.arange(num_envs * 3, dtype=np.float32).reshape(num_envs, 3)}
+    time_outs = np.array([False, True, False, False, False, False])
+    extras = {"log": {"Episode_Reward/alive": 1.5}, "time_outs": torch.tensor(time_outs)}
+    infos = Sb3VecEnvInfos(
+        num_envs=num_envs,
+        reset_ids=reset_ids,
+        episode_rewards=np.array([10.0, 20.0]),
+        episode_lengths=np.array([5.0, 7.0]),
+        time_outs=time_outs,
+        terminal_obs={key: value[reset_ids] for key, value in obs.items()},
+        extras=None if fast_variant else extras,
+    )
+
+    assert len(infos) == num_envs
+    # reset environments
+    assert infos[1]["episode"]["r"] == 10.0
+    assert infos[-2]["episode"]["l"] == 7.0
+    assert infos[1]["TimeLimit.truncated"]
+    assert not infos[4]["TimeLimit.truncated"]
+    np.testing.assert_array_equal(infos[4]["terminal_observation"]["policy"], obs["policy"][4])
+    if fast_variant:
+        assert infos[0] == {}
+    else:
+        assert infos[1]["episode"]["Episode_Reward/alive"] == 1.5
+        assert infos[0]["episode"] is None
+        assert infos[0]["terminal_observation"] is None
+        assert infos[1]["time_outs"]
+        assert not infos[2]["time_outs"]
+    # modifications of the dictionaries are kept
+    infos[4]["terminal_observation"] = None
+    infos_list = list(infos)
+    assert infos_list[4]["terminal_observation"] is None
+    assert infos[:][4] is infos[4]
+    with pytest.raises(IndexError):
+        infos[num_envs]
+
+
 """
 Helper functions.
 """
@@ -129,7 +205,7 @@ def _check_valid_array(data: np.ndarray | dict | list) -> bool:
             elif isinstance(value, np.ndarray):
                 valid_array &= not np.any(np.isnan(value))
         return valid_array
-    elif isinstance(data, list):
+    elif isinstance(data, (list, Sb3VecEnvInfos)):
         valid_array = True
         for value in data:
             valid_array &= _check_valid_array(value)
@@ -320,29 +320,36 @@ def get_reward_mask(ref_traj, curr_ee_pos, tolerance):
 
 
 def get_imitation_reward_from_dtw(ref_traj, curr_ee_pos, prev_ee_traj, criterion, device):
-    """Get imitation reward based on dynamic time warping."""
+    """Get imitation reward based on dynamic time warping.
 
-    soft_dtw = torch.zeros((curr_ee_pos.shape[0]), device=device)
+    The reference segments of all the environments are gathered into a padded batch with per-environment lengths,
+    and their soft-DTW values are computed in a single call of :meth:`SoftDTW.forward_ragged`.
+    """
+
+    num_envs = curr_ee_pos.shape[0]
+    traj_len = ref_traj.shape[1]
     prev_ee_pos = prev_ee_traj[:, 0, :]  # select the first ee pos in robot traj
     min_dist_traj_idx, min_dist_step_idx, min_dist_per_env = get_closest_state_idx(ref_traj, prev_ee_pos)
 
-    for i in range(curr_ee_pos.shape[0]):
-        traj_idx = min_dist_traj_idx[i]
-        step_idx = min_dist_step_idx[i]
-        curr_ee_pos_i = curr_ee_pos[i].reshape(1, 3)
-
-        # NOTE: in reference trajectories, larger index -> closer to goal
-        traj = ref_traj[traj_idx, step_idx:, :].reshape((1, -1, 3))
-
-        _, curr_step_idx, _ = get_closest_state_idx(traj, curr_ee_pos_i)
-
-        if curr_step_idx == 0:
-            selected_pos = ref_traj[traj_idx, step_idx, :].reshape((1, 1, 3))
-            selected_traj = torch.cat([selected_pos, selected_pos], dim=1)
-        else:
-            selected_traj = ref_traj[traj_idx, step_idx : (curr_step_idx + step_idx), :].reshape((1, -1, 3))
-        eef_traj = torch.cat((prev_ee_traj[i, 1:, :], curr_ee_pos_i)).reshape((1, -1, 3))
-        soft_dtw[i] = criterion(eef_traj, selected_traj)
+    # find the closest state to the current ee pos in the remaining part of the selected reference trajectories
+    # NOTE: in reference trajectories, larger index -> closer to goal
+    env_trajs = ref_traj[min_dist_traj_idx]  # env_trajs.shape = (num_envs, traj_len, 3)
+    step_range = torch.arange(traj_len, device=device)
+    dist_from_env_traj = torch.cdist(env_trajs, curr_ee_pos.reshape(-1, 1, 3), p=2).squeeze(-1)
+    passed_steps = step_range.unsqueeze(0) < min_dist_step_idx.unsqueeze(1)
+    dist_from_env_traj = dist_from_env_traj.masked_fill(passed_steps, torch.inf)
+    curr_step_idx = torch.argmin(dist_from_env_traj, dim=-1) - min_dist_step_idx
+
+    # gather the reference segments, padded to the longest segment
+    # if the closest state is the first state of the segment, the segment is the first state repeated twice
+    segment_len = torch.where(curr_step_idx == 0, 2, curr_step_idx)
+    max_segment_len = max(int(torch.max(segment_len)), 2)
+    segment_steps = step_range[:max_segment_len].unsqueeze(0) * (curr_step_idx.unsqueeze(1) > 0)
+    segment_steps = torch.clamp(min_dist_step_idx.unsqueeze(1) + segment_steps, max=traj_len - 1)
+    selected_traj = torch.gather(env_trajs, 1, segment_steps.unsqueeze(-1).expand(-1, -1, 3))
+
+    eef_traj = torch.cat((prev_ee_traj[:, 1:, :], curr_ee_pos.reshape(num_envs, 1, 3)), dim=1)
+    soft_dtw = criterion.forward_ragged(eef_traj, selected_traj, segment_len).to(dtype=torch.float32)
 
     w_task_progress = 1 - (min_dist_step_idx / ref_traj.shape[1])
 
@@ -112,6 +112,137 @@ def compute_softdtw_backward_cuda(D, R, inv_gamma, bandwidth, max_i, max_j, n_pa
         cuda.syncthreads()
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+@cuda.jit
+def compute_softdtw_ragged_cuda(D, lengths, gamma, bandwidth, max_i, n_passes, R):
+    """
+    Same as compute_softdtw_cuda, but the second sequence of each pair is only processed up to its length
+    :param lengths: The lengths of the (padded) second sequences, one per pair of examples
+    """
+    b = cuda.blockIdx.x
+    tid = cuda.threadIdx.x
+    max_j = lengths[b]
+
+    inv_gamma = 1.0 / gamma
+
+    for p in range(n_passes):
+
+        J = max(0, min(p - tid, max_j - 1))
+
+        i = tid + 1
+        j = J + 1
+
+        if tid + J == p and (tid < max_i and J < max_j):
+            if not (abs(i - j) > bandwidth > 0):
+                r0 = -R[b, i - 1, j - 1] * inv_gamma
+                r1 = -R[b, i - 1, j] * inv_gamma
+                r2 = -R[b, i, j - 1] * inv_gamma
+                rmax = max(max(r0, r1), r2)
+                rsum = math.exp(r0 - rmax) + math.exp(r1 - rmax) + math.exp(r2 - rmax)
+                softmin = -gamma * (math.log(rsum) + rmax)
+                R[b, i, j] = D[b, i - 1, j - 1] + softmin
+
+        cuda.syncthreads()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@cuda.jit(device=True)
+def _squared_dist_cuda(X, Y, b, i, j, max_i, max_j):
+    """
+    Squared Euclidean distance between X[b, i - 1] and Y[b, j - 1], zero outside the sequences (1-based i, j)
+    """
+    if i > max_i or j > max_j:
+        return 0.0
+    dist = 0.0
+    for d in range(X.shape[2]):
+        diff = X[b, i - 1, d] - Y[b, j - 1, d]
+        dist += diff * diff
+    return dist
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@cuda.jit(device=True)
+def _banded_backward_r_cuda(R, b, i, j, k, max_i, max_j):
+    """
+    Reads element [i, j] of the banded R for the backward pass, with the boundary handling of the dense version
+    """
+    if i == max_i + 1 and j == max_j + 1:
+        return R[b, max_i, k]
+    if i > max_i or j > max_j:
+        return -math.inf
+    r = R[b, i, k]
+    if math.isinf(r):
+        return -math.inf
+    return r
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@cuda.jit
+def compute_softdtw_banded_cuda(X, Y, gamma, bandwidth, max_i, max_j, n_passes, R):
+    """
+    Same as compute_softdtw_cuda, but the distances are computed from X and Y on the fly and R only stores
+    the Sakoe-Chiba band: element [i, j] of the dense matrix is stored at R[b, i, j - i + bandwidth + 1]
+    :param bandwidth: The integer Sakoe-Chiba bandwidth, must be positive
+    """
+    b = cuda.blockIdx.x
+    tid = cuda.threadIdx.x
+
+    inv_gamma = 1.0 / gamma
+
+    for p in range(n_passes):
+
+        J = p - tid
+
+        i = tid + 1
+        j = J + 1
+
+        if tid < max_i and 0 <= J < max_j and abs(i - j) <= bandwidth:
+            k = j - i + bandwidth + 1
+            r0 = -R[b, i - 1, k] * inv_gamma
+            r1 = -R[b, i - 1, k + 1] * inv_gamma
+            r2 = -R[b, i, k - 1] * inv_gamma
+            rmax = max(max(r0, r1), r2)
+            rsum = math.exp(r0 - rmax) + math.exp(r1 - rmax) + math.exp(r2 - rmax)
+            softmin = -gamma * (math.log(rsum) + rmax)
+            R[b, i, k] = _squared_dist_cuda(X, Y, b, i, j, max_i, max_j) + softmin
+
+        cuda.syncthreads()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@cuda.jit
+def compute_softdtw_banded_backward_cuda(X, Y, R, inv_gamma, bandwidth, max_i, max_j, n_passes, E):
+    """
+    Backward pass of compute_softdtw_banded_cuda. R and E are stored in the same banded layout
+    """
+    b = cuda.blockIdx.x
+    tid = cuda.threadIdx.x
+
+    for p in range(n_passes):
+        rev_p = n_passes - p - 1
+
+        J = rev_p - tid
+
+        i = tid + 1
+        j = J + 1
+
+        if tid < max_i and 0 <= J < max_j and abs(i - j) <= bandwidth:
+            k = j - i + bandwidth + 1
+            r = _banded_backward_r_cuda(R, b, i, j, k, max_i, max_j)
+            r_a = _banded_backward_r_cuda(R, b, i + 1, j, k - 1, max_i, max_j)
+            r_b = _banded_backward_r_cuda(R, b, i, j + 1, k + 1, max_i, max_j)
+            r_c = _banded_backward_r_cuda(R, b, i + 1, j + 1, k, max_i, max_j)
+            d_a = _squared_dist_cuda(X, Y, b, i + 1, j, max_i, max_j)
+            d_b = _squared_dist_cuda(X, Y, b, i, j + 1, max_i, max_j)
+            d_c = _squared_dist_cuda(X, Y, b, i + 1, j + 1, max_i, max_j)
+            a = math.exp((r_a - r - d_a) * inv_gamma)
+            b_ = math.exp((r_b - r - d_b) * inv_gamma)
+            c = math.exp((r_c - r - d_c) * inv_gamma)
+            E[b, i, k] = E[b, i + 1, k - 1] * a + E[b, i, k + 1] * b_ + E[b, i + 1, k] * c
+
+        cuda.syncthreads()
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 class _SoftDTWCUDA(Function):
     """
@@ -248,6 +379,120 @@ def compute_softdtw_backward(D_, R, gamma, bandwidth):
     return E[:, 1 : N + 1, 1 : M + 1]
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+@jit(nopython=True, parallel=True)
+def compute_softdtw_ragged(D, lengths, gamma, bandwidth):
+    """
+    Same as compute_softdtw, but the second sequence of each pair is only processed up to its length
+    :param lengths: The lengths of the (padded) second sequences, one per pair of examples
+    :return: The soft-DTW value of each pair of examples
+    """
+    B = D.shape[0]
+    N = D.shape[1]
+    out = np.empty(B)
+    for b in prange(B):
+        M = lengths[b]
+        R = np.ones((N + 1, M + 1)) * np.inf
+        R[0, 0] = 0
+        for j in range(1, M + 1):
+            for i in range(1, N + 1):
+
+                # Check the pruning condition
+                if 0 < bandwidth < np.abs(i - j):
+                    continue
+
+                r0 = -R[i - 1, j - 1] / gamma
+                r1 = -R[i - 1, j] / gamma
+                r2 = -R[i, j - 1] / gamma
+                rmax = max(max(r0, r1), r2)
+                rsum = np.exp(r0 - rmax) + np.exp(r1 - rmax) + np.exp(r2 - rmax)
+                softmin = -gamma * (np.log(rsum) + rmax)
+                R[i, j] = D[b, i - 1, j - 1] + softmin
+        out[b] = R[N, M]
+    return out
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+#
+# Banded CPU implementation. Instead of the dense (B, N + 2, M + 2) matrices, R and E only store the Sakoe-Chiba
+# band: element [i, j] of the dense matrix is stored at [b, i, j - i + bandwidth + 1] of a (B, N + 2, 2 * bandwidth + 3)
+# matrix, whose first and last columns are padding outside the band. The distances are computed from X and Y on the
+# fly, so that the dense distance matrix is never materialized either.
+#
+# ----------------------------------------------------------------------------------------------------------------------
+@jit(nopython=True)
+def _squared_dist(X, Y, b, i, j, N, M):
+    if i > N or j > M:
+        return 0.0
+    dist = 0.0
+    for d in range(X.shape[2]):
+        diff = X[b, i - 1, d] - Y[b, j - 1, d]
+        dist += diff * diff
+    return dist
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@jit(nopython=True)
+def _banded_backward_r(R, b, i, j, k, N, M):
+    if i == N + 1 and j == M + 1:
+        return R[b, N, k]
+    if i > N or j > M:
+        return -np.inf
+    r = R[b, i, k]
+    if np.isinf(r):
+        return -np.inf
+    return r
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@jit(nopython=True, parallel=True)
+def compute_softdtw_banded(X, Y, gamma, bandwidth, R):
+    """
+    Fills the banded R in place. R must be initialized to inf, except for R[:, 0, bandwidth + 1] = 0
+    :param bandwidth: The integer Sakoe-Chiba bandwidth, must be positive
+    """
+    B = X.shape[0]
+    N = X.shape[1]
+    M = Y.shape[1]
+    for b in prange(B):
+        for i in range(1, N + 1):
+            for j in range(max(1, i - bandwidth), min(M, i + bandwidth) + 1):
+                k = j - i + bandwidth + 1
+                r0 = -R[b, i - 1, k] / gamma
+                r1 = -R[b, i - 1, k + 1] / gamma
+                r2 = -R[b, i, k - 1] / gamma
+                rmax = max(max(r0, r1), r2)
+                rsum = np.exp(r0 - rmax) + np.exp(r1 - rmax) + np.exp(r2 - rmax)
+                softmin = -gamma * (np.log(rsum) + rmax)
+                R[b, i, k] = _squared_dist(X, Y, b, i, j, N, M) + softmin
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+@jit(nopython=True, parallel=True)
+def compute_softdtw_banded_backward(X, Y, R, gamma, bandwidth, E):
+    """
+    Fills the banded E in place. E must be initialized to zero, except for the element [N + 1, M + 1] set to one
+    """
+    B = X.shape[0]
+    N = X.shape[1]
+    M = Y.shape[1]
+    for b in prange(B):
+        for i in range(N, 0, -1):
+            for j in range(min(M, i + bandwidth), max(1, i - bandwidth) - 1, -1):
+                k = j - i + bandwidth + 1
+                r = _banded_backward_r(R, b, i, j, k, N, M)
+                r_a = _banded_backward_r(R, b, i + 1, j, k - 1, N, M)
+                r_b = _banded_backward_r(R, b, i, j + 1, k + 1, N, M)
+                r_c = _banded_backward_r(R, b, i + 1, j + 1, k, N, M)
+                a0 = (r_a - r - _squared_dist(X, Y, b, i + 1, j, N, M)) / gamma
+                b0 = (r_b - r - _squared_dist(X, Y, b, i, j + 1, N, M)) / gamma
+                c0 = (r_c - r - _squared_dist(X, Y, b, i + 1, j + 1, N, M)) / gamma
+                a = np.exp(a0)
+                b_ = np.exp(b0)
+                c = np.exp(c0)
+                E[b, i, k] = E[b, i + 1, k - 1] * a + E[b, i, k + 1] * b_ + E[b, i + 1, k] * c
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 class _SoftDTW(Function):
     """
@@ -280,13 +525,92 @@ class _SoftDTW(Function):
         return grad_output.view(-1, 1, 1).expand_as(E) * E, None, None
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+class _SoftDTWBanded(Function):
+    """
+    Banded implementation with fused Euclidean distances, on the CPU or with CUDA.
+    Takes the sequences X and Y instead of the distance matrix, and only allocates the Sakoe-Chiba band of R and E,
+    so that the memory scales with seq_len x bandwidth instead of seq_len_a x seq_len_b.
+    """
+
+    @staticmethod
+    def forward(ctx, X, Y, gamma, bandwidth, use_cuda, dtype):
+        B, N, _ = X.shape
+        M = Y.shape[1]
+        dev = X.device if use_cuda else torch.device("cpu")
+
+        # Prepare the banded output array
+        R = torch.full((B, N + 2, 2 * bandwidth + 3), math.inf, device=dev, dtype=dtype)
+        R[:, 0, bandwidth + 1] = 0
+        X_ = X.detach().to(device=dev, dtype=dtype)
+        Y_ = Y.detach().to(device=dev, dtype=dtype)
+
+        if use_cuda:
+            threads_per_block = max(N, M)
+            n_passes = N + M - 1
+            compute_softdtw_banded_cuda[B, threads_per_block](
+                cuda.as_cuda_array(X_), cuda.as_cuda_array(Y_), gamma, bandwidth, N, M, n_passes, cuda.as_cuda_array(R)
+            )
+        else:
+            compute_softdtw_banded(X_.numpy(), Y_.numpy(), gamma, bandwidth, R.numpy())
+
+        ctx.save_for_backward(X_, Y_, R)
+        ctx.gamma = gamma
+        ctx.bandwidth = bandwidth
+        ctx.use_cuda = use_cuda
+        # element [N, M] of the dense matrix
+        return R[:, N, M - N + bandwidth + 1].to(device=X.device, dtype=X.dtype)
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        X_, Y_, R = ctx.saved_tensors
+        bandwidth = ctx.bandwidth
+        B, N, _ = X_.shape
+        M = Y_.shape[1]
+
+        E = torch.zeros_like(R)
+        E[:, N + 1, M - N + bandwidth + 1] = 1
+
+        if ctx.use_cuda:
+            threads_per_block = max(N, M)
+            n_passes = N + M - 1
+            compute_softdtw_banded_backward_cuda[B, threads_per_block](
+                cuda.as_cuda_array(X_),
+                cuda.as_cuda_array(Y_),
+                cuda.as_cuda_array(R),
+                1.0 / ctx.gamma,
+                bandwidth,
+                N,
+                M,
+                n_passes,
+                cuda.as_cuda_array(E),
+            )
+        else:
+            compute_softdtw_banded_backward(X_.numpy(), Y_.numpy(), R.numpy(), ctx.gamma, bandwidth, E.numpy())
+
+        # Chain rule through the squared Euclidean distances, evaluated on the band only
+        # Row i (0-based) of the band holds the columns j = i + k - bandwidth - 1 for the band index k
+        dev = grad_output.device
+        dtype = grad_output.dtype
+        E = E[:, 1 : N + 1].to(device=dev, dtype=dtype)
+        j = torch.arange(N, device=dev).unsqueeze(1) + torch.arange(E.shape[2], device=dev) - bandwidth - 1
+        E = E * ((j >= 0) & (j < M))
+        j = j.clamp(0, M - 1)
+        X = X_.to(device=dev, dtype=dtype)
+        Y = Y_.to(device=dev, dtype=dtype)
+        W = 2 * (grad_output.view(-1, 1, 1) * E).unsqueeze(-1) * (X.unsqueeze(2) - Y[:, j])
+        grad_X = W.sum(2) if ctx.needs_input_grad[0] else None
+        grad_Y = torch.zeros_like(Y).index_add_(1, j.flatten(), -W.flatten(1, 2)) if ctx.needs_input_grad[1] else None
+        return grad_X, grad_Y, None, None, None, None
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 class SoftDTW(torch.nn.Module):
     """
     The soft DTW implementation that optionally supports CUDA
     """
 
-    def __init__(self, use_cuda, gamma=1.0, normalize=False, bandwidth=None, dist_func=None):
+    def __init__(self, use_cuda, gamma=1.0, normalize=False, bandwidth=None, dist_func=None, banded=False, dtype=None):
         """
         Initializes a new instance using the supplied parameters
         :param use_cuda: Flag indicating whether the CUDA implementation should be used
@@ -295,12 +619,26 @@ class SoftDTW(torch.nn.Module):
                           (as discussed in https://github.com/mblondel/soft-dtw/issues/10#issuecomment-383564790)
         :param bandwidth: Sakoe-Chiba bandwidth for pruning. Passing 'None' will disable pruning.
         :param dist_func: Optional point-wise distance function to use. If 'None', then a default Euclidean distance function will be used.
+        :param banded: Flag indicating whether to only allocate the Sakoe-Chiba band of the intermediate matrices.
+                       The Euclidean distances are then computed on the fly instead of being stored in a dense matrix,
+                       so that the memory scales with seq_len x bandwidth. Requires a bandwidth and the default
+                       distance function, and the lengths of the sequences must differ by at most the bandwidth.
+        :param dtype: Data type of the intermediate matrices in the banded mode, e.g. torch.float32 to halve
+                      their memory. If 'None', then float64 is used on the CPU and the dtype of the inputs with CUDA.
         """
         super().__init__()
         self.normalize = normalize
         self.gamma = gamma
         self.bandwidth = 0 if bandwidth is None else float(bandwidth)
         self.use_cuda = use_cuda
+        self.banded = banded
+        self.dtype = dtype
+
+        if banded:
+            if self.bandwidth < 1:
+                raise ValueError(f"SoftDTW: The banded mode requires a bandwidth of at least 1, got: {bandwidth}")
+            if dist_func is not None:
+                raise ValueError("SoftDTW: The banded mode only supports the default Euclidean distance function")
 
         # Set the distance function
         if dist_func is not None:
@@ -341,6 +679,88 @@ class SoftDTW(torch.nn.Module):
         y = y.unsqueeze(1).expand(-1, n, m, d)
         return torch.pow(x - y, 2).sum(3)
 
+    def forward_ragged(self, X, Y, lengths):
+        """
+        Compute the soft-DTW value between X and padded sequences Y of different lengths, without gradients.
+        All the pairs of examples are processed in a single kernel call, where each pair only processes
+        the first lengths[b] elements of Y[b].
+        :param X: One batch of examples, batch_size x seq_len x dims
+        :param Y: The other batch of examples, padded to the longest sequence, batch_size x max_seq_len x dims
+        :param lengths: The lengths of the sequences in Y, batch_size. Each length must be at least 1.
+        :return: The computed results
+        """
+        if self.normalize:
+            raise ValueError("SoftDTW: Normalization is not supported for sequences of different lengths")
+
+        with torch.no_grad():
+            D = self.dist_func(X, Y)
+            B, N, M = D.shape
+            use_cuda = self.use_cuda and D.is_cuda
+            if use_cuda and (N > 1024 or M > 1024):
+                print(
+                    "SoftDTW: Cannot use CUDA because the sequence length > 1024 (the maximum block size supported by"
+                    " CUDA)"
+                )
+                use_cuda = False
+
+            if use_cuda:
+                threads_per_block = max(N, M)
+                n_passes = 2 * threads_per_block - 1
+                lengths = lengths.to(device=D.device, dtype=torch.int32)
+                R = torch.full((B, N + 2, M + 2), math.inf, device=D.device, dtype=D.dtype)
+                R[:, 0, 0] = 0
+                compute_softdtw_ragged_cuda[B, threads_per_block](
+                    cuda.as_cuda_array(D.detach()),
+                    cuda.as_cuda_array(lengths),
+                    float(self.gamma),
+                    float(self.bandwidth),
+                    N,
+                    n_passes,
+                    cuda.as_cuda_array(R),
+                )
+                return R[torch.arange(B, device=D.device), N, lengths.long()]
+
+            out = compute_softdtw_ragged(
+                D.detach().cpu().numpy(), lengths.cpu().numpy(), float(self.gamma), float(self.bandwidth)
+            )
+            return torch.from_numpy(out).to(device=D.device, dtype=D.dtype)
+
+    def _forward_banded(self, X, Y):
+        """
+        Compute the soft-DTW value between X and Y with the banded implementation
+        """
+        bx, lx, dx = X.shape
+        by, ly, dy = Y.shape
+        assert bx == by  # Equal batch sizes
+        assert dx == dy  # Equal feature dimensions
+
+        bandwidth = int(self.bandwidth)
+        if abs(lx - ly) > bandwidth:
+            raise ValueError(
+                f"SoftDTW: The sequence lengths {lx} and {ly} differ by more than the bandwidth {bandwidth}, so the"
+                " end of the alignment lies outside the band"
+            )
+
+        use_cuda = self.use_cuda and X.is_cuda
+        if use_cuda and (lx > 1024 or ly > 1024):
+            print(
+                "SoftDTW: Cannot use CUDA because the sequence length > 1024 (the maximum block size supported by CUDA)"
+            )
+            use_cuda = False
+        dtype = self.dtype
+        if dtype is None:
+            dtype = X.dtype if use_cuda else torch.float64
+
+        if self.normalize:
+            # Stack everything up and run
+            x = torch.cat([X, X, Y])
+            y = torch.cat([Y, X, Y])
+            out = _SoftDTWBanded.apply(x, y, self.gamma, bandwidth, use_cuda, dtype)
+            out_xy, out_xx, out_yy = torch.split(out, X.shape[0])
+            return out_xy - 1 / 2 * (out_xx + out_yy)
+        else:
+            return _SoftDTWBanded.apply(X, Y, self.gamma, bandwidth, use_cuda, dtype)
+
     def forward(self, X, Y):
         """
         Compute the soft-DTW value between X and Y
@@ -349,6 +769,9 @@ class SoftDTW(torch.nn.Module):
         :return: The computed results
         """
 
+        if self.banded:
+            return self._forward_banded(X, Y)
+
         # Check the inputs and get the correct implementation
         func_dtw = self._get_func_dtw(X, Y)
 
@@ -440,6 +863,71 @@ def profile(batch_size, seq_len_a, seq_len_b, dims, tol_backward):
     print()
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+def profile_banded(batch_size, seq_len, dims, bandwidth, use_cuda=False, tol_backward=1e-3, compare_dense=True):
+    """
+    Profiles the memory and the forward() + backward() times of the banded implementation (in float64 and float32)
+    against the dense implementation with the same bandwidth, for long trajectories.
+    The memory is the size of the intermediate matrices (D, R and E for the dense implementation, R and E for the
+    banded one). With CUDA, the peak memory allocated during the run is reported as well.
+    """
+    device = "cuda" if use_cuda else "cpu"
+    n_iters = 3
+    n_band = 2 * bandwidth + 3
+
+    print(
+        "Profiling banded forward() + backward() on {} for batch_size={}, seq_len={}, dims={}, bandwidth={}...".format(
+            device, batch_size, seq_len, dims, bandwidth
+        )
+    )
+
+    variants = {
+        "banded float64": (SoftDTW(use_cuda, gamma=1.0, bandwidth=bandwidth, banded=True, dtype=torch.float64), 8, 2),
+        "banded float32": (SoftDTW(use_cuda, gamma=1.0, bandwidth=bandwidth, banded=True, dtype=torch.float32), 4, 2),
+    }
+    if compare_dense:
+        # the dense CPU implementation uses float64, the CUDA one the dtype of the inputs
+        variants["dense"] = (SoftDTW(use_cuda, gamma=1.0, bandwidth=bandwidth), 4 if use_cuda else 8, 3)
+
+    results = {}
+    for name, (sdtw, itemsize, n_matrices) in variants.items():
+        if name == "dense":
+            memory = n_matrices * batch_size * (seq_len + 2) ** 2 * itemsize
+        else:
+            memory = n_matrices * batch_size * (seq_len + 2) * n_band * itemsize
+        times = []
+        peak_memory = None
+        for i in range(n_iters):
+            torch.manual_seed(i)
+            a = torch.rand((batch_size, seq_len, dims), device=device, requires_grad=True)
+            b = torch.rand((batch_size, seq_len, dims), device=device)
+            if use_cuda:
+                torch.cuda.synchronize()
+                torch.cuda.reset_peak_memory_stats()
+            t, forward, backward = timed_run(a, b, sdtw)
+            if use_cuda:
+                torch.cuda.synchronize()
+                peak_memory = torch.cuda.max_memory_allocated()
+            # Ignore the first run, in case this is a cold start
+            if i > 0:
+                times += [t]
+        results[name] = (forward, backward)
+
+        line = "  {:<16} time: {:.4f} s, matrices: {:.1f} MB".format(name, np.mean(times), memory / 2**20)
+        if peak_memory is not None:
+            line += ", peak allocated: {:.1f} MB".format(peak_memory / 2**20)
+        print(line)
+
+    # Verify the results against the dense implementation
+    if compare_dense:
+        forward_dense, backward_dense = results["dense"]
+        for name in ("banded float64", "banded float32"):
+            forward, backward = results[name]
+            assert torch.allclose(forward, forward_dense, rtol=1e-4)
+            assert torch.allclose(backward, backward_dense, atol=tol_backward)
+    print()
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 if __name__ == "__main__":
 
@@ -448,3 +936,8 @@ if __name__ == "__main__":
     profile(128, 17, 15, 2, tol_backward=1e-6)
     profile(512, 64, 64, 2, tol_backward=1e-4)
     profile(512, 256, 256, 2, tol_backward=1e-3)
+
+    profile_banded(8, 1024, 3, 32)
+    profile_banded(8, 4096, 3, 32, compare_dense=False)
+    if torch.cuda.is_available():
+        profile_banded(64, 1024, 3, 32, use_cuda=True)
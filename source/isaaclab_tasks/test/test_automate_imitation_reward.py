@@ -0,0 +1,81 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch the simulator
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+
+import pytest
+
+from isaaclab_tasks.direct.automate import automate_algo_utils as automate_algo
+from isaaclab_tasks.direct.automate.soft_dtw_cuda import SoftDTW
+
+
+def get_imitation_reward_from_dtw_per_env(ref_traj, curr_ee_pos, prev_ee_traj, criterion, device):
+    """Reference implementation that computes the soft-DTW value of each environment separately."""
+    soft_dtw = torch.zeros((curr_ee_pos.shape[0]), device=device)
+    prev_ee_pos = prev_ee_traj[:, 0, :]
+    min_dist_traj_idx, min_dist_step_idx, _ = automate_algo.get_closest_state_idx(ref_traj, prev_ee_pos)
+
+    for i in range(curr_ee_pos.shape[0]):
+        traj_idx = min_dist_traj_idx[i]
+        step_idx = min_dist_step_idx[i]
+        curr_ee_pos_i = curr_ee_pos[i].reshape(1, 3)
+        traj = ref_traj[traj_idx, step_idx:, :].reshape((1, -1, 3))
+        _, curr_step_idx, _ = automate_algo.get_closest_state_idx(traj, curr_ee_pos_i)
+        if curr_step_idx == 0:
+            selected_pos = ref_traj[traj_idx, step_idx, :].reshape((1, 1, 3))
+            selected_traj = torch.cat([selected_pos, selected_pos], dim=1)
+        else:
+            selected_traj = ref_traj[traj_idx, step_idx : (curr_step_idx + step_idx), :].reshape((1, -1, 3))
+        eef_traj = torch.cat((prev_ee_traj[i, 1:, :], curr_ee_pos_i)).reshape((1, -1, 3))
+        soft_dtw[i] = criterion(eef_traj, selected_traj)
+
+    w_task_progress = 1 - (min_dist_step_idx / ref_traj.shape[1])
+    return (1 - torch.tanh(soft_dtw)) * w_task_progress
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_imitation_reward_from_dtw(device):
+    """Test the batched imitation reward against the per-environment computation."""
+    torch.manual_seed(0)
+    num_envs, num_trajs, traj_len, history_len = 64, 4, 50, 6
+    # monotonic reference trajectories towards the goal
+    ref_traj = torch.cumsum(torch.rand(num_trajs, traj_len, 3, device=device) * 0.01, dim=1)
+    # robot trajectories close to random points of the reference trajectories
+    start_idx = torch.randint(0, traj_len - history_len - 10, (num_envs,), device=device)
+    traj_idx = torch.randint(0, num_trajs, (num_envs,), device=device)
+    steps = start_idx.unsqueeze(1) + torch.arange(history_len, device=device) * torch.randint(
+        0, 3, (num_envs, 1), device=device
+    )
+    prev_ee_traj = ref_traj[traj_idx.unsqueeze(1), steps] + torch.randn(num_envs, history_len, 3, device=device) * 1e-3
+    curr_ee_pos = prev_ee_traj[:, -1] + torch.randn(num_envs, 3, device=device) * 5e-3
+
+    criterion = SoftDTW(use_cuda=device.startswith("cuda"), gamma=0.01)
+    expected = get_imitation_reward_from_dtw_per_env(ref_traj, curr_ee_pos, prev_ee_traj, criterion, device)
+    reward = automate_algo.get_imitation_reward_from_dtw(ref_traj, curr_ee_pos, prev_ee_traj, criterion, device)
+    torch.testing.assert_close(reward, expected, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_soft_dtw_ragged(device):
+    """Test the soft-DTW values of padded sequences against the values of the unpadded sequences."""
+    torch.manual_seed(0)
+    criterion = SoftDTW(use_cuda=device.startswith("cuda"), gamma=0.1)
+    x = torch.rand(8, 10, 3, device=device)
+    y = torch.rand(8, 12, 3, device=device)
+    lengths = torch.randint(1, 13, (8,), device=device)
+
+    values = criterion.forward_ragged(x, y, lengths)
+    for i in range(8):
+        expected = criterion(x[i : i + 1], y[i : i + 1, : lengths[i]])
+        torch.testing.assert_close(values[i : i + 1], expected, rtol=1e-5, atol=1e-5)
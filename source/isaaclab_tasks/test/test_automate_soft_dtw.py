@@ -0,0 +1,70 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch the simulator
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+
+import pytest
+
+from isaaclab_tasks.direct.automate.soft_dtw_cuda import SoftDTW
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("dtype", [torch.float64, torch.float32])
+@pytest.mark.parametrize("seq_lens", [(32, 32), (30, 27), (20, 24)])
+@pytest.mark.parametrize("normalize", [False, True])
+def test_banded_soft_dtw(device, dtype, seq_lens, normalize):
+    """Test the banded soft-DTW values and gradients against the dense implementation."""
+    seq_len_a, seq_len_b = seq_lens
+    if normalize and seq_len_a != seq_len_b:
+        pytest.skip("Normalization requires sequences of the same length.")
+    torch.manual_seed(0)
+    use_cuda = device.startswith("cuda")
+    bandwidth = 5
+    dense = SoftDTW(use_cuda, gamma=0.5, normalize=normalize, bandwidth=bandwidth)
+    banded = SoftDTW(use_cuda, gamma=0.5, normalize=normalize, bandwidth=bandwidth, banded=True, dtype=dtype)
+
+    x = torch.rand((8, seq_len_a, 3), device=device, requires_grad=True)
+    y = torch.rand((8, seq_len_b, 3), device=device, requires_grad=True)
+    out_dense = dense(x, y)
+    grad_x_dense, grad_y_dense = torch.autograd.grad(out_dense.sum(), (x, y))
+    out_banded = banded(x, y)
+    grad_x_banded, grad_y_banded = torch.autograd.grad(out_banded.sum(), (x, y))
+
+    assert out_banded.dtype == x.dtype
+    torch.testing.assert_close(out_banded, out_dense, rtol=1e-5, atol=1e-5)
+    torch.testing.assert_close(grad_x_banded, grad_x_dense, rtol=1e-4, atol=1e-5)
+    torch.testing.assert_close(grad_y_banded, grad_y_dense, rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_banded_soft_dtw_full_band(device):
+    """Test that the banded soft-DTW matches the unpruned dense implementation when the band covers the matrix."""
+    torch.manual_seed(0)
+    use_cuda = device.startswith("cuda")
+    x = torch.rand((4, 16, 2), device=device)
+    y = torch.rand((4, 16, 2), device=device)
+    out_dense = SoftDTW(use_cuda, gamma=1.0)(x, y)
+    out_banded = SoftDTW(use_cuda, gamma=1.0, bandwidth=16, banded=True)(x, y)
+    torch.testing.assert_close(out_banded, out_dense, rtol=1e-5, atol=1e-5)
+
+
+def test_banded_soft_dtw_invalid_arguments():
+    """Test the arguments that are not supported by the banded soft-DTW."""
+    with pytest.raises(ValueError):
+        SoftDTW(False, banded=True)
+    with pytest.raises(ValueError):
+        SoftDTW(False, bandwidth=4, banded=True, dist_func=SoftDTW._euclidean_dist_func)
+    # the end of the alignment lies outside the band
+    with pytest.raises(ValueError):
+        SoftDTW(False, bandwidth=2, banded=True)(torch.rand((1, 10, 3)), torch.rand((1, 13, 3)))